@@ -0,0 +1,28 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+benchmarks.bench_cli module
+
+Benchmarks of kli cold start time, each operation runs kli in a new interpreter
+
+"""
+import subprocess
+import sys
+
+from benching import bench
+
+
+def benchKli(total, argv):
+    """ Generator of kli cold start benchmark running kli with argv """
+
+    def op():
+        subprocess.run([sys.executable, "-m", "keri.app.cli.kli", *argv],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+    yield op
+
+
+for name, argv in (("version", ["version"]),  # lightest command
+                   ("sign.help", ["sign", "--help"]),  # command loading keystore stack
+                   ("help", ["--help"])):  # loads every command
+    bench(f"cli.kli.{name}", number=5)(lambda total, argv=argv: benchKli(total, argv=argv))
@@ -0,0 +1,151 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+benchmarks.bench_core module
+
+Benchmarks of CESR primitives, Serder and Parser
+
+"""
+from benching import bench
+
+from keri.core import coring, eventing, parsing
+
+SALT = b'0123456789abcdef'
+
+
+def makeSigners(count, path="bench", transferable=True):
+    """ Returns list of count deterministic signers derived with path """
+    salter = coring.Salter(raw=SALT)
+    return salter.signers(count=count, path=path, temp=True, transferable=transferable)
+
+
+@bench("core.matter.roundtrip", number=20000)
+def benchMatterRoundTrip(total):
+    qb64b = makeSigners(1)[0].verfer.qb64b
+
+    def op():
+        matter = coring.Matter(qb64b=qb64b)
+        coring.Matter(qb2=matter.qb2).qb64b
+
+    yield op
+
+
+@bench("core.indexer.roundtrip", number=20000)
+def benchIndexerRoundTrip(total):
+    qb64b = makeSigners(1)[0].sign(b"abc", index=0).qb64b
+
+    def op():
+        indexer = coring.Indexer(qb64b=qb64b)
+        coring.Indexer(qb2=indexer.qb2).qb64b
+
+    yield op
+
+
+@bench("core.counter.roundtrip", number=20000)
+def benchCounterRoundTrip(total):
+    qb64b = coring.Counter(code=coring.CtrDex.ControllerIdxSigs, count=3).qb64b
+
+    def op():
+        counter = coring.Counter(qb64b=qb64b)
+        coring.Counter(qb2=counter.qb2).qb64b
+
+    yield op
+
+
+@bench("core.group.roundtrip", number=2000)
+def benchGroupRoundTrip(total):
+    signers = makeSigners(7)
+    sigers = [signer.sign(b"abc", index=i) for i, signer in enumerate(signers)]
+
+    def op():
+        ims = bytearray(coring.encodeGroup(coring.CtrDex.ControllerIdxSigs, sigers))
+        counter = coring.Counter(qb64b=ims, strip=True)
+        coring.extractGroup(ims, klases=coring.Siger, count=counter.count)
+
+    yield op
+
+
+def makeInception(count=3):
+    """ Returns Serder of inception event with count keys """
+    signers = makeSigners(count * 2)
+    keys = [signer.verfer.qb64 for signer in signers[:count]]
+    ndigs = [coring.Diger(ser=signer.verfer.qb64b).qb64 for signer in signers[count:]]
+    return eventing.incept(keys=keys, ndigs=ndigs, code=coring.MtrDex.Blake3_256)
+
+
+@bench("core.serder.raw", number=5000)
+def benchSerderRaw(total):
+    raw = makeInception().raw
+
+    def op():
+        coring.Serder(raw=raw)
+
+    yield op
+
+
+@bench("core.serder.ked", number=5000)
+def benchSerderKed(total):
+    ked = makeInception().ked
+
+    def op():
+        coring.Serder(ked=ked)
+
+    yield op
+
+
+def makeWeightedSith(count=32, clauses=2):
+    """ Returns weighted sith of clauses each of count keys weighted 1/(count/2) """
+    return [[f"1/{count // 2}"] * count for _ in range(clauses)]
+
+
+@bench("core.tholder.satisfy", number=20000)
+def benchTholderSatisfy(total):
+    tholder = coring.Tholder(sith=makeWeightedSith())
+    indices = list(range(0, tholder.size, 2))  # exactly half of each clause
+
+    def op():
+        assert tholder.satisfy(indices)
+
+    yield op
+
+
+class Sink:
+    """ Stand in for Kevery that accepts parsed events without processing """
+
+    def __init__(self):
+        self.count = 0
+
+    def processEvent(self, serder, sigers, **kwa):
+        self.count += 1
+
+
+KelSize = 100  # events in kel stream
+
+
+def makeKel(size=KelSize):
+    """ Returns bytearray stream of kel of size events each with attachments """
+    signers = makeSigners(1)
+    keys = [signers[0].verfer.qb64]
+    serder = eventing.incept(keys=keys, code=coring.MtrDex.Blake3_256)
+    stream = bytearray()
+    stream.extend(eventing.messagize(serder, sigers=[signers[0].sign(serder.raw, index=0)],
+                                     pipelined=True))
+    pre = serder.pre
+    for sn in range(1, size):
+        serder = eventing.interact(pre=pre, dig=serder.said, sn=sn)
+        stream.extend(eventing.messagize(serder, sigers=[signers[0].sign(serder.raw, index=0)],
+                                         pipelined=True))
+    return stream
+
+
+@bench("core.parser.kel", number=20)
+def benchParserKel(total):
+    stream = makeKel()
+    parser = parsing.Parser(framed=False)
+
+    def op():
+        sink = Sink()
+        parser.parse(ims=bytearray(stream), kvy=sink)
+        assert sink.count == KelSize
+
+    yield op
@@ -0,0 +1,124 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+benchmarks.bench_db module
+
+Benchmarks of key event ingest into and replay out of temporary LMDB databases
+
+"""
+from benching import bench
+
+from keri.app import habbing
+from keri.core import coring, eventing
+from keri.db import basing
+
+SALT = b'0123456789abcdef'
+
+
+def makeInceptions(total, keys, wits):
+    """
+    Returns list of total (serder, sigers, wigers) triples of distinct fully
+    signed and fully witnessed inception events each with keys signing keys and
+    wits witnesses
+
+    Parameters:
+        total (int): number of inception events
+        keys (int): number of signing keys per event
+        wits (int): number of witnesses per event
+    """
+    salter = coring.Salter(raw=SALT)
+    witers = salter.signers(count=wits, path="wit", temp=True, transferable=False)
+    wits = [witer.verfer.qb64 for witer in witers]
+
+    events = []
+    for i in range(total):
+        signers = salter.signers(count=keys * 2, path=f"{i:x}.", temp=True)
+        serder = eventing.incept(keys=[signer.verfer.qb64 for signer in signers[:keys]],
+                                 isith=f"{max(1, (keys + 1) // 2):x}",
+                                 ndigs=[coring.Diger(ser=signer.verfer.qb64b).qb64
+                                        for signer in signers[keys:]],
+                                 nsith=f"{max(1, (keys + 1) // 2):x}",
+                                 wits=wits,
+                                 toad=len(wits),
+                                 code=coring.MtrDex.Blake3_256)
+        sigers = [signer.sign(serder.raw, index=j) for j, signer in enumerate(signers[:keys])]
+        wigers = [witer.sign(serder.raw, index=j) for j, witer in enumerate(witers)]
+        events.append((serder, sigers, wigers))
+
+    return events
+
+
+def benchProcessEvent(total, keys, wits):
+    """ Generator of Kevery.processEvent ingest benchmark """
+    events = makeInceptions(total=total, keys=keys, wits=wits)
+    with basing.openDB(name="bench", temp=True) as db:
+        kvy = eventing.Kevery(db=db, lax=False, local=False)
+        evts = iter(events)
+
+        def op():
+            serder, sigers, wigers = next(evts)
+            kvy.processEvent(serder=serder, sigers=sigers, wigers=wigers)
+
+        yield op
+
+        assert len(kvy.kevers) == total
+
+
+for keys, wits in ((1, 0), (3, 0), (7, 0), (1, 3), (3, 3), (7, 7)):
+    bench(f"db.kevery.processEvent.k{keys}w{wits}", number=50)(
+        lambda total, keys=keys, wits=wits: benchProcessEvent(total, keys=keys, wits=wits))
+
+
+KelSize = 100  # events in replayed kel
+
+
+def benchClonePreIter(total, cold=False):
+    """ Generator of Baser.clonePreIter replay benchmark
+
+    Parameters:
+        cold (bool): True means disable the replay frames cache so every
+            replay takes the full cloneEvtMsg path. False means warm cache hits
+            after the first repeat since KelSize < Baser.FrameCacheSize
+    """
+    with habbing.openHab(name="bench", salt=SALT, temp=True) as (hby, hab):
+        for _ in range(KelSize - 1):
+            hab.interact()
+        if cold:
+            hby.db.frames.clear()
+            hby.db.frames.size = 0
+
+        def op():
+            assert len(list(hby.db.clonePreIter(pre=hab.pre))) == KelSize
+
+        yield op
+
+
+def benchCloneEvtMsg(total, cold=False):
+    """ Generator of Baser.cloneEvtMsg single event replay benchmark
+
+    Parameters:
+        cold (bool): True means disable the replay frames cache. See
+            benchClonePreIter
+    """
+    with habbing.openHab(name="bench", salt=SALT, temp=True) as (hby, hab):
+        for _ in range(KelSize - 1):
+            hab.interact()
+        if cold:
+            hby.db.frames.clear()
+            hby.db.frames.size = 0
+
+        digs = list(hby.db.getFelItemPreIter(hab.pre.encode("utf-8")))
+        fn, dig = digs[len(digs) // 2]
+
+        def op():
+            hby.db.cloneEvtMsg(pre=hab.pre, fn=fn, dig=dig)
+
+        yield op
+
+
+for cold in (False, True):
+    suffix = ".cold" if cold else ""
+    bench(f"db.baser.clonePreIter{suffix}", number=20)(
+        lambda total, cold=cold: benchClonePreIter(total, cold=cold))
+    bench(f"db.baser.cloneEvtMsg{suffix}", number=2000)(
+        lambda total, cold=cold: benchCloneEvtMsg(total, cold=cold))
@@ -0,0 +1,125 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+benchmarks.bench_vdr module
+
+Benchmarks of credential verification and TEL state lookup
+
+"""
+from benching import bench
+
+from keri.app import habbing, signing
+from keri.core import coring, scheming
+from keri.core.eventing import SealEvent
+from keri.vc import proving
+from keri.vdr import credentialing, verifying
+
+SALT = b'0123456789abcdef'
+
+ChainDepth = 3  # credentials chained below leaf credential
+
+
+def seedSchema(db):
+    """ Returns SAID of permissive credential schema pinned into db """
+    sad = {'$id': '',
+           '$schema': 'http://json-schema.org/draft-07/schema#',
+           'title': 'Benchmark Credential',
+           'description': 'Credential for benchmarking chained verification',
+           'type': 'object',
+           'properties': {'v': {'type': 'string'},
+                          'd': {'type': 'string'},
+                          'i': {'type': 'string'},
+                          'ri': {'type': 'string'},
+                          's': {'type': 'string'},
+                          'a': {'type': 'object',
+                                'properties': {'d': {'type': 'string'},
+                                               'i': {'type': 'string'},
+                                               'dt': {'type': 'string', 'format': 'date-time'},
+                                               'level': {'type': 'integer'}},
+                                'required': ['d', 'i', 'dt', 'level']},
+                          'e': {'type': 'object'}},
+           'required': ['v', 'd', 'i', 'ri', 's', 'a']}
+    _, sad = coring.Saider.saidify(sad, label=coring.Ids.dollar)
+    schemer = scheming.Schemer(sed=sad)
+    db.schema.pin(schemer.said, schemer)
+    return schemer.said
+
+
+def anchor(hab, regery, registry, pre, said):
+    """ Anchor registry event pre said in kel of hab and process escrows """
+    rseal = SealEvent(pre, "0", said)._asdict()
+    hab.interact(data=[rseal])
+    seqner = coring.Seqner(sn=hab.kever.sn)
+    registry.anchorMsg(pre=pre, regd=said, seqner=seqner, saider=hab.kever.serder.saider)
+    regery.processEscrows()
+
+
+def issueChain(hab, regery, registry, verifier, schema, depth):
+    """
+    Returns list of (creder, sadsigers) duples of issued credentials where each
+    credential after the first is chained to the one before it. All but the
+    last are verified and saved by verifier.
+    """
+    chain = []
+    for level in range(depth + 1):
+        source = None
+        if chain:
+            _, source = coring.Saider.saidify(sad=dict(d="", prev=dict(n=chain[-1][0].said)))
+
+        creder = proving.credential(issuer=hab.pre,
+                                    schema=schema,
+                                    data=dict(i=hab.pre, level=level),
+                                    status=registry.regk,
+                                    source=source)
+        sadsigers, _ = signing.signPaths(hab=hab, serder=creder, paths=[[]])
+        iss = registry.issue(said=creder.said)
+        anchor(hab, regery, registry, pre=iss.pre, said=iss.said)
+        if level < depth:
+            verifier.processCredential(creder, sadsigers=sadsigers)
+        chain.append((creder, sadsigers))
+
+    return chain
+
+
+def openIssuer(hby, hab):
+    """ Returns (regery, registry) of anchored registry of hab """
+    regery = credentialing.Regery(hby=hby, name="bench", temp=True)
+    registry = regery.makeRegistry(prefix=hab.pre, name="bench")
+    anchor(hab, regery, registry, pre=registry.regk, said=registry.regd)
+    return regery, registry
+
+
+@bench("vdr.verifier.processCredential", number=100)
+def benchProcessCredential(total):
+    with habbing.openHab(name="bench", salt=SALT, temp=True) as (hby, hab):
+        schema = seedSchema(hby.db)
+        regery, registry = openIssuer(hby, hab)
+        verifier = verifying.Verifier(hby=hby, reger=regery.reger)
+        chain = issueChain(hab, regery, registry, verifier, schema, depth=ChainDepth)
+        creder, sadsigers = chain[-1]
+
+        def op():
+            verifier.processCredential(creder, sadsigers=sadsigers)
+            cue = verifier.cues.pop()
+            assert cue["kin"] == "saved"
+
+        yield op
+
+        regery.close()
+
+
+@bench("vdr.tever.vcState", number=5000)
+def benchVcState(total):
+    with habbing.openHab(name="bench", salt=SALT, temp=True) as (hby, hab):
+        schema = seedSchema(hby.db)
+        regery, registry = openIssuer(hby, hab)
+        verifier = verifying.Verifier(hby=hby, reger=regery.reger)
+        creder, _ = issueChain(hab, regery, registry, verifier, schema, depth=0)[0]
+        tever = regery.reger.tevers[registry.regk]
+
+        def op():
+            tever.vcState(creder.said)
+
+        yield op
+
+        regery.close()
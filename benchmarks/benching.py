@@ -0,0 +1,189 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+benchmarks.benching module
+
+Minimal harness for the keripy benchmark suite.
+
+Benchmarks are generator functions registered with the @bench decorator. Each
+is called with total, the number of operations the harness will time, so that
+benchmarks which consume material (such as events that may only be ingested
+once) can build enough of it up front. The generator performs its setup, yields
+the zero argument callable that is the operation to time and performs its
+teardown when resumed. All setup, such as opening temporary databases, happens
+outside the timed region.
+
+"""
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+from fnmatch import fnmatch
+
+Benches = dict()  # registered benchmarks keyed by name
+
+Warmup = 1  # untimed operations run before timing to prime caches
+
+
+@dataclass
+class Bench:
+    """
+    Registered benchmark
+
+    Attributes:
+        name (str): unique dotted name where first element is group
+        func (function): generator function that yields operation to time
+        number (int): operations per repeat at scale 1.0
+    """
+    name: str
+    func: object
+    number: int
+
+    @property
+    def group(self):
+        return self.name.split(".")[0]
+
+
+@dataclass
+class Result:
+    """
+    Timing result of one benchmark. All times are seconds per operation
+
+    Attributes:
+        name (str): benchmark name
+        group (str): benchmark group
+        number (int): operations timed in each repeat
+        repeat (int): number of repeats
+        min (float): fastest repeat
+        median (float): median repeat
+        mean (float): mean repeat
+        stdev (float): standard deviation of repeats
+        ops (float): operations per second of median repeat
+    """
+    name: str
+    group: str
+    number: int
+    repeat: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+    ops: float
+    times: list = field(default_factory=list, repr=False)
+
+
+def bench(name, number=100):
+    """
+    Decorator that registers generator function as benchmark named name that
+    times number operations per repeat at scale 1.0
+
+    Parameters:
+        name (str): unique dotted name where first element is group
+        number (int): operations per repeat at scale 1.0
+    """
+    def register(func):
+        if name in Benches:
+            raise ValueError(f"duplicate benchmark name {name}")
+        Benches[name] = Bench(name=name, func=func, number=number)
+        return func
+
+    return register
+
+
+def select(patterns=None):
+    """
+    Returns list of registered benchmarks whose names match any of glob
+    patterns. Name prefixes also match so group names select whole groups.
+    None or empty patterns selects all.
+    """
+    benches = sorted(Benches.values(), key=lambda b: b.name)
+    if not patterns:
+        return benches
+
+    return [b for b in benches
+            if any(fnmatch(b.name, p) or b.name.startswith(p + ".") or b.name == p
+                   for p in patterns)]
+
+
+def run(b, repeat=5, scale=1.0):
+    """
+    Returns Result of timing benchmark b
+
+    Parameters:
+        b (Bench): benchmark to run
+        repeat (int): number of timed repeats
+        scale (float): multiplier on b.number operations per repeat
+    """
+    number = max(1, int(b.number * scale))
+    total = number * repeat + Warmup
+    with contextmanager(b.func)(total=total) as op:
+        for _ in range(Warmup):
+            op()
+
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                op()
+            times.append((time.perf_counter() - start) / number)
+
+    median = statistics.median(times)
+    return Result(name=b.name,
+                  group=b.group,
+                  number=number,
+                  repeat=repeat,
+                  min=min(times),
+                  median=median,
+                  mean=statistics.fmean(times),
+                  stdev=statistics.stdev(times) if len(times) > 1 else 0.0,
+                  ops=1.0 / median if median else 0.0,
+                  times=times)
+
+
+def meta(repeat, scale):
+    """ Returns dict of environment metadata to record with results """
+    import keri
+
+    return dict(keri=keri.__version__,
+                python=platform.python_version(),
+                implementation=platform.python_implementation(),
+                platform=platform.platform(),
+                machine=platform.machine(),
+                processor=platform.processor(),
+                timestamp=time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                argv=sys.argv[1:],
+                repeat=repeat,
+                scale=scale)
+
+
+def dump(results, path, repeat, scale):
+    """ Write results with metadata as JSON to path """
+    data = dict(meta=meta(repeat=repeat, scale=scale),
+                results=[asdict(result) for result in results])
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def load(path):
+    """ Returns dict of result dicts keyed by name loaded from JSON at path """
+    with open(path) as f:
+        data = json.load(f)
+    return {result["name"]: result for result in data["results"]}
+
+
+def report(result, base=None):
+    """
+    Returns one line human readable report of result compared to base
+
+    Parameters:
+        result (Result): result to report
+        base (dict): prior result of same benchmark as loaded from JSON
+    """
+    line = (f"{result.name:<48} {result.median * 1e6:>12.2f} us "
+            f"{result.ops:>12.1f} ops/s  ±{result.stdev / result.median * 100 if result.median else 0.0:5.1f}%")
+    if base is not None and base["median"]:
+        line += f"  {base['median'] / result.median:6.2f}x"
+    return line
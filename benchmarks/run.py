@@ -0,0 +1,62 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+benchmarks.run module
+
+Runs the keripy benchmark suite offline against temporary databases and
+optionally writes machine readable JSON results for comparison across runs.
+
+    python benchmarks/run.py                       # run all benchmarks
+    python benchmarks/run.py core db.baser         # run selected groups or names
+    python benchmarks/run.py --out base.json       # save results
+    python benchmarks/run.py --compare base.json   # report speedup against saved results
+
+"""
+import argparse
+import sys
+
+import benching
+import bench_cli  # noqa: F401 registers benchmarks
+import bench_core  # noqa: F401 registers benchmarks
+import bench_db  # noqa: F401 registers benchmarks
+import bench_vdr  # noqa: F401 registers benchmarks
+
+parser = argparse.ArgumentParser(description="Run keripy benchmarks")
+parser.add_argument("patterns", nargs="*", help="benchmark names, groups or glob patterns to run")
+parser.add_argument("--repeat", "-r", type=int, default=5, help="timed repeats per benchmark")
+parser.add_argument("--scale", "-s", type=float, default=1.0,
+                    help="multiplier on operations per repeat, use less than 1.0 for quick runs")
+parser.add_argument("--out", "-o", default=None, help="path of JSON file to write results to")
+parser.add_argument("--compare", "-c", default=None, help="path of JSON results to compare against")
+parser.add_argument("--list", "-l", action="store_true", help="list benchmarks and exit")
+
+
+def main(argv=None):
+    args = parser.parse_args(argv)
+    benches = benching.select(args.patterns)
+
+    if args.list:
+        for b in benches:
+            print(b.name)
+        return 0
+
+    if not benches:
+        print(f"no benchmarks match {args.patterns}", file=sys.stderr)
+        return 1
+
+    bases = benching.load(args.compare) if args.compare else {}
+
+    results = []
+    for b in benches:
+        result = benching.run(b, repeat=args.repeat, scale=args.scale)
+        results.append(result)
+        print(benching.report(result, base=bases.get(b.name)), flush=True)
+
+    if args.out:
+        benching.dump(results, args.out, repeat=args.repeat, scale=args.scale)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
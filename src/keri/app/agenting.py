@@ -200,7 +200,12 @@ class WitnessInquisitor(doing.DoDoer):
     receipt set.  Could be enhanced to have a `once` method that runs once and cleans up
     and an `all` method that runs and waits for more messages to receipt.
 
+    Each witnesser is removed, releasing its pooled connection, .Linger seconds
+    after its query was sent so that replies streamed back on its connection
+    are still processed.
+
     """
+    Linger = 3.0  # seconds witnesser is kept after sending to process replies
 
     def __init__(self, hby, reger=None, msgs=None, klas=None, **kwa):
         """
@@ -217,6 +222,7 @@ class WitnessInquisitor(doing.DoDoer):
         self.klas = klas if klas is not None else HttpWitnesser
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = decking.Deck()
+        self.lingering = decking.Deck()  # (witer, tyme to remove) duples
 
         super(WitnessInquisitor, self).__init__(doers=[doing.doify(self.msgDo)], **kwa)
 
@@ -233,6 +239,7 @@ class WitnessInquisitor(doing.DoDoer):
 
         while True:
             while not self.msgs:
+                self.prune()
                 yield self.tock
 
             evt = self.msgs.popleft()
@@ -267,14 +274,23 @@ class WitnessInquisitor(doing.DoDoer):
 
             witer.msgs.append(bytearray(msg))
 
-            while not witer.sent:
+            while witer.msgs or not witer.sent or not witer.idle:
                 yield self.tock
 
             self.sent.append(witer.sent.popleft())
+            self.lingering.append((witer, self.tyme + self.Linger))
+            self.prune()
 
             yield self.tock
 
-    def query(self, src, pre, r="logs", sn=0, anchor=None, wits=None, **kwa):
+    def prune(self):
+        """ Remove witnessers whose linger time has passed releasing their
+        pooled connections """
+        while self.lingering and self.lingering[0][1] <= self.tyme:
+            witer, _ = self.lingering.popleft()
+            self.remove([witer])
+
+    def query(self, src, pre, r="logs", sn=0, anchor=None, wits=None, fn=None, **kwa):
         """ Create, sign and return a `qry` message against the attester for the prefix
 
         Parameters:
@@ -284,6 +300,8 @@ class WitnessInquisitor(doing.DoDoer):
             sn (int): optional specific sequence number to query for
             anchor (Seal) anchor to search for
             wits (list) witnesses to query
+            fn (int): optional first seen ordinal to replay logs from. None
+                means replay all
 
         Returns:
             bytearray: signed query event
@@ -292,6 +310,8 @@ class WitnessInquisitor(doing.DoDoer):
         qry = dict(s=sn)
         if anchor is not None:
             qry["a"] = anchor
+        if fn is not None:
+            qry["fn"] = fn
 
         self.msgs.append(dict(src=src, pre=pre, r=r, q=qry, wits=wits))
 
@@ -378,18 +398,23 @@ class TCPWitnesser(doing.DoDoer):
 
     """
 
-    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, **kwa):
+    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, pool=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            pool (pooling.ClientPool | None): lease connection from pool and
+                release it on exit. None means open own connection
 
         """
         self.hab = hab
         self.wit = wit
         self.url = url
+        self.pool = pool
+        self.client = None
+        self.failed = False
         self.posted = 0
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
@@ -417,12 +442,18 @@ class TCPWitnesser(doing.DoDoer):
         if up.scheme != kering.Schemes.tcp:
             raise ValueError(f"invalid scheme {up.scheme} for TcpWitnesser")
 
-        client = clienting.Client(host=up.hostname, port=up.port)
+        if self.pool is not None:
+            client = self.pool.acquire(eid=self.wit, scheme=up.scheme, url=self.url)
+            clientDoer = doing.doify(self.serviceDo)
+        else:
+            client = clienting.Client(host=up.hostname, port=up.port)
+            clientDoer = clienting.ClientDoer(client=client)
+
+        self.client = client
         self.parser = parsing.Parser(ims=client.rxbs,
                                      framed=True,
                                      kvy=self.kevery)
 
-        clientDoer = clienting.ClientDoer(client=client)
         self.extend([clientDoer, doing.doify(self.msgDo)])
 
         while True:
@@ -462,6 +493,29 @@ class TCPWitnesser(doing.DoDoer):
         """
         yield from self.parser.parsator()  # process messages continuously
 
+    def serviceDo(self, tymth=None, tock=0.0):
+        """
+        Returns doifiable Doist compatible generator method (doer dog) that
+        services pooled .client in place of ClientDoer which would close it
+
+        Usage:
+            add result of doify on this method to doers list
+        """
+        self.client.wind(tymth)
+        _ = (yield tock)
+
+        while True:
+            self.client.service()
+            yield tock
+
+    def exit(self, deeds=None):
+        """ Release pooled .client back to .pool on exit of all deeds """
+        super(TCPWitnesser, self).exit(deeds=deeds)
+        if deeds is None and self.pool is not None and self.client is not None:
+            self.pool.release(eid=self.wit, scheme=kering.Schemes.tcp, url=self.url,
+                              client=self.client, failed=self.failed)
+            self.client = None
+
     @property
     def idle(self):
         return len(self.sent) == self.posted
@@ -473,17 +527,22 @@ class HttpWitnesser(doing.DoDoer):
 
     """
 
-    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, **kwa):
+    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, pool=None, **kwa):
         """
         For the current event, gather the current set of witnesses, send the event,
         gather all receipts and send them to all other witnesses
 
         Parameters:
             hab: Habitat of the identifier to populate witnesses
+            pool (pooling.ClientPool | None): lease connection from pool and
+                release it on exit. None means open own connection
 
         """
         self.hab = hab
         self.wit = wit
+        self.url = url
+        self.pool = pool
+        self.failed = False
         self.posted = 0
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
@@ -495,8 +554,12 @@ class HttpWitnesser(doing.DoDoer):
         if up.scheme != kering.Schemes.http:
             raise ValueError(f"invalid scheme {up.scheme} for HttpWitnesser")
 
-        self.client = http.clienting.Client(hostname=up.hostname, port=up.port)
-        clientDoer = http.clienting.ClientDoer(client=self.client)
+        if self.pool is not None:
+            self.client = self.pool.acquire(eid=wit, scheme=up.scheme, url=url)
+            clientDoer = doing.doify(self.serviceDo)
+        else:
+            self.client = http.clienting.Client(hostname=up.hostname, port=up.port)
+            clientDoer = http.clienting.ClientDoer(client=self.client)
 
         doers.extend([clientDoer])
 
@@ -536,10 +599,35 @@ class HttpWitnesser(doing.DoDoer):
         while True:
             while self.client.responses:
                 rep = self.client.respond()
+                if rep.errored:
+                    self.failed = True
                 self.sent.append(rep)
                 yield
             yield
 
+    def serviceDo(self, tymth=None, tock=0.0):
+        """
+        Returns doifiable Doist compatible generator method (doer dog) that
+        services pooled .client in place of ClientDoer which would close it
+
+        Usage:
+            add result of doify on this method to doers list
+        """
+        self.client.wind(tymth)
+        _ = (yield tock)
+
+        while True:
+            self.client.service()
+            yield tock
+
+    def exit(self, deeds=None):
+        """ Release pooled .client back to .pool on exit of all deeds """
+        super(HttpWitnesser, self).exit(deeds=deeds)
+        if deeds is None and self.pool is not None and self.client is not None:
+            self.pool.release(eid=self.wit, scheme=kering.Schemes.http, url=self.url,
+                              client=self.client, failed=self.failed)
+            self.client = None
+
     @property
     def idle(self):
         return len(self.msgs) == 0 and self.posted == len(self.sent)
@@ -570,17 +658,27 @@ def witnesser(hab, wit):
 
     Returns:
         Optional(TcpWitnesser, HttpWitnesser): witnesser for ensuring full reciepts
+
+    Witnessers lease their connection from hab.pool when hab has one so that
+    connections to the same witness are kept alive and reused across events
+    and doers. The connection is released back to the pool when the witnesser
+    is removed from its parent DoDoer. The http endpoint is preferred unless
+    the pool has seen it fail repeatedly while the tcp endpoint is healthy.
     """
     urls = hab.fetchUrls(eid=wit)
-    if kering.Schemes.http in urls:
-        url = urls[kering.Schemes.http]
-        witer = HttpWitnesser(hab=hab, wit=wit, url=url)
-    elif kering.Schemes.tcp in urls:
-        url = urls[kering.Schemes.tcp]
-        witer = TCPWitnesser(hab=hab, wit=wit, url=url)
-    else:
+    schemes = [scheme for scheme in (kering.Schemes.http, kering.Schemes.tcp) if scheme in urls]
+    if not schemes:
         raise kering.ConfigurationError(f"unable to find a valid endpoint for witness {wit}")
 
+    if hab.pool is not None:  # stable sort so healthy endpoints first in preferred order
+        schemes.sort(key=lambda scheme: not hab.pool.healthy(eid=wit, scheme=scheme, url=urls[scheme]))
+
+    scheme = schemes[0]
+    if scheme == kering.Schemes.http:
+        witer = HttpWitnesser(hab=hab, wit=wit, url=urls[scheme], pool=hab.pool)
+    else:
+        witer = TCPWitnesser(hab=hab, wit=wit, url=urls[scheme], pool=hab.pool)
+
     return witer
 
 
@@ -142,7 +142,8 @@ class PasscodeEnd:
 class BootEnd(doing.DoDoer):
     """ Resource class for boot a cloud agent """
 
-    def __init__(self, servery, base="", temp=False, configFile=None, configDir=None, headDirPath=None, **kwa):
+    def __init__(self, servery, base="", temp=False, configFile=None, configDir=None, headDirPath=None,
+                 dbOpts=None, **kwa):
         """ Provides endpoints for initializing and unlocking an agent
 
         Parameters:
@@ -156,9 +157,12 @@ class BootEnd(doing.DoDoer):
             configFile (str):  name of config file to load
             configDir (str): name of base for directory to load
             headDirPath (str): root path
+            dbOpts (dict): LMDB mapSize, mapSizeMax and profile options of
+                the databases of booted agents
 
         """
         self.servery = servery
+        self.dbOpts = dbOpts if dbOpts is not None else dict()
         self.base = base
         self.temp = temp
         self.configFile = configFile
@@ -288,7 +292,8 @@ class BootEnd(doing.DoDoer):
                                     reopen=True,
                                     clear=False)
 
-        hby = habbing.Habery(name=name, base=self.base, temp=self.temp, cf=cf, headDirPath=self.headDirPath, **kwa)
+        hby = habbing.Habery(name=name, base=self.base, temp=self.temp, cf=cf, headDirPath=self.headDirPath,
+                             **self.dbOpts, **kwa)
         rgy = credentialing.Regery(hby=hby, name=name, base=self.base)
 
         hby.close()
@@ -364,7 +369,8 @@ class BootEnd(doing.DoDoer):
         else:
             cf = None
 
-        hby = habbing.Habery(name=name, base=self.base, bran=bran, cf=cf, headDirPath=self.headDirPath)
+        hby = habbing.Habery(name=name, base=self.base, bran=bran, cf=cf, headDirPath=self.headDirPath,
+                             **self.dbOpts)
         rgy = credentialing.Regery(hby=hby, name=name, base=self.base)
 
         kiwiing.setup(hby=hby, rgy=rgy, servery=self.servery, bootConfig=self.bootConfig, **self._kiwinits)
@@ -376,8 +382,13 @@ class BootEnd(doing.DoDoer):
 
 
 def setup(servery, controller="", configFile=None, configDir=None, insecure=True, path="",
-          headDirPath=None):
-    """ Set up an agent in bootloader mode """
+          headDirPath=None, dbOpts=None):
+    """ Set up an agent in bootloader mode
+
+    Parameters:
+        dbOpts (dict): LMDB mapSize, mapSizeMax and profile options of the
+            databases of booted agents
+    """
     app = falcon.App(middleware=falcon.CORSMiddleware(
         allow_origins='*', allow_credentials='*', expose_headers=['cesr-attachment', 'cesr-date', 'content-type']))
     if not insecure:
@@ -392,12 +403,13 @@ def setup(servery, controller="", configFile=None, configDir=None, insecure=True
     )
 
     ends = loadEnds(app=app, configFile=configFile, configDir=configDir, path=path, servery=servery,
-                    headDirPath=headDirPath, **kwargs)
+                    headDirPath=headDirPath, dbOpts=dbOpts, **kwargs)
 
     servery.msgs.append(dict(app=app, doers=ends))
 
 
-def loadEnds(app, servery, *, configFile=None, configDir=None, base="", temp=False, headDirPath=None, path, **kwargs):
+def loadEnds(app, servery, *, configFile=None, configDir=None, base="", temp=False, headDirPath=None, path,
+             dbOpts=None, **kwargs):
     """
     Load endpoints for KIWI admin interface into the provided Falcon app
 
@@ -414,6 +426,8 @@ def loadEnds(app, servery, *, configFile=None, configDir=None, base="", temp=Fal
         configDir: (str) directory override for configuration data
         headDirPath: (str) optional path
         path (str): directory location of UI web app files to be served with this API server
+        dbOpts (dict): LMDB mapSize, mapSizeMax and profile options of the
+            databases of booted agents
 
     Returns:
         list: doers from registering endpoints
@@ -429,7 +443,7 @@ def loadEnds(app, servery, *, configFile=None, configDir=None, base="", temp=Fal
     app.add_route("/codes", passcodeEnd)
 
     bootEnd = BootEnd(configFile=configFile, configDir=configDir, base=base, temp=temp, servery=servery,
-                      headDirPath=headDirPath, **kwargs)
+                      headDirPath=headDirPath, dbOpts=dbOpts, **kwargs)
     app.add_route("/boot", bootEnd)
     app.add_route("/boot/{name}", bootEnd, suffix="name")
 
@@ -57,6 +57,12 @@ parser.add_argument("-p", "--path",
 parser.add_argument("--keypath", action="store", required=False, default=None)
 parser.add_argument("--certpath", action="store", required=False, default=None)
 parser.add_argument("--cafilepath", action="store", required=False, default=None)
+parser.add_argument('--lmdb-profile', dest="profile", choices=("durable", "balanced", "fast"), default=None,
+                    help="LMDB durability versus throughput tuning profile of databases. Default is durable.")
+parser.add_argument('--lmdb-map-size', dest="mapSize", type=int, default=None,
+                    help="Initial LMDB memory map size of databases in MiB. Default is 100.")
+parser.add_argument('--lmdb-map-size-max', dest="mapSizeMax", type=int, default=None,
+                    help="Max LMDB memory map size of databases in MiB. Default is unlimited.")
 
 
 def launch(args):
@@ -76,6 +82,9 @@ def launch(args):
 
     servery = booting.Servery(port=int(args.admin_http_port), keypath=args.keypath, certpath=args.certpath,
                               cafilepath=args.cafilepath)  # Manager of HTTP server environments
+    dbOpts = dict(mapSize=args.mapSize * 2 ** 20 if args.mapSize else None,
+                  mapSizeMax=args.mapSizeMax * 2 ** 20 if args.mapSizeMax else None,
+                  profile=args.profile)
     booting.setup(servery=servery, controller=args.controller, configFile=args.configFile,
-                  configDir=args.configDir, insecure=args.insecure, path=args.path)
+                  configDir=args.configDir, insecure=args.insecure, path=args.path, dbOpts=dbOpts)
     return [servery]
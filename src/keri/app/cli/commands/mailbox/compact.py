@@ -0,0 +1,62 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.kli.commands.mailbox module
+
+"""
+import argparse
+
+from hio import help
+from hio.base import doing
+
+from keri.app import storing
+
+logger = help.ogler.getLogger()
+
+parser = argparse.ArgumentParser(description='Compact mailbox by removing messages past retention. '
+                                             'Run while the witness or agent using the mailbox is stopped')
+parser.set_defaults(handler=lambda args: handler(args))
+parser.add_argument('--name', '-n', help='mailbox name, the alias of the witness for witness mailboxes',
+                    required=True)
+parser.add_argument('--base', '-b', help='additional optional prefix to file location of mailbox',
+                    required=False, default="")
+parser.add_argument('--max-age', help='max seconds to keep messages after they were stored',
+                    dest="age", type=float, default=None)
+parser.add_argument('--max-count', help='max number of most recent messages to keep per topic',
+                    dest="count", type=int, default=None)
+parser.add_argument('--acked', help='remove messages acknowledged by mailbox queries',
+                    action='store_true', default=False)
+parser.add_argument('--route', '-r', help='only compact topics with this route, for example /receipt',
+                    default=None)
+
+
+def handler(args):
+    kwa = dict(args=args)
+    return [doing.doify(compact, **kwa)]
+
+
+def compact(tymth, tock=0.0, **opts):
+    """ Command line mailbox compaction handler
+
+    """
+    _ = (yield tock)
+    args = opts["args"]
+
+    policy = storing.Retention(age=args.age, count=args.count, acked=args.acked)
+    if policy == storing.Retention():
+        print("nothing to compact, provide at least one of --max-age, --max-count or --acked")
+        return -1
+
+    mbx = storing.Mailboxer(name=args.name, base=args.base, temp=False, reopen=True)
+    try:
+        if args.route is not None:
+            # empty policy without limits for other routes keeps their messages
+            mbx.policy = storing.Retention()
+            mbx.policies[args.route] = policy
+        else:
+            mbx.policy = policy
+
+        count = mbx.compact()
+        print(f"Removed {count} messages from mailbox {args.name}")
+    finally:
+        mbx.close()
@@ -108,14 +108,14 @@ class ListDoer(doing.DoDoer):
                 yield 1.0
             print("\n")
 
-        if self.issued:
-            saids = self.rgy.reger.issus.get(keys=self.hab.pre)
-        else:
-            saids = self.rgy.reger.subjs.get(keys=self.hab.pre)
-
+        reger = self.rgy.reger
         if self.schema is not None:
-            scads = self.rgy.reger.schms.get(keys=self.schema)
-            saids = [saider for saider in saids if saider.qb64 in [saider.qb64 for saider in scads]]
+            index = reger.ischs if self.issued else reger.sschs
+            saids = index.get(keys=(self.hab.pre, self.schema))
+        elif self.issued:
+            saids = reger.issus.get(keys=self.hab.pre)
+        else:
+            saids = reger.subjs.get(keys=self.hab.pre)
 
         if self.said:
             for said in saids:
@@ -131,7 +131,7 @@ class ListDoer(doing.DoDoer):
                 if not scraw:
                     raise kering.ConfigurationError("Credential schema {} not found".format(schema))
 
-                schemer = scheming.Schemer(raw=scraw)
+                schemer = scheming.cache.schemer(raw=scraw, said=schema)
                 print(f"Crecential #{idx+1}: {sad['d']}")
                 print(f"    Type: {schemer.sed['title']}")
                 if status['et'] == 'iss' or status['et'] == 'bis':
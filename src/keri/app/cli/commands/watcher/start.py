@@ -61,7 +61,7 @@ def setupWatcher(name="watcher", controller=None, alias="watcher", base="", bran
 
     app = falcon.App(cors_enable=True)
 
-    mbx = storing.Mailboxer(name=name)
+    mbx = storing.Mailboxer(name=name, **hby.dbOpts)
     rep = storing.Respondant(hby=hby, mbx=mbx)
 
     kiwiServer = watching.KiwiServer(hab=hab, app=app, rep=rep, controller=controller)
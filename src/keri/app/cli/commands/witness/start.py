@@ -10,7 +10,7 @@ import logging
 
 from keri import __version__
 from keri import help
-from keri.app import directing, indirecting, habbing, keeping
+from keri.app import directing, indirecting, habbing, keeping, storing
 from keri.app.cli.common import existing
 
 d = "Runs KERI witness controller.\n"
@@ -38,6 +38,27 @@ parser.add_argument('--base', '-b', help='additional optional prefix to file loc
 parser.add_argument('--alias', '-a', help='human readable alias for the new identifier prefix', required=True)
 parser.add_argument('--passcode', '-p', help='22 character encryption passcode for keystore (is not saved)',
                     dest="bran", default=None)  # passcode => bran
+parser.add_argument('--lmdb-profile', dest="profile", choices=("durable", "balanced", "fast"), default=None,
+                    help="LMDB durability versus throughput tuning profile of databases. Default is durable.")
+parser.add_argument('--lmdb-map-size', dest="mapSize", type=int, default=None,
+                    help="Initial LMDB memory map size of databases in MiB. Default is 100.")
+parser.add_argument('--lmdb-map-size-max', dest="mapSizeMax", type=int, default=None,
+                    help="Max LMDB memory map size of databases in MiB. Default is unlimited.")
+parser.add_argument('--mbx-max-age', dest="mbxAge", type=float, default=None,
+                    help="Max seconds to keep mailbox messages. 0 means no age limit. Default is 30 days.")
+parser.add_argument('--mbx-max-count', dest="mbxCount", type=int, default=None,
+                    help="Max number of most recent mailbox messages kept per topic. 0 means no count limit. "
+                         "Default is 1000.")
+parser.add_argument('--mbx-acked', dest="mbxAcked", action='store_true', default=False,
+                    help="Remove mailbox messages acknowledged by mailbox queries.")
+parser.add_argument('--verify-workers', dest="verifyWorkers", type=int, default=None,
+                    help="Number of threads verifying batches of signatures in parallel. Default is to use "
+                         "the shared verify pool if one is already set, otherwise verify serially.")
+parser.add_argument('--metrics-port', dest="metricsPort", type=int, default=None,
+                    help="Local port number of separate admin HTTP server serving Prometheus /metrics. "
+                         "Enables metering. Default is no metrics.")
+parser.add_argument('--metrics-host', dest="metricsHost", default="127.0.0.1",
+                    help="Host address the admin metrics HTTP server listens on. Default is 127.0.0.1.")
 
 
 def launch(args):
@@ -54,28 +75,68 @@ def launch(args):
                alias=args.alias,
                bran=args.bran,
                tcp=int(args.tcp),
-               http=int(args.http))
+               http=int(args.http),
+               mapSize=args.mapSize * 2 ** 20 if args.mapSize else None,
+               mapSizeMax=args.mapSizeMax * 2 ** 20 if args.mapSizeMax else None,
+               profile=args.profile,
+               verifyWorkers=args.verifyWorkers,
+               retention=mbxRetention(age=args.mbxAge, count=args.mbxCount, acked=args.mbxAcked),
+               metricsPort=args.metricsPort,
+               metricsHost=args.metricsHost)
 
     logger.info("\n******* Ended Witness for %s listening: http/%s, tcp/%s"
                 ".******\n\n", args.name, args.http, args.tcp)
 
 
-def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0):
+def mbxRetention(age=None, count=None, acked=False):
+    """
+    Returns witness mailbox Retention policy built from indirecting.WitnessRetention
+    with age and count overridden when provided where 0 means no limit.
+
+    Parameters:
+        age (float | None): max seconds to keep messages
+        count (int | None): max number of most recent messages kept per topic
+        acked (bool): True means remove acknowledged messages
+    """
+    default = indirecting.WitnessRetention
+    return storing.Retention(age=default.age if age is None else (age or None),
+                             count=default.count if count is None else (count or None),
+                             acked=acked or default.acked)
+
+
+def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http=5632, expire=0.0,
+               mapSize=None, mapSizeMax=None, profile=None, verifyWorkers=None, retention=None,
+               metricsPort=None, metricsHost="127.0.0.1"):
     """
     Setup and run one witness
+
+    Parameters:
+        mapSize (int): initial LMDB memory map size in bytes of databases
+        mapSizeMax (int): max LMDB memory map size in bytes of databases
+        profile (str): LMDB tuning profile of databases
+        verifyWorkers (int): threads verifying batches of signatures in parallel
+        retention (Retention): default retention policy of witness mailbox.
+            None means use indirecting.WitnessRetention
+        metricsPort (int | None): port of separate admin HTTP server serving
+            '/metrics'. None means do not serve metrics nor enable metering
+        metricsHost (str): host address admin HTTP server listens on
     """
+    if metricsPort is not None:
+        help.meter.enabled = True
 
+    dbOpts = dict(mapSize=mapSize, mapSizeMax=mapSizeMax, profile=profile)
     ks = keeping.Keeper(name=name,
                         base=base,
                         temp=False,
-                        reopen=True)
+                        reopen=True,
+                        **dbOpts)
 
     aeid = ks.gbls.get('aeid')
 
     if aeid is None:
-        hby = habbing.Habery(name=name, base=base, bran=bran)
+        hby = habbing.Habery(name=name, base=base, bran=bran, verifyWorkers=verifyWorkers, **dbOpts)
     else:
-        hby = existing.setupHby(name=name, base=base, bran=bran)
+        hby = existing.setupHby(name=name, base=base, bran=bran, verifyWorkers=verifyWorkers, **dbOpts)
 
     hbyDoer = habbing.HaberyDoer(habery=hby)  # setup doer
     doers = [hbyDoer]
@@ -83,6 +144,9 @@ def runWitness(name="witness", base="", alias="witness", bran="", tcp=5631, http
     doers.extend(indirecting.setupWitness(alias=alias,
                                           hby=hby,
                                           tcpPort=tcp,
-                                          httpPort=http))
+                                          httpPort=http,
+                                          retention=retention,
+                                          metricsPort=metricsPort,
+                                          metricsHost=metricsHost))
 
     directing.runController(doers=doers, expire=expire)
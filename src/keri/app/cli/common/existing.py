@@ -12,7 +12,7 @@ from keri import kering
 from keri.app import habbing, keeping
 
 
-def setupHby(name, base="", bran=None, cf=None):
+def setupHby(name, base="", bran=None, cf=None, **kwa):
     """ Create Habery off of existing directory
 
     Parameters:
@@ -20,6 +20,8 @@ def setupHby(name, base="", bran=None, cf=None):
         base(str): optional base directory prefix
         bran(str): optional passcode if the Habery was created encrypted
         cf (Configer): optional configuration for loading reference data
+        kwa (dict): additional Habery options such as LMDB mapSize,
+            mapSizeMax and profile
 
     Returns:
           Habery:  the configured habery
@@ -44,7 +46,7 @@ def setupHby(name, base="", bran=None, cf=None):
                 bran = bran.replace("-", "")
 
             retries += 1
-            hby = habbing.Habery(name=name, base=base, bran=bran, cf=cf, free=True)
+            hby = habbing.Habery(name=name, base=base, bran=bran, cf=cf, free=True, **kwa)
             break
         except (kering.AuthError, ValueError):
             if retries >= 3:
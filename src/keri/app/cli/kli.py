@@ -3,19 +3,69 @@
 keri.kli.commands module
 
 """
-import logging
-import multicommand
+import argparse
+import importlib
+import pkgutil
+import sys
+
+from hio.base import doing
 from keri import help
 
-from keri.app import directing
 from keri.app.cli import commands
 
 logger = help.ogler.getLogger()
 
 
+def resolve(argv, pkg=commands):
+    """ Resolve parser of subcommand selected by argv importing only the modules
+    on the path to it instead of every command module like multicommand.
+
+    Parameters:
+        argv (list): of str command line arguments without program name
+        pkg (module): package of command modules where subpackages are groups
+            of subcommands
+
+    Returns:
+        tuple: (parser, rest) of ArgumentParser of selected subcommand and list
+            of remaining arguments for it. None when argv does not select a
+            subcommand module such as for help or an unknown command
+
+    """
+    names = ["kli"]
+    for idx, arg in enumerate(argv):
+        infos = {info.name.rsplit(".", 1)[-1]: info
+                 for info in pkgutil.iter_modules(pkg.__path__, pkg.__name__ + ".")}
+        if arg not in infos:
+            return None
+
+        info = infos[arg]
+        mod = importlib.import_module(info.name)
+        names.append(arg)
+        if info.ispkg:
+            pkg = mod
+            continue
+
+        parser = getattr(mod, "parser", None)
+        if not isinstance(parser, argparse.ArgumentParser):
+            return None
+
+        parser.prog = " ".join(names)
+        return parser, argv[idx + 1:]
+
+    return None
+
+
 def main():
-    parser = multicommand.create_parser(commands)
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    resolved = resolve(argv)
+    if resolved is not None:
+        parser, rest = resolved
+        args = parser.parse_args(rest)
+    else:  # help or unknown command so load all commands
+        import multicommand
+
+        parser = multicommand.create_parser(commands)
+        args = parser.parse_args(argv)
 
     if not hasattr(args, 'handler'):
         parser.print_help()
@@ -23,7 +73,9 @@ def main():
 
     try:
         doers = args.handler(args)
-        directing.runController(doers=doers, expire=0.0)
+        # same as directing.runController without importing the event stack
+        doist = doing.Doist(limit=0.0, tock=0.03125, real=True)
+        doist.do(doers=doers)
 
     except Exception as ex:
         print(f"ERR: {ex}")
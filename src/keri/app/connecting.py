@@ -9,18 +9,51 @@ import json
 from ordered_set import OrderedSet as oset
 
 from keri import kering
+from keri.help import helping
 
 
 class Organizer:
-    """ Organizes contacts relating contact information to AIDs """
+    """ Organizes contacts relating contact information to AIDs
 
-    def __init__(self, hby):
+    Contact field values are indexed by field and case folded value in .hby.db.cidx
+    so that searches and grouping scan only the entries of one field in value
+    order. Verified contacts are cached by identifier prefix and reused while
+    their signed contact data and signature are unchanged in the database.
+
+    """
+    CacheSize = 4096  # maximum number of verified contacts cached
+
+    def __init__(self, hby, size=None):
         """ Create contact Organizer
 
         Parameters:
             hby (Habery): database environment for contact information
+            size (int): maximum number of verified contacts cached.
+                None means use .CacheSize
         """
         self.hby = hby
+        self.cache = helping.lrudict(size=size if size is not None else self.CacheSize)
+
+        if (not self.hby.db.readonly and next(self.hby.db.cidx.getItemIter(), None) is None
+                and next(self.hby.db.cfld.getItemIter(), None) is not None):
+            self.reindex()
+
+    def reindex(self):
+        """ Rebuild field value index from contact field values """
+        with self.hby.db.txn(write=True):
+            self.hby.db.cidx.trim()
+            for (pre, field), val in self.hby.db.cfld.getItemIter():
+                self._index(pre, field, val)
+
+    def _index(self, pre, field, val):
+        """ Add field val of contact pre to field value index """
+        self.hby.db.cidx.pin(keys=(field, val.lower(), pre), val=val)
+
+    def _unindex(self, pre, field):
+        """ Remove current value of field of contact pre from field value index """
+        val = self.hby.db.cfld.get(keys=(pre, field))
+        if val is not None:
+            self.hby.db.cidx.rem(keys=(field, val.lower(), pre))
 
     def update(self, pre, data):
         """ Add or update contact information in data for the identfier prefix
@@ -39,11 +72,14 @@ class Organizer:
         raw = json.dumps(existing).encode("utf-8")
         cigar = self.hby.signator.sign(ser=raw)
 
-        self.hby.db.ccigs.pin(keys=(pre,), val=cigar)
-        self.hby.db.cons.pin(keys=(pre,), val=raw)
+        with self.hby.db.txn(write=True):
+            self.hby.db.ccigs.pin(keys=(pre,), val=cigar)
+            self.hby.db.cons.pin(keys=(pre,), val=raw)
 
-        for field, val in data.items():
-            self.hby.db.cfld.pin(keys=(pre, field), val=val)
+            for field, val in data.items():
+                self._unindex(pre, field)
+                self.hby.db.cfld.pin(keys=(pre, field), val=val)
+                self._index(pre, field, val)
 
     def replace(self, pre, data):
         """ Replace all contact information for identifier prefix with data
@@ -53,8 +89,9 @@ class Organizer:
             data (dict): data to replace contact information with
 
         """
-        self.rem(pre)
-        self.update(pre, data)
+        with self.hby.db.txn(write=True):
+            self.rem(pre)
+            self.update(pre, data)
 
     def set(self, pre, field, val):
         """ Add or replace one value in contact information for identifier prefix
@@ -68,7 +105,6 @@ class Organizer:
         data = self.get(pre) or dict()
         data[field] = val
         self.replace(pre, data)
-        self.hby.db.cfld.pin(keys=(pre, field), val=val)
 
     def unset(self, pre, field):
         """ Remove field from contact information for identifier prefix
@@ -81,7 +117,6 @@ class Organizer:
         data = self.get(pre)
         del data[field]
         self.replace(pre, data)
-        self.hby.db.cfld.rem(keys=(pre, field))
 
     def rem(self, pre):
         """ Remove all contact information for identifier prefix
@@ -92,9 +127,13 @@ class Organizer:
         Returns:
 
         """
-        self.hby.db.ccigs.rem(keys=(pre,))
-        self.hby.db.cons.rem(keys=(pre,))
-        return self.hby.db.cfld.trim(keys=(pre,))
+        with self.hby.db.txn(write=True):
+            for (_, field), val in self.hby.db.cfld.getItemIter(keys=(pre, "")):
+                self.hby.db.cidx.rem(keys=(field, val.lower(), pre))
+            self.hby.db.ccigs.rem(keys=(pre,))
+            self.hby.db.cons.rem(keys=(pre,))
+            self.cache.pop(pre, None)
+            return self.hby.db.cfld.trim(keys=(pre,))
 
     def get(self, pre, field=None):
         """ Retrieve all contact information for identifier prefix
@@ -112,24 +151,33 @@ class Organizer:
             return None
         cigar = self.hby.db.ccigs.get(keys=(pre,))
 
-        if not self.hby.signator.verify(ser=raw.encode("utf-8"), cigar=cigar):
-            raise kering.ValidationError(f"failed signature on {pre} contact data")
+        cached = self.cache.get(pre)
+        if cached is not None and cigar is not None and cached[:2] == (raw, cigar.qb64):
+            data = cached[2]
+        else:
+            if not self.hby.signator.verify(ser=raw.encode("utf-8"), cigar=cigar):
+                raise kering.ValidationError(f"failed signature on {pre} contact data")
 
-        data = json.loads(raw)
-        if data is None:
-            return None
+            data = json.loads(raw)
+            if data is None:
+                return None
+
+            data["id"] = pre
+            self.cache[pre] = (raw, cigar.qb64, data)
 
         if field is not None:
             return data[field] if field in data else None
 
-        data["id"] = pre
-        return data
+        return dict(data)  # copy so callers may modify
 
-    def list(self):
+    def list(self, limit=None):
         """ Return list of all contact information for all remote identfiers
 
+        Parameters:
+            limit (int): maximum number of contacts to return. None means all
+
         Returns:
-            list: All contact information
+            list: All contact information ordered by identifier prefix
 
         """
         key = ""
@@ -139,6 +187,8 @@ class Organizer:
             if pre != key:
                 if data is not None:
                     contacts.append(data)
+                if limit is not None and len(contacts) >= limit:
+                    return contacts
                 data = dict(id=pre)
                 key = pre
 
@@ -149,46 +199,91 @@ class Organizer:
 
         return contacts
 
-    def find(self, field, val):
+    def scan(self, field, val=None, prefix=False):
+        """ Iterate index of field value to contact in case folded value order
+
+        Parameters:
+            field (str): field name to scan
+            val (str): value to filter by. None means no filter
+            prefix (bool): True means val matches values that start with val
+                ignoring case. False means val is regular expression that matches
+                anywhere in values ignoring case
+
+        Returns:
+            Iterator: of (value, pre) duples of field value and identifier prefix
+                of each contact with field
+
+        """
+        if val is not None and prefix:
+            keys, prog = (field, val.lower()), None
+        else:
+            keys = (field, "")
+            prog = re.compile(f".*{val}.*", re.I) if val is not None else None
+
+        for keys, v in self.hby.db.cidx.getItemIter(keys=keys):
+            if prog is None or prog.match(v):
+                yield v, keys[-1]
+
+    def find(self, field, val, prefix=False, limit=None):
         """ Find all contact information for all contacts that have the val in field
 
         Parameters:
             field (str): field name to search for
             val (Union[str,bytes,list]): value to search for
+            prefix (bool): True means match values that start with val ignoring case
+            limit (int): maximum number of contacts to return. None means all
 
         Returns:
-            list: All contacts that match the val in field
+            list: All contacts that match the val in field ordered by value
 
         """
         pres = []
-        prog = re.compile(f".*{val}.*", re.I)
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field and prog.match(v):
-                pres.append(pre)
+        for _, pre in self.scan(field, val, prefix=prefix):
+            if limit is not None and len(pres) >= limit:
+                break
+            pres.append(pre)
 
         return [self.get(pre) for pre in pres]
 
-    def values(self, field, val=None):
+    def values(self, field, val=None, prefix=False, limit=None):
         """ Find unique values for field in all contacts
 
         Args:
             field (str): field to load values for
             val (Optional(str|None): optional filter for the value of the grouped field
+            prefix (bool): True means filter matches values that start with val ignoring case
+            limit (int): maximum number of values to return. None means all
 
         Returns:
-            list: Unique values from all contacts for field
+            list: Unique values from all contacts for field in case folded order
 
         """
-        prog = re.compile(f".*{val}.*", re.I) if val is not None else None
-
         vals = oset()
-        for (pre, f), v in self.hby.db.cfld.getItemIter():
-            if f == field:
-                if prog is None or prog.match(v):
-                    vals.add(v)
+        for v, _ in self.scan(field, val, prefix=prefix):
+            if v not in vals and limit is not None and len(vals) >= limit:
+                break
+            vals.add(v)
 
         return list(vals)
 
+    def group(self, field, val=None, prefix=False):
+        """ Group contacts by unique values of field in one scan of field index
+
+        Args:
+            field (str): field to group by
+            val (Optional(str|None): optional filter for the value of the grouped field
+            prefix (bool): True means filter matches values that start with val ignoring case
+
+        Returns:
+            dict: lists of contacts keyed by unique value of field in case folded order
+
+        """
+        groups = dict()
+        for v, pre in self.scan(field, val, prefix=prefix):
+            groups.setdefault(v, []).append(self.get(pre))
+
+        return groups
+
     def setImg(self, pre, typ, stream):
         """ Upload image for identifier prefix
 
@@ -10,12 +10,15 @@ module for enveloping and forwarding KERI message
 from hio.base import doing
 from hio.help import decking
 
+from keri import help
 from keri import kering
 from keri.app import agenting
 from keri.core import coring, eventing
 from keri.db import dbing
 from keri.peer import exchanging
 
+logger = help.ogler.getLogger()
+
 
 class Postman(doing.DoDoer):
     """
@@ -23,13 +26,44 @@ class Postman(doing.DoDoer):
     delivers to sends them to one of the target recipient's witnesses for store and forward
     to the intended recipient
 
-    """
+    Enveloped messages are queued per destination witness. Each destination is
+    delivered by its own doer so that a slow or unreachable witness only delays
+    messages queued for that witness. Up to .batch queued messages for the same
+    witness are sent together as one CESR stream. A failed or timed out
+    delivery is retried up to .retries times with exponential backoff.
+
+    Attributes:
+        hby (Habery): environment of sending habs
+        evts (Deck): incoming events to envelope and deliver
+        cues (Deck): outgoing cues of delivered events
+        limit (int): max number of destinations delivered to concurrently
+        batch (int): max number of queued messages sent in one stream
+        retries (int): max number of retries of a failed delivery
+        backoff (float): seconds before first retry, doubled on each retry
+        timeout (float): seconds to wait for a delivery before it fails
+        queues (dict): Decks of (evt, msg) duples keyed by (src, wit) destination
+        forwarders (dict): forwardDo doers keyed by (src, wit) destination
 
-    def __init__(self, hby, evts=None, cues=None, klas=None, **kwa):
+    """
+    Limit = 8  # default max concurrent destinations
+    Batch = 16  # default max messages per stream
+    Retries = 3  # default max retries of failed delivery
+    Backoff = 1.0  # default seconds before first retry
+    Timeout = 30.0  # default seconds before delivery fails
+
+    def __init__(self, hby, evts=None, cues=None, klas=None, limit=None, batch=None,
+                 retries=None, backoff=None, timeout=None, **kwa):
         self.hby = hby
         self.evts = evts if evts is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
         self.klas = klas if klas is not None else agenting.HttpWitnesser
+        self.limit = limit if limit is not None else self.Limit
+        self.batch = batch if batch is not None else self.Batch
+        self.retries = retries if retries is not None else self.Retries
+        self.backoff = backoff if backoff is not None else self.Backoff
+        self.timeout = timeout if timeout is not None else self.Timeout
+        self.queues = dict()
+        self.forwarders = dict()
 
         doers = [doing.doify(self.deliverDo)]
         super(Postman, self).__init__(doers=doers, **kwa)
@@ -38,8 +72,10 @@ class Postman(doing.DoDoer):
         """
         Returns:  doifiable Doist compatible generator method that processes
                    a queue of messages and envelopes them in a `fwd` message
-                   and sends them to one of the witnesses of the recipient for
-                   store and forward.
+                   and queues them for delivery to one of the witnesses of the
+                   recipient for store and forward. Starts a forwardDo doer per
+                   destination witness with queued messages up to .limit
+                   concurrent destinations.
 
         Usage:
             add result of doify on this method to doers list
@@ -67,10 +103,6 @@ class Postman(doing.DoDoer):
                     print(f"exiting because can't find wit for {recp}")
                     continue
 
-                msg = bytearray()
-                msg.extend(introduce(hab, wit))
-                # Transpose the signatures to point to the new location
-
                 # create the forward message with payload embedded at `a` field
                 fwd = exchanging.exchange(route='/fwd', modifiers=dict(pre=recp, topic=tpc),
                                           payload=srdr.ked)
@@ -86,20 +118,96 @@ class Postman(doing.DoDoer):
                                               count=(len(atc) // 4)).qb64b)
                     ims.extend(atc)
 
-                witer = agenting.witnesser(hab=hab, wit=wit)
+                dest = (src, wit)
+                if dest not in self.queues:
+                    self.queues[dest] = decking.Deck()
+                self.queues[dest].append((evt, ims))
+
+            for dest in [dest for dest, doer in self.forwarders.items() if doer.done]:
+                self.remove([self.forwarders.pop(dest)])
+
+            for dest, queue in list(self.queues.items()):
+                if len(self.forwarders) >= self.limit:
+                    break
+                if dest in self.forwarders:
+                    continue
+                if not queue:
+                    del self.queues[dest]
+                    continue
+
+                doer = doing.doify(self.forwardDo, dest=dest)
+                self.forwarders[dest] = doer
+                self.extend([doer])
 
+            yield self.tock
+
+    def forwardDo(self, tymth=None, tock=0.0, dest=None, **opts):
+        """
+        Returns:  doifiable Doist compatible generator method that delivers
+                   queued messages for destination dest in batches of up to
+                   .batch messages per stream until its queue is empty.
+
+        Parameters:
+            dest (tuple): (src, wit) of qb64 prefixes of sending hab and
+                destination witness
+
+        Usage:
+            add result of doify on this method to doers list
+        """
+        self.wind(tymth)
+        self.tock = tock
+        _ = (yield self.tock)
+
+        src, wit = dest
+        hab = self.hby.habs[src]
+        queue = self.queues[dest]
+
+        while queue:
+            batch = []
+            while queue and len(batch) < self.batch:
+                batch.append(queue.popleft())
+
+            msg = bytearray()
+            msg.extend(introduce(hab, wit))
+            for _, ims in batch:
                 msg.extend(ims)
+
+            tries = 0
+            while True:
+                witer = agenting.witnesser(hab=hab, wit=wit)
                 witer.msgs.append(bytearray(msg))  # make a copy
                 self.extend([witer])
 
-                while not witer.idle:
+                start = self.tyme
+                while not witer.idle and (self.tyme - start) < self.timeout:
                     _ = (yield self.tock)
 
-                self.cues.append(dict(dest=recp, topic=tpc, said=srdr.said))
-                yield self.tock
+                delivered = witer.idle and not witer.failed
+                if not delivered:
+                    witer.failed = True  # do not pool connection
+                self.remove([witer])  # release connection
+
+                if delivered or tries >= self.retries:
+                    break
 
+                delay = self.backoff * 2 ** tries
+                tries += 1
+                logger.info(f"retrying delivery to {wit} in {delay} seconds")
+                start = self.tyme
+                while (self.tyme - start) < delay:
+                    _ = (yield self.tock)
+
+            if not delivered:
+                logger.error(f"unable to deliver {len(batch)} messages to {wit}")
+                continue
+
+            for evt, _ in batch:
+                self.cues.append(dict(dest=evt["dest"], topic=evt["topic"],
+                                      said=evt["serder"].said))
             yield self.tock
 
+        return True
+
     def send(self, src, dest, topic, serder, attachment=None):
         """
         Utility function to queue a msg on the Postman's buffer for
@@ -6,6 +6,7 @@ keri.app.habbing module
 """
 import json
 import os
+from concurrent import futures
 from contextlib import contextmanager
 from urllib.parse import urlsplit
 from math import ceil
@@ -16,7 +17,7 @@ from hio.core.tcp import clienting, serving
 from hio.help import hicting
 from keri.peer import exchanging
 
-from . import keeping, configing, directing
+from . import keeping, configing, directing, pooling
 from .. import help
 from .. import kering
 from ..core import coring, eventing, parsing, routing
@@ -198,6 +199,8 @@ class Habery:
             temporary storage of databases and config file
             weak resources for stretch of salty key
 
+        dbOpts (dict): LMDB mapSize, mapSizeMax and profile options of .ks,
+            .db and of the other databases set up for this Habery
         ks (keeping.Keeper): lmdb key store
         db (basing.Baser): lmdb data base for KEL etc
         cf (configing.Configer): config file instance
@@ -206,6 +209,9 @@ class Habery:
         rvy (routing.Revery): factory that processes reply 'rpy' messages
         kvy (eventing.Kevery): factory for local processing of local event msgs
         psr (parsing.Parser):  parses local messages for .kvy .rvy
+        pool (pooling.ClientPool): persistent witness connections shared by Habs
+        verifyPool (futures.ThreadPoolExecutor | None): shared signature
+            verification pool set up by this Habery if any
 
         habs (dict): Hab instances keyed by prefix.
             To look up Hab by name get prefix from db.habs .prefix field using
@@ -221,7 +227,9 @@ class Habery:
     """
 
     def __init__(self, *, name='test', base="", temp=False,
-                 ks=None, db=None, cf=None, clear=False, headDirPath=None, **kwa):
+                 ks=None, db=None, cf=None, clear=False, headDirPath=None,
+                 keverCacheSize=None, signerCacheTtl=None, mapSize=None,
+                 mapSizeMax=None, profile=None, verifyWorkers=None, workers=None, **kwa):
         """
         Initialize instance.
 
@@ -243,6 +251,24 @@ class Habery:
                           False means do not remove directory upon close when
                             reopening
             headDirPath (str): directory override
+            keverCacheSize (int): max number of kevers held in memory by
+                .kevers. None means use Baser.KeverCacheSize
+            signerCacheTtl (float): seconds decrypted signing keys are held in
+                memory by .mgr for reuse when signing. None means do not cache
+            mapSize (int): initial size in bytes of LMDB memory map of .ks, .db
+                and of databases such as Reger and Mailboxer set up for this
+                Habery. None means use LMDBer.MapSize
+            mapSizeMax (int): max size in bytes those memory maps may grow to.
+                None means use LMDBer.MapSizeMax
+            profile (str | dict): LMDB env tuning profile of those databases
+                such as durable, balanced or fast. None means use LMDBer.Profile
+            verifyWorkers (int): number of threads of the shared pool that
+                Kevery and Verifier use to verify batches of signatures in
+                parallel while this Habery is open. None or 0 means verify
+                serially or use the pool already set by eventing.setVerifyPool
+            workers (int): maximum number of concurrent salty key stretches
+                of .mgr when creating keys. None means use SaltyCreator.Workers
+                capped by tier
 
 
         Parameters: Passed through via kwa to setup for later init
@@ -275,19 +301,25 @@ class Habery:
         self.name = name
         self.base = base
         self.temp = temp
+        self.dbOpts = dict(mapSize=mapSize, mapSizeMax=mapSizeMax, profile=profile)
 
         self.ks = ks if ks is not None else keeping.Keeper(name=self.name,
                                                            base=self.base,
                                                            temp=self.temp,
                                                            reopen=True,
                                                            clear=clear,
-                                                           headDirPath=headDirPath)
+                                                           headDirPath=headDirPath,
+                                                           **self.dbOpts)
         self.db = db if db is not None else basing.Baser(name=self.name,
                                                          base=self.base,
                                                          temp=self.temp,
                                                          reopen=True,
                                                          clear=clear,
-                                                         headDirPath=headDirPath)
+                                                         headDirPath=headDirPath,
+                                                         keverCacheSize=keverCacheSize,
+                                                         **self.dbOpts)
+        if db is not None and keverCacheSize is not None:
+            self.db.kevers.size = keverCacheSize
         self.cf = cf if cf is not None else configing.Configer(name=self.name,
                                                                base=self.base,
                                                                temp=self.temp,
@@ -295,12 +327,21 @@ class Habery:
                                                                clear=clear)
 
         self.mgr = None  # wait to setup until after ks is known to be opened
+        self.signerCacheTtl = signerCacheTtl
+        self.workers = workers
         self.rtr = routing.Router()
         self.rvy = routing.Revery(db=self.db, rtr=self.rtr)
         self.exc = exchanging.Exchanger(db=self.db, handlers=[], local=True)
         self.kvy = eventing.Kevery(db=self.db, lax=False, local=True, rvy=self.rvy)
         self.kvy.registerReplyRoutes(router=self.rtr)
         self.psr = parsing.Parser(framed=True, kvy=self.kvy, rvy=self.rvy, exc=self.exc)
+        self.pool = pooling.ClientPool()
+        self.verifyPool = None
+        self._verifyPrior = None
+        if verifyWorkers:
+            self.verifyPool = futures.ThreadPoolExecutor(max_workers=verifyWorkers,
+                                                         thread_name_prefix="verify")
+            self._verifyPrior = eventing.setVerifyPool(pool=self.verifyPool)
         self.habs = {}  # empty .habs
         self._signator = None
         self.inited = False
@@ -376,8 +417,11 @@ class Habery:
             salt = coring.Salter(qb64=salt).qb64
 
         try:
+            cache = (keeping.SignerCache(ttl=self.signerCacheTtl)
+                     if self.signerCacheTtl is not None else None)
             self.mgr = keeping.Manager(ks=self.ks, seed=seed, aeid=aeid, pidx=pidx,
-                                       algo=algo, salt=salt, tier=tier)
+                                       algo=algo, salt=salt, tier=tier, cache=cache,
+                                       workers=self.workers)
         except kering.AuthError as ex:
             self.close()
             raise ex
@@ -406,7 +450,7 @@ class Habery:
 
             # create Hab instance and inject dependencies
             hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                      rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                      rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                       name=name, pre=pre, temp=self.temp, smids=habord.smids)
 
             # Rules for acceptance
@@ -448,7 +492,7 @@ class Habery:
                 events allowed in KEL for this Hab
         """
         hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                  rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                  rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                   name=name, temp=self.temp)
 
         hab.make(**kwa)
@@ -520,7 +564,7 @@ class Habery:
 
         # create group Hab in this Habery
         hab = Hab(ks=self.ks, db=self.db, cf=self.cf, mgr=self.mgr,
-                  rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr,
+                  rtr=self.rtr, rvy=self.rvy, kvy=self.kvy, psr=self.psr, pool=self.pool,
                   name=group, mhab=mhab, smids=smids, rmids=rmids, temp=self.temp)
 
         hab.make(**kwa)  # finish making group hab with injected pass throughs
@@ -570,6 +614,9 @@ class Habery:
         Parameters:
            clear is boolean, True means clear resource directories
         """
+        if self.mgr and self.mgr.cache is not None:
+            self.mgr.cache.clear()
+
         if self.ks:
             self.ks.close(clear=self.ks.temp or clear)
 
@@ -579,6 +626,15 @@ class Habery:
         if self.cf:
             self.cf.close(clear=self.cf.temp)
 
+        self.pool.close()
+
+        if self.verifyPool is not None:  # restore prior unless replaced since
+            current = eventing.setVerifyPool(pool=self._verifyPrior)
+            if current is not self.verifyPool:
+                eventing.setVerifyPool(pool=current)
+            self.verifyPool.shutdown(wait=False)
+            self.verifyPool = None
+
     @property
     def kevers(self):
         """
@@ -784,6 +840,7 @@ class Hab:
         rvy (routing.Revery): factory that processes reply 'rpy' messages
         kvy (eventing.Kevery): factory for local processing of local event msgs
         psr (parsing.Parser):  parses local messages for .kvy .rvy
+        pool (pooling.ClientPool | None): persistent witness connections if any
 
 
      Attributes:
@@ -819,7 +876,7 @@ class Hab:
 
     def __init__(self, ks, db, cf, mgr, rtr, rvy, kvy, psr, *,
                  name='test', pre=None, mhab=None, smids=None, rmids=None,
-                 temp=False):
+                 temp=False, pool=None):
         """
         Initialize instance.
 
@@ -850,6 +907,8 @@ class Hab:
             temp (bool): True means testing:
                 use weak level when salty algo for stretching in key creation
                 for incept and rotate of keys for this hab.pre
+            pool (pooling.ClientPool | None): persistent witness connections
+                shared with other Habs. None means open connection per use
 
         """
         self.db = db  # injected
@@ -860,6 +919,7 @@ class Hab:
         self.rvy = rvy  # injected
         self.kvy = kvy  # injected
         self.psr = psr  # injected
+        self.pool = pool  # injected
 
 
         self.name = name
@@ -1316,6 +1376,25 @@ class Hab:
             ondices (list[int | None] | None): other indices (offsets)
                 when indexed is True. See Manager.sign
 
+        """
+        return self.signMany(sers=[ser], verfers=verfers, indexed=indexed,
+                             rotated=rotated, indices=indices, ondices=ondices)[0]
+
+    def signMany(self, sers, verfers=None, indexed=True, rotated=False,
+                 indices=None, ondices=None, workers=None):
+        """Sign each serialization in sers as .sign would, resolving signing keys
+        and indices once for the batch. Returns list of one list of signatures
+        per serialization in order.
+
+        Parameters:
+            sers (Iterable[bytes]): serializations to sign
+            verfers (list[Verfer] | None): See .sign
+            indexed (bool): See .sign
+            rotated (bool): See .sign
+            indices (list[int] | None): See .sign
+            ondices (list[int | None] | None): See .sign
+            workers (int | None): threads for large batches. See Manager.signMany
+
         """
         if verfers is None:
             verfers = self.kever.verfers
@@ -1362,18 +1441,20 @@ class Hab:
                 pni = csi  # backwards compatible is both same
                 # in the future may want to fix this so pni = None works
 
-            return (self.mhab.sign(ser=ser,
+            return (self.mhab.signMany(sers=sers,
                                        verfers=[merfer],
                                        indexed=indexed,
                                        indices=[csi],
-                                       ondices=[pni]))
+                                       ondices=[pni],
+                                       workers=workers))
 
         else:
-            return self.mgr.sign(ser=ser,
-                                 verfers=verfers,
-                                 indexed=indexed,
-                                 indices=indices,
-                                 ondices=ondices)
+            return self.mgr.signMany(sers=sers,
+                                     verfers=verfers,
+                                     indexed=indexed,
+                                     indices=indices,
+                                     ondices=ondices,
+                                     workers=workers)
 
 
 
@@ -1413,6 +1494,24 @@ class Hab:
         Useful for endorsing message when provided via serder such as state,
         reply, query or similar.
         """
+        return self.endorseMany([serder], last=last, pipelined=pipelined)[0]
+
+
+    def endorseMany(self, serders, last=False, pipelined=True, workers=None):
+        """
+        Returns list of msgs one per serder in serders each endorsed as by
+        .endorse with signing keys looked up once for the batch.
+
+        Parameters:
+            serders (Iterable[Serder]): instances of msgs
+            last (bool): See .endorse
+            pipelined (bool): See .endorse
+            workers (int | None): threads for large batches. See Manager.signMany
+
+        Useful for endorsing many replies such as from .makeEndRole or
+        .makeLocScheme.
+        """
+        serders = list(serders)
         if self.kever.prefixer.transferable:
             # create SealEvent or SealLast for endorser's est evt whose keys are
             # used to sign
@@ -1425,22 +1524,22 @@ class Hab:
                                           s=hex(kever.lastEst.s),
                                           d=kever.lastEst.d)
 
-            sigers = self.sign(ser=serder.raw,
-                               indexed=True)
+            sigerss = self.signMany(sers=[serder.raw for serder in serders],
+                                    indexed=True, workers=workers)
 
-            msg = eventing.messagize(serder=serder,
-                                     sigers=sigers,
-                                     seal=seal,
-                                     pipelined=pipelined)
+            return [eventing.messagize(serder=serder,
+                                       sigers=sigers,
+                                       seal=seal,
+                                       pipelined=pipelined)
+                    for serder, sigers in zip(serders, sigerss)]
 
         else:
-            cigars = self.sign(ser=serder.raw,
-                               indexed=False)
-            msg = eventing.messagize(serder=serder,
-                                     cigars=cigars,
-                                     pipelined=pipelined)
-
-        return msg
+            cigarss = self.signMany(sers=[serder.raw for serder in serders],
+                                    indexed=False, workers=workers)
+            return [eventing.messagize(serder=serder,
+                                       cigars=cigars,
+                                       pipelined=pipelined)
+                    for serder, cigars in zip(serders, cigarss)]
 
 
     def exchange(self, serder, save=False):
@@ -2040,8 +2139,8 @@ class Hab:
                 yield msgs
 
             elif cueKin in ("replay",):
-                msgs = cue["msgs"]
-                yield msgs
+                for msg in cue["msgs"]:  # may be lazy iterator so stream each
+                    yield msg
 
             elif cueKin in ("reply",):
                 data = cue["data"]
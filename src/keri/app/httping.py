@@ -136,7 +136,6 @@ def createCESRRequest(msg, client, path=None):
     headers = Hict([
         ("Content-Type", CESR_CONTENT_TYPE),
         ("Content-Length", len(body)),
-        ("connection", "close"),
         (CESR_ATTACHMENT_HEADER, attachments)
     ])
 
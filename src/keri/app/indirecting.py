@@ -32,11 +32,23 @@ from ..vdr.eventing import Tevery
 
 logger = help.ogler.getLogger()
 
+# default retention of witness mailbox messages so that mailboxes stay bounded
+WitnessRetention = storing.Retention(age=30 * 24 * 3600.0, count=1000)
 
-def setupWitness(hby, alias="witness", mbx=None, tcpPort=5631, httpPort=5632):
+
+def setupWitness(hby, alias="witness", mbx=None, tcpPort=5631, httpPort=5632, retention=None,
+                 metricsPort=None, metricsHost="127.0.0.1"):
     """
     Setup witness controller and doers
 
+    Parameters:
+        retention (Retention | None): default retention policy of witness
+            mailbox topics. None means use WitnessRetention unless provided
+            mbx already has a default policy
+        metricsPort (int | None): port of separate admin HTTP server serving
+            '/metrics'. None means do not serve metrics
+        metricsHost (str): host address admin HTTP server listens on
+
     """
     cues = decking.Deck()
     doers = []
@@ -46,10 +58,13 @@ def setupWitness(hby, alias="witness", mbx=None, tcpPort=5631, httpPort=5632):
     if hab is None:
         hab = hby.makeHab(name=alias, transferable=False)
 
-    reger = viring.Reger(name=hab.name, db=hab.db, temp=False)
+    reger = viring.Reger(name=hab.name, db=hab.db, temp=False, **hby.dbOpts)
     verfer = verifying.Verifier(hby=hby, reger=reger)
 
-    mbx = mbx if mbx is not None else storing.Mailboxer(name=alias, temp=hby.temp)
+    mbx = mbx if mbx is not None else storing.Mailboxer(name=alias, temp=hby.temp, **hby.dbOpts)
+    if retention is not None or mbx.policy is None:
+        mbx.policy = retention if retention is not None else WitnessRetention
+    compactor = storing.MailboxCompactor(mbx=mbx)
     forwarder = forwarding.ForwardHandler(hby=hby, mbx=mbx)
     exchanger = exchanging.Exchanger(db=hby.db, handlers=[forwarder])
     clienter = httping.Clienter()
@@ -99,7 +114,14 @@ def setupWitness(hby, alias="witness", mbx=None, tcpPort=5631, httpPort=5632):
                             responses=rep.cues, queries=httpEnd.qrycues)
 
     doers.extend(oobiRes)
-    doers.extend([regDoer, exchanger, directant, serverDoer, httpServerDoer, rep, witStart, *oobiery.doers])
+    doers.extend([regDoer, exchanger, directant, serverDoer, httpServerDoer, rep, witStart, compactor,
+                  *oobiery.doers])
+
+    if metricsPort is not None:
+        adminApp = falcon.App()
+        ending.loadMetricsEnd(app=adminApp, dbs=[hby.db, reger])
+        adminServer = http.Server(host=metricsHost, port=metricsPort, app=adminApp)
+        doers.append(http.ServerDoer(server=adminServer))
 
     return doers
 
@@ -876,6 +898,7 @@ class HttpEnd:
 
         self.mbx = mbx
         self.qrycues = qrycues if qrycues is not None else decking.Deck()
+        self.qryrpys = dict()  # qrycues routed by said of their qry
 
     def on_post(self, req, rep):
         """
@@ -908,7 +931,6 @@ class HttpEnd:
             return
 
         rep.set_header('Cache-Control', "no-cache")
-        rep.set_header('connection', "close")
 
         cr = httping.parseCesrHttpRequest(req=req)
         serder = eventing.Serder(ked=cr.payload, kind=eventing.Serials.json)
@@ -925,18 +947,38 @@ class HttpEnd:
             rep.set_header('Content-Type', "application/json")
             rep.status = falcon.HTTP_204
         elif ilk in (Ilks.qry,):
+            rep.set_header('connection', "close")  # event stream ends with connection
             rep.set_header('Content-Type', "text/event-stream")
             rep.status = falcon.HTTP_200
-            rep.stream = QryRpyMailboxIterable(mbx=self.mbx, cues=self.qrycues, said=serder.said)
+            rep.stream = QryRpyMailboxIterable(mbx=self.mbx, cues=self.qrycues, said=serder.said,
+                                               rpys=self.qryrpys)
 
 
 class QryRpyMailboxIterable:
+    """
+    Iterable that waits for the query response cue with said of its qry and
+    then streams the mailbox named in the cue as a MailboxIterable.
 
-    def __init__(self, cues, mbx, said, retry=5000):
+    Cues are drained from the shared cues deque into rpys keyed by said of
+    their qry, so each waiting iterable finds its own cue with a dict lookup
+    instead of rotating the deque.
+    """
+
+    def __init__(self, cues, mbx, said, retry=5000, rpys=None):
+        """
+        Parameters:
+            cues (Deck): inbound qry response cues
+            mbx (Mailboxer): Mailbox storage
+            said (str): qb64 said of qry to wait for
+            retry (int): retry milliseconds for server sent events
+            rpys (dict): cues drained from cues keyed by said of their qry.
+                Share among iterables that share cues
+        """
         self.mbx = mbx
         self.retry = retry
         self.cues = cues
         self.said = said
+        self.rpys = rpys if rpys is not None else dict()
         self.iter = None
 
     def __iter__(self):
@@ -944,16 +986,18 @@ class QryRpyMailboxIterable:
 
     def __next__(self):
         if self.iter is None:
-            if self.cues:
+            while self.cues:
                 cue = self.cues.popleft()
-                serder = cue["serder"]
-                if serder.said == self.said:
-                    kin = cue["kin"]
-                    if kin == "stream":
-                        self.iter = iter(MailboxIterable(mbx=self.mbx, pre=cue["pre"], topics=cue["topics"],
-                                                         retry=self.retry))
-                else:
-                    self.cues.append(cue)
+                self.rpys[cue["serder"].said] = cue
+
+            if (cue := self.rpys.pop(self.said, None)) is not None:
+                kin = cue["kin"]
+                if kin == "stream":
+                    if cue.get("source") == cue["pre"]:  # only querier acks its own mail
+                        for topic, idx in cue["topics"].items():  # query acks all before idx
+                            self.mbx.ackTopic(topic=cue["pre"] + topic, fn=idx)
+                    self.iter = iter(MailboxIterable(mbx=self.mbx, pre=cue["pre"], topics=cue["topics"],
+                                                     retry=self.retry))
 
             return b''
 
@@ -961,6 +1005,14 @@ class QryRpyMailboxIterable:
 
 
 class MailboxIterable:
+    """
+    Iterable of server sent events of messages stored in mailbox for topics of
+    identifier prefix pre.
+
+    After the first full read of all topics only topics whose .mbx watermark
+    advanced past the index already sent are read again, and nothing is read
+    at all while .mbx has not stored anything since the last look.
+    """
     TimeoutMBX = 30000000
 
     def __init__(self, mbx, pre, topics, retry=5000):
@@ -968,9 +1020,11 @@ class MailboxIterable:
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.seen = None  # .mbx.seq at last read, None means not yet read
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
+        help.meter.count("keri_mailbox_streams_total", state="opened")
         return self
 
     def __next__(self):
@@ -980,8 +1034,17 @@ class MailboxIterable:
                 return bytearray(f"retry: {self.retry}\n\n".encode("utf-8"))
 
             data = bytearray()
+            if self.seen == self.mbx.seq:  # nothing stored since last read
+                self.end = time.perf_counter()
+                return data
+
+            scanned = self.seen is not None
+            self.seen = self.mbx.seq
             for topic, idx in self.topics.items():
                 key = self.pre + topic
+                if scanned and self.mbx.tops.get(key.encode("utf-8"), 0) <= idx:
+                    continue  # topic did not advance
+
                 for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
                     data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
                                           .encode("utf-8")))
@@ -989,9 +1052,11 @@ class MailboxIterable:
                     data.extend(b'\n\n')
                     idx = idx + 1
                     self.start = time.perf_counter()
+                    help.meter.count("keri_mailbox_messages_streamed_total")
 
                 self.topics[topic] = idx
             self.end = time.perf_counter()
             return data
 
+        help.meter.count("keri_mailbox_streams_total", state="closed")
         raise StopIteration
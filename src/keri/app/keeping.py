@@ -26,14 +26,16 @@ import os
 import stat
 import json
 import math
+import time
 
 from typing import Union
 from dataclasses import dataclass, asdict, field
 from collections import namedtuple, deque
+from concurrent.futures import ThreadPoolExecutor
 
 from hio.base import doing
 
-from .. import kering
+from .. import help, kering
 from ..help import helping
 from ..core import coring
 from ..db import dbing, subing, koming
@@ -445,8 +447,15 @@ class SaltyCreator(Creator):
     """
     Class for creating a key pair based on random salt plus path stretch algorithm.
 
+    The stretches of the key pairs of one .create call are independent so are
+    run concurrently in up to .workers threads. Stretching is done in libsodium
+    which releases the GIL. Each concurrent stretch holds its own memory, up to
+    1 GiB at Tiers.high, so .workers bounds memory use as well as parallelism
+    and the default .workers is capped by tier in .TierWorkers.
+
     Attributes:
         .salter is salter instance
+        .workers is int maximum number of concurrent stretches. 1 means serial
 
     Properties:
 
@@ -458,7 +467,10 @@ class SaltyCreator(Creator):
         ._salter holds instance for .salter property
     """
 
-    def __init__(self, salt=None, stem=None, tier=None, **kwa):
+    Workers = min(4, os.cpu_count() or 1)  # default maximum concurrent stretches
+    TierWorkers = {coring.Tiers.med: 2, coring.Tiers.high: 1}  # default caps by tier
+
+    def __init__(self, salt=None, stem=None, tier=None, workers=None, **kwa):
         """
         Setup Creator.
 
@@ -467,11 +479,17 @@ class SaltyCreator(Creator):
             stem is path modifier wsed with salt to derive private keys.
                     if stem is None then uses pidx
             tier is derivation criticality that determines how much hashing to use.
+            workers is int maximum number of concurrent stretches.
+                    if workers is None then uses .Workers capped by
+                    .TierWorkers of tier
 
         """
         super(SaltyCreator, self).__init__(**kwa)
         self.salter = coring.Salter(qb64=salt, tier=tier)
         self._stem = stem if stem is not None else ''
+        if workers is None:
+            workers = min(self.Workers, self.TierWorkers.get(self.tier, self.Workers))
+        self.workers = max(1, workers)
 
     @property
     def salt(self):
@@ -509,20 +527,29 @@ class SaltyCreator(Creator):
             transferable is Boolean, True means use trans deriv code. Otherwise nontrans
             temp is Boolean True means use temp stretch otherwise use time set
                  by tier for streching
+
+        Signers are returned in kidx order whether or not stretched concurrently.
+        Temp stretches are quick so are always serial.
         """
-        signers = []
         if not codes:  # if not codes make list len count of same code
             codes = [code for i in range(count)]
 
         stem = self.stem if self.stem else "{:x}".format(pidx)  # if not stem use pidx
-        for i, code in enumerate(codes):
-            path = "{}{:x}{:x}".format(stem, ridx, kidx + i)
-            signers.append(self.salter.signer(path=path,
-                                              code=code,
-                                              transferable=transferable,
-                                              tier=self.tier,
-                                              temp=temp))
-        return signers
+        paths = ["{}{:x}{:x}".format(stem, ridx, kidx + i) for i in range(len(codes))]
+
+        def derive(path, code):
+            return self.salter.signer(path=path,
+                                      code=code,
+                                      transferable=transferable,
+                                      tier=self.tier,
+                                      temp=temp)
+
+        workers = min(self.workers, len(codes))
+        if workers <= 1 or temp:
+            return [derive(path, code) for path, code in zip(paths, codes)]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(derive, paths, codes))  # map keeps order
 
 
 class Creatory:
@@ -579,6 +606,71 @@ class Creatory:
         return SaltyCreator(**kwa)
 
 
+class SignerCache:
+    """
+    Bounded in memory cache of decrypted Signers keyed by qb64 public key so that
+    repeated signing with the same keys skips the keystore read and decryption.
+    An entry expires .ttl seconds after it was cached and the least recently
+    used entry is evicted beyond .size entries. Expired entries are removed when
+    looked up. Lookups are tallied in .hits, .misses and .expirations and in the
+    keri_signer_cache_lookups_total metric.
+
+    Attributes:
+        ttl (float): seconds a cached signer may be used
+        signers (lrudict): of (Signer, expiry) duples keyed by qb64 public key
+            where expiry is monotonic time after which the entry is stale
+        hits (int): count of lookups that found a live entry
+        misses (int): count of lookups that found no entry
+        expirations (int): count of lookups that found a stale entry
+    """
+    TTL = 60.0  # default time to live of cached signer in seconds
+    Size = 1024  # default maximum number of cached signers
+
+    def __init__(self, ttl=None, size=None):
+        """
+        Parameters:
+            ttl (float): seconds a cached signer may be used. None means .TTL
+            size (int): maximum number of cached signers. None means .Size
+        """
+        self.ttl = ttl if ttl is not None else self.TTL
+        self.signers = helping.lrudict(size=size if size is not None else self.Size)
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+
+    def get(self, pub):
+        """
+        Returns Signer cached for qb64 public key pub or None if not cached or stale
+        """
+        if (entry := self.signers.get(pub)) is None:
+            self.misses += 1
+            help.meter.count("keri_signer_cache_lookups_total", result="miss")
+            return None
+
+        signer, expiry = entry
+        if time.monotonic() >= expiry:
+            del self.signers[pub]
+            self.expirations += 1
+            help.meter.count("keri_signer_cache_lookups_total", result="expired")
+            return None
+
+        self.hits += 1
+        help.meter.count("keri_signer_cache_lookups_total", result="hit")
+        return signer
+
+    def put(self, pub, signer):
+        """ Cache signer for qb64 public key pub for .ttl seconds """
+        self.signers[pub] = (signer, time.monotonic() + self.ttl)
+
+    def rem(self, pub):
+        """ Remove any signer cached for qb64 public key pub """
+        self.signers.pop(pub, None)
+
+    def clear(self):
+        """ Drop all cached signers so their secrets are no longer referenced """
+        self.signers.clear()
+
+
 # default values to init manager's globals database
 Initage = namedtuple("Initage", 'aeid pidx salt tier')
 
@@ -595,6 +687,10 @@ class Manager:
             decryption key is derived seed (private signing key seed)
         inited (bool): True means fully initialized wrt database.
                           False means not yet fully initialized
+        workers (int): maximum number of concurrent salty key stretches.
+            None means use SaltyCreator.Workers capped by tier
+        cache (SignerCache | None): decrypted signers used by .sign.
+            None means no caching so every signing reads and decrypts keys
 
     Attributes (Hidden):
 
@@ -634,12 +730,18 @@ class Manager:
 
     """
 
-    def __init__(self, *, ks=None, seed=None, **kwa):
+    BatchSize = 64  # serializations per thread task when signing many in threads
+
+    def __init__(self, *, ks=None, seed=None, workers=None, cache=None, **kwa):
         """
         Setup Manager.
 
         Parameters:
             ks (Keeper): key store instance (LMDB)
+            workers (int): maximum number of concurrent salty key stretches.
+                None means use SaltyCreator.Workers capped by tier
+            cache (SignerCache | None): opt in cache of decrypted signers for
+                .sign. None means no caching
             seed (str): qb64 private-signing key (seed) for the aeid from which
                 the private decryption key may be derived. If aeid stored in
                 database is not empty then seed may required to do any key
@@ -668,6 +770,8 @@ class Manager:
         self.encrypter = None
         self.decrypter = None
         self._seed = seed if seed is not None else ""
+        self.workers = workers
+        self.cache = cache
         self.inited = False
 
         # save keyword arg parameters to init later if db not opened yet
@@ -808,6 +912,8 @@ class Manager:
 
         self.ks.gbls.pin("aeid", aeid)  # set aeid in db
         self._seed = seed  # set .seed in memory
+        if self.cache is not None:  # drop signers decrypted under prior aeid
+            self.cache.clear()
 
         # update .decrypter
         self.decrypter = coring.Decrypter(seed=seed) if seed else None
@@ -981,7 +1087,8 @@ class Manager:
         ridx = 0  # rotation index
         kidx = 0  # key pair index
 
-        creator = Creatory(algo=algo).make(salt=salt, stem=stem, tier=tier)
+        creator = Creatory(algo=algo).make(salt=salt, stem=stem, tier=tier,
+                                           workers=self.workers)
 
         if not icodes:  # all same code, make list of len icount of same code
             if icount <= 0:
@@ -1179,7 +1286,8 @@ class Manager:
             else:
                 salt = coring.Salter(qb64=salt).qb64  # ensures salt was unencrypted
 
-        creator = Creatory(algo=pp.algo).make(salt=salt, stem=pp.stem, tier=pp.tier)
+        creator = Creatory(algo=pp.algo).make(salt=salt, stem=pp.stem, tier=pp.tier,
+                                              workers=self.workers)
 
         if not ncodes:  # all same code, make list of len count of same code
             if ncount < 0:  # next may be zero if non-trans
@@ -1213,6 +1321,8 @@ class Manager:
         if erase:
             for pub in old.pubs:  # remove prior old prikeys not current old
                 self.ks.pris.rem(pub)
+                if self.cache is not None:
+                    self.cache.rem(pub)
 
         return (verfers, digers)
 
@@ -1283,31 +1393,51 @@ class Manager:
         then signs ser with eah pub
         returns list of sigers indexed else list of cigars if not
         """
+        return self.signMany(sers=[ser], pubs=pubs, verfers=verfers, indexed=indexed,
+                             indices=indices, ondices=ondices)[0]
+
+    def signMany(self, sers, pubs=None, verfers=None, indexed=True, indices=None,
+                 ondices=None, workers=None):
+        """
+        Returns list with one list of signatures per serialization in sers in
+        order. Each list of signatures is as returned by .sign for that
+        serialization. The private keys are looked up and the indices are
+        validated once for the whole batch.
+
+        Parameters:
+            sers (Iterable[bytes]): serializations to sign
+            pubs (list[str] | None): See .sign
+            verfers (list[Verfer] | None): See .sign
+            indexed (bool): See .sign
+            indices (list[int] | None): See .sign
+            ondices (list[int | None] | None): See .sign
+            workers (int | None): number of threads to sign in when there are
+                more than .BatchSize serializations. Signing is done in
+                libsodium which releases the GIL. None or 1 means sign serially
+        """
         signers = []
 
         if pubs is None and verfers is None:
             raise ValueError("pubs or verfers required")
 
-        if pubs:
-            for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signers.append(signer)
+        if not pubs:
+            pubs = [verfer.qb64 for verfer in verfers]
 
-        else:
-            for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise kering.DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
+        if self.aeid and not self.decrypter:  # cached signers need authorization too
+            raise kering.DecryptError("Unauthorized decryption attempt. "
+                                      "Aeid but no decrypter.")
+
+        for pub in pubs:
+            if self.cache is not None and (signer := self.cache.get(pub)) is not None:
                 signers.append(signer)
+                continue
+
+            if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
+                    is None):
+                raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+            if self.cache is not None:
+                self.cache.put(pub, signer)
+            signers.append(signer)
 
         if indices and len(indices) != len(signers):
             raise ValueError(f"Mismatch indices length={len(indices)} and resultant"
@@ -1318,7 +1448,7 @@ class Manager:
                              f" signers length={len(signers)}")
 
         if indexed:
-            sigers = []
+            dexes = []  # (index, ondex) of each signer
             for j, signer in enumerate(signers):
                 if indices:  # not the default get index from indices
                     i = indices[j]  # must be whole number
@@ -1336,19 +1466,29 @@ class Manager:
                                          f"None or not whole number.")
                 else:  # default
                     o = i  # must both be same value int
+                dexes.append((i, o))
+
+            def sign(ser):
                 # .sign assigns .verfer of siger and sets code of siger
                 # appropriately for single or dual indexed signatures
-                sigers.append(signer.sign(ser,
-                                          index=i,
-                                          only=True if o is None else False,
-                                          ondex=o))
-            return sigers
+                return [signer.sign(ser,
+                                    index=i,
+                                    only=True if o is None else False,
+                                    ondex=o) for signer, (i, o) in zip(signers, dexes)]
 
         else:
-            cigars = []
-            for signer in signers:
-                cigars.append(signer.sign(ser))  # assigns .verfer to cigar
-            return cigars
+            def sign(ser):
+                return [signer.sign(ser) for signer in signers]  # assigns .verfer to cigar
+
+        sers = list(sers)
+        if workers is not None and workers > 1 and len(sers) > self.BatchSize:
+            batches = [sers[k:k + self.BatchSize] for k in range(0, len(sers), self.BatchSize)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return [sigs for batch in executor.map(lambda batch: [sign(ser) for ser in batch],
+                                                       batches)
+                        for sigs in batch]  # map keeps order
+
+        return [sign(ser) for ser in sers]
 
 
     def ingest(self, secrecies, iridx=0, ncount=1, ncode=coring.MtrDex.Ed25519_Seed,
@@ -1426,7 +1566,8 @@ class Manager:
 
         pidx = self.pidx  # get next pidx
 
-        creator = Creatory(algo=algo).make(salt=salt, stem=stem, tier=tier)
+        creator = Creatory(algo=algo).make(salt=salt, stem=stem, tier=tier,
+                                           workers=self.workers)
         ipre = ""
         dt = ""  # empty for incept of old
         pubs = []
@@ -1601,6 +1742,8 @@ class Manager:
             if erase:
                 for pub in old.pubs:  # remove prior old prikeys not current old
                     self.ks.pris.rem(pub)
+                    if self.cache is not None:
+                        self.cache.rem(pub)
 
         return (verfers, digers)
 
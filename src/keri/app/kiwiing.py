@@ -22,6 +22,7 @@ from ..app import specing, forwarding, agenting, storing, indirecting, httping,
 from ..core import coring, eventing
 from ..db import dbing
 from ..db.dbing import dgKey
+from ..end import ending
 from ..peer import exchanging
 from ..vc import proving, protocoling, walleting
 from ..vdr import verifying, credentialing
@@ -1054,9 +1055,27 @@ class CredentialEnd(doing.DoDoer):
                 type: string
              description:  schema to filter by if provided
              required: false
+           - in: query
+             name: last
+             schema:
+                type: string
+             description:  qb64 SAID of last credential seen, list starts after it
+             required: false
+           - in: query
+             name: limit
+             schema:
+                type: integer
+             description:  maximum number of credentials to return, all if not provided
+             required: false
+           - in: query
+             name: expand
+             schema:
+                type: boolean
+             description:  false means chained credentials are listed by SAID instead of expanded, defaults to true
+             required: false
         responses:
            200:
-              description: Credential list.
+              description: Credential list ordered by SAID.
               content:
                   application/json:
                     schema:
@@ -1068,6 +1087,9 @@ class CredentialEnd(doing.DoDoer):
         """
         typ = req.params.get("type")
         schema = req.params.get("schema")
+        last = req.params.get("last")
+        limit = req.params.get("limit")
+        expand = req.get_param_as_bool("expand", default=True)
 
         hab = self.hby.habByName(name=alias)
         if hab is None:
@@ -1076,21 +1098,34 @@ class CredentialEnd(doing.DoDoer):
                        "".format(alias)
             return
 
-        creds = []
+        try:
+            limit = int(limit) if limit is not None else None
+        except ValueError:
+            limit = -1
+        if limit is not None and limit < 0:
+            rep.status = falcon.HTTP_400
+            rep.text = f"Invalid limit {req.params.get('limit')}"
+            return
+
+        reger = self.rgy.reger
         if typ == "issued":
-            saids = self.rgy.reger.issus.get(keys=hab.pre)
+            index, keys = (reger.issus, hab.pre) if schema is None else (reger.ischs, (hab.pre, schema))
         elif typ == "received":
-            saids = self.rgy.reger.subjs.get(keys=hab.pre)
+            index, keys = (reger.subjs, hab.pre) if schema is None else (reger.sschs, (hab.pre, schema))
         else:
             rep.status = falcon.HTTP_400
             rep.text = f"Invalid type {typ}"
             return
 
-        if schema is not None:
-            scads = self.rgy.reger.schms.get(keys=schema)
-            saids = [saider for saider in saids if saider.qb64 in [saider.qb64 for saider in scads]]
+        saids = []
+        for saider in index.getIter(keys=keys, start=last):
+            if limit is not None and len(saids) >= limit:
+                break
+            if saider.qb64 == last:
+                continue
+            saids.append(saider)
 
-        creds = self.rgy.reger.cloneCreds(saids)
+        creds = reger.cloneCreds(saids, expand=expand)
 
         rep.status = falcon.HTTP_200
         rep.content_type = "application/json"
@@ -3047,12 +3082,9 @@ class ContactEnd:
         val = req.params.get("filter_value")
 
         if group is not None:
-            data = dict()
-            values = self.org.values(group, val)
-            for value in values:
-                contacts = self.org.find(group, value)
+            data = self.org.group(group, val)
+            for contacts in data.values():
                 self.authn(contacts)
-                data[value] = contacts
 
             rep.status = falcon.HTTP_200
             rep.data = json.dumps(data).encode("utf-8")
@@ -3854,6 +3886,9 @@ def loadEnds(app, *,
     app.add_route("/escrows", escrowEnd)
     app.add_route("/escrows/{pre}/{dig}", escrowEnd, suffix="partial")
 
+    if help.meter.enabled:  # metrics are opt-in
+        ending.loadMetricsEnd(app=app, dbs=[hby.db, rgy.reger])
+
     aeidEnd = AeidEnd(hby=hby)
     app.add_route("/codes", aeidEnd)
 
@@ -3893,7 +3928,7 @@ def setup(hby, rgy, servery, bootConfig, *, controller="", insecure=False, stati
 
     handlers = []
 
-    mbx = storing.Mailboxer(name=hby.name)
+    mbx = storing.Mailboxer(name=hby.name, **hby.dbOpts)
     counselor = grouping.Counselor(hby=hby)
     registrar = credentialing.Registrar(hby=hby, rgy=rgy, counselor=counselor)
     credentialer = credentialing.Credentialer(hby=hby, rgy=rgy, registrar=registrar, verifier=verifier)
@@ -0,0 +1,205 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.app.pooling module
+
+Pool of persistent client connections to remote endpoints such as witnesses
+"""
+import time
+from urllib.parse import urlparse
+
+from hio.core.tcp import clienting
+
+from .. import help
+from .. import kering
+
+logger = help.ogler.getLogger()
+
+
+class ClientPool:
+    """
+    Pool of persistent hio clients (http or tcp) keyed by (eid, scheme, url) so
+    that connections to the same endpoint may be reused across doers instead
+    of each doer opening and closing its own connection.
+
+    A client is leased with .acquire and must be given back with .release once
+    the lessee is done with it. A released client that is still connected and
+    has no pending traffic is kept for reuse until it has been idle for longer
+    than .idle seconds. Clients that were cut off by the remote or released as
+    failed are closed and counted against the health of their endpoint.
+
+    Attributes:
+        idle (float): seconds an unleased client may stay pooled before eviction
+        maxFails (int): consecutive failures after which endpoint is unhealthy
+        clients (dict): lists of (client, released) duples of unleased clients
+            keyed by (eid, scheme, url) where released is monotonic time of
+            release
+        fails (dict): consecutive failure count keyed by (eid, scheme, url)
+        hits (int): count of acquires satisfied by a pooled client
+        misses (int): count of acquires that created a new client
+        evictions (int): count of pooled clients closed due to idle or cutoff
+
+    """
+    Idle = 30.0  # default seconds before an unleased client is evicted
+    MaxFails = 3  # default consecutive failures before endpoint is unhealthy
+
+    def __init__(self, idle=None, maxFails=None):
+        """
+        Parameters:
+            idle (float): seconds an unleased client may stay pooled before
+                eviction. None means use .Idle
+            maxFails (int): consecutive failures after which endpoint is
+                unhealthy. None means use .MaxFails
+
+        """
+        self.idle = idle if idle is not None else self.Idle
+        self.maxFails = maxFails if maxFails is not None else self.MaxFails
+        self.clients = dict()
+        self.fails = dict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def acquire(self, eid, scheme, url):
+        """
+        Returns client leased for exclusive use from pool for endpoint. Creates
+        and opens new client when no live pooled client is available. Callers
+        that can choose among endpoints should prefer those that are .healthy
+
+        Parameters:
+            eid (str): qb64 identifier prefix of endpoint provider
+            scheme (str): url scheme from kering.Schemes
+            url (str): endpoint url
+
+        """
+        self.prune()
+        key = (eid, scheme, url)
+        idles = self.clients.get(key, [])
+        while idles:
+            client, _ = idles.pop()  # most recently released first
+            if self.alive(client):
+                self.hits += 1
+                return client
+            client.close()
+            self.evictions += 1
+            self.fails[key] = self.fails.get(key, 0) + 1
+
+        self.misses += 1
+        return self.make(scheme=scheme, url=url)
+
+    def release(self, eid, scheme, url, client, failed=False):
+        """
+        Returns client to pool for reuse unless failed, cut off, or busy in
+        which case client is closed
+
+        Parameters:
+            eid (str): qb64 identifier prefix of endpoint provider
+            scheme (str): url scheme from kering.Schemes
+            url (str): endpoint url
+            client (Client): hio client previously leased with .acquire
+            failed (bool): True means lessee saw errors on this connection
+
+        """
+        key = (eid, scheme, url)
+        connector = self.connector(client)
+        if failed or connector.cutoff:
+            self.fails[key] = self.fails.get(key, 0) + 1
+            client.close()
+            return
+
+        self.fails[key] = 0
+        if self.busy(client):  # stray traffic would be misattributed to next lessee
+            client.close()
+            return
+
+        self.clients.setdefault(key, []).append((client, time.monotonic()))
+
+    def healthy(self, eid, scheme, url):
+        """
+        Returns True if endpoint has had fewer than .maxFails consecutive
+        failures, False otherwise
+
+        Parameters:
+            eid (str): qb64 identifier prefix of endpoint provider
+            scheme (str): url scheme from kering.Schemes
+            url (str): endpoint url
+
+        """
+        return self.fails.get((eid, scheme, url), 0) < self.maxFails
+
+    def prune(self, now=None):
+        """
+        Close and evict pooled clients that have been idle longer than .idle
+
+        Parameters:
+            now (float): monotonic time to prune against. None means now
+        """
+        now = now if now is not None else time.monotonic()
+        for key in list(self.clients.keys()):
+            keeps = []
+            for client, released in self.clients[key]:
+                if now - released > self.idle:
+                    client.close()
+                    self.evictions += 1
+                else:
+                    keeps.append((client, released))
+            if keeps:
+                self.clients[key] = keeps
+            else:
+                del self.clients[key]
+
+    def close(self):
+        """ Close all pooled clients """
+        for idles in self.clients.values():
+            for client, _ in idles:
+                client.close()
+        self.clients.clear()
+
+    @staticmethod
+    def make(scheme, url):
+        """
+        Returns new opened hio client for url
+
+        Parameters:
+            scheme (str): url scheme from kering.Schemes
+            url (str): endpoint url
+
+        """
+        up = urlparse(url)
+        if scheme == kering.Schemes.http:
+            from hio.core import http  # deferred since it loads the falcon server stack
+
+            client = http.clienting.Client(hostname=up.hostname, port=up.port)
+        elif scheme == kering.Schemes.tcp:
+            client = clienting.Client(host=up.hostname, port=up.port)
+        else:
+            raise kering.ConfigurationError(f"unsupported scheme {scheme} for "
+                                            f"pooled client")
+        client.reopen()
+        return client
+
+    @staticmethod
+    def connector(client):
+        """ Returns tcp connector of client. hio tcp clients are their own """
+        return getattr(client, "connector", client)
+
+    @staticmethod
+    def busy(client):
+        """ Returns True if client has pending requests, responses or data """
+        connector = ClientPool.connector(client)
+        if connector.txbs or connector.rxbs:
+            return True
+        if connector is not client:  # http client
+            return bool(client.requests or client.responses or client.waited)
+        return False
+
+    @staticmethod
+    def alive(client):
+        """
+        Returns True if connection of pooled client has not been closed by the
+        remote while idle. Services receives once to detect far side close.
+        """
+        connector = ClientPool.connector(client)
+        if connector.connected:
+            connector.serviceReceives()
+        return not connector.cutoff and not connector.rxbs
@@ -23,10 +23,33 @@ def ratify(hab, serder, paths=None, pipelined=False):
     Returns:
         bytes: serialized SAD with qb64 CESR Proof Signature attachments
 
+    """
+    return ratifyMany(hab=hab, serders=[serder], paths=paths, pipelined=pipelined)[0]
+
+
+def ratifyMany(hab, serders, paths=None, pipelined=False):
+    """ Sign the SADs or SAIDs of many serders with the keys from the Habitat
+    looking up the signing keys once for all of them.
+
+    Parameters:
+        hab (Habitat): environment used to sign the SADs
+        serders (Iterable[Union[Serder,Creder]]): the self addressing data (SADs)
+        paths (list): list of paths specified as arrays of path components
+            signed in each SAD
+        pipelined (bool): True means prepend pipelining count code to attachemnts
+            False means to not prepend pipelining count code
+
+    Returns:
+        list: of bytes serialized SAD with qb64 CESR Proof Signature attachments
+            one per serder in order
+
     """
     paths = [[]] if paths is None else paths
-    sadsigers, sadcigars = signPaths(hab=hab, serder=serder, paths=paths)
-    return provision(serder, sadsigers=sadsigers, sadcigars=sadcigars, pipelined=pipelined)
+    serders = list(serders)  # iterated twice so realize any generator once
+    return [provision(serder, sadsigers=sadsigers, sadcigars=sadcigars, pipelined=pipelined)
+            for serder, (sadsigers, sadcigars) in zip(serders, signPathsMany(hab=hab,
+                                                                             serders=serders,
+                                                                             paths=paths))]
 
 
 def provision(serder, *, sadsigers=None, sadcigars=None, pipelined=False):
@@ -68,31 +91,47 @@ def signPaths(hab, serder, paths):
         str: qb64 signature attachment
 
     """
+    return signPathsMany(hab=hab, serders=[serder], paths=paths)[0]
 
-    sadsigers = []
-    sadcigars = []
 
-    if hab.kever.prefixer.transferable:
+def signPathsMany(hab, serders, paths):
+    """ Sign the SADs or SAIDs of many serders with the keys from the Habitat
+    in one batch so signing keys are looked up once.
+
+    Parameters:
+        hab (Habitat): environment used to sign the SADs
+        serders (Iterable[Union[Serder,Creder]]): the self addressing data (SADs)
+        paths (list): list of paths specified as arrays of path components
+            signed in each SAD
+
+    Returns:
+        list: of (sadsigers, sadcigars) duples one per serder in order as
+            returned by signPaths
+
+    """
+    serders = list(serders)
+    pathers = [coring.Pather(path=path) for path in paths]
+    transferable = hab.kever.prefixer.transferable
+    sigss = hab.signMany(sers=[pather.tail(serder=serder)
+                               for serder in serders for pather in pathers],
+                         verfers=hab.kever.verfers,
+                         indexed=transferable)
+
+    if transferable:
         prefixer, seqner, saider, indices = transSeal(hab)
-        for path in paths:
-            pather = coring.Pather(path=path)
-            data = pather.tail(serder=serder)
-
-            sigers = hab.sign(ser=data,
-                              verfers=hab.kever.verfers,
-                              indexed=True)
-            sadsigers.append((pather, prefixer, seqner, saider, sigers))
-
-    else:
-        for path in paths:
-            pather = coring.Pather(path=path)
-            data = pather.tail(serder=serder)
-            cigars = hab.sign(ser=data,
-                              verfers=hab.kever.verfers,
-                              indexed=False)
-            sadcigars.append((pather, cigars))
-
-    return sadsigers, sadcigars
+
+    results = []
+    for k in range(len(serders)):
+        sadsigers = []
+        sadcigars = []
+        for pather, sigs in zip(pathers, sigss[k * len(pathers):(k + 1) * len(pathers)]):
+            if transferable:
+                sadsigers.append((pather, prefixer, seqner, saider, sigs))
+            else:
+                sadcigars.append((pather, sigs))
+        results.append((sadsigers, sadcigars))
+
+    return results
 
 
 def transSeal(hab):
@@ -3,8 +3,10 @@
 keri.app.storing module
 
 """
+import datetime
 import itertools
 import random
+from dataclasses import dataclass
 
 from hio.base import doing
 from hio.help import decking
@@ -15,31 +17,75 @@ from .. import help
 from ..core import coring
 from ..core.coring import MtrDex
 from ..db import dbing, subing
+from ..help import helping
 from ..peer import exchanging
 
 logger = help.ogler.getLogger()
 
 
+@dataclass
+class Retention:
+    """
+    Retention policy for messages stored in the topics of a Mailboxer.
+    Messages exceeding any of the limits are removed by Mailboxer.compact.
+
+    Attributes:
+        age (float | None): max seconds to keep message after it was stored.
+            None means no age limit
+        count (int | None): max number of most recent messages to keep per topic.
+            None means no count limit
+        acked (bool): True means remove messages acknowledged by a mailbox
+            query of the topic. False means keep acknowledged messages
+    """
+    age: float = None
+    count: int = None
+    acked: bool = False
+
+
 class Mailboxer(dbing.LMDBer):
     """
     Mailboxer stores exn messages in order and provider iterator access at an index.
 
+    Messages are kept until removed by .compact according to the retention
+    policy of their topic. The last message of a topic is never removed so
+    that the first seen order numbers of later messages keep increasing.
+
+    Attributes:
+        policy (Retention | None): default retention policy of topics.
+            None means keep messages forever
+        policies (dict): Retention policies keyed by topic route such as
+            "/receipt" that override .policy for topics with that route
+        seq (int): count of messages stored by this instance. Readers compare
+            with a previously seen value to cheaply detect that nothing new
+            was stored since they last looked
+        tops (dict): watermarks of topics stored to by this instance. Each is
+            the next first seen order number, fn, of its topic keyed by topic
+            bytes so readers only need to look in topics that advanced
+
     """
     TailDirPath = "keri/mbx"
     AltTailDirPath = ".keri/mbx"
     TempPrefix = "keri_mbx_"
 
-    def __init__(self, name="mbx", headDirPath=None, reopen=True, **kwa):
+    def __init__(self, name="mbx", headDirPath=None, reopen=True, policy=None, policies=None, **kwa):
         """
 
         Parameters:
             headDirPath:
             perm:
             reopen:
+            policy (Retention | None): default retention policy of topics
+            policies (dict): Retention policies keyed by topic route
             kwa:
         """
         self.tpcs = None
         self.msgs = None
+        self.dtms = None
+        self.acks = None
+        self.policy = policy
+        self.policies = policies if policies is not None else dict()
+        self.seq = 0
+        self.tops = dict()
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -53,6 +99,8 @@ class Mailboxer(dbing.LMDBer):
 
         self.tpcs = self.env.open_db(key=b'tpcs.', dupsort=True)
         self.msgs = subing.Suber(db=self, subkey='msgs.')  # key states
+        self.dtms = subing.CesrSuber(db=self, subkey='dtms.', klas=coring.Dater)  # store times by msg dig
+        self.acks = subing.CesrSuber(db=self, subkey='acks.', klas=coring.Seqner)  # acked fn by topic
 
         return self.env
 
@@ -116,8 +164,12 @@ class Mailboxer(dbing.LMDBer):
             msg = msg.encode("utf-8")
 
         digb = coring.Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
-        self.appendToTopic(topic=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        fn = self.appendToTopic(topic=topic, val=digb)
+        result = self.msgs.pin(keys=digb, val=msg)
+        self.dtms.pin(keys=digb, val=coring.Dater())
+        self.tops[topic] = fn + 1  # advance watermark once msg is readable
+        self.seq += 1
+        return result
 
     def cloneTopicIter(self, topic, fn=0):
         """
@@ -133,6 +185,174 @@ class Mailboxer(dbing.LMDBer):
             if msg := self.msgs.get(keys=dig):
                 yield ion, topic, msg.encode("utf-8")
 
+    def watermark(self, topic):
+        """
+        Returns:
+            fn (int): first seen order number of next message of topic, that
+                is one past last stored message, 0 when topic has none
+
+        Parameters:
+            topic (Option(bytes|str)): identifier prefix/topic of messages
+        """
+        if hasattr(topic, "encode"):
+            topic = topic.encode("utf-8")
+
+        if (fn := self.tops.get(topic)) is not None:
+            return fn
+
+        iokey = dbing.suffix(topic, ion=dbing.MaxSuffix)
+        with self._begin(db=self.tpcs) as txn:
+            cursor = txn.cursor()
+            if cursor.set_range(iokey):  # walk back from first key after topic
+                found = bytes(cursor.key()) == iokey or cursor.prev()
+            else:  # topic at end of database if any
+                found = cursor.last()
+            if found:
+                key, ion = dbing.unsuffix(cursor.key())
+                if key == topic:
+                    return ion + 1
+        return 0
+
+    def ackTopic(self, topic, fn):
+        """
+        Acknowledge that messages of topic before first seen order number fn
+        were received. Acknowledgements only move forward and never past the
+        .watermark of topic. Invalid fn that is not a whole number is ignored.
+
+        Parameters:
+            topic (Option(bytes|str)): identifier prefix/topic of messages
+            fn (int): first seen order number of first unreceived message
+        """
+        if hasattr(topic, "encode"):
+            topic = topic.encode("utf-8")
+
+        if not isinstance(fn, int) or isinstance(fn, bool) or fn <= 0:
+            return
+        fn = min(fn, self.watermark(topic))
+        if fn <= 0:
+            return
+        seqner = self.acks.get(keys=topic)
+        if seqner is None or seqner.sn < fn:
+            self.acks.pin(keys=topic, val=coring.Seqner(sn=fn))
+
+    def retention(self, topic):
+        """
+        Returns:
+            policy (Retention | None): retention policy of topic
+
+        Parameters:
+            topic (bytes): identifier prefix/topic
+        """
+        _, sep, route = bytes(topic).partition(b"/")
+        if sep and (policy := self.policies.get("/" + route.decode("utf-8"))) is not None:
+            return policy
+        return self.policy
+
+    def compact(self, now=None):
+        """
+        Removes messages from topics according to the retention policy of each
+        topic. Messages stored in more than one topic are removed once no topic
+        refers to them anymore.
+
+        Returns:
+            count (int): number of topic entries removed
+
+        Parameters:
+            now (datetime | None): time to apply age limits against. None means now
+        """
+        if self.policy is None and not self.policies:
+            return 0
+
+        now = now if now is not None else helping.nowUTC()
+        refs = dict()  # reference counts of msg digs
+        drops = []  # (iokey, dig) of topic entries to remove
+        with self.snapshot():
+            entries = []
+            for iokey, dig in self.getAllItemIter(db=self.tpcs, split=False):
+                dig = bytes(dig)
+                refs[dig] = refs.get(dig, 0) + 1
+                topic, ion = dbing.unsuffix(iokey)
+                if entries and entries[-1][0] != topic:
+                    drops.extend(self._expired(entries, now))
+                    entries = []
+                entries.append((topic, ion, iokey, dig))
+            if entries:
+                drops.extend(self._expired(entries, now))
+
+        with self.txn(write=True):
+            for iokey, dig in drops:
+                self.delIoSetIokey(db=self.tpcs, iokey=iokey)
+                refs[dig] -= 1
+                if refs[dig] == 0:
+                    self.msgs.rem(keys=dig)
+                    self.dtms.rem(keys=dig)
+
+        return len(drops)
+
+    def _expired(self, entries, now):
+        """
+        Returns:
+            drops (list): (iokey, dig) duples of entries to remove from one topic
+
+        Parameters:
+            entries (list): (topic, ion, iokey, dig) tuples of all entries of
+                one topic in first seen order
+            now (datetime): time to apply age limit against
+        """
+        topic = entries[0][0]
+        policy = self.retention(topic)
+        if policy is None:
+            return []
+
+        keep = 0  # index of first entry not over count limit
+        if policy.count is not None:
+            keep = min(max(len(entries) - policy.count, 0), len(entries) - 1)  # always keep last
+        drops = [(iokey, dig) for _, _, iokey, dig in entries[:keep]]
+
+        acked = 0
+        if policy.acked and (seqner := self.acks.get(keys=topic)) is not None:
+            acked = seqner.sn
+        if policy.age is not None:
+            cutoff = now - datetime.timedelta(seconds=policy.age)
+        else:
+            cutoff = None
+
+        for _, ion, iokey, dig in entries[keep:-1]:
+            if ion < acked:
+                drops.append((iokey, dig))
+            elif cutoff is not None and (dater := self.dtms.get(keys=dig)) is not None \
+                    and dater.datetime < cutoff:
+                drops.append((iokey, dig))
+
+        return drops
+
+
+class MailboxCompactor(doing.Doer):
+    """
+    Doer that periodically compacts a Mailboxer according to its retention
+    policies. Runs once every .tock seconds.
+
+    Attributes:
+        mbx (Mailboxer): mailbox to compact
+    """
+    Tock = 3600.0  # default seconds between compactions
+
+    def __init__(self, mbx, tock=None, **kwa):
+        """
+        Parameters:
+            mbx (Mailboxer): mailbox to compact
+            tock (float): seconds between compactions. None means use .Tock
+        """
+        super(MailboxCompactor, self).__init__(tock=tock if tock is not None else self.Tock, **kwa)
+        self.mbx = mbx
+
+    def recur(self, tyme):
+        """ Compact .mbx. Returns False so doer keeps running """
+        count = self.mbx.compact()
+        if count:
+            logger.info("Mailbox %s compacted %s messages", self.mbx.name, count)
+        return False
+
 
 class Respondant(doing.DoDoer):
     """
@@ -157,7 +377,7 @@ class Respondant(doing.DoDoer):
         self.cues = cues if cues is not None else decking.Deck()
 
         self.hby = hby
-        self.mbx = mbx if mbx is not None else Mailboxer(name=self.hby.name)
+        self.mbx = mbx if mbx is not None else Mailboxer(name=self.hby.name, **self.hby.dbOpts)
         self.postman = forwarding.Postman(hby=self.hby)
 
         doers = [self.postman, doing.doify(self.responseDo), doing.doify(self.cueDo)]
@@ -5,13 +5,13 @@ keri.core.coring module
 """
 import re
 import json
+import math
+import binascii
 from typing import Union
 from collections.abc import Iterable
 
 from dataclasses import dataclass, astuple
-from collections import namedtuple, deque
-from base64 import urlsafe_b64encode as encodeB64
-from base64 import urlsafe_b64decode as decodeB64
+from collections import namedtuple
 from fractions import Fraction
 
 import cbor2 as cbor
@@ -30,7 +30,7 @@ from ..kering import (EmptyMaterialError, RawMaterialError, InvalidCodeError,
                       UnexpectedCountCodeError, UnexpectedOpCodeError)
 from ..kering import Versionage, Version
 from ..help import helping
-from ..help.helping import sceil, nonStringIterable
+from ..help.helping import nonStringIterable
 
 """
 ilk is short for message type
@@ -199,23 +199,46 @@ B64REX = b'^[A-Za-z0-9\-\_]*\Z'
 Reb64 = re.compile(B64REX)  # compile is faster
 
 
+# translation tables between standard and URL safe Base64 alphabets
+B64UrlEncodeTable = bytes.maketrans(b'+/', b'-_')
+B64UrlDecodeTable = bytes.maketrans(b'-_', b'+/')
+# Map byte ordinal of Base64 char to Base64 index for bytes like input
+B64IdxByByte = {ord(char): index for char, index in B64IdxByChr.items()}
+# Two char Base64 str of each int 0 to 4095 indexed by int
+B64_PAIRS = tuple(B64_CHARS[i >> 6] + B64_CHARS[i & 0x3f] for i in range(4096))
+
+
+def encodeB64(b):
+    """
+    Returns URL safe Base64 encoding of bytes like b as bytes with pad chars.
+    Same as base64.urlsafe_b64encode without its per call overhead.
+    """
+    return binascii.b2a_base64(b, newline=False).translate(B64UrlEncodeTable)
+
+
+def decodeB64(s):
+    """
+    Returns bytes of URL safe Base64 decoding of str or bytes like s.
+    Same as base64.urlsafe_b64decode without its per call overhead.
+    """
+    if isinstance(s, str):
+        s = s.encode("ascii")
+    elif not isinstance(s, bytes):  # bytearray or memoryview
+        s = bytes(s)
+    return binascii.a2b_base64(s.translate(B64UrlDecodeTable))
+
+
 def intToB64(i, l=1):
     """
     Returns conversion of int i to Base64 str
     l is min number of b64 digits left padded with Base64 0 == "A" char
     """
-    d = deque()  # deque of characters base64
-
-    while l:
-        d.appendleft(B64ChrByIdx[i % 64])
-        i = i // 64
-        if not i:
-            break
-        # d.appendleft(B64ChrByIdx[i % 64])
-        # i = i // 64
-    for j in range(l - len(d)):  # range(x)  x <= 0 means do not iterate
-        d.appendleft("A")
-    return ("".join(d))
+    if not l:
+        return ""
+    if i < 4096:  # fits in two digits so use table
+        return B64_CHARS[i] if (l == 1 and i < 64) else "A" * (l - 2) + B64_PAIRS[i]
+    n = max(l, (i.bit_length() + 5) // 6)  # number of b64 digits
+    return "".join([B64_CHARS[(i >> e) & 0x3f] for e in range(6 * (n - 1), -1, -6)])
 
 
 def intToB64b(i, l=1):
@@ -232,11 +255,10 @@ def b64ToInt(s):
     """
     if not s:
         raise ValueError("Empty string, conversion undefined.")
-    if hasattr(s, 'decode'):
-        s = s.decode("utf-8")
+    idxs = B64IdxByChr if isinstance(s, str) else B64IdxByByte
     i = 0
-    for e, c in enumerate(reversed(s)):
-        i |= B64IdxByChr[c] << (e * 6)  # same as i += B64IdxByChr[c] * (64 ** e)
+    for c in s:
+        i = (i << 6) | idxs[c]
     return i
 
 
@@ -252,7 +274,7 @@ def codeB64ToB2(s):
     """
     i = b64ToInt(s)
     i <<= 2 * (len(s) % 4)  # add 2 bits right zero padding for each sextet
-    n = sceil(len(s) * 3 / 4)  # compute min number of ocetets to hold all sextets
+    n = (len(s) * 3 + 3) // 4  # compute min number of ocetets to hold all sextets
     return (i.to_bytes(n, 'big'))
 
 
@@ -266,7 +288,7 @@ def codeB2ToB64(b, l):
     """
     if hasattr(b, 'encode'):
         b = b.encode("utf-8")  # convert to bytes
-    n = sceil(l * 3 / 4)  # number of bytes needed for l sextets
+    n = (l * 3 + 3) // 4  # number of bytes needed for l sextets
     if n > len(b):
         raise ValueError("Not enough bytes in {} to nab {} sextets.".format(b, l))
     i = int.from_bytes(b[:n], 'big')  # convert only first n bytes to int
@@ -285,7 +307,7 @@ def nabSextets(b, l):
     """
     if hasattr(b, 'encode'):
         b = b.encode("utf-8")  # convert to bytes
-    n = sceil(l * 3 / 4)  # number of bytes needed for l sextets
+    n = (l * 3 + 3) // 4  # number of bytes needed for l sextets
     if n > len(b):
         raise ValueError("Not enough bytes in {} to nab {} sextets.".format(b, l))
     i = int.from_bytes(b[:n], 'big')
@@ -307,9 +329,11 @@ def sniff(raw):
     if len(raw) < MINSNIFFSIZE:
         raise ShortageError("Need more bytes.")
 
-    match = Rever.search(raw)  # Rever's regex takes bytes
-    if not match or match.start() > 12:
-        raise VersionError("Invalid version string in raw = {}".format(raw))
+    # only search front of raw since version string must start within 12 bytes
+    match = Rever.search(raw, 0, MINSNIFFSIZE)  # Rever's regex takes bytes
+    if not match:
+        raise VersionError("Invalid version string in raw = {}"
+                           "".format(bytes(raw[:MINSNIFFSIZE])))
 
     ident, major, minor, kind, size = match.group("ident", "major", "minor", "kind", "size")
     version = Versionage(major=int(major, 16), minor=int(minor, 16))
@@ -355,17 +379,17 @@ def loads(raw, size=None, kind=Serials.json):
        ked (dict): deserialized
 
     Parameters:
-       raw (Union[bytes,bytearray]): raw serialization to deserialze as dict
+       raw (Union[bytes,bytearray,memoryview]): raw serialization to deserialze as dict
        size (int): number of bytes to consume for the deserialization. If None
                    then consume all bytes
        kind (str): serialization kind (JSON, MGPK, CBOR)
     """
     if kind == Serials.json:
         try:
-            ked = json.loads(raw[:size].decode("utf-8"))
+            ked = json.loads(str(raw[:size], "utf-8"))
         except Exception as ex:
             raise DeserializationError("Error deserializing JSON: {}"
-                                       "".format(raw[:size].decode("utf-8")))
+                                       "".format(bytes(raw[:size])))
 
     elif kind == Serials.mgpk:
         try:
@@ -512,7 +536,7 @@ class MatterCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 
 MtrDex = MatterCodex()  # Make instance
@@ -533,7 +557,7 @@ class SmallVarRawSizeCodex:
     Lead2: str = '6'  # First Selector Character for all ls == 2 codes
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 SmallVrzDex = SmallVarRawSizeCodex()  # Make instance
@@ -554,7 +578,7 @@ class LargeVarRawSizeCodex:
     Lead2_Big: str = '9'  # First Selector Character for all ls == 2 codes
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 LargeVrzDex = LargeVarRawSizeCodex()  # Make instance
@@ -572,7 +596,7 @@ class NonTransCodex:
     Ed448N: str = '1AAC'  # Ed448 non-transferable prefix public signing verification key. Basic derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 NonTransDex = NonTransCodex()  # Make instance
@@ -598,7 +622,7 @@ class DigCodex:
     SHA2_512: str = '0G'  # SHA2 512 bit digest self-addressing derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 DigDex = DigCodex()  # Make instance
@@ -619,7 +643,7 @@ class NumCodex:
     Huge:    str = '0A'  # Huge 16 byte b2 number (same as Salt_128)
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 NumDex = NumCodex()  # Make instance
@@ -640,7 +664,7 @@ class BextCodex:
     StrB64_Big_L2: str = '9AAA'  # String Base64 Only Big Leader Size 2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 BexDex = BextCodex()  # Make instance
@@ -693,8 +717,11 @@ class Matter:
                                    (fully qualified Base64)
         _exfil (types.MethodType): extracts .code and .raw from qb64b
                                    (fully qualified Base64)
+        _qb64b (bytes | None): memoized value of .qb64b once computed
 
     """
+    __slots__ = ("_code", "_size", "_raw", "_qb64b")
+
     Codex = MtrDex
     # Hards table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always 0 for Matter
@@ -787,6 +814,7 @@ class Matter:
             .raw and .code and .size and .rsize
 
         """
+        self._qb64b = None
         size = None  # variable raw binary size including leader in quadlets
         if raw is not None:  # raw provided
             if not code:
@@ -947,8 +975,11 @@ class Matter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Memoized since .raw and .code are read only
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
     @property
     def qb64(self):
@@ -1016,7 +1047,7 @@ class Matter:
                 raise InvalidCodeSizeError(f"Invalid code={both} for converted"
                                            f" raw pad size={ps}.")
             # prepad, convert, and prepend
-            return (both.encode("utf-8") + encodeB64(bytes([0] * ls) + raw))
+            return (both.encode("utf-8") + encodeB64(bytes(ls) + raw))
 
         else:  # fixed size so prepad but lead ls may not be zero
             both = code
@@ -1027,7 +1058,7 @@ class Matter:
             # prepad, convert, and replace upfront
             # when fixed and ls != 0 then cs % 4 is zero and ps==ls
             # otherwise  fixed and ls == 0 then cs % 4 == ps
-            return (both.encode("utf-8") + encodeB64(bytes([0] * ps) + raw)[cs % 4:])
+            return (both.encode("utf-8") + encodeB64(bytes(ps) + raw)[cs % 4:])
 
 
     def _binfil(self):
@@ -1061,11 +1092,11 @@ class Matter:
             raise InvalidCodeSizeError("Mismatch code size = {} with table = {}."
                                        .format(cs, len(code)))
 
-        n = sceil(cs * 3 / 4)  # number of b2 bytes to hold b64 code
+        n = (cs * 3 + 3) // 4  # number of b2 bytes to hold b64 code
         # convert code both to right align b2 int then left shift in pad bits
         # then convert to bytes
         bcode = (b64ToInt(both) << (2 * (cs % 4))).to_bytes(n, 'big')
-        full = bcode + bytes([0] * ls) + raw
+        full = bcode + bytes(ls) + raw
         bfs = len(full)
         if bfs % 3 or (bfs * 4 // 3) != fs:  # invalid size
             raise InvalidCodeSizeError(f"Invalid code={both} for raw size={len(raw)}.")
@@ -1084,8 +1115,8 @@ class Matter:
             raise ShortageError("Empty material.")
 
         first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
+        if not isinstance(first, str):  # bytes, bytearray or memoryview
+            first = str(first, "utf-8")
         if first not in self.Hards:
             if first[0] == '-':
                 raise UnexpectedCountCodeError("Unexpected count code start"
@@ -1101,8 +1132,8 @@ class Matter:
             raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
         hard = qb64b[:hs]  # extract hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")  # converts bytes/bytearray to str
+        if not isinstance(hard, str):
+            hard = str(hard, "utf-8")  # converts bytes/bytearray/memoryview to str
         if hard not in self.Sizes:
             raise UnexpectedCodeError(f"Unsupported code ={hard}.")
 
@@ -1114,8 +1145,8 @@ class Matter:
                 raise ValidationError(f"Whole code size not multiple of 4 for "
                                       f"variable length material. cs={cs}.")
             size = qb64b[hs:hs + ss]  # extract size chars
-            if hasattr(size, "decode"):
-                size = size.decode("utf-8")
+            if not isinstance(size, str):
+                size = str(size, "utf-8")
             size = b64ToInt(size)  # compute int size
             fs = (size * 4) + cs
 
@@ -1131,30 +1162,29 @@ class Matter:
         if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
             qb64b = qb64b.encode("utf-8")
 
+        # decode whole primitive at once into code bytes followed by any lead
+        # bytes and raw, same as qb2, instead of replacing code with prepad
+        qb2 = decodeB64(qb64b)
+        bcs = (cs * 3 + 3) // 4  # bcs is min bytes to hold cs sextets
+
         # check for non-zeroed pad bits or lead bytes
         ps = cs % 4  # code pad size ps = cs mod 4
         pbs = 2 * (ps if ps else ls)  # pad bit size in bits
         if ps:  # ps. IF ps THEN not ls (lead) and vice versa OR not ps and not ls
-            base = ps * b'A' + qb64b[cs:]  # replace pre code with prepad chars of zero
-            paw = decodeB64(base)  # decode base to leave prepadded raw
-            pi = (int.from_bytes(paw[:ps], "big"))  # prepad as int
+            pi = qb2[bcs - 1]  # last code byte holds pad bits
             if pi & (2 ** pbs - 1 ):  # masked pad bits non-zero
                 raise ValueError(f"Non zeroed prepad bits = "
                                  f"{pi & (2 ** pbs - 1 ):<06b} in {qb64b[cs:cs+1]}.")
-            raw = paw[ps:]  # strip off ps prepad paw bytes
 
         else:  # not ps. IF not ps THEN may or may not be ls (lead)
-            base = qb64b[cs:]  # strip off code leaving lead chars if any and value
-            # decode lead chars + val leaving lead bytes + raw bytes
-            # then strip off ls lead bytes leaving raw
-            paw = decodeB64(base) # decode base to leave prepadded paw bytes
-            li = int.from_bytes(paw[:ls], "big")  # lead as int
+            li = int.from_bytes(qb2[bcs:bcs + ls], "big")  # lead as int
             if li:  # pre pad lead bytes must be zero
                 if ls == 1:
                     raise ValueError(f"Non zeroed lead byte = 0x{li:02x}.")
                 else:
                     raise ValueError(f"Non zeroed lead bytes = 0x{li:04x}.")
-            raw = paw[ls:]  # paw is bytes so raw is bytes
+
+        raw = qb2[bcs + ls:]  # strip code and lead bytes leaving raw bytes
 
         if len(raw) != ((len(qb64b) - cs) * 3 // 4) - ls:  # exact lengths
             raise ConversionError(f"Improperly qualified material = {qb64b}")
@@ -1186,7 +1216,7 @@ class Matter:
                 raise UnexpectedCodeError(f"Unsupported code start sextet={first}.")
 
         hs = self.Bards[first]  # get code hard size equvalent sextets
-        bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
+        bhs = (hs * 3 + 3) // 4  # bhs is min bytes to hold hs sextets
         if len(qb2) < bhs:  # need more bytes
             raise ShortageError(f"Need {bhs - len(qb2)} more bytes.")
 
@@ -1196,7 +1226,7 @@ class Matter:
 
         hs, ss, fs, ls = self.Sizes[hard]
         cs = hs + ss  # both hs and ss
-        bcs = sceil(cs * 3 / 4)  # bcs is min bytes to hold cs sextets
+        bcs = (cs * 3 + 3) // 4  # bcs is min bytes to hold cs sextets
         size = None
         if not fs:  # compute fs from size chars in ss part of code
             if cs % 4:
@@ -1214,7 +1244,7 @@ class Matter:
         # .Codes and .Sizes are well formed.
         # hs consistent and ss == 0 and not fs % 4 and hs > 0 and fs > hs
 
-        bfs = sceil(fs * 3 / 4)  # bfs is min bytes to hold fs sextets
+        bfs = (fs * 3 + 3) // 4  # bfs is min bytes to hold fs sextets
         if len(qb2) < bfs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bfs - len(qb2)))
 
@@ -1287,6 +1317,7 @@ class Seqner(Matter):
 
 
     """
+    __slots__ = ()
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=MtrDex.Salt_128, sn=None, snh=None, **kwa):
@@ -1390,6 +1421,7 @@ class Number(Matter):
 
     Methods:
     """
+    __slots__ = ()
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=NumDex.Short, num=None, numh=None, **kwa):
@@ -1560,6 +1592,8 @@ class Dater(Matter):
     Methods:
 
     """
+    __slots__ = ()
+
     ToB64 = str.maketrans(":.+", "cdp")  #  translate characters
     FromB64 = str.maketrans("cdp", ":.+")  #  translate characters
 
@@ -1689,6 +1723,7 @@ class Bexter(Matter):
     Methods:
 
     """
+    __slots__ = ()
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=MtrDex.StrB64_L0, bext=None, **kwa):
@@ -1782,6 +1817,7 @@ class Pather(Bexter):
         qb64 = '4AAC-A-1-B-3'
 
     """
+    __slots__ = ()
 
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None, bext=None,
                  code=MtrDex.StrB64_L0, path=None, **kwa):
@@ -1999,6 +2035,7 @@ class Verfer(Matter):
         verify: verifies signature
 
     """
+    __slots__ = ("_verify",)
 
     def __init__(self, **kwa):
         """
@@ -2086,6 +2123,7 @@ class Cigar(Matter):
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ("_verfer",)
 
     def __init__(self, verfer=None, **kwa):
         """
@@ -2703,6 +2741,7 @@ class Diger(Matter):
 
 
     """
+    __slots__ = ("_verify",)
 
     def __init__(self, raw=None, ser=None, code=MtrDex.Blake3_256, **kwa):
         """
@@ -3073,6 +3112,8 @@ class Prefixer(Matter):
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
     """
+    __slots__ = ("_derive", "_verify")
+
     Dummy = "#"  # dummy spaceholder char for pre. Must not be a valid Base64 char
 
     def __init__(self, raw=None, code=None, ked=None, allows=None, **kwa):
@@ -3355,6 +3396,8 @@ class Saider(Matter):
         _verify (types.MethodType): verifies said ((.qb64 ) against a given sad
 
     """
+    __slots__ = ()
+
     Dummy = "#"  # dummy spaceholder char for said. Must not be a valid Base64 char
     # should be same set of codes as in coring.DigestCodex coring.DigDex so
     # .digestive property works. Unit test ensures code sets match
@@ -3623,7 +3666,7 @@ class IndexerCodex:
     TBD4: str = '4z'  # Test of index sig lead 1 big
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 IdrDex = IndexerCodex()
 
@@ -3649,7 +3692,7 @@ class IndexedSigCodex:
     Ed448_Big_Crt_Sig: str = '3B'  # Ed448 signature appears in current list only.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 IdxSigDex = IndexedSigCodex()  # Make instance
 
@@ -3669,7 +3712,7 @@ class IndexedCurrentSigCodex:
     Ed448_Big_Crt_Sig: str = '3B'  # Ed448 signature appears in current list only.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 IdxCrtSigDex = IndexedCurrentSigCodex()  # Make instance
 
@@ -3690,7 +3733,7 @@ class IndexedBothSigCodex:
     Ed448_Big_Sig: str = '3A'  # Ed448 signature appears in both lists.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 IdxBthSigDex = IndexedBothSigCodex()  # Make instance
 
@@ -3733,8 +3776,11 @@ class Indexer:
         ._binfil is method to compute fully qualified Base2 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
         ._bexfil is method to extract .code and .raw from fully qualified Base2
+        ._qb64b (bytes | None): memoized value of .qb64b once computed
 
     """
+    __slots__ = ("_code", "_raw", "_index", "_ondex", "_qb64b")
+
     Codex = IdrDex
     # Hards table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always > 0 for Indexer.
@@ -3790,6 +3836,7 @@ class Indexer:
         .raw, .code, .index, .ondex.
 
         """
+        self._qb64b = None
         if raw is not None:  # raw provided
             if not code:
                 raise EmptyMaterialError("Improper initialization need either "
@@ -3848,7 +3895,7 @@ class Indexer:
         elif qb64b is not None:
             self._exfil(qb64b)
             if strip:  # assumes bytearray
-                del qb64b[:len(self.qb64b)]  # may be variable length fs
+                del qb64b[:self.fullSize]  # may be variable length fs
 
         elif qb64 is not None:
             self._exfil(qb64)
@@ -3856,7 +3903,7 @@ class Indexer:
         elif qb2 is not None:
             self._bexfil(qb2)
             if strip:  # assumes bytearray
-                del qb2[:len(self.qb2)]  # may be variable length fs
+                del qb2[:self.fullSize * 3 // 4]  # may be variable length fs
 
         else:
             raise EmptyMaterialError("Improper initialization need either "
@@ -3904,14 +3951,30 @@ class Indexer:
         """
         return self._ondex
 
+    @property
+    def fullSize(self):
+        """
+        Returns full size of indexer in chars
+        Fixed size codes returns fs from .Sizes
+        Variable size codes where fs==None computes fs from .index and sizes
+        """
+        hs, ss, _, fs, _ = self.Sizes[self.code]  # get sizes
+
+        if fs is None:  # index is size of variable length material
+            fs = hs + ss + (self.index * 4)
+        return fs
+
     @property
     def qb64b(self):
         """
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Memoized since .raw, .code, .index and .ondex are read only
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
     @property
     def qb64(self):
@@ -3982,7 +4045,7 @@ class Indexer:
 
         # prepend pad bytes, convert, then replace pad chars with full derivation
         # code including index,
-        full = both.encode("utf-8") + encodeB64(bytes([0] * ps) + raw)[ps - ls:]
+        full = both.encode("utf-8") + encodeB64(bytes(ps) + raw)[ps - ls:]
 
         if len(full) != fs:  # invalid size
             raise InvalidCodeSizeError(f"Invalid code={both} for raw size={len(raw)}.")
@@ -4035,11 +4098,11 @@ class Indexer:
                     raise InvalidCodeSizeError(f"Invalid code={both} for converted"
                                                f" raw pad size={ps}.")
 
-        n = sceil(cs * 3 / 4)  # number of b2 bytes to hold b64 code + index
+        n = (cs * 3 + 3) // 4  # number of b2 bytes to hold b64 code + index
         # convert code both to right align b2 int then left shift in pad bits
         # then convert to bytes
         bcode = (b64ToInt(both) << (2 * (ps - ls))).to_bytes(n, 'big')
-        full = bcode + bytes([0] * ls) + raw
+        full = bcode + bytes(ls) + raw
 
         bfs = len(full)  # binary full size
         if bfs % 3 or (bfs * 4 // 3) != fs:  # invalid size
@@ -4060,8 +4123,8 @@ class Indexer:
             raise ShortageError("Empty material.")
 
         first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
+        if not isinstance(first, str):  # bytes, bytearray or memoryview
+            first = str(first, "utf-8")
         if first not in self.Hards:
             if first[0] == '-':
                 raise UnexpectedCountCodeError("Unexpected count code start"
@@ -4077,8 +4140,8 @@ class Indexer:
             raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
         hard = qb64b[:hs]  # get hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")
+        if not isinstance(hard, str):
+            hard = str(hard, "utf-8")
         if hard not in self.Sizes:
             raise UnexpectedCodeError(f"Unsupported code ={hard}.")
 
@@ -4094,13 +4157,13 @@ class Indexer:
             raise ShortageError(f"Need {cs - len(qb64b)} more characters.")
 
         index = qb64b[hs:hs+ms]  # extract index/size chars
-        if hasattr(index, "decode"):
-            index = index.decode("utf-8")
+        if not isinstance(index, str):
+            index = str(index, "utf-8")
         index = b64ToInt(index)  # compute int index
 
         ondex = qb64b[hs+ms:hs+ms+os]  # extract ondex chars
-        if hasattr(ondex, "decode"):
-            ondex = ondex.decode("utf-8")
+        if not isinstance(ondex, str):
+            ondex = str(ondex, "utf-8")
 
         if hard in IdxCrtSigDex:  # if current sig then ondex from code must be 0
             ondex = b64ToInt(ondex) if os else None  # compute ondex from code
@@ -4128,35 +4191,28 @@ class Indexer:
         if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
             qb64b = qb64b.encode("utf-8")
 
-        # strip off prepended code and append pad characters
-        #ps = cs % 4  # pad size ps = cs mod 4, same pad chars and lead bytes
-        #base = ps * b'A' + qb64b[cs:]  # replace prepend code with prepad zeros
-        #raw = decodeB64(base)[ps+ls:]  # decode and strip off ps+ls prepad bytes
+        # decode whole primitive at once into code bytes followed by any lead
+        # bytes and raw, same as qb2, instead of replacing code with prepad
+        qb2 = decodeB64(qb64b)
+        bcs = (cs * 3 + 3) // 4  # bcs is min bytes to hold cs sextets
 
         # check for non-zeroed pad bits or lead bytes
         ps = cs % 4  # code pad size ps = cs mod 4
         pbs = 2 * (ps if ps else ls)  # pad bit size in bits
         if ps:  # ps. IF ps THEN not ls (lead) and vice versa OR not ps and not ls
-            base = ps * b'A' + qb64b[cs:]  # replace pre code with prepad chars of zero
-            paw = decodeB64(base)  # decode base to leave prepadded raw
-            pi = (int.from_bytes(paw[:ps], "big"))  # prepad as int
+            pi = qb2[bcs - 1]  # last code byte holds pad bits
             if pi & (2 ** pbs - 1 ):  # masked pad bits non-zero
                 raise ValueError(f"Non zeroed prepad bits = "
                                  f"{pi & (2 ** pbs - 1 ):<06b} in {qb64b[cs:cs+1]}.")
-            raw = paw[ps:]  # strip off ps prepad paw bytes
         else:  # not ps. IF not ps THEN may or may not be ls (lead)
-            base = qb64b[cs:]  # strip off code leaving lead chars if any and value
-            # decode lead chars + val leaving lead bytes + raw bytes
-            # then strip off ls lead bytes leaving raw
-            paw = decodeB64(base) # decode base to leave prepadded paw bytes
-            li = int.from_bytes(paw[:ls], "big")  # lead as int
+            li = int.from_bytes(qb2[bcs:bcs + ls], "big")  # lead as int
             if li:  # pre pad lead bytes must be zero
                 if ls == 1:
                     raise ValueError(f"Non zeroed lead byte = 0x{li:02x}.")
                 else:
                     raise ValueError(f"Non zeroed lead bytes = 0x{li:04x}.")
 
-            raw = paw[ls:]
+        raw = qb2[bcs + ls:]  # strip code and lead bytes leaving raw bytes
 
         if len(raw) != (len(qb64b) - cs) * 3 // 4:  # exact lengths
             raise ConversionError(f"Improperly qualified material = {qb64b}")
@@ -4191,7 +4247,7 @@ class Indexer:
                 raise UnexpectedCodeError(f"Unsupported code start sextet={first}.")
 
         hs = self.Bards[first]  # get code hard size equvalent sextets
-        bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
+        bhs = (hs * 3 + 3) // 4  # bhs is min bytes to hold hs sextets
         if len(qb2) < bhs:  # need more bytes
             raise ShortageError(f"Need {bhs - len(qb2)} more bytes.")
 
@@ -4206,7 +4262,7 @@ class Indexer:
         # .Codes and .Sizes are well formed.
         # hs consistent and hs > 0 and ss > 0 and (fs >= hs + ss if fs is not None else True)
 
-        bcs = sceil(cs * 3 / 4)  # bcs is min bytes to hold cs sextets
+        bcs = (cs * 3 + 3) // 4  # bcs is min bytes to hold cs sextets
         if len(qb2) < bcs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bcs - len(qb2)))
 
@@ -4237,7 +4293,7 @@ class Indexer:
                                       f"variable length material. os={os}.")
             fs = (index * 4) + cs
 
-        bfs = sceil(fs * 3 / 4)  # bfs is min bytes to hold fs sextets
+        bfs = (fs * 3 + 3) // 4  # bfs is min bytes to hold fs sextets
         if len(qb2) < bfs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bfs - len(qb2)))
 
@@ -4293,6 +4349,7 @@ class Siger(Indexer):
 
 
     """
+    __slots__ = ("_verfer",)
 
     def __init__(self, verfer=None, **kwa):
         """Initialze instance
@@ -4347,7 +4404,7 @@ class CounterCodex:
     KERIProtocolStack: str = '--AAA'  # KERI ACDC Protocol Stack CESR Version
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 CtrDex = CounterCodex()
 
@@ -4363,7 +4420,7 @@ class ProtocolGenusCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 ProDex = ProtocolGenusCodex()  # Make instance
 
@@ -4403,7 +4460,7 @@ class AltCounterCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 
 class Counter:
@@ -4435,6 +4492,8 @@ class Counter:
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
+    __slots__ = ("_code", "_count")
+
     Codex = CtrDex
     # Hards table maps from bytes Base64 first two code chars to int of
     # hard size, hs,(stable) of code. The soft size, ss, (unstable) for Counter
@@ -4507,7 +4566,7 @@ class Counter:
         elif qb64b is not None:
             self._exfil(qb64b)
             if strip:  # assumes bytearray
-                del qb64b[:self.Sizes[self.code].fs]
+                del qb64b[:self.fullSize]
 
         elif qb64 is not None:
             self._exfil(qb64)
@@ -4515,7 +4574,7 @@ class Counter:
         elif qb2 is not None:  # rewrite to use direct binary exfiltration
             self._bexfil(qb2)
             if strip:  # assumes bytearray
-                del qb2[:self.Sizes[self.code].fs * 3 // 4]
+                del qb2[:self.fullSize * 3 // 4]
 
         else:
             raise EmptyMaterialError("Improper initialization need either "
@@ -4538,6 +4597,13 @@ class Counter:
         """
         return self._count
 
+    @property
+    def fullSize(self):
+        """
+        Returns full size of counter in chars which is fs from .Sizes
+        """
+        return self.Sizes[self.code].fs
+
     @property
     def qb64b(self):
         """
@@ -4626,8 +4692,8 @@ class Counter:
             raise ShortageError("Empty material, Need more characters.")
 
         first = qb64b[:2]  # extract first two char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
+        if not isinstance(first, str):  # bytes, bytearray or memoryview
+            first = str(first, "utf-8")
         if first not in self.Hards:
             if first[0] == '_':
                 raise UnexpectedOpCodeError("Unexpected op code start"
@@ -4640,8 +4706,8 @@ class Counter:
             raise ShortageError("Need {} more characters.".format(hs - len(qb64b)))
 
         hard = qb64b[:hs]  # get hard code
-        if hasattr(hard, "decode"):
-            hard = hard.decode("utf-8")  # decode converts bytearray/bytes to str
+        if not isinstance(hard, str):
+            hard = str(hard, "utf-8")  # converts bytearray/bytes/memoryview to str
         if hard not in self.Sizes:  # Sizes needs str not bytes
             raise UnexpectedCodeError("Unsupported code ={}.".format(hard))
 
@@ -4656,8 +4722,8 @@ class Counter:
             raise ShortageError("Need {} more characters.".format(cs - len(qb64b)))
 
         count = qb64b[hs:hs + ss]  # extract count chars
-        if hasattr(count, "decode"):
-            count = count.decode("utf-8")
+        if not isinstance(count, str):
+            count = str(count, "utf-8")
         count = b64ToInt(count)  # compute int count
 
         self._code = hard
@@ -4680,7 +4746,7 @@ class Counter:
                 raise UnexpectedCodeError("Unsupported code start sextet={}.".format(first))
 
         hs = self.Bards[first]  # get code hard size equvalent sextets
-        bhs = sceil(hs * 3 / 4)  # bhs is min bytes to hold hs sextets
+        bhs = (hs * 3 + 3) // 4  # bhs is min bytes to hold hs sextets
         if len(qb2) < bhs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bhs - len(qb2)))
 
@@ -4694,7 +4760,7 @@ class Counter:
         # .Codes and .Sizes are well formed.
         # hs consistent and hs > 0 and ss > 0 and fs = hs + ss and not fs % 4
 
-        bcs = sceil(cs * 3 / 4)  # bcs is min bytes to hold cs sextets
+        bcs = (cs * 3 + 3) // 4  # bcs is min bytes to hold cs sextets
         if len(qb2) < bcs:  # need more bytes
             raise ShortageError("Need {} more bytes.".format(bcs - len(qb2)))
 
@@ -4705,6 +4771,71 @@ class Counter:
         self._count = count
 
 
+def extractGroup(ims, klases, count, bny=False, strip=True):
+    """
+    Returns list of count members of counted group extracted in order in one
+    pass from front of ims. Each member is an instance of klases when klases
+    is a class or a tuple of instances, one of each class in klases, when
+    klases is a tuple of classes such as (Verfer, Cigar) for receipt couples.
+    Raises ShortageError without stripping anything from ims when ims does
+    not yet hold the whole group so extraction may be retried once more bytes
+    have arrived.
+
+    Parameters:
+        ims (bytearray | bytes | memoryview): stream starting with the members
+            of the group not including the group counter
+        klases (type | tuple): Matter or Indexer subclass or tuple of them
+        count (int): number of members in group from group counter
+        bny (bool): True means members are qb2, False means qb64b
+        strip (bool): True means strip whole group from front of ims bytearray
+            once extracted. False means do not strip
+    """
+    single = isinstance(klases, type)
+    klases = (klases, ) if single else tuple(klases)
+    group = []
+    offset = 0  # offset of next member in ims
+    with memoryview(ims) as mv:  # released before ims is stripped
+        for _ in range(count):
+            members = []
+            for klas in klases:
+                if bny:
+                    member = klas(qb2=mv[offset:])
+                    offset += member.fullSize * 3 // 4
+                else:
+                    member = klas(qb64b=mv[offset:])
+                    offset += member.fullSize
+                members.append(member)
+            group.append(members[0] if single else tuple(members))
+
+    if strip:
+        del ims[:offset]
+    return group
+
+
+def encodeGroup(code, members, bny=False):
+    """
+    Returns bytes of counter with code and count of members followed by all
+    members in order joined in one pass.
+
+    Parameters:
+        code (str): counter code of group from CtrDex
+        members (Sequence): of group members where each member is either a
+            primitive such as Matter, Indexer or subclass, a tuple of them such
+            as (verfer, cigar) for a receipt couple, or already qualified bytes
+            in the domain given by bny
+        bny (bool): True means qb2, False means qb64b
+    """
+    counter = Counter(code=code, count=len(members))
+    parts = [counter.qb2 if bny else counter.qb64b]
+    for member in members:
+        for part in (member if isinstance(member, tuple) else (member, )):
+            if isinstance(part, (bytes, bytearray, memoryview)):
+                parts.append(part)
+            else:
+                parts.append(part.qb2 if bny else part.qb64b)
+    return b"".join(parts)
+
+
 class Sadder:
     """
     Sadder is self addressed data (SAD) serializer-deserializer class
@@ -4732,11 +4863,17 @@ class Sadder:
         ._version is Versionage instance of event version
         ._ident (Identage):  protocol type identifier
         ._saider (Saider): instance for this Sadder's SAID
+        ._memo (dict): memoized derived properties of subclasses keyed by
+            property name. Reset whenever .raw, .ked, or .kind is set
 
     Note:
         loads and jumps of json use str whereas cbor and msgpack use bytes
+        .ked must not be changed in place as that leaves .raw and .said and
+        any memoized derived properties stale. Set .ked instead.
 
     """
+    __slots__ = ("_code", "_raw", "_ked", "_kind", "_size", "_version",
+                 "_ident", "_saider", "_memo")
 
     def __init__(self, raw=b'', ked=None, kind=None, sad=None, code=MtrDex.Blake3_256):
         """
@@ -4755,6 +4892,7 @@ class Sadder:
 
         """
         self._code = code  # need default code for .saider
+        self._memo = {}
         if raw:  # deserialize raw using property setter
             self.raw = raw  # raw property setter does the deserialization
         elif ked:  # serialize ked using property setter
@@ -4774,6 +4912,7 @@ class Sadder:
         self._version = sad.version
         self._ident = sad.ident
         self._saider = sad.saider
+        self._memo = {}
 
 
     def _inhale(self, raw):
@@ -4854,6 +4993,7 @@ class Sadder:
         self._version = version
         self._size = size
         self._saider = Saider(qb64=ked["d"], code=self._code)
+        self._memo = {}  # derived properties now stale
 
     @property
     def ked(self):
@@ -4872,6 +5012,7 @@ class Sadder:
         self._size = size
         self._version = version
         self._saider = Saider(qb64=ked["d"], code=self._code)
+        self._memo = {}  # derived properties now stale
 
     @property
     def kind(self):
@@ -4890,6 +5031,7 @@ class Sadder:
         self._size = size
         self._version = version
         self._saider = Saider(qb64=ked["d"], code=self._code)
+        self._memo = {}  # derived properties now stale
 
 
     @property
@@ -4991,11 +5133,14 @@ class Serder(Sadder):
           ._size is int of number of bytes in serialed event only
           ._code is default code for .diger
           ._diger is Diger instance of digest of .raw
+          ._memo is dict of memoized .verfers, .werfers, .nexter, .tholder,
+            .ntholder, and .sner. Reset when .raw, .ked, or .kind is set
 
     Note:
         loads and jumps of json use str whereas cbor and msgpack use bytes
 
     """
+    __slots__ = ()  # all attributes in Sadder slots so no .__dict__
 
     def __init__(self, raw=b'', ked=None, kind=None, sad=None, code=MtrDex.Blake3_256):
         """
@@ -5026,13 +5171,16 @@ class Serder(Sadder):
         Returns list of Verfer instances as converted from .ked['k'].
         One for each key.
         verfers property getter
+        Memoized so returns new list of same Verfer instances on each access
         """
-        if "k" in self.ked:  # establishment event
-            keys = self.ked["k"]
-        else:  # non-establishment event
-            keys = []
+        if "verfers" not in self._memo:
+            if "k" in self.ked:  # establishment event
+                keys = self.ked["k"]
+            else:  # non-establishment event
+                keys = []
+            self._memo["verfers"] = [Verfer(qb64=key) for key in keys]
 
-        return [Verfer(qb64=key) for key in keys]
+        return list(self._memo["verfers"])  # copy so caller may change list
 
     @property
     def nexter(self):
@@ -5040,13 +5188,16 @@ class Serder(Sadder):
         Returns list of Diger instances as converted from .ked['n'].
         One for each key.
         nexter property getter
+        Memoized
         """
-        if "n" in self.ked:  # establishment event
-            digs = self.ked["n"]
-        else:  # non-establishment event
-            digs = []
+        if "nexter" not in self._memo:
+            if "n" in self.ked:  # establishment event
+                digs = self.ked["n"]
+            else:  # non-establishment event
+                digs = []
+            self._memo["nexter"] = Nexter(digs=digs)
 
-        return Nexter(digs=digs)
+        return self._memo["nexter"]
 
     @property
     def werfers(self):
@@ -5054,38 +5205,50 @@ class Serder(Sadder):
         Returns list of Verfer instances as converted from .ked['b'].
         One for each backer (witness).
         werfers property getter
+        Memoized so returns new list of same Verfer instances on each access
         """
-        if "b" in self.ked:  # inception establishment event
-            wits = self.ked["b"]
-        else:  # non-establishment event
-            wits = []
+        if "werfers" not in self._memo:
+            if "b" in self.ked:  # inception establishment event
+                wits = self.ked["b"]
+            else:  # non-establishment event
+                wits = []
+            self._memo["werfers"] = [Verfer(qb64=wit) for wit in wits]
 
-        return [Verfer(qb64=wit) for wit in wits]
+        return list(self._memo["werfers"])  # copy so caller may change list
 
     @property
     def tholder(self):
         """
         Returns Tholder instance as converted from .ked['kt'] or None if missing.
-
+        Memoized
         """
-        return Tholder(sith=self.ked["kt"]) if "kt" in self.ked else None
+        if "tholder" not in self._memo:
+            self._memo["tholder"] = (Tholder(sith=self.ked["kt"])
+                                     if "kt" in self.ked else None)
+        return self._memo["tholder"]
 
     @property
     def ntholder(self):
         """
         Returns Tholder instance as converted from .ked['nt'] or None if missing.
-
+        Memoized
         """
-        return Tholder(sith=self.ked["nt"]) if "nt" in self.ked else None
+        if "ntholder" not in self._memo:
+            self._memo["ntholder"] = (Tholder(sith=self.ked["nt"])
+                                      if "nt" in self.ked else None)
+        return self._memo["ntholder"]
 
     @property
     def sner(self):
         """
         sner (Number of sequence number) property getter
+        Memoized
         Returns:
             (Number): of .ked["s"] hex number str converted
         """
-        return Number(num=self.ked["s"])  # auto converts hex num str to int
+        if "sner" not in self._memo:
+            self._memo["sner"] = Number(num=self.ked["s"])  # auto converts hex num str to int
+        return self._memo["sner"]
 
 
     @property
@@ -5166,6 +5329,8 @@ class Tholder:
     Methods:
         .satisfy returns bool, True means ilist of verified signature key indices satisfies
              threshold, False otherwise.
+        .tallier returns Tallier that accumulates verified signature key indices
+             one at a time and tells when threshold is satisfied.
 
     Static Methods:
         weight (str): converts weight str expression into either int or Fraction
@@ -5183,6 +5348,14 @@ class Tholder:
         ._satisfy is method reference of threshold specified verification method
         ._satisfy_numeric is numeric threshold verification method
         ._satisfy_weighted is fractional weighted threshold verification method
+        ._denom is int common denominator of all weights when weighted
+        ._clauses is list of (offset, full, weights) of each clause when weighted
+            where offset is int index of first key of clause, full is int
+            bitmask of all keys of clause and weights is tuple of int weights
+            over ._denom
+        ._weights is list of (clause, weight) for each key index when weighted
+            where clause is int offset of clause in ._clauses and weight is
+            int weight over ._denom
 
 
     """
@@ -5436,6 +5609,19 @@ class Tholder:
         self._number = None
         self._bexter = Bexter(bext=bext)
 
+        # precompile weights into ints over common denominator so satisfaction
+        # is integer sums of weights selected by bitmask of indices
+        self._denom = math.lcm(*(Fraction(w).denominator
+                                 for clause in thold for w in clause))
+        self._clauses = []
+        self._weights = []
+        wio = 0  # weight index offset
+        for c, clause in enumerate(thold):
+            weights = tuple(int(w * self._denom) for w in clause)
+            self._clauses.append((wio, (1 << len(weights)) - 1, weights))
+            self._weights.extend((c, w) for w in weights)
+            wio += len(weights)
+
 
     @staticmethod
     def _oldcheckWeight(w: Fraction) -> Fraction:
@@ -5497,15 +5683,45 @@ class Tholder:
         return (self._satisfy(indices=indices))
 
 
+    def tallier(self, indices=None):
+        """
+        Returns Tallier of this threshold to accumulate verified signature
+        indices incrementally.
+
+        Parameters:
+            indices is optional list of indices of verified signatures to
+                start with
+        """
+        return Tallier(tholder=self, indices=indices)
+
+
+    def valid(self, index):
+        """
+        Returns True if index is a valid signature index for this threshold,
+        False otherwise. Valid indices are whole numbers and when weighted are
+        also in range of the key list. Any invalid index means not satisfied.
+
+        Parameters:
+            index (int): offset into key list of verified signature
+        """
+        if not isinstance(index, int) or isinstance(index, bool) or index < 0:
+            return False
+        return not self.weighted or index < self.size
+
+
     def _satisfy_numeric(self, indices):
         """
-        Returns True if satisfies numeric threshold False otherwise
+        Returns True if satisfies numeric threshold False otherwise.
+        Duplicate indices are counted once.
 
         Parameters:
             indices is list of indices (offsets into key list) of verified signatures
         """
         try:
-            if self.thold > 0 and len(indices) >= self.thold:  # at least one
+            if not all(self.valid(idx) for idx in indices):
+                return False
+
+            if self.thold > 0 and len(set(indices)) >= self.thold:  # at least one
                 return True
 
         except Exception as ex:
@@ -5527,20 +5743,22 @@ class Tholder:
             if not indices:  # empty indices
                 return False
 
-            # remove duplicates with set, sort low to high
-            indices = sorted(set(indices))
-            sats = [False] * self.size  # default all satifactions to False
+            mask = 0  # bit i set when index i verified
             for idx in indices:
-                sats[idx] = True  # set verified signature index to True
+                if not self.valid(idx):
+                    return False
+                mask |= 1 << idx
 
-            wio = 0  # weight index offset
-            for clause in self.thold:
+            for offset, full, weights in self._clauses:
+                bits = (mask >> offset) & full
+                if bits == full:  # all keys in clause signed so sum >= 1
+                    continue
                 cw = 0  # init clause weight
-                for w in clause:
-                    if sats[wio]:  # verified signature so weight applies
-                        cw += w
-                    wio += 1
-                if cw < 1:  # each clause must sum to at least 1
+                while bits:
+                    low = bits & -bits  # lowest set bit
+                    cw += weights[low.bit_length() - 1]
+                    bits ^= low
+                if cw < self._denom:  # each clause must sum to at least 1
                     return False
 
             return True  # all clauses including final one cw >= 1
@@ -5551,6 +5769,90 @@ class Tholder:
         return False
 
 
+class Tallier:
+    """
+    Tallier accumulates indices of verified signatures one at a time against
+    the threshold of a Tholder so that satisfaction is known after each
+    addition without reevaluating all the indices so far.
+
+    Attributes:
+        tholder (Tholder): threshold being tallied
+        indices (set): of int indices added so far
+        invalid (bool): True when an invalid index was added so that as with
+            Tholder.satisfy the threshold can no longer be satisfied
+
+    Properties:
+        .satisfied is Boolean True when indices so far satisfy threshold
+
+    Hidden:
+        ._sums is list of int weight of each clause so far when weighted
+        ._met is int number of clauses with weight of at least 1 so far
+    """
+
+    def __init__(self, tholder, indices=None):
+        """
+        Parameters:
+            tholder (Tholder): threshold to tally indices against
+            indices (Iterable | None): of int indices of verified signatures
+                to start with
+        """
+        self.tholder = tholder
+        self.indices = set()
+        self.invalid = False
+        self._sums = [0] * len(tholder._clauses) if tholder.weighted else []
+        self._met = 0
+        if indices:
+            self.extend(indices)
+
+    @property
+    def satisfied(self):
+        """ satisfied property getter """
+        if self.invalid:
+            return False
+        if self.tholder.weighted:
+            return self._met == len(self._sums)
+        return self.tholder.thold > 0 and len(self.indices) >= self.tholder.thold
+
+    def add(self, index):
+        """
+        Returns True if threshold is satisfied after adding index of verified
+        signature, False otherwise. Duplicate indices are counted once.
+        An invalid index, see Tholder.valid, rejects the whole tally as
+        Tholder.satisfy does so it is never satisfied thereafter.
+
+        Parameters:
+            index (int): offset into key list of verified signature
+        """
+        if not self.tholder.valid(index):
+            self.invalid = True
+            return False
+
+        if index in self.indices:
+            return self.satisfied
+
+        if self.tholder.weighted:
+            c, w = self.tholder._weights[index]
+            denom = self.tholder._denom
+            if self._sums[c] < denom <= self._sums[c] + w:
+                self._met += 1
+            self._sums[c] += w
+
+        self.indices.add(index)
+        return self.satisfied
+
+    def extend(self, indices):
+        """
+        Returns True if threshold is satisfied after adding all indices of
+        verified signatures, False otherwise.
+
+        Parameters:
+            indices (Iterable): of int offsets into key list of verified signatures
+        """
+        for index in indices:
+            self.add(index)
+        return self.satisfied
+
+
 class Dicter:
     """ Dicter class is base class for objects that can be stored in a Suber
 
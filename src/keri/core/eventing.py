@@ -6,7 +6,10 @@ keri.core.eventing module
 import datetime
 import json
 import logging
+import os
+import time
 from collections import namedtuple
+from concurrent import futures
 from dataclasses import dataclass, astuple
 from urllib.parse import urlsplit
 from math import ceil
@@ -16,7 +19,8 @@ from hio.help import decking
 from . import coring
 from .coring import (versify, Serials, Ilks, MtrDex, NonTransDex, CtrDex, Counter,
                      Number, Seqner, Siger, Cigar, Dater, Indexer, IdrDex,
-                     Verfer, Diger, Prefixer, Nexter, Serder, Tholder, Saider)
+                     Verfer, Diger, Prefixer, Nexter, Serder, Tholder, Saider,
+                     encodeGroup)
 from .. import help
 from .. import kering
 from ..db import basing, dbing
@@ -33,6 +37,11 @@ from ..kering import Version
 logger = help.ogler.getLogger()
 
 EscrowTimeoutPS = 3600  # seconds for partial signed escrow timeout
+VerifyBatchMin = 8  # min number of signatures in batch to verify on pool
+
+# errors Kevery.processEvent raises after escrowing event rather than rejecting it
+EscrowErrors = (MissingSignatureError, MissingWitnessSignatureError,
+                MissingDelegationError, OutOfOrderError, LikelyDuplicitousError)
 
 ICP_LABELS = ["v", "i", "s", "t", "kt", "k", "n",
               "bt", "b", "c", "a"]
@@ -63,7 +72,7 @@ class TraitCodex:
     NoBackers: str = 'NB'  # Do not allow any backers for registry
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 TraitDex = TraitCodex()  # Make instance
@@ -151,7 +160,7 @@ class ColdCodex:
     CtOpB2: int = 0o7  # CountCode or OpCode Base2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 ColdDex = ColdCodex()  # Make instance
@@ -445,6 +454,84 @@ def validateSN(sn, inceptive=None):
     return sn
 
 
+_verifyPool = None  # shared executor of verifyBatch. None means serial
+
+
+def setVerifyPool(pool=None, workers=None):
+    """
+    Returns the prior shared executor used by verifyBatch after replacing it
+    with pool or, when workers is provided, with a new thread pool of workers
+    threads. The prior executor is not shut down.
+
+    pysodium calls libsodium through ctypes which releases the GIL for the
+    duration of each call so a thread pool verifies on multiple cores without
+    pickling. A process pool may also be provided.
+
+    Parameters:
+        pool (futures.Executor | None): executor for batch verification.
+            None with workers None means verify serially
+        workers (int | None): number of threads of new thread pool
+    """
+    global _verifyPool
+    prior = _verifyPool
+    if workers is not None:
+        pool = futures.ThreadPoolExecutor(max_workers=workers,
+                                          thread_name_prefix="verify")
+    _verifyPool = pool
+    return prior
+
+
+def _poolWorkers(pool):
+    """
+    Returns number of workers of executor pool. Uses its max workers when
+    known, as for thread and process pools, otherwise the number of cpus.
+    """
+    return getattr(pool, "_max_workers", None) or os.cpu_count() or 1
+
+
+def _verifyChunk(triples):
+    """
+    Returns list of bool, one per (verfer, sig, ser) triple of chunk triples
+    """
+    return [verfer.verify(sig, ser) for verfer, sig, ser in triples]
+
+
+def verifyBatch(triples, pool=None):
+    """
+    Returns list of bool, one per triple in order of triples, each True when
+    signature of triple verifies and False otherwise.
+
+    Batches of at least VerifyBatchMin triples are verified in parallel on
+    pool in one chunk per pool worker. Smaller batches or no pool are verified serially in the
+    calling thread.
+
+    Parameters:
+        triples (Iterable): of (verfer, sig, ser) triples where verfer is Verfer
+            of public key, sig is bytes of raw signature, and ser is bytes of
+            signed serialization
+        pool (futures.Executor | None): executor. None means use shared
+            executor set by setVerifyPool if any
+    """
+    triples = list(triples)
+    pool = pool if pool is not None else _verifyPool
+    start = time.perf_counter() if help.meter.enabled else None
+    if pool is None or len(triples) < VerifyBatchMin:
+        verifieds = _verifyChunk(triples)
+    else:
+        size = max(VerifyBatchMin // 2, ceil(len(triples) / _poolWorkers(pool)))
+        chunks = [triples[i:i + size] for i in range(0, len(triples), size)]
+        verifieds = [result for results in pool.map(_verifyChunk, chunks)
+                     for result in results]
+
+    if start is not None and triples:
+        help.meter.observe("keri_signature_verify_seconds", time.perf_counter() - start)
+        valid = sum(verifieds)
+        help.meter.count("keri_signatures_verified_total", valid, result="valid")
+        help.meter.count("keri_signatures_verified_total", len(verifieds) - valid,
+                         result="invalid")
+    return verifieds
+
+
 def verifySigs(raw, sigers, verfers):
     """
     Returns tuple of (vsigers, vindices) where:
@@ -481,8 +568,9 @@ def verifySigs(raw, sigers, verfers):
     # create lists of unique verified signatures and indices
     vindices = []
     vsigers = []
-    for siger in usigers:
-        if siger.verfer.verify(siger.raw, raw):
+    results = verifyBatch((siger.verfer, siger.raw, raw) for siger in usigers)
+    for siger, verified in zip(usigers, results):
+        if verified:
             vindices.append(siger.index)
             vsigers.append(siger)
 
@@ -1394,26 +1482,22 @@ def messagize(serder, *, sigers=None, seal=None, wigers=None, cigars=None,
             atc.extend(Counter(CtrDex.TransLastIdxSigGroups, count=1).qb64b)
             atc.extend(seal.i.encode("utf-8"))
 
-        atc.extend(Counter(code=CtrDex.ControllerIdxSigs, count=len(sigers)).qb64b)
-        for siger in sigers:
-            atc.extend(siger.qb64b)
+        atc.extend(encodeGroup(CtrDex.ControllerIdxSigs, sigers))
 
     if wigers:
-        atc.extend(Counter(code=CtrDex.WitnessIdxSigs, count=len(wigers)).qb64b)
         for wiger in wigers:
             if wiger.verfer and wiger.verfer.code not in NonTransDex:
                 raise ValueError("Attempt to use tranferable prefix={} for "
                                  "receipt.".format(wiger.verfer.qb64))
-            atc.extend(wiger.qb64b)
+        atc.extend(encodeGroup(CtrDex.WitnessIdxSigs, wigers))
 
     if cigars:
-        atc.extend(Counter(code=CtrDex.NonTransReceiptCouples, count=len(cigars)).qb64b)
         for cigar in cigars:
             if cigar.verfer.code not in NonTransDex:
                 raise ValueError("Attempt to use tranferable prefix={} for "
                                  "receipt.".format(cigar.verfer.qb64))
-            atc.extend(cigar.verfer.qb64b)
-            atc.extend(cigar.qb64b)
+        atc.extend(encodeGroup(CtrDex.NonTransReceiptCouples,
+                               [(cigar.verfer, cigar) for cigar in cigars]))
 
     if pipelined:
         if len(atc) % 4:
@@ -1658,14 +1742,15 @@ class Kever:
         # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
         # all validated above so may add to KEL and FEL logs as first seen
         # returns fn == None if already logged fn log is non idempotent
-        fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                first=True if not check else False, seqner=seqner, saider=saider,
-                                firner=firner, dater=dater)
-        if fn is not None:  # first is non-idempotent for fn check mode fn is None
-            self.fn = fn
-            self.fner = Number(num=self.fn)
-            self.dater = Dater(dts=dts)
-            self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+        with self.db.txn(write=True):  # log and state commit together
+            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                    first=True if not check else False, seqner=seqner, saider=saider,
+                                    firner=firner, dater=dater)
+            if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                self.fn = fn
+                self.fner = Number(num=self.fn)
+                self.dater = Dater(dts=dts)
+                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
 
 
     @property
@@ -1927,31 +2012,33 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
-                                    first=True if not check else False, seqner=seqner, saider=saider,
-                                    firner=firner, dater=dater)
-
-            # nxt and signatures verify so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need whole serder for digest agility compare
-            self.ilk = ilk
-            self.tholder = tholder
-            self.verfers = serder.verfers
-            # update .nexter
-            self.nexter = serder.nexter
-            self.ntholder = serder.ntholder
-
-            self.toader = toader
-            self.wits = wits
-            self.cuts = cuts
-            self.adds = adds
-
-            # last establishment event location need this to recognize recovery events
-            self.lastEst = LastEstLoc(s=self.sner.num, d=self.serder.saider.qb64)
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fn = fn
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            # nxt and signatures verify so compute new state but only assign it
+            # once the log and state commit so a failed commit leaves this
+            # Kever matching the database
+            pending = dict(sner=sner,  # sequence number Number instance
+                           serder=serder,  # need whole serder for digest agility compare
+                           ilk=ilk,
+                           tholder=tholder,
+                           verfers=serder.verfers,
+                           nexter=serder.nexter,
+                           ntholder=serder.ntholder,
+                           toader=toader,
+                           wits=wits,
+                           cuts=cuts,
+                           adds=adds,
+                           # last establishment event location need this to recognize recovery events
+                           lastEst=LastEstLoc(s=sner.num, d=serder.saider.qb64))
+
+            with self.db.txn(write=True):  # log and state commit together
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers, wits=wits,
+                                        first=True if not check else False, seqner=seqner, saider=saider,
+                                        firner=firner, dater=dater)
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    pending.update(fn=fn, dater=Dater(dts=dts))
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state(**pending))
+
+            for name, val in pending.items():
+                setattr(self, name, val)
 
 
         elif ilk == Ilks.ixn:  # subsequent interaction event
@@ -1988,17 +2075,21 @@ class Kever:
 
             # .validateSigsDelWigs above ensures thresholds met otherwise raises exception
             # all validated above so may add to KEL and FEL logs as first seen
-            fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
-                                    first=True if not check else False)  # First seen accepted
-
-            # validates so update state
-            self.sner = sner  # sequence number Number instance
-            self.serder = serder  # need for digest agility includes .serder.diger
-            self.ilk = ilk
-            if fn is not None:  # first is non-idempotent for fn check mode fn is None
-                self.fn = fn
-                self.dater = Dater(dts=dts)
-                self.db.states.pin(keys=self.prefixer.qb64, val=self.state())
+            # validates so compute new state but only assign it once the log
+            # and state commit
+            pending = dict(sner=sner,  # sequence number Number instance
+                           serder=serder,  # need for digest agility includes .serder.diger
+                           ilk=ilk)
+
+            with self.db.txn(write=True):  # log and state commit together
+                fn, dts = self.logEvent(serder=serder, sigers=sigers, wigers=wigers,
+                                        first=True if not check else False)  # First seen accepted
+                if fn is not None:  # first is non-idempotent for fn check mode fn is None
+                    pending.update(fn=fn, dater=Dater(dts=dts))
+                    self.db.states.pin(keys=self.prefixer.qb64, val=self.state(**pending))
+
+            for name, val in pending.items():
+                setattr(self, name, val)
 
         else:  # unsupported event ilk so discard
             raise ValidationError("Unsupported ilk = {} for evt = {}.".format(ilk, ked))
@@ -2270,6 +2361,7 @@ class Kever:
         # during initial delegation we just escrow the delcept event
         if seqner is None and saider is None and delegator is not None:
             self.escrowPSEvent(serder=serder, sigers=sigers, wigers=wigers)
+            self.db.waker.depend(pre=serder.preb, dep=delegator)
             raise MissingDelegationError("No delegation seal for delegator {} "
                                          "with evt = {}.".format(delegator, serder.ked))
 
@@ -2288,6 +2380,7 @@ class Kever:
             sn = validateSN(sn=serder.ked["s"], inceptive=inceptive)
             self.escrowPSEvent(serder=serder, sigers=sigers, wigers=wigers)
             self.escrowPACouple(serder=serder, seqner=seqner, saider=saider)
+            self.db.waker.depend(pre=serder.preb, dep=delegator)
             raise MissingDelegationError("No delegating event from {} at {} for "
                                          "evt = {}.".format(delegator,
                                                             saider.qb64,
@@ -2364,35 +2457,38 @@ class Kever:
                 When dater provided then use dater for first seen datetime
         """
         fn = None  # None means not a first seen log event so does not return an fn
-        dgkey = dgKey(serder.preb, serder.saidb)
-        dtsb = helping.nowIso8601().encode("utf-8")
-        self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
-        self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
-        if first:  # append event dig to first seen database in order
-            if seqner and saider:  # authorized delegated or issued event
-                couple = seqner.qb64b + saider.qb64b
-                self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
-            fn = self.db.appendFe(serder.preb, serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:
-                    self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
-                                          fn=fn, firner=firner, dater=dater))
-                logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
-                            serder.preb, fn, firner.sn, serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                dtsb = dater.dtsb
-            self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
-            logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
-                        serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
-        self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+        with self.db.txn(write=True):
+            dgkey = dgKey(serder.preb, serder.saidb)
+            dtsb = helping.nowIso8601().encode("utf-8")
+            self.db.putDts(dgkey, dtsb)  # idempotent do not change dts if already
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[coring.Prefixer(qb64=w) for w in wits])
+            self.db.putEvt(dgkey, serder.raw)  # idempotent (maybe already excrowed)
+            if first:  # append event dig to first seen database in order
+                if seqner and saider:  # authorized delegated or issued event
+                    couple = seqner.qb64b + saider.qb64b
+                    self.db.setAes(dgkey, couple)  # authorizer event seal (delegator/issuer)
+                fn = self.db.appendFe(serder.preb, serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:
+                        self.cues.append(dict(kin="noticeBadCloneFN", serder=serder,
+                                              fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
+                                serder.preb, fn, firner.sn, serder.pretty())
+                if dater:  # cloned replay use original's dts from dater
+                    dtsb = dater.dtsb
+                self.db.setDts(dgkey, dtsb)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
+                            serder.preb, fn, dtsb.decode("utf-8"), serder.pretty())
+            self.db.addKe(snKey(serder.preb, serder.sn), serder.saidb)
+        if fn is not None:  # KEL advanced so dependent escrows may now resolve
+            self.db.waker.wake(serder.preb)
         logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
                     serder.preb, serder.pretty())
         return (fn, dtsb.decode("utf-8"))  # (fn int, dts str) if first else (None, dts str)
@@ -2407,14 +2503,19 @@ class Kever:
             sigers is list of Siger instances of indexed controller sigs
             wigers is optional list of Siger instance of indexed witness sigs
         """
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        self.db.putEvt(dgkey, serder.raw)
-        snkey = snKey(serder.preb, serder.sn)
-        self.db.addPse(snkey, serder.saidb)  # b'EOWwyMU3XA7RtWdelFt-6waurOTH_aW_Z9VTaU-CshGk.00000000000000000000000000000001'
+        with self.db.txn(write=True):
+            dgkey = dgKey(serder.preb, serder.saidb)
+            cnt = self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            self.db.putEvt(dgkey, serder.raw)
+            snkey = snKey(serder.preb, serder.sn)
+            self.db.addPse(snkey, serder.saidb)  # b'EOWwyMU3XA7RtWdelFt-6waurOTH_aW_Z9VTaU-CshGk.00000000000000000000000000000001'
+            grew = (self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey)) > cnt
+        if grew:  # new sigs so revisit escrowed event
+            self.db.waker.wake(serder.preb)
         logger.info("Kever state: Escrowed partially signed or delegated "
                     "event = %s\n", serder.ked)
 
@@ -2451,33 +2552,48 @@ class Kever:
             seqner is Seqner instance of sn of seal source event of delegator/issuer
             saider is Diger instance of digest of delegator/issuer
         """
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if sigers:
-            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        if seqner and saider:
-            couple = seqner.qb64b + saider.qb64b
-            self.db.putPde(dgkey, couple)
+        with self.db.txn(write=True):
+            dgkey = dgKey(serder.preb, serder.saidb)
+            cnt = self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))  # idempotent
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if sigers:
+                self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            if seqner and saider:
+                couple = seqner.qb64b + saider.qb64b
+                self.db.putPde(dgkey, couple)
 
-        self.db.putEvt(dgkey, serder.raw)
+            self.db.putEvt(dgkey, serder.raw)
+            result = self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+            grew = (self.db.cntSigs(dgkey) + self.db.cntWigs(dgkey)) > cnt
+        if grew:  # new sigs so revisit escrowed event
+            self.db.waker.wake(serder.preb)
         logger.info("Kever state: Escrowed partially witnessed "
                     "event = %s\n", serder.ked)
-        return self.db.addPwe(snKey(serder.preb, serder.sn), serder.saidb)
+        return result
 
 
-    def state(self, kind=Serials.json):
+    def state(self, kind=Serials.json, **pending):
         """
         Returns Serder instance of current key state notification message
 
         Parameters:
             kind is serialization kind for message json, cbor, mgpk
+            pending (dict): attribute values keyed by attribute name, such as
+                sner, serder, or fn, that have been validated but not yet
+                assigned to this Kever. These override the current attributes
+                so the state of an event may be persisted before the Kever
+                itself is updated.
         """
-        eevt = StateEstEvent(s="{:x}".format(self.lastEst.s),
-                             d=self.lastEst.d,
-                             br=self.cuts,
-                             ba=self.adds)
+        def get(name):
+            return pending[name] if name in pending else getattr(self, name)
+
+        lastEst = get("lastEst")
+        eevt = StateEstEvent(s="{:x}".format(lastEst.s),
+                             d=lastEst.d,
+                             br=get("cuts"),
+                             ba=get("adds"))
 
         cnfg = []
         if self.estOnly:
@@ -2485,20 +2601,23 @@ class Kever:
         if self.doNotDelegate:
             cnfg.append(TraitDex.DoNotDelegate)
 
+        serder = get("serder")
+        ntholder = get("ntholder")
+        nexter = get("nexter")
         return (state(pre=self.prefixer.qb64,
-                      sn=self.sner.num,
-                      pig=(self.serder.ked["p"] if "p" in self.serder.ked else ""),
-                      dig=self.serder.said,
-                      fn=self.fn,
-                      stamp=self.dater.dts,  # need to add dater object for first seen dts
-                      eilk=self.ilk,
-                      keys=[verfer.qb64 for verfer in self.verfers],
+                      sn=get("sner").num,
+                      pig=(serder.ked["p"] if "p" in serder.ked else ""),
+                      dig=serder.said,
+                      fn=get("fn"),
+                      stamp=get("dater").dts,  # need to add dater object for first seen dts
+                      eilk=get("ilk"),
+                      keys=[verfer.qb64 for verfer in get("verfers")],
                       eevt=eevt,
-                      sith=self.tholder.sith,
-                      nsith=self.ntholder.sith if self.ntholder else '0',
-                      ndigs=self.nexter.digs if self.nexter else [],
-                      toad=self.toader.num,
-                      wits=self.wits,
+                      sith=get("tholder").sith,
+                      nsith=ntholder.sith if ntholder else '0',
+                      ndigs=nexter.digs if nexter else [],
+                      toad=get("toader").num,
+                      wits=get("wits"),
                       cnfg=cnfg,
                       dpre=self.delegator,
                       kind=kind
@@ -2683,6 +2802,7 @@ class Kevery:
         while evts:
             self.processEvent(**evts.pull())
 
+    @help.meter.tallied("keri_kevery_events_total", escrows=EscrowErrors)
     def processEvent(self, serder, sigers, *, wigers=None,
                      seqner=None, saider=None,
                      firner=None, dater=None):
@@ -2886,6 +3006,7 @@ class Kevery:
 
             # process each couple verify sig and write to db
             wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
+            vwigers = []
             for wiger in wigers:
                 # assign verfers from witness list
                 if wiger.index >= len(wits):
@@ -2905,7 +3026,12 @@ class Kevery:
                                     " on nonlocal event receipt=\n%s\n", serder.pretty())
                         continue  # skip own receipt attachment on non-local event
 
-                if wiger.verfer.verify(wiger.raw, lserder.raw):
+                vwigers.append(wiger)  # verify below in batch
+
+            results = verifyBatch((wiger.verfer, wiger.raw, lserder.raw)
+                                  for wiger in vwigers)
+            for wiger, verified in zip(vwigers, results):
+                if verified:
                     # write receipt indexed sig to database
                     self.db.addWig(key=dgkey, val=wiger.qb64b)
 
@@ -2953,6 +3079,7 @@ class Kevery:
                                       "".format(ked["s"], ked))
 
             # process each couple verify sig and write to db
+            vcigars = []
             for cigar in cigars:
                 if cigar.verfer.transferable:  # skip transferable verfers
                     continue  # skip invalid couplets
@@ -2967,8 +3094,12 @@ class Kevery:
                         logger.info("Kevery process: skipped own receipt attachment"
                                     " on nonlocal event receipt=\n%s\n", serder.pretty())
                         continue  # skip own receipt attachment on non-local event
+                vcigars.append(cigar)  # verify below in batch
 
-                if cigar.verfer.verify(cigar.raw, lserder.raw):
+            results = verifyBatch((cigar.verfer, cigar.raw, lserder.raw)
+                                  for cigar in vcigars)
+            for cigar, verified in zip(vcigars, results):
+                if verified:
                     wits = [wit.qb64 for wit in self.fetchWitnessState(pre, sn)]
                     rpre = cigar.verfer.qb64  # prefix of receiptor
                     if rpre in wits:  # its a witness receipt
@@ -3022,6 +3153,7 @@ class Kevery:
                                   "".format(ked["s"]))
 
         # process each couple to verify sig and write to db
+        vcigars = []
         for cigar in cigars:
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid couplets
@@ -3035,8 +3167,12 @@ class Kevery:
                     logger.info("Kevery process: skipped own receipt attachment"
                                 " on nonlocal event receipt=\n%s\n", serder.pretty())
                     continue  # skip own receipt attachment on non-local event
+            vcigars.append(cigar)  # verify below in batch
 
-            if cigar.verfer.verify(cigar.raw, serder.raw):
+        results = verifyBatch((cigar.verfer, cigar.raw, serder.raw)
+                              for cigar in vcigars)
+        for cigar, verified in zip(vcigars, results):
+            if verified:
                 wits = self.fetchWitnessState(pre, sn)
                 rpre = cigar.verfer.qb64  # prefix of receiptor
                 if rpre in wits:  # its a witness receipt
@@ -3798,16 +3934,15 @@ class Kevery:
                     self.escrowQueryNotFoundEvent(serder=serder, prefixer=source, sigers=sigers, cigars=cigars)
                     raise QueryNotFoundError("Query not found error={}.".format(ked))
 
-            msgs = list()  # outgoing messages
-            for msg in self.db.clonePreIter(pre=pre, fn=0):
-                msgs.append(msg)
-
-            if kever.delegator:
-                cloner = self.db.clonePreIter(pre=kever.delegator, fn=0)  # create iterator at 0
-                for msg in cloner:
-                    msgs.append(msg)
+            fn = 0  # first seen ordinal to replay from. querier may have prefix
+            if "fn" in qry:
+                fn = int(qry["fn"])
+            elif "d" in qry:  # SAID of last event querier has so replay after it
+                if (fner := self.db.fons.get(keys=dgKey(pre, qry["d"]))) is not None:
+                    fn = fner.sn + 1
 
-            if msgs:
+            if self.db.getFe(fnKey(pre, fn)) is not None:  # querier missing tail
+                msgs = self.replayLogs(pre=pre, fn=fn)  # lazy so not materialized
                 self.cues.push(dict(kin="replay", src=src, msgs=msgs, dest=source.qb64))
 
         elif route == "ksn":
@@ -3827,11 +3962,19 @@ class Kevery:
             src = qry["src"]
             topics = qry["topics"]
 
+            if (not isinstance(topics, dict) or
+                    not all(isinstance(idx, int) and not isinstance(idx, bool) and idx >= 0
+                            for idx in topics.values())):
+                raise ValidationError("Invalid mailbox topics = {} for evt = {}"
+                                      "".format(topics, ked))
+
             if pre not in self.kevers:
                 self.escrowQueryNotFoundEvent(serder=serder, prefixer=source, sigers=sigers, cigars=cigars)
                 raise QueryNotFoundError("Query not found error={}.".format(ked))
 
-            self.cues.push(dict(kin="stream", serder=serder, pre=pre, src=src, topics=topics))
+            # only the verified querier may acknowledge its own mail
+            self.cues.push(dict(kin="stream", serder=serder, pre=pre, src=src, topics=topics,
+                                source=source.qb64 if source is not None else None))
             # if pre in self.kevers:
             #     kever = self.kevers[pre]
             #     if src in kever.wits and src in self.db.prefixes:  # We are a witness for identifier
@@ -3840,6 +3983,43 @@ class Kevery:
             self.cues.push(dict(kin="invalid", serder=serder))
             raise ValidationError("invalid query message {} for evt = {}".format(ilk, ked))
 
+    def replayLogs(self, pre, fn=0):
+        """
+        Returns iterator of first seen event messages with attachments of the
+        KEL of pre starting at first seen ordinal fn followed by those of its
+        delegator's KEL if any. When fn is not zero only the tail of the
+        delegator's KEL starting at the first event that delegates a replayed
+        event is included since the querier already has the rest.
+
+        Parameters:
+            pre (str): qb64 identifier prefix of KEL to replay
+            fn (int): first seen ordinal of first event to replay
+
+        Each event is read with its own short transaction so no read
+        transaction stays open while the iterator waits in .cues.
+        """
+        yield from self.db.clonePreIter(pre=pre, fn=fn)
+
+        delegator = self.kevers[pre].delegator
+        if not delegator:
+            return
+
+        dfn = 0  # replay delegator's KEL from first seen ordinal dfn
+        if fn > 0:
+            dfn = None
+            while (dig := self.db.getFe(fnKey(pre, fn))) is not None:
+                if (couple := self.db.getAes(dgKey(pre, bytes(dig)))) is not None:
+                    _, saider = deSourceCouple(bytes(couple))
+                    fner = self.db.fons.get(keys=dgKey(delegator, saider.qb64b))
+                    if fner is not None:
+                        dfn = fner.sn
+                        break
+                fn += 1
+            if dfn is None:  # no replayed event is delegated
+                return
+
+        yield from self.db.clonePreIter(pre=delegator, fn=dfn)
+
     def fetchEstEvent(self, pre, sn):
         """
         Returns Serder instance of establishment event that is authoritative for
@@ -3881,16 +4061,17 @@ class Kevery:
             saider (Saider): instance of dig of event delegatint/issuing event if any
             wigers (list): of witness signatures
         """
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
-        if wigers:
-            self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
-        if seqner and saider:
-            couple = seqner.qb64b + saider.qb64b
-            self.db.putPde(dgkey, couple)  # idempotent
+        with self.db.txn(write=True):
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addOoe(snKey(serder.preb, serder.sn), serder.saidb)
+            if wigers:
+                self.db.putWigs(dgkey, [siger.qb64b for siger in wigers])
+            if seqner and saider:
+                couple = seqner.qb64b + saider.qb64b
+                self.db.putPde(dgkey, couple)  # idempotent
         # log escrowed
         logger.info("Kevery process: escrowed out of order event=\n%s\n",
                     json.dumps(serder.ked, indent=1))
@@ -3906,14 +4087,15 @@ class Kevery:
             cigars (list): of non-transferable receipts
         """
         cigars = cigars if cigars is not None else []
-        dgkey = dgKey(prefixer.qb64b, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addQnf(dgkey, serder.saidb)
+        with self.db.txn(write=True):
+            dgkey = dgKey(prefixer.qb64b, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addQnf(dgkey, serder.saidb)
 
-        for cigar in cigars:
-            self.db.addRct(key=dgkey, val=cigar.verfer.qb64b + cigar.qb64b)
+            for cigar in cigars:
+                self.db.addRct(key=dgkey, val=cigar.verfer.qb64b + cigar.qb64b)
 
         # log escrowed
         logger.info("Kevery process: escrowed query not found event=\n%s\n",
@@ -3927,11 +4109,12 @@ class Kevery:
             serder is Serder instance of  event
             sigers is list of Siger instance for  event
         """
-        dgkey = dgKey(serder.preb, serder.saidb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
+        with self.db.txn(write=True):
+            dgkey = dgKey(serder.preb, serder.saidb)
+            self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
+            self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
+            self.db.putEvt(dgkey, serder.raw)
+            self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
         # log duplicitous
         logger.info("Kevery process: escrowed likely duplicitous event=\n%s\n",
                     json.dumps(serder.ked, indent=1))
@@ -3962,12 +4145,16 @@ class Kevery:
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
         self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
+        added = False
         for wiger in wigers:  # escrow each couple
             # don't know witness pre yet without witness list so no verfer in wiger
             # if wiger.verfer.transferable:  # skip transferable verfers
             # continue  # skip invalid triplets
             couple = said.encode("utf-8") + wiger.qb64b
-            self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple)
+            if self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple):
+                added = True
+        if added:  # receipted event may be escrowed so revisit
+            self.db.waker.wake(serder.preb)
         # log escrowed
         logger.info("Kevery process: escrowed unverified witness indexed receipt"
                     " of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn, said)
@@ -3994,11 +4181,15 @@ class Kevery:
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
         self.db.putDts(dgKey(serder.preb, said), helping.nowIso8601().encode("utf-8"))
+        added = False
         for cigar in cigars:  # escrow each triple
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid triplets
             triple = said.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
-            self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
+            if self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple):  # should be snKey
+                added = True
+        if added:  # receipted event may be escrowed so revisit
+            self.db.waker.wake(serder.preb)
         # log escrowed
         logger.info("Kevery process: escrowed unverified receipt of pre= %s "
                     " sn=%x dig=%s\n", serder.pre, serder.sn, said)
@@ -4043,6 +4234,7 @@ class Kevery:
             for siger in sigers:  # escrow each quintlet
                 quintuple = prelet + siger.qb64b  # quintuple
                 self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+            self.db.waker.depend(pre=serder.preb, dep=prefixer.qb64b)  # receiptor
             # log escrowed
             logger.info("Kevery process: escrowed unverified transferable receipt "
                         "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -4085,6 +4277,7 @@ class Kevery:
         for siger in sigers:  # escrow each quintlet
             quintuple = prelet + siger.qb64b  # quintuple
             self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.db.waker.depend(pre=serder.preb, dep=prefixer.qb64b)  # receiptor
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferable receipt "
                     "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -4118,6 +4311,7 @@ class Kevery:
         quintuple = (serder.saidb + sprefixer.qb64b + sseqner.qb64b +
                      saider.qb64b + siger.qb64b)
         self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        self.db.waker.depend(pre=serder.preb, dep=sprefixer.qb64b)  # receiptor
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferabe validator "
                     "receipt of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn,
@@ -4125,19 +4319,26 @@ class Kevery:
 
     def processEscrows(self):
         """
-        Iterate throush escrows and process any that may now be finalized
+        Iterate throush escrows and process any that may now be finalized.
+        Key event escrows only revisit the escrowed events whose dependency
+        has advanced since this Kevery's last pass as indexed by .db.waker,
+        except for a periodic full sweep that times out stale escrowed events.
 
         Parameters:
         """
 
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
-            self.processEscrowUnverTrans()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
-            self.processEscrowDuplicitous()
+            for escrow, process in (("ooes", self.processEscrowOutOfOrders),
+                                    ("uwes", self.processEscrowUnverWitness),
+                                    ("ures", self.processEscrowUnverNonTrans),
+                                    ("vres", self.processEscrowUnverTrans),
+                                    ("pwes", self.processEscrowPartialWigs),
+                                    ("pses", self.processEscrowPartialSigs),
+                                    ("ldes", self.processEscrowDuplicitous)):
+                pres = self.db.waker.woken(escrow, self)  # None means full sweep
+                if pres is None or pres:  # skip when nothing woken
+                    process(pres=pres)
+                self.db.waker.settle(escrow, self)  # only once pass succeeds
             self.processEscrowKeyState()
             self.processQueryNotFound()
 
@@ -4148,7 +4349,7 @@ class Kevery:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
             raise ex
 
-    def processEscrowOutOfOrders(self):
+    def processEscrowOutOfOrders(self, pres=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
@@ -4176,6 +4377,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of event
                 sn is int sequence number of event
 
+        Parameters:
+            pres (set | None): prefix bytes of escrowed events to process.
+                None means process all escrowed events
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -4191,6 +4396,8 @@ class Kevery:
             for ekey, edig in self.db.getOoeItemsNextIter(key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if pres is not None and pre not in pres:
+                        continue  # not woken so still waiting
                     # check date if expired then remove escrow.
                     dtb = self.db.getDts(dgKey(pre, bytes(edig)))
                     if dtb is None:  # othewise is a datetime as bytes
@@ -4284,7 +4491,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialSigs(self):
+    def processEscrowPartialSigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled,
         either due to missing signatures or missing dependent events like a
@@ -4309,6 +4516,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of event
                 sn is int sequence number of event
 
+        Parameters:
+            pres (set | None): prefix bytes of escrowed events to process.
+                None means process all escrowed events
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -4325,6 +4536,8 @@ class Kevery:
                 eserder = None
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if pres is not None and pre not in pres:
+                        continue  # not woken so still waiting
                     dgkey = dgKey(pre, bytes(edig))
                     # check date if expired then remove escrow.
                     dtb = self.db.getDts(dgkey)
@@ -4443,7 +4656,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialWigs(self):
+    def processEscrowPartialWigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
@@ -4469,6 +4682,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of event
                 sn is int sequence number of event
 
+        Parameters:
+            pres (set | None): prefix bytes of escrowed events to process.
+                None means process all escrowed events
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -4485,6 +4702,8 @@ class Kevery:
             for ekey, edig in self.db.getPweItemsNextIter(key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if pres is not None and pre not in pres:
+                        continue  # not woken so still waiting
                     # check date if expired then remove escrow.
                     dtb = self.db.getDts(dgKey(pre, bytes(edig)))
                     if dtb is None:  # othewise is a datetime as bytes
@@ -4598,7 +4817,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverWitness(self):
+    def processEscrowUnverWitness(self, pres=None):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -4637,6 +4856,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of receipted event
                 sn is int sequence number of receipted event
 
+        Parameters:
+            pres (set | None): prefix bytes of escrowed events to process.
+                None means process all escrowed events
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -4653,6 +4876,8 @@ class Kevery:
             for ekey, ecouple in self.db.getUweItemsNextIter(key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
+                    if pres is not None and pre not in pres:
+                        continue  # not woken so still waiting
                     #  get escrowed receipt's rdiger of receipted event and
                     # wiger indexed signature of receipted event
                     rdiger, wiger = deWitnessCouple(ecouple)
@@ -4721,7 +4946,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowUnverNonTrans(self):
+    def processEscrowUnverNonTrans(self, pres=None):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -4758,6 +4983,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of receipted event
                 sn is int sequence number of receipted event
 
+        Parameters:
+            pres (set | None): prefix bytes of escrowed events to process.
+                None means process all escrowed events
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -4774,6 +5003,8 @@ class Kevery:
             for ekey, etriplet in self.db.getUreItemsNextIter(key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if pres is not None and pre not in pres:
+                        continue  # not woken so still waiting
                     rsaider, sprefixer, cigar = deReceiptTriple(etriplet)
                     cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
 
@@ -5111,13 +5342,14 @@ class Kevery:
                 raise ValidationError("Bad escrowed witness receipt wig"
                                       " at pre={} sn={:x}."
                                       "".format(pre, sn))
-            self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b)
+            if self.db.addWig(key=dgKey(pre, serder.said), val=wiger.qb64b):
+                self.db.waker.wake(pre)  # new wig so revisit escrowed event
             # processEscrowPartialWigs removes from this .Pwes escrow
             # when fully witnessed using self.db.delPwe(snkey, dig)
 
         return found
 
-    def processEscrowUnverTrans(self):
+    def processEscrowUnverTrans(self, pres=None):
         """
         Process event receipts from transferable identifiers (validators)
         escrowed by Kever that are unverified.
@@ -5152,6 +5384,10 @@ class Kevery:
                 sigers is list of Siger instances for receipted event
 
 
+        Parameters:
+            pres (set | None): prefix bytes of escrowed events to process.
+                None means process all escrowed events
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -5168,6 +5404,8 @@ class Kevery:
             for ekey, equinlet in self.db.getVreItemsNextIter(key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if pres is not None and pre not in pres:
+                        continue  # not woken so still waiting
                     esaider, sprefixer, sseqner, ssaider, siger = deTransReceiptQuintuple(equinlet)
 
                     # check date if expired then remove escrow.
@@ -5274,6 +5512,7 @@ class Kevery:
                 except UnverifiedTransferableReceiptError as ex:
                     # still waiting on missing prior event to validate
                     # only happens if we process above
+                    self.db.waker.depend(pre=pre, dep=sprefixer.qb64b)
                     if logger.isEnabledFor(logging.DEBUG):  # adds exception data
                         logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
                     else:
@@ -5298,7 +5537,7 @@ class Kevery:
                 break
             key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowDuplicitous(self):
+    def processEscrowDuplicitous(self, pres=None):
         """
         Process events escrowed by Kever that are likely duplicitous.
         An event is likely duplicitous if a different version of event already
@@ -5325,6 +5564,10 @@ class Kevery:
                 pre is str qb64 of identifier prefix of event
                 sn is int sequence number of event
 
+        Parameters:
+            pres (set | None): prefix bytes of escrowed events to process.
+                None means process all escrowed events
+
         Steps:
             Each pass  (walk index table)
                 For each prefix,sn
@@ -5339,6 +5582,8 @@ class Kevery:
             for ekey, edig in self.db.getLdeItemsNextIter(key=key):
                 try:
                     pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                    if pres is not None and pre not in pres:
+                        continue  # not woken so still waiting
                     # check date if expired then remove escrow.
                     dtb = self.db.getDts(dgKey(pre, bytes(edig)))
                     if dtb is None:  # othewise is a datetime as bytes
@@ -11,7 +11,7 @@ from dataclasses import dataclass, astuple
 
 from .coring import (Ilks, CtrDex, Counter, Seqner, Siger, Cigar, IdxSigDex,
                      Dater, Verfer, Prefixer, Serder, Saider, Pather, Idents,
-                     Sadder, )
+                     Sadder, extractGroup)
 from .. import help
 from .. import kering
 from ..vc.proving import Creder
@@ -58,7 +58,7 @@ class ColdCodex:
     CtOpB2: int = 0o7  # CountCode or OpCode Base2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 
 ColdDex = ColdCodex()  # Make instance
@@ -198,6 +198,33 @@ class Parser:
                     raise  # bad pipelined frame so abort by raising error
                 yield
 
+    @staticmethod
+    def _groupExtractor(ims, klases, count, cold=Colds.txt, abort=False):
+        """
+        Returns generator to extract and return list of count members of a
+        counted group from input message stream, ims, in one pass given stream
+        state, cold, is txt or bny. Each member is instance of klases when
+        klases is a class else tuple of instances of each class in klases.
+        Yields if not enough bytes in ims to fill out whole group. Nothing is
+        stripped from ims until whole group is extracted.
+
+        Usage:
+
+        members = yield from self._groupExtractor
+        """
+        while True:
+            try:
+                if cold == Colds.txt:
+                    return extractGroup(ims, klases=klases, count=count)
+                elif cold == Colds.bny:
+                    return extractGroup(ims, klases=klases, count=count, bny=True)
+                else:
+                    raise kering.ColdStartError("Invalid stream state cold={}.".format(cold))
+            except kering.ShortageError as ex:
+                if abort:  # pipelined pre-collects full frame before extracting
+                    raise  # bad pipelined frame so abort by raising error
+                yield
+
     def _sadPathSigGroup(self, ctr, ims, root=None, cold=Colds.txt, pipelined=False):
         """
 
@@ -234,13 +261,12 @@ class Parser:
             for prefixer, seqner, saider, isigers in self._transIdxSigGroups(sctr, ims, cold=cold, pipelined=pipelined):
                 yield sctr.code, (subpath, prefixer, seqner, saider, isigers)
         elif sctr.code == CtrDex.ControllerIdxSigs:
-            isigers = []
-            for i in range(sctr.count):  # extract each attached signature
-                isiger = yield from self._extractor(ims=ims,
-                                                    klas=Siger,
-                                                    cold=cold,
-                                                    abort=pipelined)
-                isigers.append(isiger)
+            # extract all attached signatures
+            isigers = yield from self._groupExtractor(ims=ims,
+                                                      klases=Siger,
+                                                      count=sctr.count,
+                                                      cold=cold,
+                                                      abort=pipelined)
             yield sctr.code, (subpath, isigers)
         elif sctr.code == CtrDex.NonTransReceiptCouples:
             for cigar in self._nonTransReceiptCouples(ctr=sctr, ims=ims, cold=cold, pipelined=pipelined):
@@ -294,13 +320,12 @@ class Parser:
                 raise kering.UnexpectedCountCodeError("Wrong "
                                                       "count code={}.Expected code={}."
                                                       "".format(ictr.code, CtrDex.ControllerIdxSigs))
-            isigers = []
-            for i in range(ictr.count):  # extract each attached signature
-                isiger = yield from self._extractor(ims=ims,
-                                                    klas=Siger,
-                                                    cold=cold,
-                                                    abort=pipelined)
-                isigers.append(isiger)
+            # extract all attached signatures
+            isigers = yield from self._groupExtractor(ims=ims,
+                                                      klases=Siger,
+                                                      count=ictr.count,
+                                                      cold=cold,
+                                                      abort=pipelined)
 
             yield prefixer, seqner, saider, isigers
 
@@ -324,15 +349,13 @@ class Parser:
         Yields:
 
         """
-        for i in range(ctr.count):  # extract each attached couple
-            verfer = yield from self._extractor(ims=ims,
-                                                klas=Verfer,
-                                                cold=cold,
-                                                abort=pipelined)
-            cigar = yield from self._extractor(ims=ims,
-                                               klas=Cigar,
-                                               cold=cold,
-                                               abort=pipelined)
+        # extract all attached couples
+        couples = yield from self._groupExtractor(ims=ims,
+                                                  klases=(Verfer, Cigar),
+                                                  count=ctr.count,
+                                                  cold=cold,
+                                                  abort=pipelined)
+        for verfer, cigar in couples:
             cigar.verfer = verfer
 
             yield cigar
@@ -719,6 +742,8 @@ class Parser:
             except kering.ShortageError as ex:  # need more bytes
                 yield
             else:  # extracted successfully
+                # deleting from front of bytearray just advances its start so
+                # stripping is O(1) not a memmove of rest of stream
                 del ims[:sadder.size]  # strip off event from front of ims
                 break
 
@@ -772,20 +797,20 @@ class Parser:
                 # iteratively process attachment counters (all non pipelined)
                 while True:  # do while already extracted first counter is ctr
                     if ctr.code == CtrDex.ControllerIdxSigs:
-                        for i in range(ctr.count):  # extract each attached signature
-                            siger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            sigers.append(siger)
+                        # extract all attached signatures
+                        sigers.extend((yield from self._groupExtractor(ims=ims,
+                                                                       klases=Siger,
+                                                                       count=ctr.count,
+                                                                       cold=cold,
+                                                                       abort=pipelined)))
 
                     elif ctr.code == CtrDex.WitnessIdxSigs:
-                        for i in range(ctr.count):  # extract each attached signature
-                            wiger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            wigers.append(wiger)
+                        # extract all attached signatures
+                        wigers.extend((yield from self._groupExtractor(ims=ims,
+                                                                       klases=Siger,
+                                                                       count=ctr.count,
+                                                                       cold=cold,
+                                                                       abort=pipelined)))
 
                     elif ctr.code == CtrDex.NonTransReceiptCouples:
                         # extract attached rct couplets into list of sigvers
@@ -805,24 +830,15 @@ class Parser:
                         # sdig is dig of signer's est event when signed
                         # sig is indexed signature of signer on this event msg
 
-                        for i in range(ctr.count):  # extract each attached quadruple
-                            prefixer = yield from self._extractor(ims,
-                                                                  klas=Prefixer,
-                                                                  cold=cold,
-                                                                  abort=pipelined)
-                            seqner = yield from self._extractor(ims,
-                                                                klas=Seqner,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            saider = yield from self._extractor(ims,
-                                                                klas=Saider,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            siger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            trqs.append((prefixer, seqner, saider, siger))
+                        # extract all attached quadruples
+                        trqs.extend((yield from self._groupExtractor(ims=ims,
+                                                                     klases=(Prefixer,
+                                                                             Seqner,
+                                                                             Saider,
+                                                                             Siger),
+                                                                     count=ctr.count,
+                                                                     cold=cold,
+                                                                     abort=pipelined)))
 
                     elif ctr.code == CtrDex.TransIdxSigGroups:
                         # extract attaced trans indexed sig groups each made of
@@ -856,13 +872,12 @@ class Parser:
                                 raise kering.UnexpectedCountCodeError("Wrong "
                                                                       "count code={}.Expected code={}."
                                                                       "".format(ictr.code, CtrDex.ControllerIdxSigs))
-                            isigers = []
-                            for i in range(ictr.count):  # extract each attached signature
-                                isiger = yield from self._extractor(ims=ims,
-                                                                    klas=Siger,
-                                                                    cold=cold,
-                                                                    abort=pipelined)
-                                isigers.append(isiger)
+                            # extract all attached signatures
+                            isigers = yield from self._groupExtractor(ims=ims,
+                                                                      klases=Siger,
+                                                                      count=ictr.count,
+                                                                      cold=cold,
+                                                                      abort=pipelined)
                             ssgs.append((prefixer, isigers))
 
                     elif ctr.code == CtrDex.FirstSeenReplayCouples:
@@ -870,32 +885,24 @@ class Parser:
                         # snu+dtm
                         # snu is fn (first seen ordinal) of event
                         # dtm is dt of event
-                        for i in range(ctr.count):  # extract each attached quadruple
-                            firner = yield from self._extractor(ims,
-                                                                klas=Seqner,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            dater = yield from self._extractor(ims,
-                                                               klas=Dater,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            frcs.append((firner, dater))
+                        # extract all attached couples
+                        frcs.extend((yield from self._groupExtractor(ims=ims,
+                                                                     klases=(Seqner, Dater),
+                                                                     count=ctr.count,
+                                                                     cold=cold,
+                                                                     abort=pipelined)))
 
                     elif ctr.code == CtrDex.SealSourceCouples:
                         # extract attached first seen replay couples
                         # snu+dig
                         # snu is sequence number  of event
                         # dig is digest of event
-                        for i in range(ctr.count):  # extract each attached quadruple
-                            seqner = yield from self._extractor(ims,
-                                                                klas=Seqner,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            saider = yield from self._extractor(ims,
-                                                                klas=Saider,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            sscs.append((seqner, saider))
+                        # extract all attached couples
+                        sscs.extend((yield from self._groupExtractor(ims=ims,
+                                                                     klases=(Seqner, Saider),
+                                                                     count=ctr.count,
+                                                                     cold=cold,
+                                                                     abort=pipelined)))
 
                     elif ctr.code == CtrDex.SadPathSigGroup:
                         path = yield from self._extractor(ims,
@@ -974,6 +981,7 @@ class Parser:
             serder = Serder(sad=sadder)
 
             ilk = serder.ked["t"]  # dispatch abased on ilk
+            help.meter.count("keri_parser_frames_total", ident=Idents.keri, ilk=ilk)
 
             if ilk in [Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt]:  # event msg
                 firner, dater = frcs[-1] if frcs else (None, None)  # use last one if more than one
@@ -1103,6 +1111,7 @@ class Parser:
                                              " {}.".format(ilk, serder.pretty()))
 
         elif sadder.ident == Idents.acdc:
+            help.meter.count("keri_parser_frames_total", ident=Idents.acdc, ilk="")
             creder = Creder(sad=sadder)
             args = dict(creder=creder)
 
@@ -8,17 +8,97 @@ self-addressing and schema support
 import json
 
 import cbor2 as cbor
-import jsonschema
 import msgpack
 
 from . import coring
 from .coring import MtrDex, Serials, Saider, Ids
 from .. import help, kering
+from ..help import helping
 from ..kering import ValidationError, DeserializationError
 
+# jsonschema is imported on first use in the functions that need it since
+# importing it dominates the import time of this module and its importers
+
 logger = help.ogler.getLogger()
 
 
+class SchemaCache:
+    """ Bounded cache of Schemer instances and compiled schema validators keyed by schema SAID
+
+    A schema SAID is the digest of the schema content so a cached entry can never go
+    stale. Entries are only ever evicted, least recently used first, to stay within
+    .size. Cached Schemer instances are shared so must be treated as immutable.
+
+    Attributes:
+        size (int): maximum number of schemers and of validators cached
+        schemers (lrudict): Schemer instances keyed by SAID
+        validators (lrudict): compiled jsonschema validators keyed by (SAID, resolver)
+
+    """
+    Size = 256  # default maximum number of cached schemers and validators
+
+    def __init__(self, size=None):
+        """ Create empty cache
+
+        Parameters:
+            size (int): maximum number of schemers and of validators cached.
+                None means use .Size
+
+        """
+        self.size = size if size is not None else self.Size
+        self.schemers = helping.lrudict(size=self.size)
+        self.validators = helping.lrudict(size=self.size)
+
+    def schemer(self, raw, said=None):
+        """ Returns Schemer of raw schema, cached when said is given and cached
+
+        Parameters:
+            raw (bytes): serialized schema used when said is not cached
+            said (str): qb64 SAID of schema expected in raw if known
+
+        """
+        if said is not None and (schemer := self.schemers.get(said)) is not None:
+            return schemer
+
+        schemer = Schemer(raw=raw)
+        self.schemers[schemer.said] = schemer
+        return schemer
+
+    def validator(self, said, schema, resolver=None):
+        """ Returns compiled jsonschema validator of schema, cached by said
+
+        Checks schema against its metaschema once when compiling it.
+
+        Parameters:
+            said (str): qb64 SAID of schema
+            schema (dict): JSON schema with SAID said
+            resolver (CacheResolver): resolver of external references in schema
+
+        Raises:
+            jsonschema.exceptions.SchemaError: if schema is not valid against its metaschema
+
+        """
+        key = (said, resolver)
+        if (validator := self.validators.get(key)) is not None:
+            return validator
+
+        import jsonschema
+
+        klas = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+        klas.check_schema(schema)
+        kwa = dict()
+        if resolver is not None:
+            kwa["resolver"] = resolver.resolver(scer=schema)
+        validator = klas(schema, **kwa)
+        self.validators[key] = validator
+        return validator
+
+    def clear(self):
+        """ Remove all cached schemers and validators """
+        self.schemers.clear()
+        self.validators.clear()
+
+
 class CacheResolver:
     """ Sample jsonschema resolver for loading schema $ref references from a local hash.
 
@@ -40,7 +120,7 @@ class CacheResolver:
             key (str): URI to resolve to the schema
             schema (bytes): is bytes of the schema for the URI
         """
-        schemer = Schemer(raw=schema)
+        schemer = cache.schemer(raw=schema, said=key)
         if schemer.said != key:
             return
 
@@ -80,6 +160,8 @@ class CacheResolver:
             scer (Optional(bytes)) is the source document that is being processed for reference resolution
 
         """
+        import jsonschema
+
         return jsonschema.RefResolver("", scer, handlers={"did": self.handler})
 
 
@@ -193,7 +275,7 @@ class JSONSchema:
         return True
 
     @staticmethod
-    def verify_schema(schema):
+    def verify_schema(schema, said=None):
         """ Validate schema integrity
 
         Returns True if the provided schema validates successfully
@@ -201,20 +283,29 @@ class JSONSchema:
 
         Parameters:
             schema (dict): is the JSON schema to verify
+            said (str): qb64 SAID of schema. When provided the schema is compiled
+                and checked once and its validator cached for later verification
         """
+        import jsonschema
+
         try:
-            jsonschema.Draft7Validator.check_schema(schema=schema)
+            if said is not None:
+                cache.validator(said=said, schema=schema)
+            else:
+                jsonschema.Draft7Validator.check_schema(schema=schema)
         except jsonschema.exceptions.SchemaError:
             return False
 
         return True
 
-    def verify_json(self, schema=b'', raw=b''):
+    def verify_json(self, schema=b'', raw=b'', said=None):
         """ Verify the raw content against the schema for JSON that conforms to the schema
 
         Parameters:
             schema (bytes): is the schema use for validation
             raw (bytes): is JSON to validate against the Schema
+            said (str): qb64 SAID of schema. When provided the compiled validator
+                of schema is reused from cache
 
         Returns:
             boolean: True if the JSON passes validation against the
@@ -222,12 +313,20 @@ class JSONSchema:
                    if raw is not valid JSON, schema is not valid JSON Schema or
                    the validation fails
         """
+        import jsonschema
+
         try:
             d = json.loads(raw)
-            kwargs = dict()
-            if self.resolver is not None:
-                kwargs["resolver"] = self.resolver.resolver(scer=raw)
-            jsonschema.validate(instance=d, schema=schema, **kwargs)
+            if said is not None:
+                validator = cache.validator(said=said, schema=schema, resolver=self.resolver)
+                error = jsonschema.exceptions.best_match(validator.iter_errors(d))
+                if error is not None:
+                    raise error
+            else:
+                kwargs = dict()
+                if self.resolver is not None:
+                    kwargs["resolver"] = self.resolver.resolver(scer=raw)
+                jsonschema.validate(instance=d, schema=schema, **kwargs)
         except jsonschema.exceptions.ValidationError as ex:
             raise kering.ValidationError(f'Credential validation exception: {ex}')
         except jsonschema.exceptions.SchemaError as ex:
@@ -407,7 +506,7 @@ class Schemer:
             raw (bytes): is serialised JSON content to verify against schema
         """
 
-        return self.typ.verify_json(schema=self.sed, raw=raw)
+        return self.typ.verify_json(schema=self.sed, raw=raw, said=self.said)
 
     def pretty(self, *, size=1024):
         """
@@ -426,4 +525,7 @@ class Schemer:
 
         """
 
-        return self.typ.verify_schema(schema=self.sed)
+        return self.typ.verify_schema(schema=self.sed, said=self.said)
+
+
+cache = SchemaCache()  # shared by every Schemer, SchemerSuber and Verifier in process
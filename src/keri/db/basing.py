@@ -21,6 +21,8 @@ need to call it
 
 import os
 import shutil
+import time
+import weakref
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict, field
 from typing import Optional
@@ -36,6 +38,7 @@ from .. import kering
 from ..core import coring, eventing, parsing
 
 from .. import help
+from ..help import helping
 
 logger = help.ogler.getLogger()
 
@@ -45,17 +48,36 @@ class dbdict(dict):
     Subclass of dict that has db as attribute and employs read through cash
     from db Baser.stts of kever states to reload kever from state in database
     if not in memory as dict item
+
+    When .size is not None the cache is bounded to .size items by evicting the
+    least recently used kevers of nonlocal prefixes. Kevers of local prefixes
+    in .db.prefixes are pinned and never evicted so the cache exceeds .size
+    only when there are more local prefixes than .size. An evicted kever is
+    reloaded from its state in .db on its next lookup.
+
+    Attributes:
+        db (Baser): database with key states for read through
+        size (int | None): max number of kevers held in memory. None means
+            unbounded
+        hits (int): count of lookups served from memory
+        misses (int): count of lookups not in memory so read through to .db
+        evictions (int): count of kevers evicted to stay within .size
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'size', 'hits', 'misses', 'evictions')  # no .__dict__
 
-    def __init__(self, *pa, **kwa):
+    def __init__(self, *pa, size=None, **kwa):
         super(dbdict, self).__init__(*pa, **kwa)
         self.db = None
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __getitem__(self, k):
         try:
-            return super(dbdict, self).__getitem__(k)
+            val = super(dbdict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db:
                 raise ex  # reraise KeyError
             if (state := self.db.states.get(keys=k)) is None:
@@ -67,6 +89,36 @@ class dbdict(dict):
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self.size is not None:  # reinsert as most recently used
+            super(dbdict, self).__delitem__(k)
+            super(dbdict, self).__setitem__(k, val)
+        return val
+
+    def __setitem__(self, k, v):
+        if self.size is not None:
+            super(dbdict, self).pop(k, None)  # insert as most recently used
+        super(dbdict, self).__setitem__(k, v)
+        if self.size is not None and len(self) > self.size:
+            self._evict()
+
+    def _evict(self):
+        """
+        Evicts least recently used kevers of nonlocal prefixes until within
+        .size or only kevers of local prefixes remain.
+        """
+        pinned = self.db.prefixes if self.db else ()
+        over = len(self) - self.size
+        victims = []
+        for k in self:  # least recently used first
+            if len(victims) >= over:
+                break
+            if k not in pinned:
+                victims.append(k)
+        for k in victims:
+            super(dbdict, self).__delitem__(k)
+            self.evictions += 1
+
     def __contains__(self, k):
         if not super(dbdict, self).__contains__(k):
             try:
@@ -78,10 +130,152 @@ class dbdict(dict):
             return True
 
     def get(self, k, default=None):
-        if not super(dbdict, self).__contains__(k):
+        try:
+            return self.__getitem__(k)
+        except KeyError:
             return default
+
+
+class Waker:
+    """
+    In-memory dependency index of the key event escrows of a Baser.
+    Escrowed events are indexed by the identifier prefix whose KEL they are
+    waiting on. That is the escrowed event's own prefix for prior events,
+    signatures, witness receipts, and receipted events or another prefix such
+    as the delegator or the transferable receiptor. When a prefix advances,
+    because an event for it is accepted or new escrow material for it arrives,
+    .wake marks it and its dependents as woken in every escrow of every
+    consumer so that escrow processing revisits only those entries.
+
+    Each consumer, such as a Kevery, that processes the escrows of the Baser
+    has its own woken sets so one consumer does not take the wakes meant for
+    another. Woken prefixes taken by .woken are held until .settle marks the
+    pass over them as successful. A pass that is not settled, because it
+    raised, is retried with the next call to .woken.
+
+    Every .period seconds each escrow of each consumer gets a full sweep
+    instead so that stale entries time out and entries whose dependency was
+    never indexed, such as those left over from a prior process run, are still
+    revisited.
+
+    Attributes:
+        period (float): seconds between full sweeps of each escrow
+        deps (dict): maps dependency prefix bytes to set of dependent prefix bytes
+        consumers (weakref.WeakKeyDictionary): maps consumer to its WakeState
+    """
+    Escrows = ("ooes", "pses", "pwes", "uwes", "ures", "vres", "ldes")
+    Period = 60.0  # seconds between full escrow sweeps
+
+    def __init__(self, period=None):
+        """
+        Parameters:
+            period (float): seconds between full sweeps of each escrow
+        """
+        self.period = period if period is not None else self.Period
+        self.deps = dict()
+        self.consumers = weakref.WeakKeyDictionary()
+
+    def state(self, consumer):
+        """
+        Returns:
+            state (WakeState): woken state of consumer, created when new
+
+        Parameters:
+            consumer (object): weak referenceable consumer of woken prefixes
+        """
+        state = self.consumers.get(consumer)
+        if state is None:
+            state = self.consumers[consumer] = WakeState(
+                woke={escrow: set() for escrow in self.Escrows})
+        return state
+
+    def depend(self, pre, dep):
+        """
+        Index escrowed events of prefix pre as waiting on prefix dep
+
+        Parameters:
+            pre (Union[str, bytes]): prefix of escrowed event
+            dep (Union[str, bytes]): prefix of KEL escrowed event waits on
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        if hasattr(dep, "encode"):
+            dep = dep.encode("utf-8")
+        if dep != pre:  # own prefix is always woken with dep
+            self.deps.setdefault(dep, set()).add(pre)
+
+    def wake(self, pre):
+        """
+        Mark escrowed events of prefix pre and of every prefix indexed as
+        waiting on pre as woken in every escrow of every consumer. Dependents
+        are unindexed once woken. Escrow processing reindexes those still
+        waiting.
+
+        Parameters:
+            pre (Union[str, bytes]): prefix whose KEL or escrow advanced
+        """
+        if hasattr(pre, "encode"):
+            pre = pre.encode("utf-8")
+        pres = self.deps.pop(pre, set())
+        pres.add(pre)
+        for state in list(self.consumers.values()):
+            for woke in state.woke.values():
+                woke.update(pres)
+
+    def woken(self, escrow, consumer):
+        """
+        Returns:
+            pres (set | None): of woken prefix bytes for consumer to process in
+                escrow, or None when a full sweep of escrow is due so every
+                entry is to be processed. These are held until .settle and
+                included again by the next call when not settled.
+
+        Parameters:
+            escrow (str): escrow name in .Escrows
+            consumer (object): weak referenceable consumer of woken prefixes
+        """
+        state = self.state(consumer)
+        now = time.monotonic()
+        woke = state.woke[escrow]
+        state.woke[escrow] = set()
+        held = state.held.get(escrow, set())
+        swept = state.swept.get(escrow)
+        if held is None or swept is None or (now - swept) >= self.period:
+            pres = None
         else:
-            return self.__getitem__(k)
+            pres = held | woke
+        state.held[escrow] = pres
+        return set(pres) if pres is not None else None
+
+    def settle(self, escrow, consumer):
+        """
+        Release the woken prefixes held for consumer in escrow after a
+        successful pass over them
+
+        Parameters:
+            escrow (str): escrow name in .Escrows
+            consumer (object): weak referenceable consumer of woken prefixes
+        """
+        state = self.state(consumer)
+        if escrow in state.held and state.held.pop(escrow) is None:
+            state.swept[escrow] = time.monotonic()
+
+
+@dataclass
+class WakeState:
+    """
+    Woken state of one consumer of a Waker
+
+    Attributes:
+        woke (dict): maps escrow name to set of woken prefix bytes
+        held (dict): maps escrow name to set of woken prefix bytes taken but
+            not settled, or None for an unsettled full sweep
+        swept (dict): maps escrow name to monotonic time of last settled
+            full sweep
+    """
+    woke: dict = field(default_factory=dict)
+    held: dict = field(default_factory=dict)
+    swept: dict = field(default_factory=dict)
 
 
 @dataclass
@@ -409,6 +603,10 @@ class Baser(dbing.LMDBer):
 
         kevers (dict): Kever instances indexed by identifier prefix qb64
         prefixes (OrderedSet): local prefixes corresponding to habitats for this db
+        waker (Waker): in-memory dependency index of key event escrows
+        frames (lrudict): LRU cache of replayed event messages keyed by dgKey
+            with values (fn, msg bytes). Entry is removed whenever the event
+            or any of its attachments is changed.
 
         .evts is named sub DB whose values are serialized events
             dgKey
@@ -650,7 +848,12 @@ class Baser(dbing.LMDBer):
 
     """
 
-    def __init__(self, headDirPath=None, reopen=False, **kwa):
+    FrameCacheSize = 4096  # default max number of cached replay frames
+
+    KeverCacheSize = None  # default max kevers in memory. None means unbounded
+
+    def __init__(self, headDirPath=None, reopen=False, frameCacheSize=None,
+                 keverCacheSize=None, **kwa):
         """
         Setup named sub databases.
 
@@ -665,12 +868,20 @@ class Baser(dbing.LMDBer):
                 If not provided use default .HeadDirpath
             mode is int numeric os dir permissions for database directory
             reopen (bool): True means database will be reopened by this init
+            frameCacheSize (int): max number of replay frames cached in memory
+                by .cloneEvtMsg. None means use .FrameCacheSize. 0 means no cache
+            keverCacheSize (int): max number of kevers held in memory by
+                .kevers. None means use .KeverCacheSize
 
 
         """
         self.prefixes = oset()
-        self._kevers = dbdict()
+        self.frames = helping.lrudict(size=(frameCacheSize if frameCacheSize
+                                            is not None else self.FrameCacheSize))
+        self._kevers = dbdict(size=(keverCacheSize if keverCacheSize is not None
+                                    else self.KeverCacheSize))
         self._kevers.db = self  # assign db for read thorugh cache of kevers
+        self.waker = Waker()  # dependency index of key event escrows
 
         super(Baser, self).__init__(headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -698,6 +909,7 @@ class Baser(dbing.LMDBer):
 
         """
         super(Baser, self).reopen(**kwa)
+        self.frames.clear()  # cached frames may be stale for reopened env
 
         # Create by opening first time named sub DBs within main DB instance
         # Names end with "." as sub DB name must include a non Base64 character
@@ -924,6 +1136,12 @@ class Baser(dbing.LMDBer):
         # Field values for contact information for remote identfiers.  Keyed by prefix/field
         self.cfld = subing.Suber(db=self,
                                  subkey="cfld.")
+        # Inverted index of contact field values to remote identifiers.
+        # Keyed by field/lowercase value/prefix with value the field value.
+        # Separator sorts before any value char so keys are in value order
+        self.cidx = subing.Suber(db=self,
+                                 subkey="cidx.",
+                                 sep="\x00")
 
         # Global settings for the Habery environment
         self.hbys = subing.Suber(db=self, subkey='hbys.')
@@ -946,19 +1164,20 @@ class Baser(dbing.LMDBer):
 
         """
         removes = []
-        for keys, data in self.habs.getItemIter():
-            if (state := self.states.get(keys=data.hid)) is not None:
-                try:
-                    kever = eventing.Kever(state=state, db=self,
-                                           prefixes=self.prefixes,
-                                           local=True)
-                except kering.MissingEntryError as ex:  # no kel event for keystate
-                    removes.append(keys)  # remove from .habs
-                    continue
-                self.kevers[kever.prefixer.qb64] = kever
-                self.prefixes.add(kever.prefixer.qb64)
-            elif data.mid is None:  # in .habs but no corresponding key state and not a group so remove
-                removes.append(keys)  # no key state or KEL event for .hab record
+        with self.snapshot():  # consistent reads of habs and states
+            for keys, data in self.habs.getItemIter():
+                if (state := self.states.get(keys=data.hid)) is not None:
+                    try:
+                        kever = eventing.Kever(state=state, db=self,
+                                               prefixes=self.prefixes,
+                                               local=True)
+                    except kering.MissingEntryError as ex:  # no kel event for keystate
+                        removes.append(keys)  # remove from .habs
+                        continue
+                    self.kevers[kever.prefixer.qb64] = kever
+                    self.prefixes.add(kever.prefixer.qb64)
+                elif data.mid is None:  # in .habs but no corresponding key state and not a group so remove
+                    removes.append(keys)  # no key state or KEL event for .hab record
 
         for keys in removes:  # remove bare .habs records
             self.habs.rem(keys=keys)
@@ -1052,16 +1271,22 @@ class Baser(dbing.LMDBer):
         Returns iterator of first seen event messages with attachments for the
         identifier prefix pre starting at first seen order number, fn.
         Essentially a replay in first seen order with attachments
+
+        Walks the first seen ordinals of pre, which are contiguous, with a
+        short read per event so that no read transaction stays open across a
+        yield while a lazy consumer such as a replay cue holds the iterator.
         """
         if hasattr(pre, 'encode'):
             pre = pre.encode("utf-8")
 
-        for fn, dig in self.getFelItemPreIter(pre, fn=fn):
+        while (dig := self.getFe(dbing.fnKey(pre, fn))) is not None:
             try:
-                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
+                msg = self.cloneEvtMsg(pre=pre, fn=fn, dig=bytes(dig))
             except Exception:
-                continue  # skip this event
-            yield msg
+                msg = None  # skip this event
+            fn += 1
+            if msg is not None:
+                yield msg
 
     def cloneAllPreIter(self, key=b''):
         """
@@ -1081,9 +1306,20 @@ class Baser(dbing.LMDBer):
                 continue  # skip this event
             yield msg
 
+    def _unframe(self, key):
+        """
+        Removes cached replay frame of event at dgKey key from .frames if any
+
+        Parameters:
+            key (Union[str, bytes, memoryview]): dgKey of event
+        """
+        if self.frames:
+            self.frames.pop(key.encode("utf-8") if hasattr(key, "encode") else bytes(key), None)
+
     def cloneEvtMsg(self, pre, fn, dig):
         """
         Clones Event as Serialized CESR Message with Body and attached Foot
+        Serves from .frames cache of replay frames when cached for same fn.
 
         Parameters:
             pre (bytes): identifier prefix of event
@@ -1093,56 +1329,45 @@ class Baser(dbing.LMDBer):
         Returns:
             bytearray: message body with attachments
         """
+        dgkey = dbing.dgKey(pre, dig)  # get message
+        if (frame := self.frames.get(dgkey)) is not None and frame[0] == fn:
+            return bytearray(frame[1])  # copy so caller may change
+
         msg = bytearray()  # message
         atc = bytearray()  # attachments
-        dgkey = dbing.dgKey(pre, dig)  # get message
-        if not (raw := self.getEvt(key=dgkey)):
-            raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
-        msg.extend(raw)
-
-        # add indexed signatures to attachments
-        if not (sigs := self.getSigs(key=dgkey)):
-            raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
-        atc.extend(coring.Counter(code=coring.CtrDex.ControllerIdxSigs,
-                                  count=len(sigs)).qb64b)
-        for sig in sigs:
-            atc.extend(sig)
-
-        # add indexed witness signatures to attachments
-        if wigs := self.getWigs(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.WitnessIdxSigs,
-                                      count=len(wigs)).qb64b)
-            for wig in wigs:
-                atc.extend(wig)
-
-        # add authorizer (delegator/issure) source seal event couple to attachments
-        couple = self.getAes(dgkey)
-        if couple is not None:
-            atc.extend(coring.Counter(code=coring.CtrDex.SealSourceCouples,
-                                      count=1).qb64b)
-            atc.extend(couple)
-
-        # add trans receipts quadruples to attachments
-        if quads := self.getVrcs(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.TransReceiptQuadruples,
-                                      count=len(quads)).qb64b)
-            for quad in quads:
-                atc.extend(quad)
-
-        # add nontrans receipts couples to attachments
-        if coups := self.getRcts(key=dgkey):
-            atc.extend(coring.Counter(code=coring.CtrDex.NonTransReceiptCouples,
-                                      count=len(coups)).qb64b)
-            for coup in coups:
-                atc.extend(coup)
-
-        # add first seen replay couple to attachments
-        if not (dts := self.getDts(key=dgkey)):
-            raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
-        atc.extend(coring.Counter(code=coring.CtrDex.FirstSeenReplayCouples,
-                                  count=1).qb64b)
-        atc.extend(coring.Seqner(sn=fn).qb64b)
-        atc.extend(coring.Dater(dts=bytes(dts)).qb64b)
+        with self.snapshot():  # consistent reads across sub dbs
+            if not (raw := self.getEvt(key=dgkey)):
+                raise kering.MissingEntryError("Missing event for dig={}.".format(dig))
+            msg.extend(raw)
+
+            # add indexed signatures to attachments
+            if not (sigs := self.getSigs(key=dgkey)):
+                raise kering.MissingEntryError("Missing sigs for dig={}.".format(dig))
+            atc.extend(coring.encodeGroup(coring.CtrDex.ControllerIdxSigs, sigs))
+
+            # add indexed witness signatures to attachments
+            if wigs := self.getWigs(key=dgkey):
+                atc.extend(coring.encodeGroup(coring.CtrDex.WitnessIdxSigs, wigs))
+
+            # add authorizer (delegator/issure) source seal event couple to attachments
+            couple = self.getAes(dgkey)
+            if couple is not None:
+                atc.extend(coring.encodeGroup(coring.CtrDex.SealSourceCouples, [couple]))
+
+            # add trans receipts quadruples to attachments
+            if quads := self.getVrcs(key=dgkey):
+                atc.extend(coring.encodeGroup(coring.CtrDex.TransReceiptQuadruples, quads))
+
+            # add nontrans receipts couples to attachments
+            if coups := self.getRcts(key=dgkey):
+                atc.extend(coring.encodeGroup(coring.CtrDex.NonTransReceiptCouples, coups))
+
+            # add first seen replay couple to attachments
+            if not (dts := self.getDts(key=dgkey)):
+                raise kering.MissingEntryError("Missing datetime for dig={}.".format(dig))
+            atc.extend(coring.encodeGroup(coring.CtrDex.FirstSeenReplayCouples,
+                                          [(coring.Seqner(sn=fn),
+                                            coring.Dater(dts=bytes(dts)))]))
 
         # prepend pipelining counter to attachments
         if len(atc) % 4:
@@ -1152,6 +1377,8 @@ class Baser(dbing.LMDBer):
                               count=(len(atc) // 4)).qb64b
         msg.extend(pcnt)
         msg.extend(atc)
+        if self.frames.size != 0 and not self._txnWrite:  # never cache uncommitted
+            self.frames[dgkey] = (fn, bytes(msg))
         return msg
 
     def findAnchoringEvent(self, pre, anchor):
@@ -1215,16 +1442,17 @@ class Baser(dbing.LMDBer):
         if prefixer.transferable:
             # receipted event and receipter in database so get receipter est evt
             # retrieve dig of last event at sn of est evt of receipter.
-            sdig = self.getKeLast(key=dbing.snKey(pre=prefixer.qb64b,
-                                                  sn=sn))
-            if sdig is None:
-                # receipter's est event not yet in receipters's KEL
-                raise kering.ValidationError("key event sn {} for pre {} is not yet in KEL"
-                                             "".format(sn, pre))
-            # retrieve last event itself of receipter est evt from sdig
-            sraw = self.getEvt(key=dbing.dgKey(pre=prefixer.qb64b, dig=bytes(sdig)))
-            # assumes db ensures that sraw must not be none because sdig was in KE
-            sserder = coring.Serder(raw=bytes(sraw))
+            with self.snapshot():  # consistent reads of kels and evts
+                sdig = self.getKeLast(key=dbing.snKey(pre=prefixer.qb64b,
+                                                      sn=sn))
+                if sdig is None:
+                    # receipter's est event not yet in receipters's KEL
+                    raise kering.ValidationError("key event sn {} for pre {} is not yet in KEL"
+                                                 "".format(sn, pre))
+                # retrieve last event itself of receipter est evt from sdig
+                sraw = self.getEvt(key=dbing.dgKey(pre=prefixer.qb64b, dig=bytes(sdig)))
+                # assumes db ensures that sraw must not be none because sdig was in KE
+                sserder = coring.Serder(raw=bytes(sraw))
             if dig is not None and not sserder.compare(said=dig):  # endorser's dig not match event
                 raise kering.ValidationError("Bad proof sig group at sn = {}"
                                              " for ksn = {}."
@@ -1247,6 +1475,7 @@ class Baser(dbing.LMDBer):
         Returns True If val successfully written Else False
         Return False if key already exists
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.putVal(self.evts, key, val)
 
     def setEvt(self, key, val):
@@ -1256,6 +1485,7 @@ class Baser(dbing.LMDBer):
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.setVal(self.evts, key, val)
 
     def getEvt(self, key):
@@ -1272,6 +1502,7 @@ class Baser(dbing.LMDBer):
         Deletes value at key.
         Returns True If key exists in database Else False
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.delVal(self.evts, key)
 
     def putFe(self, key, val):
@@ -1367,6 +1598,7 @@ class Baser(dbing.LMDBer):
         Returns True If val successfully written Else False
         Returns False if key already exists
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.putVal(self.dtss, key, val)
 
     def setDts(self, key, val):
@@ -1376,6 +1608,7 @@ class Baser(dbing.LMDBer):
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.setVal(self.dtss, key, val)
 
     def getDts(self, key):
@@ -1392,6 +1625,7 @@ class Baser(dbing.LMDBer):
         Deletes value at key.
         Returns True If key exists in database Else False
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.delVal(self.dtss, key)
 
     def putAes(self, key, val):
@@ -1402,6 +1636,7 @@ class Baser(dbing.LMDBer):
         Returns True If val successfully written Else False
         Returns False if key already exists
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.putVal(self.aess, key, val)
 
     def setAes(self, key, val):
@@ -1411,6 +1646,7 @@ class Baser(dbing.LMDBer):
         Overwrites existing val if any
         Returns True If val successfully written Else False
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.setVal(self.aess, key, val)
 
     def getAes(self, key):
@@ -1427,6 +1663,7 @@ class Baser(dbing.LMDBer):
         Deletes value at key.
         Returns True If key exists in database Else False
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.delVal(self.aess, key)
 
     def getSigs(self, key):
@@ -1456,6 +1693,7 @@ class Baser(dbing.LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.putVals(self.sigs, key, vals)
 
     def addSig(self, key, val):
@@ -1466,6 +1704,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.addVal(self.sigs, key, val)
 
     def cntSigs(self, key):
@@ -1482,6 +1721,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.delVals(self.sigs, key, val)
 
     def getWigs(self, key):
@@ -1511,6 +1751,7 @@ class Baser(dbing.LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.putVals(self.wigs, key, vals)
 
     def addWig(self, key, val):
@@ -1521,6 +1762,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.addVal(self.wigs, key, val)
 
     def cntWigs(self, key):
@@ -1537,6 +1779,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.delVals(self.wigs, key, val)
 
     def putRcts(self, key, vals):
@@ -1549,6 +1792,7 @@ class Baser(dbing.LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.putVals(self.rcts, key, vals)
 
     def addRct(self, key, val):
@@ -1560,6 +1804,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.addVal(self.rcts, key, val)
 
     def getRcts(self, key):
@@ -1597,6 +1842,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.delVals(self.rcts, key, val)
 
     def putUres(self, key, vals):
@@ -1717,6 +1963,7 @@ class Baser(dbing.LMDBer):
         Apparently always returns True (is this how .put works with dupsort=True)
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.putVals(self.vrcs, key, vals)
 
     def addVrc(self, key, val):
@@ -1728,6 +1975,7 @@ class Baser(dbing.LMDBer):
         Returns True if written else False if dup val already exists
         Duplicates are inserted in lexocographic order not insertion order.
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.addVal(self.vrcs, key, val)
 
     def getVrcs(self, key):
@@ -1764,6 +2012,7 @@ class Baser(dbing.LMDBer):
         Deletes all values at key if val = b'' else deletes dup val = val.
         Returns True If key exists in database (or key, val if val not b'') Else False
         """
+        self._unframe(key)  # invalidate cached replay frame
         return self.delVals(self.vrcs, key, val)
 
     def putVres(self, key, vals):
@@ -2676,6 +2925,44 @@ class Baser(dbing.LMDBer):
         """
         return self.delIoVal(self.ldes, key, val)
 
+    def escrowStats(self, now=None):
+        """
+        Returns list of (escrow, count, age) triples, one for each escrow sub
+        db, where count is the number of escrowed entries and age is seconds
+        since the oldest entry was escrowed or None when empty or when entries
+        of escrow are not datetime stamped.
+
+        Reads every entry of every escrow so is meant for occasional sampling
+        such as a metrics scrape, not for hot paths.
+
+        Parameters:
+            now (datetime): current time. None means now UTC
+        """
+        now = now if now is not None else helping.nowUTC()
+        stats = []
+        with self.snapshot():
+            for escrow in ("ooes", "pses", "pwes", "uwes", "ldes"):  # dated by .dtss
+                count = 0
+                oldest = None
+                for key, val in self.getAllItemIter(db=getattr(self, escrow), split=False):
+                    count += 1
+                    pre, _ = dbing.splitKey(key)
+                    dts = self.getDts(dbing.dgKey(pre, bytes(val[33:])))  # strip proem
+                    if dts is not None:
+                        dte = helping.fromIso8601(bytes(dts))
+                        oldest = dte if oldest is None or dte < oldest else oldest
+                age = (now - oldest).total_seconds() if oldest is not None else None
+                stats.append((escrow, count, age))
+
+            for escrow in ("ures", "vres", "pdes", "qnfs"):
+                stats.append((escrow, self.cnt(getattr(self, escrow)), None))
+
+            for escrow in ("rpes", "glwe", "gpae", "gpse", "gdee", "gpwe", "epse",
+                           "knes", "eoobi"):
+                stats.append((escrow, self.cnt(getattr(self, escrow).sdb), None))
+
+        return stats
+
 
 class BaserDoer(doing.Doer):
     """
@@ -45,9 +45,11 @@ l
 
 """
 
+import functools
 import os
 import shutil
 import stat
+import time
 from collections import abc
 from contextlib import contextmanager
 from typing import Union
@@ -59,6 +61,7 @@ from hio.base import filing
 
 from hio.base import filing
 
+from .. import help
 from ..help import helping
 
 ProemSize = 32  # does not include trailing separator
@@ -256,6 +259,148 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+def growing(f):
+    """
+    Decorator for LMDBer write methods. Retries the write when it fails
+    because the LMDB memory map is full, after growing the map with
+    LMDBer.grow(), or because another process resized the map, after adopting
+    the new size. A write made inside an outer LMDBer.txn() context is not
+    retried here because the whole outer transaction was aborted. Instead the
+    outer context grows the map before it reraises. Neither is done while a
+    read transaction, such as one held by a lazy getter, is open in this
+    process since resizing would invalidate its mapped pages. The error is
+    reraised instead.
+    """
+    @functools.wraps(f)
+    def wrapper(self, *pa, **kwa):
+        while True:
+            try:
+                return f(self, *pa, **kwa)
+            except lmdb.MapResizedError:
+                if self.txnActive is not None or self.readers:
+                    raise
+                self.env.set_mapsize(0)  # adopt size set by other process
+            except lmdb.MapFullError:
+                if self.txnActive is not None:
+                    raise
+                self.grow()  # raises MapFullError when at .mapSizeMax
+
+    return wrapper
+
+
+class SubTxn:
+    """
+    SubTxn binds an already open LMDB transaction to a given named sub db so
+    that the LMDBer methods may reuse an outer transaction created by
+    LMDBer.txn() exactly as if they had begun their own transaction on that
+    sub db. Entering or exiting the context of a SubTxn neither commits nor
+    aborts the bound transaction. That is left to its owner.
+
+    Attributes:
+        txn (lmdb.Transaction): open transaction owned by LMDBer.txn()
+        db (lmdb._Database): named sub db for all operations
+    """
+
+    def __init__(self, txn, db):
+        """
+        Parameters:
+            txn (lmdb.Transaction): open transaction owned by LMDBer.txn()
+            db (lmdb._Database): named sub db for all operations
+        """
+        self.txn = txn
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False  # owner of .txn commits or aborts it
+
+    def get(self, key, default=None):
+        return self.txn.get(key, default=default, db=self.db)
+
+    def put(self, key, value, **kwa):
+        return self.txn.put(key, value, db=self.db, **kwa)
+
+    def delete(self, key, value=b''):
+        return self.txn.delete(key, value=value, db=self.db)
+
+    def cursor(self):
+        return self.txn.cursor(db=self.db)
+
+
+class ReadTxn:
+    """
+    ReadTxn wraps a read only transaction begun by LMDBer so that
+    LMDBer.readers counts it while its context is open. Lazy getters hold
+    their context open for as long as they are being consumed. LMDBer only
+    resizes its memory map when no such read transaction is open because a
+    resize would invalidate the pages they have mapped.
+
+    Attributes:
+        txn (lmdb.Transaction | MeteredTxn): wrapped transaction
+        lmdber (LMDBer): owner whose .readers counts open read transactions
+    """
+    __slots__ = ("txn", "lmdber")
+
+    def __init__(self, txn, lmdber):
+        """
+        Parameters:
+            txn (lmdb.Transaction | MeteredTxn): transaction to wrap
+            lmdber (LMDBer): owner whose .readers counts open read transactions
+        """
+        self.txn = txn
+        self.lmdber = lmdber
+
+    def __enter__(self):
+        txn = self.txn.__enter__()
+        self.lmdber.readers += 1
+        return txn
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # not below zero when exited after owner was closed and its count reset
+        self.lmdber.readers = max(0, self.lmdber.readers - 1)
+        return self.txn.__exit__(exc_type, exc_value, traceback)
+
+
+class MeteredTxn:
+    """
+    MeteredTxn wraps a transaction begun by LMDBer so that the latency from
+    begin to commit or abort is recorded in help.meter once the transaction
+    context exits.
+
+    Attributes:
+        txn (lmdb.Transaction): wrapped transaction
+        mode (str): read or write
+        scope (str): op for single operation transactions or context for
+            LMDBer.txn() contexts
+        start (float): perf_counter time when transaction was begun
+    """
+
+    def __init__(self, txn, mode, scope):
+        """
+        Parameters:
+            txn (lmdb.Transaction): transaction to wrap
+            mode (str): read or write
+            scope (str): op or context
+        """
+        self.txn = txn
+        self.mode = mode
+        self.scope = scope
+        self.start = time.perf_counter()
+
+    def __enter__(self):
+        return self.txn.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            return self.txn.__exit__(exc_type, exc_value, traceback)
+        finally:
+            help.meter.observe("keri_lmdb_transaction_seconds",
+                               time.perf_counter() - self.start,
+                               mode=self.mode, scope=self.scope)
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -279,6 +424,17 @@ class LMDBer(filing.Filer):
     Attributes:
         env (lmdb.env): LMDB main (super) database environment
         readonly (bool): True means open LMDB env as readonly
+        mapSize (int): current size in bytes of LMDB memory map of .env
+        mapSizeMax (int | None): largest size in bytes the memory map may grow
+            to when full. None means unlimited
+        profile (dict): LMDB env tuning flags writemap, map_async, metasync,
+            sync and readahead used to open .env
+        txnActive (lmdb.Transaction | None): outer transaction opened by .txn()
+            shared by every read or write made on this LMDBer while inside the
+            context of .txn(). None when no such transaction is open.
+        readers (int): number of read only transactions open in this process,
+            including those held by partially consumed lazy getters. The
+            memory map is only resized when zero.
 
     Properties:
 
@@ -306,9 +462,28 @@ class LMDBer(filing.Filer):
     TempSuffix = "_test"
     Perm = stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR  # 0o1700==960
     MaxNamedDBs = 96
-
-
-    def __init__(self, readonly=False, **kwa):
+    MapSize = 104857600  # 100 MiB default initial size of memory map
+    MapSizeMax = None  # default max size of memory map. None means unlimited
+    MapGrowth = 2  # geometric growth factor of memory map when full
+    MapFill = 0.9  # fraction of memory map in use that triggers growth
+    # LMDB env tuning profiles of durability versus throughput
+    #   durable: fsync data and meta pages on every commit. LMDB default.
+    #   balanced: skip fsync of meta page so last commit may be rolled back
+    #       on system crash but database stays consistent
+    #   fast: writable memory map with async flush and no fsync so recent
+    #       commits may be lost on system crash. readahead off helps random
+    #       reads of databases larger than RAM
+    Profiles = dict(durable=dict(writemap=False, map_async=False,
+                                 metasync=True, sync=True, readahead=True),
+                    balanced=dict(writemap=False, map_async=False,
+                                  metasync=False, sync=True, readahead=True),
+                    fast=dict(writemap=True, map_async=True,
+                              metasync=False, sync=False, readahead=False))
+    Profile = "durable"  # default profile
+
+
+    def __init__(self, readonly=False, mapSize=None, mapSizeMax=None,
+                 profile=None, **kwa):
         """
         Setup main database directory at .dirpath.
         Create main database environment at .env using .path.
@@ -342,10 +517,31 @@ class LMDBer(filing.Filer):
 
             readonly (bool): True means open database in readonly mode
                                 False means open database in read/write mode
+            mapSize (int): initial size in bytes of LMDB memory map.
+                None means use .MapSize
+            mapSizeMax (int): max size in bytes memory map may grow to when full.
+                None means use .MapSizeMax
+            profile (str | dict): name of LMDB env tuning profile in .Profiles
+                or dict of any of writemap, map_async, metasync, sync and
+                readahead flags that override the .Profile profile.
+                None means use .Profile
 
         """
         self.env = None
         self.readonly = True if readonly else False
+        self.mapSize = mapSize if mapSize is not None else self.MapSize
+        self.mapSizeMax = mapSizeMax if mapSizeMax is not None else self.MapSizeMax
+        if profile is None:
+            profile = self.Profile
+        if isinstance(profile, str):
+            if profile not in self.Profiles:
+                raise ValueError(f"Unknown LMDB profile={profile}.")
+            profile = self.Profiles[profile]
+        self.profile = dict(self.Profiles[self.Profile])
+        self.profile.update(profile)
+        self.txnActive = None
+        self._txnWrite = False
+        self.readers = 0
         super(LMDBer, self).__init__(**kwa)
 
 
@@ -380,12 +576,64 @@ class LMDBer(filing.Filer):
 
         # open lmdb major database instance
         # creates files data.mdb and lock.mdb in .dbDirPath
-        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs, map_size=104857600,
-                             mode=self.perm, readonly=self.readonly)
+        profile = dict(self.profile)
+        if self.readonly:  # writable memory map needs read/write env
+            profile.update(writemap=False, map_async=False)
+        self.env = lmdb.open(self.path, max_dbs=self.MaxNamedDBs,
+                             map_size=self.mapSize, mode=self.perm,
+                             readonly=self.readonly, **profile)
+        self.mapSize = self.env.info()["map_size"]  # may be larger if preexistent
         self.opened = True if opened and self.env else False
         return self.opened
 
 
+    def grow(self, size=None):
+        """
+        Returns new size in bytes of memory map of .env after growing it
+        geometrically by .MapGrowth or to size when provided but no larger than
+        .mapSizeMax.
+
+        LMDB allows resizing only when no transaction is active in this
+        process so do not call from inside .txn(). A resize while a lazy
+        getter is still iterating would invalidate the pages its read
+        transaction has mapped so growth is refused while .readers is not zero.
+
+        Parameters:
+            size (int): new size in bytes. None means grow by .MapGrowth
+
+        Raises:
+            lmdb.MapFullError: when already at .mapSizeMax or when a read
+                transaction is open
+        """
+        if self.readers:
+            raise lmdb.MapFullError(f"Map full and {self.readers} read "
+                                    f"transactions open on {self.path}.")
+        size = size if size is not None else int(self.mapSize * self.MapGrowth)
+        if self.mapSizeMax is not None:
+            if self.mapSize >= self.mapSizeMax:
+                raise lmdb.MapFullError(f"Map at max size={self.mapSizeMax} "
+                                        f"for {self.path}.")
+            size = min(size, self.mapSizeMax)
+        self.env.set_mapsize(size)
+        self.mapSize = self.env.info()["map_size"]
+        return self.mapSize
+
+
+    def _reserve(self):
+        """
+        Grows memory map of .env before a write transaction when more than
+        .MapFill of it is in use so that the transaction is unlikely to fail
+        with lmdb.MapFullError. Growth is deferred while a read transaction is
+        open.
+        """
+        if self.readers:
+            return
+        used = (self.env.info()["last_pgno"] + 1) * self.env.stat()["psize"]
+        if used > self.mapSize * self.MapFill:
+            if self.mapSizeMax is None or self.mapSize < self.mapSizeMax:
+                self.grow()
+
+
     def close(self, clear=False):
         """
         Close lmdb at .env and if clear or .temp then remove lmdb directory at .path
@@ -399,11 +647,124 @@ class LMDBer(filing.Filer):
                 pass
 
         self.env = None
+        self.txnActive = None
+        self._txnWrite = False
+        self.readers = 0
 
         return(super(LMDBer, self).close(clear=clear))
 
 
+    @contextmanager
+    def txn(self, write=False):
+        """
+        Context manager that opens a single LMDB transaction on .env that every
+        LMDBer method, and hence every Suber and Komer on this LMDBer, reuses
+        while inside the context. A write transaction is committed once on
+        normal exit of the context and aborted if an exception escapes the
+        context so that all the writes made inside the context are atomic.
+
+        Nested contexts reuse the outermost transaction and do not commit.
+        A write context may not be nested inside a read only context.
+
+        Because LMDB allows only one write transaction at a time, do not
+        yield to other doers from inside a write context.
+
+        Parameters:
+            write (bool): True means open read/write transaction
+                          False means open read only transaction
+
+        Usage:
+            with db.txn(write=True):
+                db.putEvt(dgkey, raw)
+                db.addKe(snkey, dig)
+
+        """
+        if self.txnActive is not None:  # nested so reuse outer transaction
+            if write and not self._txnWrite:
+                raise ValueError("Write transaction nested in read only "
+                                 "transaction.")
+            yield self.txnActive
+            return
+
+        if write:
+            self._reserve()
+
+        # buffers=False in write transaction since memoryviews returned by
+        # reads are invalidated by any later write in the same transaction
+        try:
+            txn = self.env.begin(write=write, buffers=not write)
+            if help.meter.enabled:
+                txn = MeteredTxn(txn, mode="write" if write else "read", scope="context")
+            if not write:
+                txn = ReadTxn(txn, self)
+            with txn as txn:
+                self.txnActive = txn
+                self._txnWrite = write
+                try:
+                    yield txn
+                finally:
+                    self.txnActive = None
+                    self._txnWrite = False
+        except lmdb.MapResizedError:
+            if not self.readers:
+                self.env.set_mapsize(0)  # adopt size set by other process
+            raise
+        except lmdb.MapFullError:
+            if not self.readers and (self.mapSizeMax is None
+                                     or self.mapSize < self.mapSizeMax):
+                self.grow()  # so repeat of aborted transaction may succeed
+            raise
+
+
+    @contextmanager
+    def snapshot(self):
+        """
+        Context manager that opens a single read only LMDB transaction on .env
+        so that every getter of this LMDBer, and hence of every Suber and Komer
+        on this LMDBer, reads from the same consistent snapshot while inside
+        the context. This saves beginning a transaction per read and prevents
+        torn reads across sub dbs when another process writes concurrently.
+        Writes made inside the context are not visible to reads made inside
+        the context.
+
+        Nested in .txn(write=True) reuses the write transaction so reads see
+        the writes made so far.
+
+        Because a long lived read transaction keeps its snapshot pages from
+        being reclaimed, do not yield to other doers from inside the context.
+
+        Usage:
+            with db.snapshot():
+                raw = db.getEvt(dgkey)
+                sigs = db.getSigs(dgkey)
+
+        """
+        with self.txn(write=False) as txn:
+            yield txn
+
+
+    def _begin(self, db, write=False):
+        """
+        Returns context manager for transaction on named sub db db. Reuses the
+        active outer transaction from .txn() when there is one that supports
+        write. Otherwise begins new transaction on .env that commits on exit.
+
+        Parameters:
+            db (lmdb._Database): named sub db
+            write (bool): True means transaction must support writes
+        """
+        if self.txnActive is not None and (self._txnWrite or not write):
+            return SubTxn(self.txnActive, db)
+        txn = self.env.begin(db=db, write=write, buffers=True)
+        if help.meter.enabled:
+            txn = MeteredTxn(txn, mode="write" if write else "read", scope="op")
+        if not write:
+            return ReadTxn(txn, self)
+        return txn
+
+
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
+    @growing
     def putVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -416,10 +777,11 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return (txn.put(key, val, overwrite=False))
 
 
+    @growing
     def setVal(self, db, key, val):
         """
         Write serialized bytes val to location key in db
@@ -431,7 +793,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of value to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return (txn.put(key, val))
 
 
@@ -445,10 +807,11 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             return( txn.get(key))
 
 
+    @growing
     def delVal(self, db, key):
         """
         Deletes value at key in db.
@@ -458,7 +821,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=False
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return (txn.delete(key))
 
 
@@ -469,7 +832,7 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with dupsort=True
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             for _, _ in cursor:
@@ -495,7 +858,7 @@ class LMDBer(filing.Filer):
             split (bool): True means split key at sep before returning
             sep (bytes): separator char for key
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
@@ -530,7 +893,7 @@ class LMDBer(filing.Filer):
                         from multiple branches of the key space. If top key is
                         empty then gets all items in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
@@ -541,6 +904,7 @@ class LMDBer(filing.Filer):
             return  # done raises StopIteration
 
 
+    @growing
     def delTopVal(self, db, key=b''):
         """
         Deletes all values in branch of db given top key.
@@ -564,7 +928,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(key):  # move to val at key >= key if any
@@ -581,6 +945,7 @@ class LMDBer(filing.Filer):
     # For subdbs with no duplicate values allowed at each key. (dupsort==False)
     # and use keys with ordinal as monotonically increasing number part
     # such as sn or fn
+    @growing
     def appendOrdValPre(self, db, pre, val):
         """
         Appends val in order after last previous key with same pre in db.
@@ -599,7 +964,7 @@ class LMDBer(filing.Filer):
         # set key with fn at max and then walk backwards to find last entry at pre
         # if any otherwise zeroth entry at pre
         key = onKey(pre, MaxON)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             on = 0  # unless other cases match then zeroth entry at pre
             cursor = txn.cursor()
             if not cursor.set_range(key):  # max is past end of database
@@ -646,7 +1011,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix
             on is int ordinal number to resume replay
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             if not cursor.set_range(key):  #  moves to val at key >= key
@@ -674,7 +1039,7 @@ class LMDBer(filing.Filer):
             key is key location in db to resume replay,
                    If empty then start at first key in database
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if not cursor.set_range(key):  #  moves to val at key >= key, first if empty
                 return  # no values end of db
@@ -692,6 +1057,7 @@ class LMDBer(filing.Filer):
     # size limitation of 511 bytes.
 
 
+    @growing
     def putIoSetVals(self, db, key, vals, *, sep=b'.'):
         """
         Add each val in vals to insertion ordered set of values all with the
@@ -711,7 +1077,7 @@ class LMDBer(filing.Filer):
         """
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
             cursor = txn.cursor()
@@ -735,6 +1101,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def addIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Add val to insertion ordered set of values all with the same apparent
@@ -751,7 +1118,7 @@ class LMDBer(filing.Filer):
             val (bytes): serialized value to add
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             vals = oset()
             ion = 0
             iokey = suffix(key, ion, sep=sep)  # start zeroth entry if any
@@ -772,6 +1139,7 @@ class LMDBer(filing.Filer):
             return cursor.put(iokey, val, dupdata=False, overwrite=False)
 
 
+    @growing
     def setIoSetVals(self, db, key, vals, *, sep=b'.'):
         """
         Erase all vals at key and then add unique vals as insertion ordered set of
@@ -790,13 +1158,14 @@ class LMDBer(filing.Filer):
         self.delIoSetVals(db=db, key=key, sep=sep)
         result = False
         vals = oset(vals)  # make set
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             for i, val in enumerate(vals):
                 iokey = suffix(key, i, sep=sep)  # ion is at add on amount
                 result = txn.put(iokey, val, dupdata=False, overwrite=True) or result
             return result
 
 
+    @growing
     def appendIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Append val to insertion ordered set of values all with the same apparent
@@ -814,7 +1183,7 @@ class LMDBer(filing.Filer):
         """
         ion = 0  # default is zeroth insertion at key
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -864,7 +1233,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             vals = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -892,7 +1261,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -920,7 +1289,7 @@ class LMDBer(filing.Filer):
         val = None
         ion = None  # no last value
         iokey = suffix(key, ion=MaxSuffix, sep=sep)  # make iokey at max and walk back
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not cursor.set_range(iokey):  # max is past end of database
                 # Three possibilities for max past end of database
@@ -971,6 +1340,7 @@ class LMDBer(filing.Filer):
         return len(self.getIoSetVals(db=db, key=key, sep=sep))
 
 
+    @growing
     def delIoSetVals(self, db, key, *, sep=b'.'):
         """
         Deletes all values at apparent effective key.
@@ -986,7 +1356,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
         """
         result = False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1000,6 +1370,7 @@ class LMDBer(filing.Filer):
             return result
 
 
+    @growing
     def delIoSetVal(self, db, key, val, *, sep=b'.'):
         """
         Deletes val at apparent effective key if exists.
@@ -1029,7 +1400,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             val (bytes): value to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1055,7 +1426,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             items = []
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -1083,7 +1454,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             ion (int): starting ordinal value, default 0
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1095,6 +1466,7 @@ class LMDBer(filing.Filer):
             return  # done raises StopIteration
 
 
+    @growing
     def delIoSetIokey(self, db, iokey):
         """
         Deletes val at at actual iokey that includes ordinal key suffix.
@@ -1107,11 +1479,12 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort==False
             iokey (bytes): actual key with ordinal key suffix
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return txn.delete(iokey)
 
 
     # For subdbs that support duplicates at each key (dupsort==True)
+    @growing
     def putVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db
@@ -1128,13 +1501,14 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             vals is list of bytes of values to be written
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             result = True
             for val in vals:
                 result = result and txn.put(key, val, dupdata=True)
             return result
 
 
+    @growing
     def addVal(self, db, key, val):
         """
         Add val bytes as dup to key in db
@@ -1157,7 +1531,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self._begin(db=db, write=True) as txn:
                 result = txn.put(key, val, dupdata=True)
         return result
 
@@ -1174,7 +1548,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
@@ -1193,7 +1567,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             if cursor.set_key(key):  # move to first_dup
@@ -1202,7 +1576,7 @@ class LMDBer(filing.Filer):
             return val
 
 
-    def getValsIter(self, db, key):
+    def getValsIter(self, db, key, start=b''):
         """
         Return iterator of all dup values at key in db
         Raises StopIteration error when done or if empty
@@ -1212,11 +1586,13 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
+            start is bytes of dup value to start at inclusive. Empty means
+                start at first dup
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
-            vals = []
-            if cursor.set_key(key):  # moves to first_dup
+            found = cursor.set_range_dup(key, start) if start else cursor.set_key(key)
+            if found:  # moves to first dup at or after start
                 for val in cursor.iternext_dup():
                     yield val
 
@@ -1229,7 +1605,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             if cursor.set_key(key):  # moves to first_dup
@@ -1248,7 +1624,7 @@ class LMDBer(filing.Filer):
             db is opened named sub db
             pre is bytes of key within sub db's keyspace pre.on
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = onKey(pre, on)  # start replay at this enty 0 is earliest
             count = 0
@@ -1263,6 +1639,7 @@ class LMDBer(filing.Filer):
 
             return count
 
+    @growing
     def delVals(self, db, key, val=b''):
         """
         Deletes all values at key in db if val=b'' else deletes the dup
@@ -1274,12 +1651,13 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
             val is bytes of dup val at key to delete
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return (txn.delete(key, val))
 
 
     # For subdbs that support insertion order preserving duplicates at each key.
     # dupsort==True and prepends and strips io val proem
+    @growing
     def putIoVals(self, db, key, vals):
         """
         Write each entry from list of bytes vals to key in db in insertion order
@@ -1306,7 +1684,7 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getIoVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             idx = 0
             cursor = txn.cursor()
             if cursor.set_key(key): # move to key if any
@@ -1350,7 +1728,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
@@ -1371,7 +1749,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             vals = []
             if cursor.set_key(key):  # moves to first_dup
@@ -1391,7 +1769,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             val = None
             if cursor.set_key(key):  # move to first_dup
@@ -1421,7 +1799,7 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             items = []
             if cursor.set_range(key):  # moves to first_dup at key
@@ -1455,7 +1833,7 @@ class LMDBer(filing.Filer):
                     Othewise don't skip for first pass
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             if cursor.set_range(key):  # moves to first_dup at key
                 found = True
@@ -1476,7 +1854,7 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             count = 0
             if cursor.set_key(key):  # moves to first_dup
@@ -1484,6 +1862,7 @@ class LMDBer(filing.Filer):
             return count
 
 
+    @growing
     def delIoVals(self,db, key):
         """
         Deletes all values at key in db if key present.
@@ -1494,10 +1873,11 @@ class LMDBer(filing.Filer):
             key is bytes of key within sub db's keyspace
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             return (txn.delete(key))
 
 
+    @growing
     def delIoVal(self, db, key, val):
         """
         Deletes dup io val at key in db. Performs strip search to find match.
@@ -1527,7 +1907,7 @@ class LMDBer(filing.Filer):
             val is bytes of value to be deleted without intersion ordering proem
         """
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self._begin(db=db, write=True) as txn:
             cursor = txn.cursor()
             if cursor.set_key(key):  # move to first_dup
                 for proval in cursor.iternext_dup():  #  value with proem
@@ -1554,7 +1934,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
@@ -1583,7 +1963,7 @@ class LMDBer(filing.Filer):
                 within sub db's keyspace
             fn is first
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt := fn)
             # set_key returns True if exact key else false
@@ -1613,7 +1993,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=0)
             while cursor.set_key(key):  # moves to first_dup
@@ -1645,7 +2025,7 @@ class LMDBer(filing.Filer):
             pre is bytes of itdentifier prefix prepended to sn in key
                 within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self._begin(db=db, write=False) as txn:
             cursor = txn.cursor()
             key = snKey(pre, cnt:=0)
             while cursor.set_range(key):  #  moves to first dup of key >= key
@@ -73,12 +73,13 @@ class Broker:
         """
         for (typ, pre, aid, ion), saider in self.escrowdb.getIoItemIter(keys=(typ,)):
             try:
-                tsgs = eventing.fetchTsgs(db=self.tigerdb, saider=saider)
+                with self.db.snapshot():  # consistent reads of escrow artifacts
+                    tsgs = eventing.fetchTsgs(db=self.tigerdb, saider=saider)
 
-                keys = (saider.qb64,)
-                dater = self.daterdb.get(keys=keys)
-                serder = self.serderdb.get(keys=keys)
-                vcigars = self.cigardb.get(keys=keys)
+                    keys = (saider.qb64,)
+                    dater = self.daterdb.get(keys=keys)
+                    serder = self.serderdb.get(keys=keys)
+                    vcigars = self.cigardb.get(keys=keys)
 
                 try:
                     if not (dater and serder and (tsgs or vcigars)):
@@ -1206,8 +1206,11 @@ class SchemerSuber(Suber):
             use srdr here
 
         """
-        val = self.db.getVal(db=self.sdb, key=self._tokey(keys))
-        return scheming.Schemer(raw=bytes(val)) if val is not None else None
+        key = self._tokey(keys)
+        val = self.db.getVal(db=self.sdb, key=key)
+        if val is None:
+            return None
+        return scheming.cache.schemer(raw=bytes(val), said=bytes(key).decode("utf-8"))
 
     def rem(self, keys: Union[str, Iterable]):
         """
@@ -1237,7 +1240,8 @@ class SchemerSuber(Suber):
 
         """
         for iokey, val in self.db.getTopItemIter(db=self.sdb, key=self._tokey(keys)):
-            yield self._tokeys(iokey), scheming.Schemer(raw=bytes(val))
+            yield (self._tokeys(iokey),
+                   scheming.cache.schemer(raw=bytes(val), said=bytes(iokey).decode("utf-8")))
 
 
 class DupSuber(SuberBase):
@@ -1521,7 +1525,7 @@ class CesrDupSuber(DupSuber):
 
 
 
-    def getIter(self, keys: Union[str, Iterable]):
+    def getIter(self, keys: Union[str, Iterable], start: Union[str, coring.Matter] = None):
         """
         Gets dup vals iterator at key made from keys
 
@@ -1529,12 +1533,21 @@ class CesrDupSuber(DupSuber):
 
         Parameters:
             keys (tuple): of key strs to be combined in order to form key
+            start (Union[str, Matter]): dup val or its qb64 to start at
+                inclusive. None means start at first dup
 
         Returns:
             iterator:  vals each of self.klas. Raises StopIteration when done
 
         """
-        for val in self.db.getValsIter(db=self.sdb, key=self._tokey(keys)):
+        if start is None:
+            start = b''
+        elif isinstance(start, coring.Matter):
+            start = start.qb64b
+        elif hasattr(start, "encode"):
+            start = start.encode("utf-8")
+
+        for val in self.db.getValsIter(db=self.sdb, key=self._tokey(keys), start=start):
             yield self.klas(qb64b=bytes(val))
 
 
@@ -9,6 +9,7 @@ import json
 import os
 import re
 import sys
+import time
 
 from ordered_set import OrderedSet as oset
 from collections import namedtuple
@@ -464,6 +465,87 @@ class OOBIEnd:
             rep.status = falcon.HTTP_NOT_FOUND
 
 
+class MetricsEnd:
+    """ REST API for scraping hot path metrics in Prometheus text format
+
+    Escrow gauges are sampled by reading every escrow entry so each sample is
+    cached for .ttl seconds and reused by scrapes within that time.
+
+    Attributes:
+        .dbs (list): of Baser or Reger whose escrows are sampled
+        .meter (Meter): registry of recorded counters and histograms
+        .ttl (float): seconds to reuse sampled escrow gauges
+        .gauges (list): of (name, labels, value) triples of last sampled gauges
+        .sampled (float | None): monotonic time of last sample of .gauges.
+            None means not yet sampled
+
+    """
+    TTL = 30.0  # default seconds to reuse sampled escrow gauges
+
+    def __init__(self, dbs, meter=None, ttl=None):
+        """  End point for scraping metrics
+
+        Parameters:
+            dbs (list): of Baser or Reger whose escrows are sampled
+            meter (Meter): registry of recorded metrics. None means help.meter
+            ttl (float): seconds to reuse sampled escrow gauges. None means .TTL
+
+        """
+        self.dbs = dbs
+        self.meter = meter if meter is not None else help.meter
+        self.ttl = ttl if ttl is not None else self.TTL
+        self.gauges = []
+        self.sampled = None
+
+    def sample(self):
+        """ Returns list of escrow gauges sampled at most once every .ttl seconds """
+        now = time.monotonic()
+        if self.sampled is not None and now - self.sampled < self.ttl:
+            return self.gauges
+
+        gauges = []
+        for db in self.dbs:
+            store = type(db).__name__.lower()
+            for escrow, count, age in db.escrowStats():
+                labels = dict(store=store, escrow=escrow)
+                gauges.append(("keri_escrow_entries", labels, count))
+                if age is not None:
+                    gauges.append(("keri_escrow_oldest_age_seconds", labels, age))
+
+        self.gauges = gauges
+        self.sampled = now
+        return gauges
+
+    def on_get(self, req, rep):
+        """  GET endpoint for metrics resource
+
+        Parameters:
+            req: Falcon request object
+            rep: Falcon response object
+
+        """
+        rep.status = falcon.HTTP_200
+        rep.content_type = "text/plain; version=0.0.4"
+        rep.text = self.meter.expose(gauges=self.sample())
+
+
+def loadMetricsEnd(app, dbs, meter=None, ttl=None):
+    """
+    Load Prometheus style metrics endpoint at '/metrics' into app
+
+    Parameters:
+        app(falcon.App): Falcon Rest app for endpoint route registration
+        dbs (list): of Baser or Reger whose escrows are sampled
+        meter (Meter): registry of recorded metrics. None means help.meter
+        ttl (float): seconds to reuse sampled escrow gauges. None means
+            MetricsEnd.TTL
+
+    """
+    end = MetricsEnd(dbs=dbs, meter=meter, ttl=ttl)
+    app.add_route("/metrics", end)
+    return end
+
+
 WEB_DIR_PATH = os.path.dirname(
     os.path.abspath(
         sys.modules.get(__name__).__file__))
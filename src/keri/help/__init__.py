@@ -16,4 +16,9 @@ from hio.help import ogling
 #  want help.ogler always defined by default
 ogler = ogling.initOgler(prefix='keri', syslogged=False)  # inits once only on first import
 
+from . import metering
+
+#  help.meter is shared in process registry of hot path metrics
+meter = metering.initMeter()
+
 from .helping import nowIso8601, toIso8601, fromIso8601
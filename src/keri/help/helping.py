@@ -7,6 +7,7 @@ import base64
 import dataclasses
 import datetime
 import re
+from collections import OrderedDict
 from collections.abc import Iterable, Sequence, Mapping
 
 import pysodium
@@ -155,6 +156,54 @@ def verify64uEd25519(signature, message, verkey):
     return (verifyEd25519(sig, msg, vk))
 
 
+class lrudict(OrderedDict):
+    """
+    Subclass of OrderedDict bounded to at most .size items by evicting the
+    least recently used item on insertion. Subscript and .get lookups count
+    as use and are tallied as hits or misses.
+
+    Attributes:
+        size (int | None): maximum number of items. None means unbounded
+        hits (int): count of lookups that found an item
+        misses (int): count of lookups that did not find an item
+        evictions (int): count of items evicted to stay within .size
+    """
+
+    def __init__(self, *pa, size=None, **kwa):
+        """
+        Parameters:
+            size (int | None): maximum number of items. None means unbounded
+        """
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        super(lrudict, self).__init__(*pa, **kwa)
+
+    def __getitem__(self, k):
+        try:
+            val = super(lrudict, self).__getitem__(k)
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        self.move_to_end(k)
+        return val
+
+    def __setitem__(self, k, v):
+        super(lrudict, self).__setitem__(k, v)
+        self.move_to_end(k)
+        while self.size is not None and len(self) > self.size:
+            self.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, k, default=None):
+        try:
+            return self.__getitem__(k)
+        except KeyError:
+            return default
+
+
 def nonStringIterable(obj):
     """
     Returns:
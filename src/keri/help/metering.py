@@ -0,0 +1,201 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.help.metering module
+
+In process counters and timing histograms of hot paths exposed in Prometheus
+text exposition format
+
+"""
+import functools
+import os
+from bisect import bisect_left
+
+
+class Histogram:
+    """
+    Histogram of observed values counted into fixed upper bound buckets
+
+    Attributes:
+        bounds (tuple): of float upper bounds of buckets in ascending order.
+            Values greater than the last bound are counted in +Inf bucket
+        counts (list): of int non cumulative count of values in each bucket
+            with final +Inf bucket
+        sum (float): sum of all observed values
+        count (int): number of observed values
+    """
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds):
+        """
+        Parameters:
+            bounds (tuple): of float upper bounds of buckets in ascending order
+        """
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """ Count value into its bucket """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Meter:
+    """
+    Registry of named counters and histograms each partitioned by labels.
+    When not .enabled all recording methods return immediately so that
+    instrumented hot paths pay only an attribute check.
+
+    Attributes:
+        enabled (bool): True means record, False means ignore all recording
+        bounds (tuple): of float bucket upper bounds for histograms in seconds
+        counters (dict): of dicts of float value keyed by label items tuple
+            keyed by metric name
+        histograms (dict): of dicts of Histogram keyed by label items tuple
+            keyed by metric name
+    """
+    Bounds = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05,
+              0.1, 0.5, 1.0, 5.0)  # default histogram bucket upper bounds seconds
+
+    def __init__(self, enabled=True, bounds=None):
+        """
+        Parameters:
+            enabled (bool): True means record, False means ignore all recording
+            bounds (tuple): of float bucket upper bounds for histograms.
+                None means use .Bounds
+        """
+        self.enabled = enabled
+        self.bounds = tuple(bounds) if bounds is not None else self.Bounds
+        self.counters = dict()
+        self.histograms = dict()
+
+    def count(self, name, value=1, **labels):
+        """
+        Add value to counter name with labels
+
+        Parameters:
+            name (str): metric name
+            value (float): amount to add
+            labels (dict): label names and str values
+        """
+        if not self.enabled:
+            return
+        series = self.counters.setdefault(name, dict())
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """
+        Count value into histogram name with labels
+
+        Parameters:
+            name (str): metric name
+            value (float): observed value usually elapsed seconds
+            labels (dict): label names and str values
+        """
+        if not self.enabled:
+            return
+        series = self.histograms.setdefault(name, dict())
+        key = tuple(sorted(labels.items()))
+        if key not in series:
+            series[key] = Histogram(bounds=self.bounds)
+        series[key].observe(value)
+
+    def tallied(self, name, escrows=()):
+        """
+        Returns decorator that counts calls of decorated function in counter
+        name by outcome label. A call that returns is accepted, one that raises
+        an exception in escrows is escrowed and one that raises any other
+        exception is rejected. Exceptions are reraised.
+
+        Parameters:
+            name (str): metric name
+            escrows (tuple): of exception classes that mean escrowed
+        """
+        def decorator(f):
+            @functools.wraps(f)
+            def wrapper(*pa, **kwa):
+                if not self.enabled:
+                    return f(*pa, **kwa)
+                try:
+                    result = f(*pa, **kwa)
+                except escrows:
+                    self.count(name, outcome="escrowed")
+                    raise
+                except Exception:
+                    self.count(name, outcome="rejected")
+                    raise
+                self.count(name, outcome="accepted")
+                return result
+
+            return wrapper
+
+        return decorator
+
+    def clear(self):
+        """ Remove all recorded values """
+        self.counters.clear()
+        self.histograms.clear()
+
+    def expose(self, gauges=None):
+        """
+        Returns str of all recorded metrics in Prometheus text exposition format
+
+        Parameters:
+            gauges (Iterable): of (name, labels, value) triples of gauge values
+                sampled at time of exposition where labels is dict
+        """
+        lines = []
+        for name in sorted(self.counters):
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(self.counters[name].items()):
+                lines.append(f"{name}{_labelize(key)} {_valuize(value)}")
+
+        for name in sorted(self.histograms):
+            lines.append(f"# TYPE {name} histogram")
+            for key, hist in sorted(self.histograms[name].items()):
+                total = 0
+                for bound, count in zip(hist.bounds + (float("inf"),), hist.counts):
+                    total += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{name}_bucket{_labelize(key + (('le', le),))} {total}")
+                lines.append(f"{name}_sum{_labelize(key)} {_valuize(hist.sum)}")
+                lines.append(f"{name}_count{_labelize(key)} {hist.count}")
+
+        typed = set()
+        for name, labels, value in sorted(gauges if gauges is not None else [],
+                                          key=lambda gauge: gauge[0]):
+            if name not in typed:
+                lines.append(f"# TYPE {name} gauge")
+                typed.add(name)
+            lines.append(f"{name}{_labelize(tuple(sorted(labels.items())))} {_valuize(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labelize(key):
+    """ Returns str of Prometheus label set of label items tuple key """
+    if not key:
+        return ""
+    labels = ",".join('{}="{}"'.format(label, str(value).replace("\\", "\\\\")
+                                                      .replace('"', '\\"')
+                                                      .replace("\n", "\\n"))
+                      for label, value in key)
+    return "{" + labels + "}"
+
+
+def _valuize(value):
+    """ Returns str of Prometheus sample value """
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def initMeter():
+    """
+    Returns Meter disabled unless environment variable KERI_METER is one of
+    1, true, yes or on so that metering is opt-in
+    """
+    flag = os.environ.get("KERI_METER", "0").lower()
+    return Meter(enabled=flag in ("1", "true", "yes", "on"))
@@ -27,16 +27,35 @@ logger = help.ogler.getLogger()
 
 class Regery:
 
-    def __init__(self, hby, name="test", base="", reger=None, temp=False, cues=None):
+    def __init__(self, hby, name="test", base="", reger=None, temp=False, cues=None,
+                 teverCacheSize=None, **kwa):
+        """ Initialize instance
 
+        Parameters:
+            hby (Habery): identifier environment of registries
+            name (str): name of registry database
+            base (str): optional directory path segment inserted before name
+            reger (Reger): registry database. None means create one
+            temp (bool): True means use temporary database
+            cues (Deck): outgoing cues
+            teverCacheSize (int): max number of tevers held in memory by
+                .tevers. None means use Reger.TeverCacheSize
+            kwa (dict): LMDB mapSize, mapSizeMax and profile options of created
+                reger that override those of hby.dbOpts
+
+        """
         self.hby = hby
         self.name = name
         self.base = base
         self.temp = temp
         self.cues = cues if cues is not None else decking.Deck()
 
+        dbOpts = self.hby.dbOpts | kwa
         self.reger = reger if reger is not None else Reger(name=self.name, base=base, db=self.hby.db, temp=temp,
-                                                           reopen=True)
+                                                           reopen=True, teverCacheSize=teverCacheSize,
+                                                           **dbOpts)
+        if reger is not None and teverCacheSize is not None and isinstance(self.reger.tevers, viring.RegerDict):
+            self.reger.tevers.size = teverCacheSize
         self.tvy = eventing.Tevery(reger=self.reger, db=self.hby.db, local=True, lax=True)
         self.psr = parsing.Parser(framed=True, kvy=self.hby.kvy, tvy=self.tvy)
 
@@ -721,7 +740,7 @@ class Credentialer(doing.DoDoer):
             raise kering.ConfigurationError("Credential schema {} not found.  It must be loaded with data oobi before "
                                             "issuing credentials".format(schema))
 
-        schemer = scheming.Schemer(raw=scraw)
+        schemer = scheming.cache.schemer(raw=scraw, said=schema)
         try:
             schemer.verify(creder.raw)
         except kering.ValidationError as ex:
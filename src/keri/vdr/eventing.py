@@ -1208,19 +1208,22 @@ class Tever:
         Returns:
             status (Serder): transaction event state notification message
         """
-        digs = []
-        for _, dig in self.reger.getTelItemPreIter(pre=vci.encode("utf-8")):
-            digs.append(dig)
+        with self.reger.snapshot():  # consistent reads of tels, tvts and ancs
+            digs = []
+            for _, dig in self.reger.getTelItemPreIter(pre=vci.encode("utf-8")):
+                digs.append(bytes(dig))
 
-        if len(digs) == 0:
-            return None
+            if len(digs) == 0:
+                return None
 
-        vcsn = len(digs) - 1
-        vcdig = bytes(digs[-1])
+            vcsn = len(digs) - 1
+            vcdig = digs[-1]
 
-        dgkey = dbing.dgKey(vci, vcdig)  # get message
-        raw = self.reger.getTvt(key=dgkey)
-        serder = coring.Serder(raw=bytes(raw))
+            dgkey = dbing.dgKey(vci, vcdig)  # get message
+            raw = self.reger.getTvt(key=dgkey)
+            serder = coring.Serder(raw=bytes(raw))
+            couple = self.reger.getAnc(dgkey)
+            ancb = bytearray(couple)
 
         if self.noBackers:
             vcilk = Ilks.iss if len(digs) == 1 else Ilks.rev
@@ -1229,9 +1232,6 @@ class Tever:
             vcilk = Ilks.bis if len(digs) == 1 else Ilks.brv
             ra = serder.ked["ra"]
 
-        dgkey = dbing.dgKey(vci, vcdig)
-        couple = self.reger.getAnc(dgkey)
-        ancb = bytearray(couple)
         seqner = coring.Seqner(qb64b=ancb, strip=True)
         saider = coring.Saider(qb64b=ancb, strip=True)
 
@@ -1280,16 +1280,17 @@ class Tever:
 
         dig = serder.saider.qb64b
         key = dgKey(pre, dig)
-        sealet = seqner.qb64b + saider.qb64b
-        self.reger.putAnc(key, sealet)
-        if bigers:
-            self.reger.putTibs(key, [biger.qb64b for biger in bigers])
-        if baks:
-            self.reger.delBaks(key)
-            self.reger.putBaks(key, [bak.encode("utf-8") for bak in baks])
-        self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
-        self.reger.putTvt(key, serder.raw)
-        self.reger.putTel(snKey(pre, sn), dig)
+        with self.reger.txn(write=True):
+            sealet = seqner.qb64b + saider.qb64b
+            self.reger.putAnc(key, sealet)
+            if bigers:
+                self.reger.putTibs(key, [biger.qb64b for biger in bigers])
+            if baks:
+                self.reger.delBaks(key)
+                self.reger.putBaks(key, [bak.encode("utf-8") for bak in baks])
+            self.reger.tets.pin(keys=(pre.decode("utf-8"), dig.decode("utf-8")), val=coring.Dater())
+            self.reger.putTvt(key, serder.raw)
+            self.reger.putTel(snKey(pre, sn), dig)
         logger.info("Tever state: %s Added to TEL valid event=\n%s\n",
                     pre, json.dumps(serder.ked, indent=1))
 
@@ -1414,11 +1415,12 @@ class Tever:
 
         """
         dgkey = dgKey(serder.preb, serder.saidb)
-        sealet = seqner.qb64b + saider.qb64b
-        self.reger.putAnc(dgkey, sealet)
-        self.reger.putTibs(dgkey, [biger.qb64b for biger in bigers])
-        self.reger.putTvt(dgkey, serder.raw)
-        self.reger.putTwe(snKey(serder.preb, serder.sn), serder.saidb)
+        with self.reger.txn(write=True):
+            sealet = seqner.qb64b + saider.qb64b
+            self.reger.putAnc(dgkey, sealet)
+            self.reger.putTibs(dgkey, [biger.qb64b for biger in bigers])
+            self.reger.putTvt(dgkey, serder.raw)
+            self.reger.putTwe(snKey(serder.preb, serder.sn), serder.saidb)
         logger.info("Tever state: Escrowed partially witnessed "
                     "event = %s\n", serder.ked)
 
@@ -1437,18 +1439,20 @@ class Tever:
 
         """
         key = dgKey(serder.preb, serder.saidb)
-        if seqner and saider:
-            sealet = seqner.qb64b + saider.qb64b
-            self.reger.putAnc(key, sealet)
-        if bigers:
-            self.reger.putTibs(key, [biger.qb64b for biger in bigers])
-        if baks:
-            self.reger.delBaks(key)
-            self.reger.putBaks(key, [bak.encode("utf-8") for bak in baks])
-        self.reger.putTvt(key, serder.raw)
+        with self.reger.txn(write=True):
+            if seqner and saider:
+                sealet = seqner.qb64b + saider.qb64b
+                self.reger.putAnc(key, sealet)
+            if bigers:
+                self.reger.putTibs(key, [biger.qb64b for biger in bigers])
+            if baks:
+                self.reger.delBaks(key)
+                self.reger.putBaks(key, [bak.encode("utf-8") for bak in baks])
+            self.reger.putTvt(key, serder.raw)
+            result = self.reger.putTae(snKey(serder.preb, serder.sn), serder.saidb)
         logger.info("Tever state: Escrowed anchorless event "
                     "event = %s\n", serder.ked)
-        return self.reger.putTae(snKey(serder.preb, serder.sn), serder.saidb)
+        return result
 
     def getBackerState(self, ked):
         """ Calculate and return the current list of backers for event dict
@@ -1644,7 +1648,8 @@ class Tevery:
         """ Process TEL query event message (qry)
 
         Process query mode replay message for collective or single element query.
-        Will cue response message with kin of "replay".  Assume promiscuous mode for now.
+        Will cue response message with kin of "replay" whose msgs is a list of
+        messages like the Kevery replay cue.  Assume promiscuous mode for now.
 
         Parameters:
             serder (Serder): is query message serder
@@ -1665,15 +1670,10 @@ class Tevery:
         if route == "tels":
             mgmt = qry["ri"]
 
-            cloner = self.reger.clonePreIter(pre=mgmt, fn=0)  # create iterator at 0
-            msgs = bytearray()  # outgoing messages
-            for msg in cloner:
-                msgs.extend(msg)
+            msgs = list(self.reger.clonePreIter(pre=mgmt, fn=0))  # outgoing messages
 
             if vci := qry["i"]:
-                cloner = self.reger.clonePreIter(pre=vci, fn=0)  # create iterator at 0
-                for msg in cloner:
-                    msgs.extend(msg)
+                msgs.extend(self.reger.clonePreIter(pre=vci, fn=0))
 
             if msgs:
                 self.cues.append(dict(kin="replay", dest=source, msgs=msgs))
@@ -2038,10 +2038,11 @@ class Tevery:
 
         """
         key = dgKey(serder.preb, serder.saidb)
-        self.reger.putTvt(key, serder.raw)
-        sealet = seqner.qb64b + saider.qb64b
-        self.reger.putAnc(key, sealet)
-        self.reger.putOot(snKey(serder.preb, serder.sn), serder.saidb)
+        with self.reger.txn(write=True):
+            self.reger.putTvt(key, serder.raw)
+            sealet = seqner.qb64b + saider.qb64b
+            self.reger.putAnc(key, sealet)
+            self.reger.putOot(snKey(serder.preb, serder.sn), serder.saidb)
         logger.info("Tever state: Escrowed our of order TEL event "
                     "event = %s\n", serder.ked)
 
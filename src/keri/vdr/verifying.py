@@ -138,7 +138,7 @@ class Verifier:
                 self.cues.append(dict(kin="query", q=dict(r="schema", said=schema)))
             raise kering.MissingSchemaError("schema {} not in cache".format(schema))
 
-        schemer = scheming.Schemer(raw=scraw)
+        schemer = scheming.cache.schemer(raw=scraw, said=schema)
         try:
             schemer.verify(creder.raw)
         except kering.ValidationError as ex:
@@ -147,8 +147,10 @@ class Verifier:
             raise kering.FailedSchemaValidationError("Credential {} is not valid against schema {}: {}"
                                                      .format(creder.said, schema, ex))
 
-        for (pather, cigar) in sadcigars:
-            if not cigar.verfer.verify(cigar.raw, creder.raw):  # cig not verify
+        results = core.eventing.verifyBatch((cigar.verfer, cigar.raw, creder.raw)
+                                            for (pather, cigar) in sadcigars)
+        for (pather, cigar), verified in zip(sadcigars, results):
+            if not verified:  # cig not verify
                 self.escrowPSC(creder, sadsigers, sadcigars)
                 raise kering.MissingSignatureError("Failure satisfying credential on sigs for {}"
                                                    " for evt = {}.".format(cigar,
@@ -356,19 +358,7 @@ class Verifier:
 
         """
         self.reger.logCred(creder, sadsigers, sadcigars)
-
-        schema = creder.schema.encode("utf-8")
-        issuer = creder.issuer.encode("utf-8")
-
-        # Look up indicies
-        saider = creder.saider
-        self.reger.saved.pin(keys=saider.qb64b, val=saider)
-        self.reger.issus.add(keys=issuer, val=saider)
-        self.reger.schms.add(keys=schema, val=saider)
-
-        if 'i' in creder.subject:
-            subject = creder.subject["i"].encode("utf-8")
-            self.reger.subjs.add(keys=subject, val=saider)
+        self.reger.indexCred(creder)
 
     def query(self, pre, regk, vcid, *, dt=None, dta=None, dtb=None, **kwa):
         """ Returns query message for querying registry
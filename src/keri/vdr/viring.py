@@ -27,19 +27,39 @@ class RegerDict(dict):
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     if not in memory as dict item
+
+    When .size is not None the cache is bounded to .size items by evicting the
+    least recently used tevers of nonlocal registries. Tevers of local
+    registries in .reger.registries are pinned and never evicted so the cache
+    exceeds .size only when there are more local registries than .size. An
+    evicted tever is reloaded from its state in .reger on its next lookup.
+
+    Attributes:
+        reger (Reger): database with registry states for read through
+        db (Baser): database of KELs for reloaded tevers
+        size (int | None): max number of tevers held in memory. None means
+            unbounded
+        hits (int): count of lookups served from memory
+        misses (int): count of lookups not in memory so read through to .reger
+        evictions (int): count of tevers evicted to stay within .size
     """
-    __slots__ = ('reger', 'db', 'klas')  # no .__dict__ just for db reference
+    __slots__ = ('reger', 'db', 'klas', 'size', 'hits', 'misses', 'evictions')
 
-    def __init__(self, *pa, **kwa):
+    def __init__(self, *pa, size=None, **kwa):
         super(RegerDict, self).__init__(*pa, **kwa)
         self.db = None
         self.reger = None
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __getitem__(self, k):
         from ..vdr import eventing
         try:
-            return super(RegerDict, self).__getitem__(k)
+            val = super(RegerDict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db or not self.reger:
                 raise ex  # reraise KeyError
             if (state := self.reger.states.get(keys=k)) is None:
@@ -48,17 +68,47 @@ class RegerDict(dict):
                 tever = eventing.Tever(stt=state, db=self.db, reger=self.reger)
             except kering.MissingEntryError:  # no kel event for keystate
                 raise ex  # reraise KeyError
-            super(RegerDict, self).__setitem__(k, tever)
+            self._insert(k, tever)
             return tever
 
+        self.hits += 1
+        if self.size is not None:  # reinsert as most recently used
+            super(RegerDict, self).__delitem__(k)
+            super(RegerDict, self).__setitem__(k, val)
+        return val
+
     def __setitem__(self, key, item):
-        super(RegerDict, self).__setitem__(key, item)
+        self._insert(key, item)
         self.reger.states.pin(keys=key, val=item.state())
 
     def __delitem__(self, key):
         super(RegerDict, self).__delitem__(key)
         self.reger.states.rem(keys=key)
 
+    def _insert(self, key, item):
+        """
+        Inserts item at key as most recently used then evicts least recently
+        used tevers of nonlocal registries while over .size. Evicted
+        tevers keep their state in .reger.
+        """
+        if self.size is not None:
+            super(RegerDict, self).pop(key, None)
+        super(RegerDict, self).__setitem__(key, item)
+        if self.size is None or len(self) <= self.size:
+            return
+
+        pinned = self.reger.registries if self.reger else ()
+        over = len(self) - self.size
+        victims = []
+        for k in self:  # least recently used first
+            if len(victims) >= over:
+                break
+            if k not in pinned:
+                victims.append(k)
+        for k in victims:
+            super(RegerDict, self).__delitem__(k)  # not .__delitem__ keep state
+            self.evictions += 1
+
     def __contains__(self, k):
         if not super(RegerDict, self).__contains__(k):
             try:
@@ -80,10 +130,10 @@ class RegerDict(dict):
             Serder: value from underlying dict or database
 
         """
-        if not super(RegerDict, self).__contains__(k):
-            return default
-        else:
+        try:
             return self.__getitem__(k)
+        except KeyError:
+            return default
 
 
 @dataclass
@@ -172,8 +222,9 @@ class Reger(dbing.LMDBer):
     TailDirPath = "keri/reg"
     AltTailDirPath = ".keri/reg"
     TempPrefix = "keri_reg_"
+    TeverCacheSize = None  # default max tevers in memory. None means unbounded
 
-    def __init__(self, headDirPath=None, reopen=True, **kwa):
+    def __init__(self, headDirPath=None, reopen=True, teverCacheSize=None, **kwa):
         """
         Setup named sub databases.
 
@@ -189,6 +240,10 @@ class Reger(dbing.LMDBer):
             mode (int): numeric os dir permissions for database directory
             reopen (boolean,): IF True then database will be reopened by this init
 
+        Parameters:
+            teverCacheSize (int): max number of tevers held in memory by
+                .tevers. None means use .TeverCacheSize
+
         Notes:
 
         dupsort=True for sub DB means allow unique (key,pair) duplicates at a key.
@@ -204,7 +259,8 @@ class Reger(dbing.LMDBer):
 
         self.registries = oset()
         if "db" in kwa:
-            self._tevers = RegerDict()
+            self._tevers = RegerDict(size=(teverCacheSize if teverCacheSize is not None
+                                           else self.TeverCacheSize))
             self._tevers.reger = self  # assign db for read thorugh cache of kevers
             self._tevers.db = kwa["db"]
         else:
@@ -267,6 +323,10 @@ class Reger(dbing.LMDBer):
         self.subjs = subing.CesrDupSuber(db=self, subkey='subjs.', klas=coring.Saider)
         # Index of credentials by schema
         self.schms = subing.CesrDupSuber(db=self, subkey='schms.', klas=coring.Saider)
+        # Index of credentials by issuer and schema, keys == (issuer, schema)
+        self.ischs = subing.CesrDupSuber(db=self, subkey='ischs.', klas=coring.Saider)
+        # Index of credentials by subject and schema, keys == (subject, schema)
+        self.sschs = subing.CesrDupSuber(db=self, subkey='sschs.', klas=coring.Saider)
 
         # Partially signed credential escrow
         self.pse = subing.CesrSuber(db=self, subkey='pse.', klas=coring.Dater)
@@ -315,21 +375,64 @@ class Reger(dbing.LMDBer):
         # Completed Credentials
         self.ccrd = proving.CrederSuber(db=self, subkey="ccrd.")
 
+        if not self.readonly:
+            self.reindexCreds()
+
         return self.env
 
-    def cloneCreds(self, saids):
+    def indexCred(self, creder):
+        """ Add SAID of credential to indices of saved credentials
+
+        Parameters:
+            creder (Creder): saved credential to index
+
+        """
+        saider = creder.saider
+        self.saved.pin(keys=saider.qb64b, val=saider)
+        self.issus.add(keys=creder.issuer, val=saider)
+        self.schms.add(keys=creder.schema, val=saider)
+        self.ischs.add(keys=(creder.issuer, creder.schema), val=saider)
+
+        if 'i' in creder.subject:
+            self.subjs.add(keys=creder.subject["i"], val=saider)
+            self.sschs.add(keys=(creder.subject["i"], creder.schema), val=saider)
+
+    def reindexCreds(self):
+        """ Build composite issuer and subject by schema indices of saved credentials
+        when missing such as for a database created before they were added
+
+        """
+        if next(self.ischs.getItemIter(), None) is not None:
+            return  # already indexed
+
+        with self.txn(write=True):
+            for _, saider in self.saved.getItemIter():
+                if (creder := self.creds.get(keys=saider.qb64)) is not None:
+                    self.indexCred(creder)
+
+    def cloneCreds(self, saids, expand=True, memo=None):
         """ Returns fully expanded credential with chained credentials attached.
 
         Parameters:
            saids (list): of Saider objects:
+           expand (bool): True means attach chained credentials fully expanded.
+                False means attach list of SAIDs of chained credentials instead
+           memo (dict): cloned credentials keyed by SAID to reuse, shared by
+                recursive calls so each chained credential is cloned once.
+                None means new empty memo
 
         Returns:
             list: fully hydrated credentials with full chains provided
 
         """
+        memo = memo if memo is not None else dict()
         creds = []
         for saider in saids:
             key = saider.qb64
+            if key in memo:
+                creds.append(memo[key])
+                continue
+
             creder, sadsigers, sadcigars = self.cloneCred(said=key)
 
             chainSaids = []
@@ -341,7 +444,11 @@ class Reger(dbing.LMDBer):
                     continue
 
                 chainSaids.append(coring.Saider(qb64=p["n"]))
-            chains = self.cloneCreds(chainSaids)
+
+            if expand:
+                chains = self.cloneCreds(chainSaids, memo=memo)
+            else:
+                chains = [chainSaider.qb64 for chainSaider in chainSaids]
 
             regk = creder.status
             status = self.tevers[regk].vcState(saider.qb64)
@@ -359,6 +466,7 @@ class Reger(dbing.LMDBer):
                 status=status.ked,
             )
 
+            memo[key] = cred
             creds.append(cred)
         return creds
 
@@ -900,6 +1008,51 @@ class Reger(dbing.LMDBer):
         """
         return self.delIoVal(self.baks, key, val)
 
+    def escrowStats(self, now=None):
+        """
+        Returns list of (escrow, count, age) triples, one for each escrow sub
+        db, where count is the number of escrowed entries and age is seconds
+        since the oldest entry was escrowed or None when empty or when entries
+        of escrow are not datetime stamped.
+
+        Reads every entry of every escrow so is meant for occasional sampling
+        such as a metrics scrape, not for hot paths.
+
+        Parameters:
+            now (datetime): current time. None means now UTC
+        """
+        now = now if now is not None else helping.nowUTC()
+        stats = []
+        with self.snapshot():
+            for escrow in ("oots", "twes", "taes"):  # dated by .tets
+                count = 0
+                oldest = None
+                for key, val in self.getAllItemIter(db=getattr(self, escrow), split=False):
+                    count += 1
+                    pre, _ = dbing.splitKey(key)
+                    dater = self.tets.get(keys=(bytes(pre).decode("utf-8"),
+                                                bytes(val).decode("utf-8")))
+                    if dater is not None:
+                        oldest = (dater.datetime if oldest is None or dater.datetime < oldest
+                                  else oldest)
+                age = (now - oldest).total_seconds() if oldest is not None else None
+                stats.append((escrow, count, age))
+
+            for escrow in ("pse", "mre", "mie", "mce", "mse"):  # dated by value
+                count = 0
+                oldest = None
+                for _, dater in getattr(self, escrow).getItemIter():
+                    count += 1
+                    oldest = (dater.datetime if oldest is None or dater.datetime < oldest
+                              else oldest)
+                age = (now - oldest).total_seconds() if oldest is not None else None
+                stats.append((escrow, count, age))
+
+            for escrow in ("tpwe", "tmse", "tede"):
+                stats.append((escrow, self.cnt(getattr(self, escrow).sdb), None))
+
+        return stats
+
 
 def buildProof(prefixer, seqner, diger, sigers):
     """
@@ -1,10 +1,12 @@
 import os
+import subprocess
+import sys
 
 import multicommand
 import pytest
 
 from keri.app import directing, habbing
-from keri.app.cli import commands
+from keri.app.cli import commands, kli
 from keri.app.cli.common import existing
 from keri.core import coring
 from keri.kering import ValidationError
@@ -247,3 +249,34 @@ def test_standalone_kli_commands(helpers, capsys):
                           '  "broken-chain-escrow": [],\n'
                           '  "missing-schema-escrow": []\n'
                           '}\n')
+
+
+def test_kli_resolve():
+    from keri.app.cli.commands import sign
+    from keri.app.cli.commands.vc import list as vclist
+
+    parser, rest = kli.resolve(["sign", "--name", "test", "--alias", "test", "--text", "hi"])
+    assert parser is sign.parser
+    assert parser.prog == "kli sign"
+    assert rest == ["--name", "test", "--alias", "test", "--text", "hi"]
+    args = parser.parse_args(rest)
+    full = multicommand.create_parser(commands).parse_args(["sign", "--name", "test", "--alias", "test",
+                                                            "--text", "hi"])
+    assert args.name == full.name == "test"
+    assert args.text == full.text == "hi"
+    assert args.handler is not None
+
+    parser, rest = kli.resolve(["vc", "list", "--name", "test"])
+    assert parser is vclist.parser
+    assert parser.prog == "kli vc list"
+    assert rest == ["--name", "test"]
+
+    assert kli.resolve([]) is None
+    assert kli.resolve(["vc"]) is None  # group without subcommand
+    assert kli.resolve(["bogus"]) is None
+    assert kli.resolve(["--help"]) is None
+
+    # only modules of selected subcommand are imported
+    code = ("import sys; from keri.app.cli import kli; kli.resolve(['version']); "
+            "assert not {'falcon', 'jsonschema', 'keri.app.habbing', 'keri.vdr.verifying'} & set(sys.modules)")
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -6,6 +6,7 @@ tests.app.agenting module
 import time
 
 from hio.base import doing, tyming
+from hio.core.tcp import serving
 
 from keri import kering
 from keri.core import coring
@@ -108,6 +109,10 @@ class ReceiptDoer(doing.DoDoer):
                 break
             yield self.tock
 
+        # connections to wan and wil reused for rotation, wes newly added
+        assert self.hby.pool.hits == 2
+        assert self.hby.pool.misses == 3
+
         self.remove([witDoer])
         return True
 
@@ -233,9 +238,25 @@ def test_witness_inquisitor(mockHelpingNowUTC, seeder):
             wigs = wesHab.db.getWigs(dgkey)
             assert len(wigs) == 3
 
+        # witness servers restart below so drop connections pooled to the old
+        # ones and the closed remoters the old servers kept for them
+        palHby.pool.close()
+        qinHby.pool.close()
+        for doer in wanDoers + wilDoers + wesDoers:
+            if isinstance(doer, serving.ServerDoer):
+                doer.server.ixes.clear()
+
         doist = doing.Doist(limit=limit, tock=tock)
         doers = wanDoers + wilDoers + wesDoers + [qinWitq, palWitq]
         doist.do(doers=doers)
 
         assert palHab.pre in qinHab.kevers
         assert qinHab.pre in palHab.kevers
+
+        # witnessers removed after lingering so pooled connections released
+        for witq in (qinWitq, palWitq):
+            assert not witq.lingering
+            assert not [doer for doer in witq.doers
+                        if isinstance(doer, (agenting.TCPWitnesser, agenting.HttpWitnesser))]
+        assert sum(len(idles) for idles in qinHby.pool.clients.values()) >= 1
+        assert sum(len(idles) for idles in palHby.pool.clients.values()) >= 1
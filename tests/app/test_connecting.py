@@ -185,3 +185,51 @@ def test_organizer_imgs():
             img.extend(chunk)
 
         assert len(img) == 0
+
+
+def test_organizer_index():
+    joe = "EtyPSuUjLyLdXAtGMrsTt0-ELyWeU8fJcymHiGOfuaSA"
+    bob = "EuEQX8At31X96iDVpigv-rTdOKvFiWFunbJ1aDfq89IQ"
+    ken = "EFC7f_MEPE5dboc_E4yG15fnpMD34YaU3ue6vnDLodJU"
+
+    with habbing.openHby(name="test", temp=True) as hby:
+        org = connecting.Organizer(hby=hby)
+
+        org.replace(pre=joe, data=dict(company="HCF", alias="joe"))
+        org.replace(pre=bob, data=dict(company="hcf labs", alias="bob"))
+        org.replace(pre=ken, data=dict(company="GLEIF", alias="ken"))
+
+        assert list(org.scan("company")) == [("GLEIF", ken), ("HCF", joe), ("hcf labs", bob)]
+        assert org.values(field="company", val="hc", prefix=True) == ["HCF", "hcf labs"]
+        assert org.values(field="company", limit=2) == ["GLEIF", "HCF"]
+        assert [d["id"] for d in org.find(field="company", val="HCF", prefix=True)] == [joe, bob]
+        assert [d["id"] for d in org.find(field="company", val="labs")] == [bob]
+        assert [d["id"] for d in org.find(field="company", val="hcf", limit=1)] == [joe]
+        assert {v: [d["id"] for d in ds] for v, ds in org.group(field="company").items()} == \
+               {"GLEIF": [ken], "HCF": [joe], "hcf labs": [bob]}
+        assert [d["id"] for d in org.list(limit=2)] == [ken, joe]
+
+        # index follows changes to contacts
+        org.set(pre=bob, field="company", val="GLEIF")
+        org.unset(pre=joe, field="company")
+        org.update(pre=ken, data=dict(alias="kenneth"))
+        assert list(org.scan("company")) == [("GLEIF", ken), ("GLEIF", bob)]
+        assert [v for v, _ in org.scan("alias")] == ["bob", "joe", "kenneth"]
+        org.rem(pre=ken)
+        assert list(org.scan("company")) == [("GLEIF", bob)]
+        assert [v for v, _ in org.scan("alias")] == ["bob", "joe"]
+
+        # verified contacts are cached until their signed data changes
+        assert org.get(pre=bob)["company"] == "GLEIF"
+        hits = org.cache.hits
+        assert org.get(pre=bob)["company"] == "GLEIF"
+        assert org.cache.hits == hits + 1
+        d = org.get(pre=bob)
+        d["company"] = "changed"
+        assert org.get(pre=bob)["company"] == "GLEIF"
+
+        # index is rebuilt for database with contacts but no index
+        hby.db.cidx.trim()
+        org = connecting.Organizer(hby=hby)
+        assert list(org.scan("company")) == [("GLEIF", bob)]
+        assert [v for v, _ in org.scan("alias")] == ["bob", "joe"]
@@ -76,6 +76,77 @@ def test_postman(seeder):
         assert serder.ked["a"] == dict(msg="test")
 
 
+def test_postman_destinations(seeder):
+    """
+    Test Postman batches messages per destination witness and that an
+    unreachable witness does not hold up delivery to other witnesses
+    """
+    with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab), \
+            habbing.openHby(name="wes", salt=coring.Salter(raw=b'wess-the-witness').qb64, temp=True) as wesHby, \
+            habbing.openHby(name="wan", salt=coring.Salter(raw=b'wann-the-witness').qb64, temp=True) as wanHby, \
+            habbing.openHby(name="repTest", temp=True) as recpHby:
+
+        mbx = storing.Mailboxer(name="wes", temp=True)
+        wesDoers = indirecting.setupWitness(alias="wes", hby=wesHby, mbx=mbx, tcpPort=5634, httpPort=5644)
+        wesHab = wesHby.habByName("wes")
+        wanHab = wanHby.makeHab(name="wan", transferable=False)  # never started
+        seeder.seedWitEnds(hby.db, witHabs=[wesHab, wanHab])
+
+        kvy = eventing.Kevery(db=hby.db)
+        recps = []
+        for name, witHab in (("bob", wanHab), ("cal", wesHab)):
+            recpHab = recpHby.makeHab(name=name, transferable=True, wits=[witHab.pre])
+            recpIcp = recpHab.makeOwnEvent(sn=0)
+            witKvy = eventing.Kevery(db=witHab.db, lax=False, local=False)
+            parsing.Parser().parse(ims=bytearray(recpIcp), kvy=witKvy)
+            rct = witHab.receipt(coring.Serder(raw=recpIcp))
+            parsing.Parser().parseOne(bytearray(recpIcp), kvy=kvy)
+            parsing.Parser().parseOne(bytearray(rct), kvy=kvy)
+            kvy.processEscrows()
+            assert recpHab.pre in kvy.kevers
+            recps.append(recpHab)
+
+        bob, cal = recps
+        pman = forwarding.Postman(hby=hby, limit=2, batch=8, retries=1, backoff=0.125,
+                                  timeout=0.5)
+        assert pman.limit == 2
+        assert pman.batch == 8
+
+        # queued first for unreachable witness of bob
+        exn = exchanging.exchange(route="/echo", payload=dict(msg="bob"))
+        pman.send(src=hab.pre, dest=bob.pre, topic="echo", serder=exn)
+        saids = []
+        for i in range(3):
+            exn = exchanging.exchange(route="/echo", payload=dict(msg=f"cal{i}"))
+            atc = hab.endorse(exn)
+            del atc[:exn.size]
+            saids.append(exn.said)
+            pman.send(src=hab.pre, dest=cal.pre, topic="echo", serder=exn, attachment=atc)
+
+        doers = wesDoers + [pman]
+        limit = 2.0
+        tock = 0.03125
+        doist = doing.Doist(tock=tock, limit=limit, doers=doers)
+        doist.enter()
+
+        tymer = tyming.Tymer(tymth=doist.tymen(), duration=doist.limit)
+
+        while not tymer.expired:
+            doist.recur()
+            time.sleep(doist.tock)
+
+        doist.exit()
+
+        # all of cal delivered in one batch, bob given up after retry
+        assert [cue["said"] for cue in pman.cues] == saids
+        assert pman.forwarders == {} or all(doer.done for doer in pman.forwarders.values())
+
+        msgs = []
+        for _, topic, msg in mbx.cloneTopicIter(topic=cal.pre + "/echo", fn=0):
+            msgs.append(coring.Serder(raw=msg).ked["a"]["msg"])
+        assert msgs == ["cal0", "cal1", "cal2"]
+
+
 def test_forward_handler():
     with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
 
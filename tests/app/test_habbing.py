@@ -608,6 +608,73 @@ def test_habery_signatory():
         assert len(hby.prefixes) == 0
 
 
+def test_habery_db_opts():
+    """
+    Test Habery LMDB options apply to its databases and those of its Regery
+    """
+    from keri.vdr import credentialing
+
+    size = 8 * 2 ** 20
+    with habbing.openHby(mapSize=size, mapSizeMax=4 * size, profile="balanced") as hby:
+        assert hby.dbOpts == dict(mapSize=size, mapSizeMax=4 * size, profile="balanced")
+        for dber in (hby.db, hby.ks):
+            assert dber.mapSize == size
+            assert dber.mapSizeMax == 4 * size
+            assert not dber.env.flags()["metasync"]
+
+        rgy = credentialing.Regery(hby=hby, name=hby.name, temp=True)
+        assert rgy.reger.mapSize == size
+        assert rgy.reger.mapSizeMax == 4 * size
+        assert not rgy.reger.env.flags()["metasync"]
+        rgy.close()
+
+        rgy = credentialing.Regery(hby=hby, name=hby.name, temp=True, profile="durable")
+        assert rgy.reger.mapSize == size
+        assert rgy.reger.env.flags()["metasync"]  # override
+        rgy.close()
+
+    with habbing.openHby() as hby:  # defaults
+        assert hby.db.mapSize == basing.Baser.MapSize
+        assert hby.db.mapSizeMax is None
+        assert hby.db.env.flags()["metasync"]
+
+
+def test_habery_verify_workers():
+    """
+    Test Habery sets up shared signature verification pool
+    """
+    from concurrent import futures
+
+    with habbing.openHby() as hby:
+        assert hby.verifyPool is None
+        assert eventing._verifyPool is None
+
+    with habbing.openHby(verifyWorkers=2) as hby:
+        assert isinstance(hby.verifyPool, futures.ThreadPoolExecutor)
+        assert hby.verifyPool._max_workers == 2
+        assert eventing._verifyPool is hby.verifyPool
+        hab = hby.makeHab(name="test")
+        assert hab.kever.sn == 0
+
+    assert hby.verifyPool is None
+    assert eventing._verifyPool is None  # prior restored
+
+
+def test_habery_workers():
+    """
+    Test Habery passes max concurrent salty key stretches to its Manager
+    """
+    with habbing.openHby() as hby:
+        assert hby.workers is None
+        assert hby.mgr.workers is None
+
+    with habbing.openHby(workers=3) as hby:
+        assert hby.workers == 3
+        assert hby.mgr.workers == 3
+        hab = hby.makeHab(name="test", icount=3, ncount=3, isith="2", nsith="2")
+        assert len(hab.kever.verfers) == 3
+
+
 def test_habery_reconfigure(mockHelpingNowUTC):
     """
     Test   .reconfigure method using .cf for config file
@@ -811,6 +878,37 @@ def test_make_other_event():
 
 
 
+def test_hab_sign_many():
+    with habbing.openHby() as hby:
+        hab = hby.makeHab(name="test", icount=3, isith="2", ncount=3, nsith="2")
+        sers = [f"message {i}".encode("utf-8") for i in range(5)]
+
+        sigerss = hab.signMany(sers=sers)
+        assert len(sigerss) == len(sers)
+        for ser, sigers in zip(sers, sigerss):
+            assert [siger.qb64 for siger in sigers] == [siger.qb64 for siger in hab.sign(ser=ser)]
+
+        cigarss = hab.signMany(sers=sers, indexed=False)
+        assert [cigar.qb64 for cigar in cigarss[2]] == \
+               [cigar.qb64 for cigar in hab.sign(ser=sers[2], indexed=False)]
+
+        # threads for large batches give same signatures in same order
+        size = hby.mgr.BatchSize
+        hby.mgr.BatchSize = 2
+        try:
+            threaded = hab.signMany(sers=sers, workers=2)
+        finally:
+            hby.mgr.BatchSize = size
+        assert [[siger.qb64 for siger in sigers] for sigers in threaded] == \
+               [[siger.qb64 for siger in sigers] for sigers in sigerss]
+
+        serders = [hab.makeEndRole(eid=hab.pre, stamp=f"2021-01-01T00:00:0{i}.000000+00:00")
+                   for i in range(3)]  # makeEndRole returns endorsed msg
+        serders = [coring.Serder(raw=bytes(msg)) for msg in serders]
+        msgs = hab.endorseMany(serders)
+        assert msgs == [hab.endorse(serder) for serder in serders]
+        assert hab.endorseMany([]) == []
+
 
 if __name__ == "__main__":
     pass
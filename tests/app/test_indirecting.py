@@ -5,11 +5,16 @@ tests.app.indirecting module
 """
 import json
 
+import falcon
 import pytest
+from falcon import testing
+from hio.core import http
 from hio.help import decking
 
+from keri import kering
 from keri.app import indirecting, storing, habbing
-from keri.core import coring
+from keri.core import coring, eventing, parsing
+from keri.db import basing
 
 
 def test_mailbox_iter():
@@ -97,6 +102,57 @@ def test_mailbox_multiple_iter():
         next(mbi)
 
 
+def test_mailbox_iter_watermarks():
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    msg = dict(i=pre, t="rct")
+    mbx = storing.Mailboxer(temp=True)
+    assert mbx.seq == 0
+    assert mbx.tops == {}
+
+    mbx.storeMsg(topic=f"{pre}/receipt", msg=json.dumps(msg).encode("utf-8"))
+    mbx.storeMsg(topic=f"{pre}/receipt", msg=json.dumps(msg).encode("utf-8"))
+    assert mbx.seq == 2
+    assert mbx.tops == {f"{pre}/receipt".encode("utf-8"): 2}
+
+    mb = indirecting.MailboxIterable(mbx=mbx, pre=pre, topics={"/receipt": 0, "/multisig": 0},
+                                     retry=1000)
+    mbi = iter(mb)
+    assert next(mbi) == b'retry: 1000\n\n'
+
+    reads = []
+    cloneTopicIter = mbx.cloneTopicIter
+
+    def spy(topic, fn=0):
+        reads.append((topic, fn))
+        return cloneTopicIter(topic, fn)
+
+    mbx.cloneTopicIter = spy
+
+    # first read catches up on all topics
+    val = next(mbi)
+    assert val.count(b'event: /receipt') == 2
+    assert reads == [(f"{pre}/receipt", 0), (f"{pre}/multisig", 0)]
+    assert mb.seen == 2
+
+    # idle mailbox is not read
+    reads.clear()
+    for i in range(3):
+        assert next(mbi) == b''
+    assert reads == []
+
+    # only advanced topics are read
+    mbx.storeMsg(topic=f"{pre}/multisig", msg=json.dumps(msg).encode("utf-8"))
+    val = next(mbi)
+    assert val.count(b'event: /multisig') == 1
+    assert reads == [(f"{pre}/multisig", 0)]
+
+    # other identifier advancing does not read own topics
+    reads.clear()
+    mbx.storeMsg(topic="EBxyz/receipt", msg=json.dumps(msg).encode("utf-8"))
+    assert next(mbi) == b''
+    assert reads == []
+
+
 def test_qrymailbox_iter():
     with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
         assert hab.pre == 'EIaGMMWJFPmtXznY1IIiKDIrg-vIyge6mBl2QV8dDjI3'
@@ -117,19 +173,21 @@ def test_qrymailbox_iter():
         assert val == b''
         assert mb.iter is None
 
-        # A cue with the wrong said still returns nothing and recues the cue
+        # A cue with the wrong said still returns nothing and routes the cue by said
         cues.append(dict(kin="stream", serder=icpSrdr))
         val = next(mbi)
         assert val == b''
-        assert len(cues) == 1
+        assert len(cues) == 0
+        assert icpSrdr.said in mb.rpys
         assert mb.iter is None
-        cues.popleft()
+        mb.rpys.pop(icpSrdr.said)
 
         cues.append(dict(kin="stream", pre=hab.pre, serder=srdr,
                          topics={"/receipt": 0, "/challenge": 1, "/multisig": 0}))
         val = next(mbi)
         assert val == b''
         assert len(cues) == 0
+        assert mb.rpys == {}
         assert mb.iter is not None
 
         # And now it behaves just like a standard MailboxIterable
@@ -149,6 +207,120 @@ def test_qrymailbox_iter():
             next(mbi)
 
 
+def test_qry_rpy_mailbox_acks():
+    """
+    Test only the querier itself acknowledges its mailbox topics
+    """
+    with habbing.openHby(name="wes", salt=coring.Salter(raw=b'wess-the-witness').qb64) as wesHby, \
+            habbing.openHby(name="vic", salt=coring.Salter(raw=b'vicy-the-victim0').qb64) as vicHby, \
+            habbing.openHby(name="mal", salt=coring.Salter(raw=b'malo-the-malice0').qb64) as malHby:
+        wesHab = wesHby.makeHab(name="wes", transferable=False)
+        vicHab = vicHby.makeHab(name="vic")
+        malHab = malHby.makeHab(name="mal")
+
+        cues = decking.Deck()
+        kvy = eventing.Kevery(db=wesHby.db, lax=True, local=False, cues=cues)
+        psr = parsing.Parser(kvy=kvy)
+        psr.parse(ims=bytearray(vicHab.makeOwnInception()))
+        psr.parse(ims=bytearray(malHab.makeOwnInception()))
+        assert vicHab.pre in kvy.kevers and malHab.pre in kvy.kevers
+
+        mbx = storing.Mailboxer(name="wes", temp=True)
+        topic = f"{vicHab.pre}/receipt"
+        for i in range(3):
+            mbx.storeMsg(topic=topic, msg=json.dumps(dict(i=vicHab.pre, n=i)).encode("utf-8"))
+        assert mbx.watermark(topic) == 3
+
+        # third party query of victim mailbox streams but does not ack
+        qry = malHab.query(pre=vicHab.pre, src=wesHab.pre, route="mbx",
+                           query=dict(topics={"/receipt": 1000}))
+        psr.parse(ims=bytearray(qry))
+        assert cues[-1]["kin"] == "stream" and cues[-1]["source"] == malHab.pre
+        mb = indirecting.QryRpyMailboxIterable(mbx=mbx, cues=cues, said=coring.Serder(raw=qry).said)
+        assert next(mb) == b''
+        assert mb.iter is not None
+        assert mbx.acks.get(keys=topic) is None
+
+        # querier query acks own mailbox up to watermark only
+        qry = vicHab.query(pre=vicHab.pre, src=wesHab.pre, route="mbx",
+                           query=dict(topics={"/receipt": 1000}))
+        psr.parse(ims=bytearray(qry))
+        mb = indirecting.QryRpyMailboxIterable(mbx=mbx, cues=cues, said=coring.Serder(raw=qry).said)
+        assert next(mb) == b''
+        assert mbx.acks.get(keys=topic).sn == 3
+
+        # invalid topic indices are rejected
+        for topics in ({"/receipt": "3"}, {"/receipt": -1}, {"/receipt": True}, ["/receipt"]):
+            serder = eventing.query(route="mbx", query=dict(i=vicHab.pre, src=wesHab.pre, topics=topics))
+            with pytest.raises(kering.ValidationError):
+                kvy.processQuery(serder=serder, source=coring.Prefixer(qb64=vicHab.pre))
+
+        mbx.close(clear=True)
+
+
+def test_setup_witness_retention():
+    """
+    Test witness mailbox gets default retention policy unless configured
+    """
+    assert indirecting.WitnessRetention == storing.Retention(age=30 * 24 * 3600.0, count=1000)
+
+    with habbing.openHby(name="wan", salt=coring.Salter(raw=b'wann-the-witness').qb64) as wanHby, \
+            habbing.openHby(name="wil", salt=coring.Salter(raw=b'will-the-witness').qb64) as wilHby:
+        mbx = storing.Mailboxer(name="wan", temp=True)
+        doers = indirecting.setupWitness(alias="wan", hby=wanHby, mbx=mbx, tcpPort=5636, httpPort=5646)
+        assert mbx.policy == indirecting.WitnessRetention
+        compactors = [doer for doer in doers if isinstance(doer, storing.MailboxCompactor)]
+        assert len(compactors) == 1
+        assert compactors[0].mbx is mbx
+        mbx.close(clear=True)
+
+        policy = storing.Retention(count=5, acked=True)
+        mbx = storing.Mailboxer(name="wil", temp=True)
+        indirecting.setupWitness(alias="wil", hby=wilHby, mbx=mbx, tcpPort=5637, httpPort=5647,
+                                 retention=policy)
+        assert mbx.policy == policy
+        mbx.close(clear=True)
+
+    from keri.app.cli.commands.witness import start
+    assert start.mbxRetention() == indirecting.WitnessRetention
+    assert start.mbxRetention(age=60.0, acked=True) == storing.Retention(age=60.0, count=1000,
+                                                                         acked=True)
+    assert start.mbxRetention(age=0, count=0) == storing.Retention()  # unbounded
+
+
+def test_setup_witness_metrics():
+    """
+    Test witness serves metrics only on separate admin port when configured
+    """
+    with habbing.openHby(name="wes", salt=coring.Salter(raw=b'wess-the-witness').qb64) as hby:
+        mbx = storing.Mailboxer(name="wes", temp=True)
+        doers = indirecting.setupWitness(alias="wes", hby=hby, mbx=mbx, tcpPort=5638, httpPort=5648)
+        servers = [doer.server for doer in doers if isinstance(doer, http.ServerDoer)]
+        assert len(servers) == 1
+        client = testing.TestClient(app=servers[0].app)
+        assert client.simulate_get("/metrics").status == falcon.HTTP_NOT_FOUND
+        for doer in doers:
+            if isinstance(doer, basing.BaserDoer):
+                doer.baser.close(clear=True)
+
+        doers = indirecting.setupWitness(alias="wit", hby=hby, mbx=mbx, tcpPort=5639, httpPort=5649,
+                                         metricsPort=5659)
+        servers = [doer.server for doer in doers if isinstance(doer, http.ServerDoer)]
+        assert len(servers) == 2
+        client = testing.TestClient(app=servers[0].app)
+        assert client.simulate_get("/metrics").status == falcon.HTTP_NOT_FOUND
+        client = testing.TestClient(app=servers[1].app)
+        rep = client.simulate_get("/metrics")
+        assert rep.status == falcon.HTTP_OK
+        assert 'keri_escrow_entries{escrow="ooes",store="baser"} 0' in rep.text
+        assert 'keri_escrow_entries{escrow="oots",store="reger"} 0' in rep.text
+        for doer in doers:
+            if isinstance(doer, basing.BaserDoer):
+                doer.baser.close(clear=True)
+        mbx.close(clear=True)
+
+
 if __name__ == "__main__":
     test_mailbox_iter()
+    test_mailbox_iter_watermarks()
     test_qrymailbox_iter()
@@ -19,7 +19,8 @@ from hio.base import doing
 from keri.help import helping
 from keri.core import coring
 from keri.core.coring import IdrDex
-from keri.app import keeping
+from keri import kering
+from keri.app import habbing, keeping
 
 
 def test_dataclasses():
@@ -668,9 +669,29 @@ def test_creator():
     assert signer.verfer.code in coring.NonTransDex
     assert signer.verfer.qb64 == 'BFRtyHAjSuJaRX6TDPva35GN11VHAruaOXMc79ZYDKsT'
 
+    # concurrent stretches give same signers in same order as serial
+    creator = keeping.SaltyCreator(salt=salt, workers=1)
+    assert creator.workers == 1
+    serial = [signer.qb64 for signer in creator.create(count=3, kidx=1)]
+    assert serial[0] == creator.create(kidx=1)[0].qb64
+    creator = keeping.SaltyCreator(salt=salt, workers=3)
+    assert creator.workers == 3
+    assert [signer.qb64 for signer in creator.create(count=3, kidx=1)] == serial
+
     creator = keeping.Creatory(algo=keeping.Algos.salty).make(salt=salt)
     assert isinstance(creator, keeping.SaltyCreator)
     assert creator.salter.qb64 == salt
+    assert creator.workers == keeping.SaltyCreator.Workers
+    creator = keeping.Creatory(algo=keeping.Algos.salty).make(salt=salt, workers=2)
+    assert creator.workers == 2
+
+    # default concurrent stretches capped by memory hungry tiers
+    creator = keeping.SaltyCreator(salt=salt, tier=coring.Tiers.high)
+    assert creator.workers == 1
+    creator = keeping.SaltyCreator(salt=salt, tier=coring.Tiers.med)
+    assert creator.workers == min(2, keeping.SaltyCreator.Workers)
+    creator = keeping.SaltyCreator(salt=salt, tier=coring.Tiers.high, workers=3)
+    assert creator.workers == 3
 
     creator = keeping.Creatory(algo=keeping.Algos.randy).make()
     assert isinstance(creator, keeping.RandyCreator)
@@ -1992,5 +2013,126 @@ def test_manager_sign_dual_indices():
     assert not manager.ks.opened
     """End Test"""
 
+def test_manager_signer_cache():
+    """
+    test Manager signing with cache of decrypted signers
+    """
+    salt = coring.Salter(raw=b'0123456789abcdef').qb64
+    cryptsigner = coring.Signer(raw=b'h,#|\x8ap"\x12\xc43t2\xa6\xe1\x18\x19\xf0f2,y\xc4\xc21@\xf5@\x15.\xa2\x1a\xcf',
+                                code=coring.MtrDex.Ed25519_Seed, transferable=False)
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+
+    with keeping.openKS() as keeper:
+        cache = keeping.SignerCache(ttl=60.0, size=2)
+        manager = keeping.Manager(ks=keeper, seed=cryptsigner.qb64, salt=salt,
+                                  aeid=cryptsigner.verfer.qb64, cache=cache)
+        verfers, digers = manager.incept(icount=3, ncount=3, temp=True)
+        pubs = [verfer.qb64 for verfer in verfers]
+
+        sigers = manager.sign(ser=ser, verfers=verfers)
+        assert (cache.hits, cache.misses) == (0, 3)
+        assert len(cache.signers) == 2  # size bounded
+        assert cache.signers.evictions == 1
+        assert [siger.qb64 for siger in sigers[1:]] == \
+               [siger.qb64 for siger in manager.sign(ser=ser, pubs=pubs[1:], indices=[1, 2])]
+        assert (cache.hits, cache.misses) == (2, 3)
+
+        # cached signers still require authorized decrypter
+        decrypter = manager.decrypter
+        manager.decrypter = None
+        with pytest.raises(kering.DecryptError):  # cached
+            manager.sign(ser=ser, pubs=pubs[1:], indexed=False)
+        with pytest.raises(kering.DecryptError):  # not cached
+            manager.sign(ser=ser, pubs=pubs[:1])
+        assert (cache.hits, cache.misses) == (2, 3)
+        manager.decrypter = decrypter
+
+        # signers from cache are not redecrypted
+        cigars = manager.sign(ser=ser, pubs=pubs[1:], indexed=False)
+        assert [cigar.verfer.qb64 for cigar in cigars] == pubs[1:]
+        assert (cache.hits, cache.misses) == (4, 3)
+
+        # erased keys are removed from cache
+        manager.rotate(pre=pubs[0], ncount=3, temp=True)
+        manager.rotate(pre=pubs[0], ncount=3, temp=True)
+        assert not set(pubs) & set(cache.signers)
+        with pytest.raises(ValueError):
+            manager.sign(ser=ser, pubs=pubs[1:])
+
+        # stale entries expire
+        cache = keeping.SignerCache(ttl=0.0)
+        manager.cache = cache
+        verfers, digers = manager.incept(icount=1, ncount=1, temp=True)
+        manager.sign(ser=ser, verfers=verfers)
+        manager.sign(ser=ser, verfers=verfers)
+        assert (cache.hits, cache.misses, cache.expirations) == (0, 1, 1)
+
+        # change of aeid drops cached signers
+        manager.cache = cache = keeping.SignerCache()
+        manager.sign(ser=ser, verfers=verfers)
+        assert len(cache.signers) == 1
+        manager.updateAeid(aeid="", seed="")
+        assert len(cache.signers) == 0
+
+    with habbing.openHby(name="test", temp=True, signerCacheTtl=30.0) as hby:
+        assert hby.mgr.cache.ttl == 30.0
+        hab = hby.makeHab(name="test")  # signs inception so caches signer
+        hits, misses = hby.mgr.cache.hits, hby.mgr.cache.misses
+        hab.sign(ser=ser)
+        hab.sign(ser=ser)
+        assert (hby.mgr.cache.hits, hby.mgr.cache.misses) == (hits + 2, misses)
+    assert len(hby.mgr.cache.signers) == 0  # cleared on close
+
+    with habbing.openHby(name="test", temp=True) as hby:
+        assert hby.mgr.cache is None
+
+    """End Test"""
+
+
+def test_manager_sign_many():
+    """
+    test Manager batch signing of many serializations
+    """
+    salt = coring.Salter(raw=b'0123456789abcdef').qb64
+    sers = [f"serialization {i}".encode("utf-8") for i in range(7)]
+
+    with keeping.openKS() as keeper:
+        manager = keeping.Manager(ks=keeper, salt=salt)
+        verfers, digers = manager.incept(icount=3, ncount=3, temp=True)
+        pubs = [verfer.qb64 for verfer in verfers]
+
+        sigerss = manager.signMany(sers=sers, verfers=verfers)
+        assert len(sigerss) == len(sers)
+        for ser, sigers in zip(sers, sigerss):
+            assert [siger.qb64 for siger in sigers] == \
+                   [siger.qb64 for siger in manager.sign(ser=ser, verfers=verfers)]
+            assert [siger.index for siger in sigers] == [0, 1, 2]
+
+        sigerss = manager.signMany(sers=sers, pubs=pubs, indices=[3, 4, 5], ondices=[None, 1, 2])
+        assert [(siger.index, siger.ondex) for siger in sigerss[-1]] == [(3, None), (4, 1), (5, 2)]
+
+        cigarss = manager.signMany(sers=sers, pubs=pubs, indexed=False)
+        assert [cigar.qb64 for cigar in cigarss[0]] == \
+               [cigar.qb64 for cigar in manager.sign(ser=sers[0], pubs=pubs, indexed=False)]
+
+        # large batches signed in threads keep order
+        manager.BatchSize = 2
+        threaded = manager.signMany(sers=sers, verfers=verfers, workers=3)
+        serial = manager.signMany(sers=sers, verfers=verfers)
+        assert [[siger.qb64 for siger in sigers] for sigers in threaded] == \
+               [[siger.qb64 for siger in sigers] for sigers in serial]
+
+        assert manager.signMany(sers=[], verfers=verfers) == []
+
+        with pytest.raises(ValueError):
+            manager.signMany(sers=sers)
+        with pytest.raises(ValueError):
+            manager.signMany(sers=sers, pubs=pubs, indices=[0, 1])
+        with pytest.raises(ValueError):
+            manager.signMany(sers=sers, pubs=pubs, indices=[0, -1, 2])
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_manager_sign_dual_indices()
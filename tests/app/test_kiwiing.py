@@ -137,6 +137,39 @@ def test_credential_handlers(mockHelpingNowUTC, seeder):
         state = result.json[0]["status"]
         assert state["et"] == coring.Ilks.rev
 
+        body["credentialData"] = dict(LEI="7654321098abcdefg")
+        result = client.simulate_post(path="/credentials/test", body=json.dumps(body).encode("utf-8"))
+        assert result.status == falcon.HTTP_200
+        other = proving.Creder(ked=result.json)
+        regery.processEscrows()
+        credentialer.processEscrows()
+        verifier.processEscrows()
+
+        saids = sorted([creder.said, other.said])
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", schema=schema))
+        assert result.status == falcon.HTTP_200
+        assert [cred["sad"]["d"] for cred in result.json] == saids
+        assert result.json[0]["chains"] == []
+
+        result = client.simulate_get(path="/credentials/test",
+                                     params=dict(type="issued", schema="EBadSchemaSAID"))
+        assert result.status == falcon.HTTP_200
+        assert result.json == []
+
+        # page through credentials one at a time
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", limit=1))
+        assert result.status == falcon.HTTP_200
+        assert [cred["sad"]["d"] for cred in result.json] == saids[:1]
+        result = client.simulate_get(path="/credentials/test",
+                                     params=dict(type="issued", schema=schema, limit=1, last=saids[0]))
+        assert [cred["sad"]["d"] for cred in result.json] == saids[1:]
+        result = client.simulate_get(path="/credentials/test",
+                                     params=dict(type="issued", limit=1, last=saids[1], expand="false"))
+        assert result.json == []
+
+        result = client.simulate_get(path="/credentials/test", params=dict(type="issued", limit="x"))
+        assert result.status == falcon.HTTP_400
+
 
 def test_multisig_incept():
     prefix = "ends_test"
@@ -1039,15 +1072,15 @@ def test_contact_ends(seeder):
                                   'last': 'Burns3',
                                   'wellKnowns': []}]
 
-        # Begins with search on last name
+        # Begins with search on last name ordered by last name
         response = client.simulate_get("/contacts",
                                        query_string="filter_field=last&filter_value=Burns")
         assert response.status == falcon.HTTP_200
         assert response.json == [{'challenges': [],
                                   'company': 'GLEIF',
-                                  'first': 'Ken3',
-                                  'id': 'EAjKmvW6flpWJfdYYZ2Lu4pllPWKFjCBz0dcX-S86Nvg',
-                                  'last': 'Burns3',
+                                  'first': 'Ken0',
+                                  'id': 'EPo8Wy1xpTa6ri25M4IlmWBBzs5y8v4Qn3Z8xP4kEjcK',
+                                  'last': 'Burns0',
                                   'wellKnowns': []},
                                  {'challenges': [],
                                   'company': 'GLEIF',
@@ -1055,12 +1088,6 @@ def test_contact_ends(seeder):
                                   'id': 'EER-n23rDM2RQB8Kw4KRrm8SFpoid4Jnelhauo6KxQpz',
                                   'last': 'Burns1',
                                   'wellKnowns': []},
-                                 {'challenges': [],
-                                  'company': 'ProSapien',
-                                  'first': 'Ken4',
-                                  'id': 'EGwcSt3uvK5-oHI7hVU7dKMvWt0vRfMW2demzBBMDnBG',
-                                  'last': 'Burns4',
-                                  'wellKnowns': []},
                                  {'challenges': [],
                                   'company': 'ProSapien',
                                   'first': 'Ken2',
@@ -1069,9 +1096,15 @@ def test_contact_ends(seeder):
                                   'wellKnowns': []},
                                  {'challenges': [],
                                   'company': 'GLEIF',
-                                  'first': 'Ken0',
-                                  'id': 'EPo8Wy1xpTa6ri25M4IlmWBBzs5y8v4Qn3Z8xP4kEjcK',
-                                  'last': 'Burns0',
+                                  'first': 'Ken3',
+                                  'id': 'EAjKmvW6flpWJfdYYZ2Lu4pllPWKFjCBz0dcX-S86Nvg',
+                                  'last': 'Burns3',
+                                  'wellKnowns': []},
+                                 {'challenges': [],
+                                  'company': 'ProSapien',
+                                  'first': 'Ken4',
+                                  'id': 'EGwcSt3uvK5-oHI7hVU7dKMvWt0vRfMW2demzBBMDnBG',
+                                  'last': 'Burns4',
                                   'wellKnowns': []}]
 
         response = client.simulate_delete(f"/contacts/E8AKUcbZyik8EdkOwXgnyAxO5mSIPJWGZ_o7zMhnNnjo")
@@ -0,0 +1,163 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.app.pooling module
+
+"""
+import time
+
+import falcon
+import pytest
+from hio.core import http
+from hio.core.tcp import clienting
+
+from keri import kering
+from keri.app import agenting, habbing, httping, indirecting, pooling
+from keri.db import basing
+
+
+def test_client_pool():
+    """
+    Test ClientPool lease, release, eviction and health tracking
+    """
+    pool = pooling.ClientPool(idle=10.0, maxFails=2)
+    assert pool.idle == 10.0
+    assert pool.maxFails == 2
+
+    eid = "BGKVzj4ve0VSd8z_AmvhLg4lqcC_9WYX90k03q-R_Ydo"
+    hurl = "http://127.0.0.1:5999"
+    turl = "tcp://127.0.0.1:5998"
+
+    client = pool.acquire(eid=eid, scheme=kering.Schemes.http, url=hurl)
+    assert isinstance(client, http.clienting.Client)
+    assert pool.misses == 1
+    assert pool.hits == 0
+
+    pool.release(eid=eid, scheme=kering.Schemes.http, url=hurl, client=client)
+    assert pool.clients[(eid, kering.Schemes.http, hurl)][0][0] is client
+    assert pool.acquire(eid=eid, scheme=kering.Schemes.http, url=hurl) is client
+    assert pool.hits == 1
+    assert (eid, kering.Schemes.http, hurl) not in pool.clients or \
+           not pool.clients[(eid, kering.Schemes.http, hurl)]
+
+    # other scheme or url is other key
+    tclient = pool.acquire(eid=eid, scheme=kering.Schemes.tcp, url=turl)
+    assert isinstance(tclient, clienting.Client)
+    assert pool.misses == 2
+
+    # busy client is not pooled
+    client.request(method="GET", path="/")
+    assert pool.busy(client)
+    pool.release(eid=eid, scheme=kering.Schemes.http, url=hurl, client=client)
+    assert not pool.clients.get((eid, kering.Schemes.http, hurl))
+    assert pool.healthy(eid=eid, scheme=kering.Schemes.http, url=hurl)
+
+    # idle clients evicted
+    pool.release(eid=eid, scheme=kering.Schemes.tcp, url=turl, client=tclient)
+    assert len(pool.clients[(eid, kering.Schemes.tcp, turl)]) == 1
+    pool.prune(now=time.monotonic() + 5.0)
+    assert len(pool.clients[(eid, kering.Schemes.tcp, turl)]) == 1
+    pool.prune(now=time.monotonic() + 11.0)
+    assert (eid, kering.Schemes.tcp, turl) not in pool.clients
+    assert pool.evictions == 1
+
+    # failures tracked until healthy release
+    for i in range(2):
+        client = pool.acquire(eid=eid, scheme=kering.Schemes.http, url=hurl)
+        pool.release(eid=eid, scheme=kering.Schemes.http, url=hurl, client=client,
+                     failed=True)
+    assert pool.fails[(eid, kering.Schemes.http, hurl)] == 2
+    assert not pool.healthy(eid=eid, scheme=kering.Schemes.http, url=hurl)
+    assert not pool.clients.get((eid, kering.Schemes.http, hurl))
+    client = pool.acquire(eid=eid, scheme=kering.Schemes.http, url=hurl)
+    pool.release(eid=eid, scheme=kering.Schemes.http, url=hurl, client=client)
+    assert pool.healthy(eid=eid, scheme=kering.Schemes.http, url=hurl)
+
+    with pytest.raises(kering.ConfigurationError):
+        pool.acquire(eid=eid, scheme="ftp", url="ftp://127.0.0.1:21")
+
+    pool.close()
+    assert pool.clients == {}
+
+    # Habery shares its pool with its Habs
+    with habbing.openHby(name="pal", temp=True) as hby:
+        hab = hby.makeHab(name="pal")
+        assert isinstance(hby.pool, pooling.ClientPool)
+        assert hab.pool is hby.pool
+
+    """Done Test"""
+
+
+def test_client_pool_http_reuse():
+    """
+    Test pooled http client is reused across CESR posts to a live server
+    """
+    with habbing.openHby(name="pal", temp=True) as hby:
+        hab = hby.makeHab(name="pal")
+        pool = hab.pool
+        eid = hab.pre
+        url = "http://127.0.0.1:5677"
+
+        rxbs = bytearray()
+        app = falcon.App()
+        app.add_route("/", indirecting.HttpEnd(rxbs=rxbs))
+        server = http.Server(port=5677, app=app)
+        server.reopen()
+
+        def post(msg):
+            client = pool.acquire(eid=eid, scheme=kering.Schemes.http, url=url)
+            httping.createCESRRequest(bytearray(msg), client)
+            while not client.responses:
+                client.service()
+                server.service()
+                time.sleep(0.01)
+            assert client.respond().status == 204
+            client.service()  # notice any remote close
+            server.service()
+            pool.release(eid=eid, scheme=kering.Schemes.http, url=url, client=client)
+
+        try:
+            post(hab.makeOwnInception())
+            post(hab.interact())
+            post(hab.interact())
+            assert pool.misses == 1
+            assert pool.hits == 2
+            assert pool.fails[(eid, kering.Schemes.http, url)] == 0
+            assert pool.healthy(eid=eid, scheme=kering.Schemes.http, url=url)
+            assert len(rxbs) > 0
+        finally:
+            pool.close()
+            server.close()
+
+    """Done Test"""
+
+
+def test_witnesser_health():
+    """
+    Test witnesser prefers http endpoint unless pool finds it unhealthy
+    """
+    with habbing.openHby(name="pal", temp=True) as hby:
+        hab = hby.makeHab(name="pal")
+        wit = "BGKVzj4ve0VSd8z_AmvhLg4lqcC_9WYX90k03q-R_Ydo"
+        hurl = "http://127.0.0.1:5999"
+        turl = "tcp://127.0.0.1:5998"
+        hby.db.locs.pin(keys=(wit, kering.Schemes.http), val=basing.LocationRecord(url=hurl))
+        hby.db.locs.pin(keys=(wit, kering.Schemes.tcp), val=basing.LocationRecord(url=turl))
+
+        witer = agenting.witnesser(hab, wit)
+        assert isinstance(witer, agenting.HttpWitnesser)
+        hab.pool.release(eid=wit, scheme=kering.Schemes.http, url=hurl, client=witer.client)
+
+        hab.pool.fails[(wit, kering.Schemes.http, hurl)] = hab.pool.maxFails
+        witer = agenting.witnesser(hab, wit)
+        assert isinstance(witer, agenting.TCPWitnesser)
+        assert witer.url == turl
+
+        hab.pool.fails[(wit, kering.Schemes.tcp, turl)] = hab.pool.maxFails
+        assert isinstance(agenting.witnesser(hab, wit), agenting.HttpWitnesser)  # both unhealthy
+        hab.pool.close()
+
+    """Done Test"""
+
+
+if __name__ == "__main__":
+    test_client_pool()
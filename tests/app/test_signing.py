@@ -413,6 +413,35 @@ def test_signature_transposition(seeder, mockCoringRandomNonce, mockHelpingNowIs
     """End Test"""
 
 
+def test_ratify_many(seeder):
+    with habbing.openHab(name="sid", temp=True, salt=b'0123456789abcdef') as (hby, hab), \
+            habbing.openHab(name="wan", temp=True, salt=b'0123456789abcdef',
+                            transferable=False) as (wanHby, wanHab):
+        creders = [proving.credential(schema="EAllThM1rLBSMZ_ozM1uAnFvSfC0N1jaQ42aKU5sCZ5Q",
+                                      issuer=hab.pre,
+                                      data=dict(i=hab.pre, n=i),
+                                      status="ETQoH02zJRCTNz-Wl3nnkUD_RVSzSwcoNvmfa18AWt3M")
+                   for i in range(3)]
+
+        paths = [[], ["a"]]
+        msgs = signing.ratifyMany(hab=hab, serders=creders, paths=paths)
+        assert msgs == [signing.ratify(hab=hab, serder=creder, paths=paths) for creder in creders]
+        assert signing.ratifyMany(hab=hab, serders=(creder for creder in creders),
+                                  paths=paths) == msgs  # generator consumed once
+
+        results = signing.signPathsMany(hab=hab, serders=creders, paths=paths)
+        for creder, (sadsigers, sadcigars) in zip(creders, results):
+            assert sadcigars == []
+            assert [sadsiger[0].bext for sadsiger in sadsigers] == ["-", "-a"]
+            expect, _ = signing.signPaths(hab=hab, serder=creder, paths=paths)
+            assert [[siger.qb64 for siger in sigers] for (_, _, _, _, sigers) in sadsigers] == \
+                   [[siger.qb64 for siger in sigers] for (_, _, _, _, sigers) in expect]
+
+        msgs = signing.ratifyMany(hab=wanHab, serders=creders)
+        assert msgs == [signing.ratify(hab=wanHab, serder=creder) for creder in creders]
+        assert signing.ratifyMany(hab=hab, serders=[]) == []
+
+
 def test_signatory():
     salt = coring.Salter(raw=b'0123456789abcdef')  # init sig Salter
 
@@ -3,6 +3,7 @@
 tests.peer.mailboxing
 
 """
+import datetime
 import os
 
 import lmdb
@@ -11,7 +12,8 @@ from keri.app import keeping
 from keri.core import coring
 from keri.db import dbing, basing
 from keri.peer import exchanging
-from keri.app.storing import Mailboxer
+from keri.app.storing import Mailboxer, Retention, MailboxCompactor
+from keri.help import helping
 
 
 def test_mailboxing():
@@ -110,5 +112,80 @@ def test_mailboxing():
 
 
 
+def test_mailbox_compaction():
+    """
+    Test Mailboxer retention policies and compaction
+    """
+    pre = "EAD919wF4oiG7ck6mnBWTRD_Z-Io0wZKCxL0zjx5je9I"
+    rct = f"{pre}/receipt"
+    chl = f"{pre}/challenge"
+
+    def fns(mber, topic):
+        return [fn for fn, _, _ in mber.cloneTopicIter(topic=topic)]
+
+    with dbing.openLMDB(cls=Mailboxer) as mber:
+        assert mber.policy is None
+        assert mber.policies == {}
+
+        for idx in range(6):
+            exn = exchanging.exchange("/challenge", payload=dict(b=idx),
+                                      date="2021-07-15T13:01:37.624492+00:00")
+            mber.storeMsg(topic=rct, msg=exn.raw)
+            mber.storeMsg(topic=chl, msg=exn.raw)  # same msg in two topics
+
+        assert mber.compact() == 0  # no policies keeps everything
+        assert fns(mber, rct) == [0, 1, 2, 3, 4, 5]
+
+        # policy per route overrides default
+        mber.policy = Retention()
+        mber.policies["/receipt"] = Retention(count=2)
+        assert mber.retention(rct.encode("utf-8")) == Retention(count=2)
+        assert mber.retention(chl.encode("utf-8")) == Retention()
+        assert mber.compact() == 4
+        assert fns(mber, rct) == [4, 5]
+        assert fns(mber, chl) == [0, 1, 2, 3, 4, 5]
+        assert len(mber.getTopicMsgs(chl)) == 6  # shared msgs still there
+
+        mber.policies.clear()
+        mber.policy = Retention(acked=True)
+        assert mber.compact() == 0  # nothing acked yet
+        mber.ackTopic(topic=chl, fn=3)
+        mber.ackTopic(topic=chl, fn=2)  # acks only move forward
+        assert mber.acks.get(keys=chl).sn == 3
+        mber.ackTopic(topic=chl, fn="5")  # invalid ignored
+        mber.ackTopic(topic=chl, fn=True)
+        assert mber.acks.get(keys=chl).sn == 3
+        assert mber.watermark(chl) == 6
+        mber.tops.clear()  # watermark from database when not stored by this instance
+        assert mber.watermark(chl) == 6
+        assert mber.watermark(rct) == 6
+        assert mber.watermark(f"{pre}/multisig") == 0
+        assert mber.compact() == 3
+        assert fns(mber, chl) == [3, 4, 5]
+        assert len(list(mber.msgs.getItemIter())) == 3  # unreferenced msgs removed
+
+        # last entry always kept so order numbers keep increasing
+        mber.ackTopic(topic=chl, fn=1000)  # clamped to watermark
+        assert mber.acks.get(keys=chl).sn == 6
+        assert mber.compact() == 2
+        assert fns(mber, chl) == [5]
+        exn = exchanging.exchange("/challenge", payload=dict(b=6),
+                                  date="2021-07-15T13:01:37.624492+00:00")
+        mber.storeMsg(topic=chl, msg=exn.raw)
+        assert fns(mber, chl) == [5, 6]
+
+        mber.policy = Retention(age=60.0)
+        assert mber.compact() == 0
+        later = helping.nowUTC() + datetime.timedelta(seconds=120)
+        assert mber.compact(now=later) == 2  # one in each topic
+        assert fns(mber, rct) == [5]
+        assert fns(mber, chl) == [6]
+
+        compactor = MailboxCompactor(mbx=mber)
+        assert compactor.tock == MailboxCompactor.Tock
+        assert compactor.recur(tyme=0.0) is False
+
+
 if __name__ == '__main__':
     test_mailboxing()
+    test_mailbox_compaction()
@@ -22,7 +22,7 @@ from keri.core import coring
 from keri.core import eventing
 from keri.core.coring import Ilkage, Ilks, Ids, Idents, Sadder
 from keri.core.coring import Seqner, NumDex, Number, Siger, Dater, Bexter
-from keri.core.coring import Serder, Tholder
+from keri.core.coring import Serder, Tholder, Tallier, extractGroup, encodeGroup
 from keri.core.coring import Serialage, Serials, Vstrings
 from keri.core.coring import (Sizage, MtrDex, Matter, Xizage, IdrDex, IdxSigDex,
                               IdxCrtSigDex, IdxBthSigDex, Indexer,
@@ -5471,6 +5471,60 @@ def test_serder():
     """Done Test """
 
 
+def test_serder_memo():
+    """
+    Test Serder memoization of derived properties
+    """
+    signers = coring.Salter(raw=b'0123456789abcdef').signers(count=3)
+    keys = [signers[0].verfer.qb64]
+    wits = [signers[1].verfer.qb64]
+    srdr = eventing.incept(keys=keys, wits=wits,
+                           ndigs=[coring.Diger(ser=signers[2].verfer.qb64b).qb64])
+    assert not hasattr(srdr, "__dict__")  # slotted
+    assert srdr._memo == {}
+
+    verfers = srdr.verfers
+    assert [verfer.qb64 for verfer in verfers] == keys
+    assert srdr.verfers is not verfers  # copy of list
+    assert srdr.verfers[0] is verfers[0]  # same memoized instances
+    assert [werfer.qb64 for werfer in srdr.werfers] == wits
+    assert srdr.werfers[0] is srdr.werfers[0]
+    assert srdr.tholder is srdr.tholder
+    assert srdr.ntholder is srdr.ntholder
+    assert srdr.nexter is srdr.nexter
+    assert srdr.sner is srdr.sner
+    assert srdr.sn == 0
+    assert set(srdr._memo) == {"verfers", "werfers", "tholder", "ntholder",
+                               "nexter", "sner"}
+
+    # setting .ked resets memo
+    ked = dict(srdr.ked)
+    ked["s"] = "1"
+    ked["k"] = [signers[1].verfer.qb64]
+    srdr.ked = ked
+    assert srdr._memo == {}
+    assert srdr.sn == 1
+    assert [verfer.qb64 for verfer in srdr.verfers] == [signers[1].verfer.qb64]
+
+    # setting .raw resets memo
+    raw = eventing.interact(pre=srdr.pre, dig=srdr.said, sn=2).raw
+    srdr.raw = raw
+    assert srdr._memo == {}
+    assert srdr.sn == 2
+    assert srdr.verfers == []
+    assert srdr.tholder is None
+    assert srdr.ntholder is None
+    assert "tholder" in srdr._memo  # None memoized too
+
+    # clone has own memo
+    clone = Serder(sad=srdr)
+    assert clone._memo == {}
+    assert clone.sner is not srdr.sner
+    assert clone.sn == srdr.sn
+
+    """Done Test """
+
+
 def test_tholder():
     """
     Test Tholder signing threshold satisfier class
@@ -5841,6 +5895,122 @@ def test_tholder():
     """ Done Test """
 
 
+def test_extract_encode_group():
+    """
+    Test bulk extraction and encoding of counted groups of primitives
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=3, temp=True, transferable=False)
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+    sigers = [signer.sign(ser, index=i) for i, signer in enumerate(signers)]
+    cigars = [signer.sign(ser) for signer in signers]
+    assert not hasattr(sigers[0], "__dict__")  # slotted
+    assert not hasattr(cigars[0], "__dict__")
+    assert sigers[0].qb64b is sigers[0].qb64b  # memoized
+
+    # indexed signatures
+    msg = encodeGroup(CtrDex.ControllerIdxSigs, sigers)
+    assert msg == Counter(CtrDex.ControllerIdxSigs, count=3).qb64b + \
+           b"".join(siger.qb64b for siger in sigers)
+    ims = bytearray(msg) + b"rest"
+    ctr = Counter(qb64b=ims, strip=True)
+    assert ctr.fullSize == 4
+    group = extractGroup(ims, klases=Siger, count=ctr.count)
+    assert [siger.qb64b for siger in group] == [siger.qb64b for siger in sigers]
+    assert [siger.index for siger in group] == [0, 1, 2]
+    assert group[0].fullSize == len(sigers[0].qb64b) == 88
+    assert ims == bytearray(b"rest")
+
+    # receipt couples of tuples in binary
+    msg = encodeGroup(CtrDex.NonTransReceiptCouples,
+                      [(cigar.verfer, cigar) for cigar in cigars], bny=True)
+    ims = bytearray(msg)
+    ctr = Counter(qb2=ims, strip=True)
+    group = extractGroup(ims, klases=(Verfer, Cigar), count=ctr.count, bny=True)
+    assert [(verfer.qb64, cigar.qb64) for verfer, cigar in group] == \
+           [(cigar.verfer.qb64, cigar.qb64) for cigar in cigars]
+    assert not ims
+
+    # already qualified members and shortage strips nothing
+    msg = encodeGroup(CtrDex.ControllerIdxSigs, [siger.qb64b for siger in sigers])
+    ims = bytearray(msg[4:-1])
+    with pytest.raises(ShortageError):
+        extractGroup(ims, klases=Siger, count=3)
+    assert ims == msg[4:-1]
+    ims.extend(msg[-1:])  # not exported after shortage
+    assert len(extractGroup(ims, klases=Siger, count=3)) == 3
+    assert not ims
+
+    group = extractGroup(bytes(msg[4:]), klases=Siger, count=2, strip=False)
+    assert [siger.qb64 for siger in group] == [siger.qb64 for siger in sigers[:2]]
+    assert encodeGroup(CtrDex.ControllerIdxSigs, []) == b'-AAA'
+
+    """ Done Test """
+
+
+def test_tallier():
+    """
+    Test Tallier incremental threshold satisfaction and precompiled weights
+    """
+    tholder = Tholder(sith=[["1/2", "1/2", "1/4", "1/4", "1/4"], ["1/3", "2/3", "0"]])
+    assert tholder._denom == 12
+    assert tholder._clauses == [(0, 0b11111, (6, 6, 3, 3, 3)), (5, 0b111, (4, 8, 0))]
+
+    # precompiled satisfy agrees with fraction sums for every subset of keys
+    for mask in range(1 << tholder.size):
+        indices = [i for i in range(tholder.size) if mask & (1 << i)]
+        sats = set(indices)
+        expect, wio = bool(indices), 0
+        for clause in tholder.thold:
+            if sum(w for j, w in enumerate(clause, start=wio) if j in sats) < 1:
+                expect = False
+            wio += len(clause)
+        assert tholder.satisfy(indices=indices) == expect
+        assert tholder.tallier(indices=indices).satisfied == expect
+
+    assert not tholder.satisfy(indices=[0, 1, 6, 8])  # index out of range
+    assert not tholder.satisfy(indices=[0, 1, 6, -1])
+
+    tallier = tholder.tallier()
+    assert isinstance(tallier, Tallier)
+    assert not tallier.satisfied
+    assert not tallier.add(0)
+    assert not tallier.add(0)  # duplicate counted once
+    assert not tallier.add(7)  # zero weight
+    assert not tallier.add(5)
+    assert not tallier.add(6)  # second clause met
+    assert not tallier.add(2)
+    assert tallier.add(4)  # first clause met
+    assert tallier.add(1)
+    assert tallier.indices == {0, 1, 2, 4, 5, 6, 7}
+
+    # invalid index rejects the whole set in both satisfy and tallier
+    tallier = tholder.tallier(indices=[0, 1, 5])
+    assert not tallier.satisfied
+    assert not tallier.add(8)
+    assert tallier.invalid
+    assert not tallier.add(6)  # would otherwise satisfy
+    assert not tholder.satisfy(indices=[0, 1, 5, 6, 8])
+
+    numer = Tholder(sith="2")
+    tallier = Tallier(tholder=numer, indices=[1, 1])
+    assert not tallier.satisfied
+    assert tallier.add(0)
+    assert tallier.add(5)  # numeric threshold has no key list size
+    assert numer.satisfy(indices=[1, 1, 0, 5])
+    assert not numer.satisfy(indices=[1, 1])  # duplicates counted once
+    assert Tallier(tholder=Tholder(sith="0")).extend([0, 1, 2]) is False
+
+    for holder in (tholder, numer):
+        for indices in ([0, 1, 5, 6, 99], [0, 1, 5, 6, -1], [0, 1, 5, 6, "2"],
+                        [0, 1, 5, 6, True], [0, 1, 5, 6, None], [0, 1, 5, 6]):
+            expect = holder.satisfy(indices=indices)
+            assert holder.tallier(indices=indices).satisfied == expect
+            assert Tallier(tholder=holder).extend(indices) == expect
+            assert expect == all(holder.valid(index) for index in indices)
+
+    """ Done Test """
+
+
 if __name__ == "__main__":
     #test_matter()
     test_counter()
@@ -7,7 +7,9 @@ import os
 import time
 import datetime
 
-from keri import help
+import pytest
+
+from keri import help, kering
 from keri.help import helping
 from keri.db import dbing, basing
 from keri.app import keeping
@@ -1399,6 +1401,78 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+def test_escrow_waker():
+    """
+    Test Kevery.processEscrows only revisits escrowed events that were woken
+    """
+    salt = coring.Salter(raw=b'0123456789abcdef').qb64
+    psr = parsing.Parser()
+
+    with basing.openDB(name="edy") as db, keeping.openKS(name="edy") as ks, \
+            basing.openDB(name="ven") as vdb:
+        mgr = keeping.Manager(ks=ks, salt=salt)
+        kvy = eventing.Kevery(db=db)
+        vkvy = eventing.Kevery(db=vdb)
+
+        verfers, digers = mgr.incept(icount=1, ncount=1, stem='wes', temp=True)
+        srdr = eventing.incept(keys=[verfer.qb64 for verfer in verfers],
+                               ndigs=[diger.qb64 for diger in digers],
+                               code=coring.MtrDex.Blake3_256)
+        pre = srdr.pre
+        mgr.move(old=verfers[0].qb64, new=pre)
+        sigers = mgr.sign(ser=srdr.raw, verfers=verfers)
+        icpmsg = eventing.messagize(srdr, sigers=sigers)
+        icpdig = srdr.said
+
+        srdr = eventing.interact(pre=pre, dig=icpdig, sn=1, data=[])
+        sigers = mgr.sign(ser=srdr.raw, verfers=verfers)
+        ixnmsg = eventing.messagize(srdr, sigers=sigers)
+
+        psr.parse(ims=bytearray(ixnmsg), kvy=vkvy)  # out of order
+        assert pre not in vkvy.kevers
+        assert len(vdb.getOoes(dbing.snKey(pre, 1))) == 1
+
+        vdb.waker.period = 3600.0
+        vkvy.processEscrows()  # first pass is full sweep
+        assert len(vdb.getOoes(dbing.snKey(pre, 1))) == 1
+        assert vdb.waker.state(vkvy).woke["ooes"] == set()  # nothing woken
+
+        # stale but not woken so not revisited until next sweep
+        vkvy.TimeoutOOE = 0
+        vkvy.processEscrows()
+        assert len(vdb.getOoes(dbing.snKey(pre, 1))) == 1
+        vkvy.TimeoutOOE = 1200
+
+        # second Kevery on same db gets its own woken sets
+        okvy = eventing.Kevery(db=vdb)
+        okvy.processEscrows()  # first pass is full sweep
+        assert len(vdb.getOoes(dbing.snKey(pre, 1))) == 1
+
+        # accepting prior event wakes escrowed event
+        psr.parse(ims=bytearray(icpmsg), kvy=vkvy)
+        assert vkvy.kevers[pre].sn == 0
+        assert vdb.waker.state(vkvy).woke["ooes"] == {pre.encode("utf-8")}
+        assert vdb.waker.state(okvy).woke["ooes"] == {pre.encode("utf-8")}
+
+        # failed pass keeps woken prefixes for next pass
+        process = vkvy.processEscrowOutOfOrders
+
+        def fail(pres=None):
+            raise kering.ValidationError("fail")
+
+        vkvy.processEscrowOutOfOrders = fail
+        with pytest.raises(kering.ValidationError):
+            vkvy.processEscrows()
+        vkvy.processEscrowOutOfOrders = process
+        assert len(vdb.getOoes(dbing.snKey(pre, 1))) == 1
+
+        vkvy.processEscrows()
+        assert vkvy.kevers[pre].sn == 1
+        assert vdb.getOoes(dbing.snKey(pre, 1)) == []
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_unverified_receipt_escrow()
 
@@ -4,6 +4,7 @@ tests.core.test_eventing module
 
 """
 import os
+from concurrent import futures
 
 import blake3
 import pysodium
@@ -582,6 +583,58 @@ def test_dequintuple():
     """end test"""
 
 
+def test_verify_batch():
+    """
+    Test verifyBatch parallel batch signature verification
+    """
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+    signers = coring.Salter(raw=b'0123456789abcdef').signers(count=12, temp=True)
+    triples = [(signer.verfer, signer.sign(ser).raw, ser) for signer in signers]
+    triples[3] = (signers[3].verfer, signers[4].sign(ser).raw, ser)  # bad sig
+    triples[7] = (signers[7].verfer, signers[7].sign(ser).raw, ser + b'x')  # bad ser
+    expect = [i not in (3, 7) for i in range(len(triples))]
+
+    assert eventing.verifyBatch([]) == []
+    assert eventing.verifyBatch(triples) == expect  # serial
+    assert eventing.verifyBatch(iter(triples[:2])) == [True, True]
+
+    with futures.ThreadPoolExecutor(max_workers=4) as pool:
+        assert eventing.verifyBatch(triples, pool=pool) == expect
+        assert eventing._poolWorkers(pool) == 4  # chunk per worker
+
+    class Pool:  # executor that does not expose its worker count
+        def __init__(self):
+            self.chunks = []
+
+        def map(self, fn, chunks):
+            self.chunks = list(chunks)
+            return map(fn, self.chunks)
+
+    pool = Pool()
+    assert eventing._poolWorkers(pool) == (os.cpu_count() or 1)
+    assert eventing.verifyBatch(triples, pool=pool) == expect
+
+    prior = eventing.setVerifyPool(workers=2)
+    try:
+        assert prior is None
+        assert isinstance(eventing._verifyPool, futures.ThreadPoolExecutor)
+        assert eventing.verifyBatch(triples) == expect  # shared pool
+
+        # verifySigs uses the shared pool for indexed signatures
+        sigers = [signer.sign(ser, index=i) for i, signer in enumerate(signers)]
+        sigers[5] = signers[6].sign(ser, index=5)  # bad sig
+        verfers = [signer.verfer for signer in signers]
+        vsigers, vindices = eventing.verifySigs(raw=ser, sigers=sigers, verfers=verfers)
+        assert vindices == [i for i in range(len(signers)) if i != 5]
+        assert [siger.qb64 for siger in vsigers] == [siger.qb64 for siger in sigers
+                                                     if siger.index != 5]
+    finally:
+        eventing.setVerifyPool(prior).shutdown()
+
+    assert eventing._verifyPool is None
+    """ Done Test """
+
+
 def test_lastestloc():
     """
     Test LastEstLoc namedtuple
@@ -2190,6 +2243,62 @@ def test_keyeventsequence_0():
     """ Done Test """
 
 
+def test_kever_update_failed_commit():
+    """
+    Test Kever state is unchanged when the commit of an update fails
+    """
+    salt = b'g\x15\x89\x1a@\xa4\xa47\x07\xb9Q\xb8\x18\xcdJW'
+    signers = generateSigners(salt=salt, count=3, transferable=True)
+
+    with openDB(name="controller") as conlgr:
+        keys0 = [signers[0].verfer.qb64]
+        nxt1 = [coring.Diger(ser=signers[1].verfer.qb64b).qb64]
+        serder0 = incept(keys=keys0, ndigs=nxt1)
+        pre = serder0.pre
+        kever = Kever(serder=serder0, sigers=[signers[0].sign(serder0.raw, index=0)],
+                      db=conlgr)
+        state0 = conlgr.states.get(keys=pre)
+
+        def failpin(keys, val):
+            raise dbing.lmdb.MapFullError("full")
+
+        pin = conlgr.states.pin
+        conlgr.states.pin = failpin
+
+        # interaction
+        serder1 = interact(pre=pre, dig=serder0.said, sn=1)
+        with pytest.raises(dbing.lmdb.MapFullError):
+            kever.update(serder=serder1, sigers=[signers[0].sign(serder1.raw, index=0)])
+        assert kever.sn == 0
+        assert kever.serder.said == serder0.said
+        assert kever.ilk == Ilks.icp
+        assert conlgr.getKeLast(key=snKey(pre, 1)) is None  # aborted
+
+        # rotation
+        keys1 = [signers[1].verfer.qb64]
+        nxt2 = [coring.Diger(ser=signers[2].verfer.qb64b).qb64]
+        serder1 = rotate(pre=pre, keys=keys1, dig=serder0.said, ndigs=nxt2, sn=1)
+        with pytest.raises(dbing.lmdb.MapFullError):
+            kever.update(serder=serder1, sigers=[signers[1].sign(serder1.raw, index=0)])
+        assert kever.sn == 0
+        assert kever.serder.said == serder0.said
+        assert [verfer.qb64 for verfer in kever.verfers] == keys0
+        assert kever.nexter.digs == nxt1
+        assert kever.lastEst == LastEstLoc(s=0, d=serder0.said)
+        assert conlgr.states.get(keys=pre).ked == state0.ked
+        assert conlgr.getKeLast(key=snKey(pre, 1)) is None
+
+        # once the commit succeeds the state advances
+        conlgr.states.pin = pin
+        kever.update(serder=serder1, sigers=[signers[1].sign(serder1.raw, index=0)])
+        assert kever.sn == 1
+        assert [verfer.qb64 for verfer in kever.verfers] == keys1
+        assert kever.lastEst == LastEstLoc(s=1, d=serder1.said)
+        assert conlgr.states.get(keys=pre).ked["s"] == "1"
+
+    """ Done Test """
+
+
 def test_keyeventsequence_1():
     """
     Test generation of a sequence of key events
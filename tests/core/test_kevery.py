@@ -427,5 +427,55 @@ def test_stale_event_receipts():
         """ Done Test """
 
 
+def test_query_logs_tail():
+    """
+    Test logs query replays only tail of KEL from first seen ordinal
+    """
+    with habbing.openHab(name="pal", salt=b'0123456789abcdef', transferable=True, temp=True) as (hby, hab):
+        hab.interact()
+        hab.interact()
+        hab.rotate()
+        assert hab.kever.sn == 3
+        kvy = Kevery(db=hab.db, lax=True)
+        source = coring.Prefixer(qb64=hab.pre)
+        saids = [bytes(dig).decode("utf-8") for _, dig in hab.db.getFelItemPreIter(hab.pre.encode("utf-8"))]
+        assert len(saids) == 4
+
+        # full replay by default
+        qry = eventing.query(route="logs", query=dict(i=hab.pre, src=hab.pre))
+        kvy.processQuery(serder=qry, source=source)
+        cue = kvy.cues.popleft()
+        assert cue["kin"] == "replay"
+        msgs = list(cue["msgs"])
+        assert [coring.Serder(raw=msg).said for msg in msgs] == saids
+
+        # replay from first seen ordinal
+        qry = eventing.query(route="logs", query=dict(i=hab.pre, src=hab.pre, fn=2))
+        kvy.processQuery(serder=qry, source=source)
+        msgs = list(kvy.cues.popleft()["msgs"])
+        assert [coring.Serder(raw=msg).said for msg in msgs] == saids[2:]
+
+        # replay after SAID of last event querier has
+        qry = eventing.query(route="logs", query=dict(i=hab.pre, src=hab.pre, d=saids[2]))
+        kvy.processQuery(serder=qry, source=source)
+        msgs = list(kvy.cues.popleft()["msgs"])
+        assert [coring.Serder(raw=msg).said for msg in msgs] == saids[3:]
+
+        # querier already up to date so nothing to replay
+        qry = eventing.query(route="logs", query=dict(i=hab.pre, src=hab.pre, d=saids[3]))
+        kvy.processQuery(serder=qry, source=source)
+        assert not kvy.cues
+
+        # pending replay holds no read transaction so sees later events
+        qry = eventing.query(route="logs", query=dict(i=hab.pre, src=hab.pre, fn=3))
+        kvy.processQuery(serder=qry, source=source)
+        msgs = kvy.cues.popleft()["msgs"]
+        assert coring.Serder(raw=next(msgs)).said == saids[3]
+        hab.interact()
+        assert [coring.Serder(raw=msg).said for msg in msgs] == [hab.kever.serder.said]
+
+    """ Done Test """
+
+
 if __name__ == "__main__":
     test_kevery()
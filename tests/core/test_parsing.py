@@ -248,5 +248,55 @@ def test_parser():
 
 
 
+def test_parse_views():
+    """
+    Test extraction of primitives and messages from memoryview without copy
+    of stream and parsing of non bytearray streams
+    """
+    signer = Salter(raw=b'0123456789abcdef').signers(count=1, temp=True)[0]
+    serder = incept(keys=[signer.verfer.qb64])
+    siger = signer.sign(serder.raw, index=0)
+    counter = Counter(code=CtrDex.ControllerIdxSigs, count=1)
+    msg = bytearray(serder.raw + counter.qb64b + siger.qb64b)
+
+    # extract from view of stream
+    view = memoryview(msg)
+    sadder = coring.Sadder(raw=view)
+    assert sadder.raw == serder.raw
+    assert isinstance(sadder.raw, bytes)
+    view = view[sadder.size:]
+    ctr = Counter(qb64b=view)
+    assert ctr.code == CtrDex.ControllerIdxSigs
+    assert ctr.count == 1
+    view = view[len(ctr.qb64b):]
+    isiger = coring.Siger(qb64b=view)
+    assert isiger.qb64b == siger.qb64b
+    assert isinstance(isiger.raw, bytes)
+    assert len(view) == len(isiger.qb64b)
+
+    qb2 = bytearray(counter.qb2 + siger.qb2)
+    view = memoryview(qb2)
+    ctr = Counter(qb2=view)
+    assert ctr.count == 1
+    isiger = coring.Siger(qb2=view[len(ctr.qb2):])
+    assert isiger.qb64b == siger.qb64b
+
+    # sniff only looks at front of stream for version string
+    with pytest.raises(coring.VersionError):
+        coring.sniff(b'{"v":"' + b'x' * 64 + serder.raw)
+
+    # parse bytes and memoryview streams
+    for ims in (bytes(msg), memoryview(msg)):
+        with openDB() as db:
+            kvy = Kevery(db=db)
+            parsing.Parser().parse(ims=ims, kvy=kvy)
+            assert serder.pre in kvy.kevers
+
+    assert len(msg) == len(serder.raw) + len(counter.qb64b) + len(siger.qb64b)
+
+    """ Done Test """
+
+
 if __name__ == "__main__":
     test_parser()
+    test_parse_views()
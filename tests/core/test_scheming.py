@@ -5,10 +5,12 @@ tests keri.core.scheming
 """
 import json
 
+import jsonschema
 import pytest
 
 from keri.core.coring import MtrDex, dumps, Saider, Ids
-from keri.core.scheming import Schemer, JSONSchema, CacheResolver
+from keri.core import scheming
+from keri.core.scheming import Schemer, JSONSchema, CacheResolver, SchemaCache
 from keri.db import basing
 from keri.kering import ValidationError
 
@@ -294,7 +296,61 @@ def test_resolution():
             schemer.verify(badload)
 
 
+def test_schema_cache():
+    """ Test bounded cache of schemers and compiled validators keyed by SAID """
+    sad = {
+        "$id": "",
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "type": "object",
+        "properties": {"a": {"type": "string"}},
+        "required": ["a"]
+    }
+    _, sad = Saider.saidify(sad, label=Ids.dollar)
+    raw = dumps(sad)
+
+    schemas = SchemaCache(size=2)
+    assert schemas.size == 2
+    schemer = schemas.schemer(raw=raw)
+    assert schemas.schemer(raw=raw, said=schemer.said) is schemer
+    assert schemas.schemers.hits == 1
+
+    validator = schemas.validator(said=schemer.said, schema=schemer.sed)
+    assert schemas.validator(said=schemer.said, schema=schemer.sed) is validator
+    assert validator.is_valid({"a": "b"})
+    assert not validator.is_valid({"a": 1})
+
+    bad = dict(sad, type="nonesuch")
+    with pytest.raises(jsonschema.exceptions.SchemaError):
+        schemas.validator(said="Ebad", schema=bad)
+    assert ("Ebad", None) not in schemas.validators
+
+    schemas.validator(said="E1", schema=schemer.sed)
+    schemas.validator(said="E2", schema=schemer.sed)
+    assert len(schemas.validators) == 2  # bounded
+    assert schemas.validators.evictions == 1
+
+    schemas.clear()
+    assert len(schemas.schemers) == len(schemas.validators) == 0
+
+    # Schemer verification compiles validator once into shared cache
+    scheming.cache.clear()
+    misses = scheming.cache.validators.misses
+    schemer = Schemer(raw=raw)
+    assert (schemer.said, None) in scheming.cache.validators
+    assert schemer.verify(b'{"a": "b"}') is True
+    with pytest.raises(ValidationError):
+        schemer.verify(b'{"a": 1}')
+    assert scheming.cache.validators.misses == misses + 1
+
+    # SchemerSuber shares cached schemers
+    with basing.openDB(name="test") as db:
+        db.schema.pin(schemer.said, schemer)
+        schemer = db.schema.get(schemer.said)
+        assert db.schema.get(schemer.said) is schemer
+
+
 if __name__ == '__main__':
     test_json_schema()
     test_json_schema_dict()
     test_resolution()
+    test_schema_cache()
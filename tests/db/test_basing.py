@@ -20,6 +20,7 @@ from keri.db import dbing
 from keri.db.basing import openDB, Baser
 from keri.db.dbing import (dgKey, onKey, snKey)
 from keri.db.dbing import openLMDB
+from keri.help import helping
 
 
 def test_baser():
@@ -1715,7 +1716,7 @@ def test_clean_baser():
         state = natHab.db.states.get(keys=natHab.pre)  # Serder instance
         assert state.sn == 6
         assert state.ked["f"] == '6'
-        assert natHab.db.env.stat()['entries'] == 68
+        assert natHab.db.env.stat()['entries'] == 69
 
         # test reopenDB with reuse  (because temp)
         with basing.reopenDB(db=natHab.db, reuse=True):
@@ -1724,7 +1725,7 @@ def test_clean_baser():
             assert ldig == natHab.kever.serder.saidb
             serder = coring.Serder(raw=bytes(natHab.db.getEvt(dbing.dgKey(natHab.pre,ldig))))
             assert serder.said == natHab.kever.serder.said
-            assert natHab.db.env.stat()['entries'] == 68
+            assert natHab.db.env.stat()['entries'] == 69
 
             # verify name pre kom in db
             data = natHab.db.habs.get(keys=natHab.name)
@@ -2057,6 +2058,183 @@ def test_dbdict():
     """End Test"""
 
 
+def test_dbdict_lru():
+    """
+    Test bounded dbdict with eviction of nonlocal kevers
+    """
+    with habbing.openHby(name="test", base="test") as hby:
+        hab = hby.makeHab(name="test")
+        db = hby.db
+        assert db.kevers.size is basing.Baser.KeverCacheSize is None
+
+        dbd = basing.dbdict(size=3)
+        dbd.db = db
+        assert dbd.hits == dbd.misses == dbd.evictions == 0
+
+        dbd[hab.pre] = hab.kever  # local so pinned
+        dbd['a'] = 1
+        dbd['b'] = 2
+        assert dbd['a'] == 1  # b now least recently used
+        dbd['c'] = 3
+        assert list(dbd.keys()) == [hab.pre, 'a', 'c']
+        assert dbd.evictions == 1
+        dbd['d'] = 4
+        assert list(dbd.keys()) == [hab.pre, 'c', 'd']  # local never evicted
+        assert dbd.evictions == 2
+        assert dbd.hits == 1
+
+        assert 'b' not in dbd  # evicted with no state in db
+        assert dbd.get('b') is None
+        assert dbd.misses == 2
+
+        # evicted kever with state in db is reloaded on lookup
+        dbd.clear()
+        dbd.db = None
+        dbd[hab.pre] = hab.kever
+        dbd['a'] = 1
+        dbd['b'] = 2
+        dbd['c'] = 3  # no pinning without db so evicts hab.pre
+        assert hab.pre not in list(dbd.keys())
+        dbd.db = db
+        kever = dbd.get(hab.pre)  # get reads through
+        assert kever is not hab.kever
+        assert kever.state().ked == hab.kever.state().ked
+        assert list(dbd.keys()) == ['b', 'c', hab.pre]
+
+    with habbing.openHby(name="test", base="test", keverCacheSize=16) as hby:
+        assert hby.db.kevers.size == 16
+
+    """End Test"""
+
+
+def test_waker():
+    """
+    Test Waker dependency index of key event escrows
+    """
+    class Consumer:
+        pass
+
+    waker = basing.Waker(period=3600.0)
+    assert waker.period == 3600.0
+    assert waker.deps == {}
+    assert len(waker.consumers) == 0
+
+    one = Consumer()
+    two = Consumer()
+
+    # first call to woken for each escrow is a full sweep
+    for escrow in waker.Escrows:
+        assert waker.woken(escrow, one) is None
+        waker.settle(escrow, one)
+    assert set(waker.state(one).woke) == set(basing.Waker.Escrows)
+    assert waker.woken("ooes", one) == set()  # nothing woken since sweep
+    waker.settle("ooes", one)
+
+    waker.wake("Epre")
+    assert waker.woken("ooes", one) == {b"Epre"}
+    waker.settle("ooes", one)
+    assert waker.woken("ooes", one) == set()  # cleared once settled
+    waker.settle("ooes", one)
+    assert waker.woken("pses", one) == {b"Epre"}  # each escrow woken separately
+    waker.settle("pses", one)
+
+    # each consumer has its own woken sets
+    assert waker.woken("ooes", two) is None  # new consumer full sweep
+    waker.settle("ooes", two)
+    waker.wake("Epre")
+    assert waker.woken("ooes", one) == {b"Epre"}
+    waker.settle("ooes", one)
+    assert waker.woken("ooes", two) == {b"Epre"}  # not taken by one
+    waker.settle("ooes", two)
+
+    # unsettled pass is retried by next call
+    waker.wake("Epre")
+    assert waker.woken("ooes", one) == {b"Epre"}  # pass raises so no settle
+    waker.wake("Eother")
+    assert waker.woken("ooes", one) == {b"Epre", b"Eother"}
+    waker.settle("ooes", one)
+    assert waker.woken("ooes", one) == set()
+    waker.settle("ooes", one)
+
+    # unsettled full sweep is retried as full sweep
+    assert waker.woken("ures", two) is None
+    assert waker.woken("ures", two) is None
+    waker.settle("ures", two)
+    assert waker.woken("ures", two) == set()
+    waker.settle("ures", two)
+
+    assert waker.woken("pses", one) == {b"Epre", b"Eother"}
+    waker.settle("pses", one)
+
+    waker.depend(pre=b"Edelegate", dep="Edelegator")
+    waker.depend(pre=b"Edelegator", dep="Edelegator")  # own prefix not indexed
+    assert waker.deps == {b"Edelegator": {b"Edelegate"}}
+    waker.wake(b"Edelegator")
+    assert waker.deps == {}  # woken dependents unindexed
+    assert waker.woken("pses", one) == {b"Edelegate", b"Edelegator"}
+    waker.settle("pses", one)
+
+    waker.period = 0.0  # every call is now a full sweep
+    waker.wake(b"Epre")
+    assert waker.woken("vres", one) is None
+    waker.settle("vres", one)
+    assert waker.woken("vres", one) is None
+    waker.settle("vres", one)
+
+    del two  # consumers are weakly referenced
+    assert len(waker.consumers) == 1
+
+    with openDB() as baser:
+        assert isinstance(baser.waker, basing.Waker)
+
+    """End Test"""
+
+
+def test_frame_cache():
+    """
+    Test Baser .frames LRU cache of replayed event messages
+    """
+    with habbing.openHby(name="test", base="test") as hby:
+        hab = hby.makeHab(name="test")
+        hab.interact()
+        db = hby.db
+        pre = hab.pre.encode("utf-8")
+        assert isinstance(db.frames, helping.lrudict)
+        assert db.frames.size == basing.Baser.FrameCacheSize
+        db.frames.clear()
+
+        msgs = [bytes(msg) for msg in db.clonePreIter(pre=pre)]
+        assert len(msgs) == 2
+        assert len(db.frames) == 2
+        hits = db.frames.hits
+        again = [bytes(msg) for msg in db.clonePreIter(pre=pre)]
+        assert again == msgs
+        assert db.frames.hits == hits + 2
+
+        # returned message is a copy so changing it leaves cache intact
+        msg = db.cloneEvtMsg(pre=pre, fn=0, dig=hab.kever.prefixer.qb64b)
+        msg.extend(b"junk")
+        assert bytes(db.cloneEvtMsg(pre=pre, fn=0, dig=hab.kever.prefixer.qb64b)) == msgs[0]
+
+        # adding an attachment invalidates the cached frame
+        dig = hab.kever.serder.saidb
+        key = dgKey(pre, dig)
+        assert key in db.frames
+        wig = b'AACdI8OSQkMJ9r-xigjEByEjIua7LHH3AOJ22PQKqljMhuhcgh9nGRcKnsz5KvKd7K_H9-1298F4Id1DxvIoEmCQ'
+        db.addWig(key=key, val=wig)
+        assert key not in db.frames
+        msg = db.cloneEvtMsg(pre=pre, fn=1, dig=dig)
+        assert bytes(msg) != msgs[1]
+        assert wig in bytes(msg)
+
+    # disabled cache
+    with openDB(frameCacheSize=0) as db:
+        assert db.frames.size == 0
+        assert not db.frames
+
+    """End Test"""
+
+
 def test_baserdoer():
     """
     Test BaserDoer
@@ -2127,4 +2305,5 @@ if __name__ == "__main__":
     test_fetchkeldel()
     test_usebaser()
     test_dbdict()
+    test_waker()
     test_baserdoer()
@@ -796,6 +796,178 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_txn():
+    """
+    Test LMDBer.txn shared transaction context
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beep.')
+        ddb = dber.env.open_db(key=b'boop.', dupsort=True)
+        odb = dber.env.open_db(key=b'bop.')
+        assert dber.txnActive is None
+
+        key = b'A'
+        with dber.txn(write=True) as txn:
+            assert dber.txnActive is txn
+            assert dber.putVal(db, key, b'x')
+            assert dber.getVal(db, key) == b'x'  # sees own uncommitted write
+            assert dber.addVal(ddb, key, b'y')
+            assert dber.appendOrdValPre(odb, b'B', b'z') == 0
+            assert dber.appendOrdValPre(odb, b'B', b'z') == 1
+            with dber.txn(write=True) as inner:  # nested reuses outer
+                assert inner is txn
+                assert dber.setVal(db, key, b'w')
+        assert dber.txnActive is None
+        assert bytes(dber.getVal(db, key)) == b'w'
+        assert dber.getVals(ddb, key) == [b'y']
+
+        # exception aborts all writes in context
+        with pytest.raises(ValueError):
+            with dber.txn(write=True):
+                assert dber.setVal(db, key, b'v')
+                assert dber.delVals(ddb, key)
+                raise ValueError("abort")
+        assert dber.txnActive is None
+        assert bytes(dber.getVal(db, key)) == b'w'
+        assert dber.getVals(ddb, key) == [b'y']
+
+        # read only context
+        with dber.txn() as txn:
+            assert bytes(dber.getVal(db, key)) == b'w'
+            assert dber.setVal(db, b'C', b'c')  # write uses own transaction
+            with pytest.raises(ValueError):
+                with dber.txn(write=True):
+                    pass
+        assert bytes(dber.getVal(db, b'C')) == b'c'
+
+    """ End Test """
+
+
+def test_lmdber_snapshot():
+    """
+    Test LMDBer.snapshot consistent read only transaction context
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beep.')
+        ddb = dber.env.open_db(key=b'boop.', dupsort=True)
+        assert dber.putVal(db, b'A', b'a')
+        assert dber.addVal(ddb, b'A', b'b')
+
+        with dber.snapshot() as snap:
+            assert dber.txnActive is snap
+            assert bytes(dber.getVal(db, b'A')) == b'a'
+            assert dber.setVal(db, b'A', b'x')  # committed by own transaction
+            assert dber.addVal(ddb, b'A', b'y')
+            # reads in snapshot do not see later writes
+            assert bytes(dber.getVal(db, b'A')) == b'a'
+            assert [bytes(val) for val in dber.getVals(ddb, b'A')] == [b'b']
+            with dber.snapshot() as inner:  # nested reuses outer
+                assert inner is snap
+        assert dber.txnActive is None
+        assert bytes(dber.getVal(db, b'A')) == b'x'
+        assert dber.getVals(ddb, b'A') == [b'b', b'y']
+
+        with dber.txn(write=True) as txn:
+            assert dber.setVal(db, b'A', b'z')
+            with dber.snapshot() as snap:  # reuses write so sees its writes
+                assert snap is txn
+                assert dber.getVal(db, b'A') == b'z'
+
+    """ End Test """
+
+
+def test_lmdber_map():
+    """
+    Test LMDBer configurable map size, growth and tuning profiles
+    """
+    with openLMDB() as dber:
+        assert dber.mapSize == LMDBer.MapSize == 104857600
+        assert dber.mapSizeMax is None
+        assert dber.profile == LMDBer.Profiles["durable"]
+        assert dber.env.flags()["sync"]
+        assert dber.env.flags()["metasync"]
+
+    with pytest.raises(ValueError):
+        LMDBer(name="test", temp=True, profile="bogus")
+
+    with openLMDB(profile="fast") as dber:
+        assert dber.profile == LMDBer.Profiles["fast"]
+        flags = dber.env.flags()
+        assert flags["writemap"]
+        assert flags["map_async"]
+        assert not flags["sync"]
+        assert not flags["metasync"]
+        assert not flags["readahead"]
+
+    with openLMDB(profile=dict(metasync=False)) as dber:  # override default
+        assert not dber.profile["metasync"]
+        assert dber.profile["sync"]
+        assert not dber.env.flags()["metasync"]
+
+    size = 64 * 4096
+    val = b'v' * 2048
+    with openLMDB(mapSize=size) as dber:
+        assert dber.mapSize == size
+        db = dber.env.open_db(key=b'beep.')
+        for i in range(512):  # standalone writes grow map when full
+            assert dber.putVal(db, b'%04d' % i, val)
+        assert dber.mapSize > size
+        assert dber.env.info()["map_size"] == dber.mapSize
+        assert dber.getVal(db, b'0511') == val
+
+        size = dber.grow(size=dber.mapSize * 4)
+        assert size == dber.env.info()["map_size"]
+
+        # full outer transaction is aborted but map grows for a repeat
+        with pytest.raises(lmdb.MapFullError):
+            with dber.txn(write=True):
+                for i in range(size // len(val)):
+                    dber.putVal(db, b'T%06d' % i, val)
+        assert dber.mapSize > size
+        assert dber.getVal(db, b'T000000') is None
+
+    with openLMDB(mapSize=size, mapSizeMax=size) as dber:
+        db = dber.env.open_db(key=b'beep.')
+        with pytest.raises(lmdb.MapFullError):
+            for i in range(size // len(val) + 1):
+                dber.putVal(db, b'%06d' % i, val)
+        assert dber.mapSize == size
+
+    # map does not grow while a lazy getter holds a read transaction open
+    size = 64 * 4096
+    with openLMDB(mapSize=size) as dber:
+        db = dber.env.open_db(key=b'beep.')
+        for i in range(4):
+            assert dber.putVal(db, b'A%d' % i, val)
+        assert dber.readers == 0
+        items = dber.getAllItemIter(db)
+        assert bytes(next(items)[1]) == val
+        assert dber.readers == 1
+        with pytest.raises(lmdb.MapFullError):
+            for i in range(size // len(val) + 1):
+                dber.putVal(db, b'%06d' % i, val)
+        assert dber.mapSize == size
+        with pytest.raises(lmdb.MapFullError):
+            dber.grow()
+        with dber.txn(write=True):  # reserve deferred
+            pass
+        assert dber.mapSize == size
+        assert [bytes(v) for k, v in items] == [val] * 3  # resumes safely
+        assert dber.readers == 0
+
+        for i in range(size // len(val) + 1):  # grows once reader closed
+            assert dber.putVal(db, b'B%06d' % i, val)
+        assert dber.mapSize > size
+
+        with dber.snapshot():
+            assert dber.readers == 1
+            with pytest.raises(lmdb.MapFullError):
+                dber.grow()
+        assert dber.readers == 0
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_lmdber()
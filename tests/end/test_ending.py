@@ -14,6 +14,7 @@ from hio.base import tyming, doing
 from keri import help, kering
 from keri.app import habbing
 from keri.core import coring
+from keri.db import dbing
 from keri.end import ending
 
 logger = help.ogler.getLogger()
@@ -419,6 +420,40 @@ def test_get_oobi():
     """Done Test"""
 
 
+def test_get_metrics():
+    """
+    Uses falcon TestClient
+    """
+    with habbing.openHab(name="metrics", temp=True) as (hby, hab):
+        meter = help.metering.Meter()
+        meter.count("keri_parser_frames_total", ident="KERI", ilk="icp")
+
+        app = falcon.App()
+        end = ending.loadMetricsEnd(app, dbs=[hby.db], meter=meter)
+        assert end.ttl == ending.MetricsEnd.TTL
+        client = testing.TestClient(app=app)
+
+        rep = client.simulate_get('/metrics', )
+        assert rep.status == falcon.HTTP_OK
+        assert rep.headers["content-type"] == "text/plain; version=0.0.4"
+        assert 'keri_parser_frames_total{ident="KERI",ilk="icp"} 1' in rep.text
+        assert 'keri_escrow_entries{escrow="ooes",store="baser"} 0' in rep.text
+
+        # escrow an out of order event so its age is reported
+        serder = coring.Serder(raw=bytes(hab.interact()))
+        hby.db.putDts(dbing.dgKey(serder.preb, serder.saidb), help.nowIso8601().encode("utf-8"))
+        hby.db.addOoe(dbing.snKey(serder.preb, serder.sn + 1), serder.saidb)
+        rep = client.simulate_get('/metrics', )  # escrow gauges reused within ttl
+        assert 'keri_escrow_entries{escrow="ooes",store="baser"} 0' in rep.text
+
+        end.ttl = 0.0  # resample on every scrape
+        rep = client.simulate_get('/metrics', )
+        assert 'keri_escrow_entries{escrow="ooes",store="baser"} 1' in rep.text
+        assert 'keri_escrow_oldest_age_seconds{escrow="ooes",store="baser"}' in rep.text
+
+    """Done Test"""
+
+
 def test_end_demo():
     """
     Run with rest api client like Paw or PostMan
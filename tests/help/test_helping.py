@@ -273,5 +273,38 @@ def test_iso8601():
     """ End Test """
 
 
+def test_lrudict():
+    """
+    Test lrudict bounded LRU mapping
+    """
+    lru = helping.lrudict(size=2)
+    assert lru.size == 2
+    assert lru.hits == lru.misses == lru.evictions == 0
+
+    lru["a"] = 1
+    lru["b"] = 2
+    assert lru["a"] == 1  # a now most recently used
+    lru["c"] = 3  # evicts b
+    assert list(lru.keys()) == ["a", "c"]
+    assert lru.evictions == 1
+    assert lru.get("b") is None
+    assert lru.get("b", 5) == 5
+    assert lru.get("c") == 3
+    assert lru.hits == 2
+    assert lru.misses == 2
+
+    lru["a"] = 4  # update makes most recent
+    assert list(lru.items()) == [("c", 3), ("a", 4)]
+    assert lru.pop("a") == 4
+    assert len(lru) == 1
+
+    lru = helping.lrudict()  # unbounded
+    for i in range(100):
+        lru[i] = i
+    assert len(lru) == 100
+    assert lru.evictions == 0
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_klasify()
@@ -0,0 +1,103 @@
+# -*- encoding: utf-8 -*-
+"""
+tests.help.test_metering module
+
+"""
+import pytest
+
+from keri import help, kering
+from keri.help import metering
+
+
+def test_meter():
+    """
+    Test Meter counters, histograms, tallies and exposition
+    """
+    assert isinstance(help.meter, metering.Meter)
+
+    meter = metering.Meter(bounds=(0.001, 0.01))
+    assert meter.enabled is True
+
+    meter.count("keri_frames_total", ilk="icp")
+    meter.count("keri_frames_total", ilk="icp")
+    meter.count("keri_frames_total", 3, ilk="ixn")
+    assert meter.counters["keri_frames_total"] == {(("ilk", "icp"),): 2,
+                                                   (("ilk", "ixn"),): 3}
+
+    meter.observe("keri_verify_seconds", 0.0005)
+    meter.observe("keri_verify_seconds", 0.005)
+    meter.observe("keri_verify_seconds", 0.5)
+    hist = meter.histograms["keri_verify_seconds"][()]
+    assert hist.counts == [1, 1, 1]
+    assert hist.count == 3
+    assert hist.sum == pytest.approx(0.5055)
+
+    @meter.tallied("keri_events_total", escrows=(kering.OutOfOrderError,))
+    def process(outcome):
+        if outcome == "escrowed":
+            raise kering.OutOfOrderError("escrowed")
+        if outcome == "rejected":
+            raise kering.ValidationError("rejected")
+        return outcome
+
+    assert process("accepted") == "accepted"
+    with pytest.raises(kering.OutOfOrderError):
+        process("escrowed")
+    with pytest.raises(kering.ValidationError):
+        process("rejected")
+    with pytest.raises(kering.ValidationError):
+        process("rejected")
+    assert meter.counters["keri_events_total"] == {(("outcome", "accepted"),): 1,
+                                                   (("outcome", "escrowed"),): 1,
+                                                   (("outcome", "rejected"),): 2}
+
+    text = meter.expose(gauges=[("keri_escrow_entries", dict(escrow="ooes"), 4),
+                                ("keri_escrow_entries", dict(escrow="pses"), 0)])
+    assert text == ('# TYPE keri_events_total counter\n'
+                    'keri_events_total{outcome="accepted"} 1\n'
+                    'keri_events_total{outcome="escrowed"} 1\n'
+                    'keri_events_total{outcome="rejected"} 2\n'
+                    '# TYPE keri_frames_total counter\n'
+                    'keri_frames_total{ilk="icp"} 2\n'
+                    'keri_frames_total{ilk="ixn"} 3\n'
+                    '# TYPE keri_verify_seconds histogram\n'
+                    'keri_verify_seconds_bucket{le="0.001"} 1\n'
+                    'keri_verify_seconds_bucket{le="0.01"} 2\n'
+                    'keri_verify_seconds_bucket{le="+Inf"} 3\n'
+                    'keri_verify_seconds_sum 0.5055\n'
+                    'keri_verify_seconds_count 3\n'
+                    '# TYPE keri_escrow_entries gauge\n'
+                    'keri_escrow_entries{escrow="ooes"} 4\n'
+                    'keri_escrow_entries{escrow="pses"} 0\n')
+
+    # disabled meter records nothing
+    meter.clear()
+    meter.enabled = False
+    meter.count("keri_frames_total", ilk="icp")
+    meter.observe("keri_verify_seconds", 0.1)
+    assert process("accepted") == "accepted"
+    assert meter.counters == {}
+    assert meter.histograms == {}
+    assert meter.expose() == "\n"
+
+    """End Test"""
+
+
+def test_init_meter(monkeypatch):
+    """
+    Test initMeter switch from environment
+    """
+    monkeypatch.delenv("KERI_METER", raising=False)
+    assert metering.initMeter().enabled is False
+    monkeypatch.setenv("KERI_METER", "on")
+    assert metering.initMeter().enabled is True
+    monkeypatch.setenv("KERI_METER", "off")
+    assert metering.initMeter().enabled is False
+    monkeypatch.setenv("KERI_METER", "1")
+    assert metering.initMeter().enabled is True
+
+    """End Test"""
+
+
+if __name__ == "__main__":
+    test_meter()
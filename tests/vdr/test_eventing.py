@@ -3,6 +3,8 @@
 tests.vdr.eventing module
 
 """
+from collections import deque
+
 import pytest
 
 from keri.app import habbing, keeping
@@ -739,6 +741,16 @@ def test_tevery():
         assert status.ked["et"] == Ilks.rev
         assert status.sn == 1
 
+        # tels query cues replay of list of messages like Kevery replay cue
+        tvy.cues.clear()
+        qry = keventing.query(route="tels", query=dict(ri=regk, i=vcdig.decode("utf-8")))
+        tvy.processQuery(serder=qry, source=hab.pre)
+        cue = tvy.cues.popleft()
+        assert cue["kin"] == "replay"
+        assert isinstance(cue["msgs"], list)
+        assert [Serder(raw=msg).said for msg in cue["msgs"]] == [vcp.said, iss.said, rev.said]
+        assert list(hab.processCuesIter(deque([cue]))) == cue["msgs"]
+
 
 def test_tevery_process_escrow(mockCoringRandomNonce):
     with basing.openDB() as db, keeping.openKS() as kpr, viring.openReger() as reg:
@@ -488,6 +488,22 @@ def test_verifier_chained_credential(seeder):
         assert saider[0].qb64 == vLeiCreder.said
         saider = ianreg.reger.schms.get(vLeiSchema)
         assert saider[0].qb64 == vLeiCreder.said
+        saider = ianreg.reger.ischs.get(keys=(ian.pre, vLeiSchema))
+        assert saider[0].qb64 == vLeiCreder.said
+        saider = ianreg.reger.sschs.get(keys=(han.pre, vLeiSchema))
+        assert saider[0].qb64 == vLeiCreder.said
+        assert ianreg.reger.ischs.get(keys=(ian.pre, qviSchema)) == []
+
+        # chained credential expanded once or listed by SAID
+        creds = ianreg.reger.cloneCreds([vLeiCreder.saider])
+        assert creds[0]["sad"]["d"] == vLeiCreder.said
+        assert creds[0]["chains"][0]["sad"]["d"] == creder.said
+        memo = dict()
+        creds = ianreg.reger.cloneCreds([vLeiCreder.saider, creder.saider], memo=memo)
+        assert set(memo) == {vLeiCreder.said, creder.said}
+        assert creds[1] is creds[0]["chains"][0]
+        creds = ianreg.reger.cloneCreds([vLeiCreder.saider], expand=False)
+        assert creds[0]["chains"] == [creder.said]
 
         # Now lets get Ron's crecential into Vic's Tevers and Database
         vickvy = ceventing.Kevery(db=vic.db, lax=False, local=False)
@@ -9,7 +9,13 @@ import os
 
 import lmdb
 
+from keri.app import habbing
+from keri.core import coring, eventing
 from keri.core.coring import Diger, versify, Serials
+from keri.db import basing
+from keri.help import helping
+from keri.vc import proving
+from keri.vdr import credentialing, viring
 from keri.db.dbing import openLMDB, dgKey, snKey
 from keri.vdr.viring import Reger
 
@@ -342,6 +348,110 @@ def test_clone():
           b'AAAAAAAAABCEzpq06UecHwzy-K9FpNoRxCJp2wIGM9u2Edk-PLMZ1H4')
 
 
+def test_regerdict_lru():
+    """
+    Test bounded RegerDict with eviction of nonlocal tevers
+    """
+    class Stub:
+        def __init__(self, state):
+            self._state = state
+
+        def state(self):
+            return self._state
+
+    state = eventing.incept(keys=[coring.Signer().verfer.qb64])
+    with basing.openDB() as db, viring.openReger(db=db, teverCacheSize=3) as reg:
+        tevers = reg.tevers
+        assert isinstance(tevers, viring.RegerDict)
+        assert tevers.size == 3
+        assert tevers.hits == tevers.misses == tevers.evictions == 0
+
+        reg.registries.add('z')  # local so pinned
+        for k in ('z', 'a', 'b'):
+            tevers[k] = Stub(state)
+        assert tevers['a'] is not None  # b now least recently used
+        tevers['c'] = Stub(state)
+        assert list(tevers.keys()) == ['z', 'a', 'c']
+        assert tevers.evictions == 1
+        tevers['d'] = Stub(state)
+        assert list(tevers.keys()) == ['z', 'c', 'd']  # local never evicted
+        assert tevers.evictions == 2
+        assert tevers.hits == 1
+
+        # eviction keeps state in database for read through
+        assert reg.states.get(keys='b') is not None
+        del tevers['d']  # explicit delete removes state
+        assert reg.states.get(keys='d') is None
+
+    """End Test"""
+
+
+def test_escrow_stats():
+    """
+    Test Reger escrow counts and ages
+    """
+    with viring.openReger() as reg:
+        stats = {escrow: (count, age) for escrow, count, age in reg.escrowStats()}
+        assert set(stats) == {"oots", "twes", "taes", "pse", "mre", "mie", "mce",
+                              "mse", "tpwe", "tmse", "tede"}
+        assert all(stat == (0, None) for stat in stats.values())
+
+        pre = "EA8Ih8hxLi3mmkyItXK1u55cnHl4WgNZ_RE-gKXqgcX4"
+        dig = "EBz9ZK3CSyatq6rNWPWOjDeZbXeYIoT9X9j6EYzlGJbR"
+        then = coring.Dater(dts="2021-01-01T00:00:00.000000+00:00")
+        reg.putTwe(snKey(pre, 1), dig.encode("utf-8"))
+        reg.tets.pin(keys=(pre, dig), val=then)
+        reg.mre.pin(keys=dig, val=then)
+        reg.mre.pin(keys=pre, val=coring.Dater())
+
+        now = helping.fromIso8601("2021-01-01T00:01:00.000000+00:00")
+        stats = {escrow: (count, age) for escrow, count, age in reg.escrowStats(now=now)}
+        assert stats["twes"] == (1, 60.0)
+        assert stats["mre"] == (2, 60.0)
+        assert stats["oots"] == (0, None)
+
+    """End Test"""
+
+
+def test_reindex_creds():
+    """
+    Test composite credential indices backfilled and paged by start
+    """
+    with habbing.openHab(name="test", transferable=True, temp=True) as (hby, hab):
+        regery = credentialing.Regery(hby=hby, name="test", temp=True)
+        reger = regery.reger
+
+        schema = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
+        creders = [proving.credential(issuer=hab.pre, schema=schema,
+                                      data=dict(i=hab.pre, n=i), status=hab.pre)
+                   for i in range(3)]
+        for creder in creders:
+            reger.creds.put(keys=creder.saidb, val=creder)
+            reger.indexCred(creder)
+
+        saids = sorted(creder.said for creder in creders)
+        assert [saider.qb64 for saider in reger.ischs.get(keys=(hab.pre, schema))] == saids
+        assert [saider.qb64 for saider in reger.sschs.get(keys=(hab.pre, schema))] == saids
+        assert [saider.qb64 for saider in reger.ischs.getIter(keys=(hab.pre, schema),
+                                                               start=saids[1])] == saids[1:]
+        assert [saider.qb64 for saider in reger.ischs.getIter(keys=(hab.pre, schema),
+                                                               start=coring.Saider(qb64=saids[2]))] == saids[2:]
+
+        # database without composite indices is backfilled
+        for saider in reger.ischs.get(keys=(hab.pre, schema)):
+            reger.ischs.rem(keys=(hab.pre, schema), val=saider)
+        assert reger.ischs.get(keys=(hab.pre, schema)) == []
+        reger.reindexCreds()
+        assert [saider.qb64 for saider in reger.ischs.get(keys=(hab.pre, schema))] == saids
+
+        regery.close()
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_issuer()
     test_clone()
+    test_regerdict_lru()
+    test_escrow_stats()
+    test_reindex_creds()